@@ -13,6 +13,7 @@
 from ....internals import _deprecate_pos_args
 from ....common.array_descriptor import CumlArrayDescriptor
 from ....internals.array_sparse import SparseCumlArray
+from ....common.sketches import FrequentItemsSketch, QuantileSketch
 from ..utils.validation import FLOAT_DTYPES
 from ..utils.validation import check_is_fitted
 from cuml.internals.mixins import AllowNaNTagMixin, SparseInputTagMixin, \
@@ -25,6 +26,7 @@ from ....thirdparty_adapters import (_get_mask,
 from cuml.internals.safe_imports import gpu_only_import_from
 import cuml
 from cuml.internals.safe_imports import gpu_only_import
+import copy
 import numbers
 import warnings
 
@@ -92,6 +94,92 @@ def _most_frequent(array, extra_value, n_repeat):
     return value
 
 
+def _weighted_columns(X, missing_values):
+    """Represent the columns of X as values with occurrence weights.
+
+    Missing values get a zero weight. For a sparse matrix the implicit
+    zeros of each column are gathered into a single point of weight the
+    number of implicit zeros, so that the columns never get densified.
+    """
+    if sparse.issparse(X):
+        n_nonzero = np.diff(X.indptr)
+        n_points = int(n_nonzero.max()) + 1 if X.shape[1] else 1
+        columns = np.repeat(np.arange(X.shape[1]), n_nonzero.tolist())
+        rows = np.arange(X.nnz) - X.indptr[columns]
+        values = np.zeros((n_points, X.shape[1]), dtype=X.dtype)
+        weights = np.zeros((n_points, X.shape[1]), dtype=np.float64)
+        values[rows, columns] = X.data
+        weights[rows, columns] = ~_get_mask(X.data, missing_values)
+        weights[-1] = X.shape[0] - n_nonzero
+        return values, weights
+    weights = (~_get_mask(X, missing_values)).astype(np.float64)
+    return X, weights
+
+
+class _ColumnSummary:
+    """Mergeable per-column summary of the data seen by an imputer.
+
+    Keeps running sums and counts for the "mean" strategy, a quantile
+    sketch for "median" and one frequent items sketch per column for
+    "most_frequent". Nothing needs to be kept for "constant".
+    """
+
+    def __init__(self, strategy, n_features, sketch_size):
+        self.strategy = strategy
+        self.n_features = n_features
+        self.dtype = None
+        self.sums = np.zeros(n_features, dtype=np.float64)
+        self.counts = np.zeros(n_features, dtype=np.float64)
+        if strategy == "median":
+            self.sketch = QuantileSketch(n_features, size=sketch_size)
+        elif strategy == "most_frequent":
+            self.sketch = [FrequentItemsSketch(size=sketch_size)
+                           for _ in range(n_features)]
+
+    def update(self, X, missing_values):
+        values, weights = _weighted_columns(X, missing_values)
+        self.dtype = X.dtype
+        self.counts += weights.sum(axis=0)
+        if self.strategy == "mean":
+            self.sums += np.where(weights > 0, values, 0).sum(axis=0)
+        elif self.strategy == "median":
+            self.sketch.update(values, weights)
+        elif self.strategy == "most_frequent":
+            for i, sketch in enumerate(self.sketch):
+                present = weights[:, i] > 0
+                sketch.update(values[present, i], weights[present, i])
+
+    def merge(self, other):
+        if (other.strategy, other.n_features) != (self.strategy,
+                                                  self.n_features):
+            raise ValueError("Cannot merge the summary of an imputer with a "
+                             "different strategy or number of features")
+        self.dtype = self.dtype if other.dtype is None else other.dtype
+        self.sums += other.sums
+        self.counts += other.counts
+        if self.strategy == "median":
+            self.sketch.merge(other.sketch)
+        elif self.strategy == "most_frequent":
+            for sketch, other_sketch in zip(self.sketch, other.sketch):
+                sketch.merge(other_sketch)
+
+    def statistics(self, fill_value):
+        if self.strategy == "mean":
+            return np.where(self.counts > 0,
+                            self.sums / np.maximum(self.counts, 1), np.nan)
+        elif self.strategy == "median":
+            return self.sketch.median()
+        elif self.strategy == "most_frequent":
+            dtype = self.dtype if (self.counts > 0).all() else np.float64
+            # filled in place so that large int64 modes stay exact
+            modes = np.empty(self.n_features, dtype=dtype)
+            for i, sketch in enumerate(self.sketch):
+                modes[i] = sketch.most_frequent(default=np.nan)
+            return modes
+        elif self.strategy == "constant":
+            return np.full(self.n_features, fill_value, dtype=self.dtype)
+
+
 class _BaseImputer(TransformerMixin):
     """Base class for all imputers.
 
@@ -113,6 +201,20 @@ class _BaseImputer(TransformerMixin):
         else:
             self.indicator_ = None
 
+    def _partial_fit_indicator(self, X, previous_features=None):
+        """Fit a MissingIndicator on X, keeping the features already known
+        to contain missing values."""
+        if previous_features is None and self.add_indicator:
+            indicator = getattr(self, 'indicator_', None)
+            if indicator is not None:
+                with cuml.using_output_type("cupy"):
+                    previous_features = indicator.features_
+        self._fit_indicator(X)
+        if self.add_indicator and previous_features is not None:
+            with cuml.using_output_type("cupy"):
+                self.indicator_.features_ = np.union1d(
+                    previous_features, self.indicator_.features_)
+
     def _transform_indicator(self, X):
         """Compute the indicator mask.'
 
@@ -198,6 +300,12 @@ class SimpleImputer(_BaseImputer, BaseEstimator,
         the missing indicator even if there are missing values at
         transform/test time.
 
+    sketch_size : int, default=2048
+        Number of points (for strategy="median") or of distinct values per
+        feature (for strategy="most_frequent") kept by the summaries built
+        by :meth:`partial_fit`. The statistics are exact as long as each
+        feature received fewer points or distinct values than this.
+
     Attributes
     ----------
     statistics_ : array of shape (n_features,)
@@ -206,6 +314,11 @@ class SimpleImputer(_BaseImputer, BaseEstimator,
         During :meth:`transform`, features corresponding to `np.nan`
         statistics will be discarded.
 
+    n_samples_seen_ : int
+        The number of samples processed by :meth:`partial_fit` and
+        :meth:`merge`. Only set when the imputer was fitted with
+        :meth:`partial_fit`.
+
     See also
     --------
     IterativeImputer : Multivariate imputation of missing values.
@@ -228,13 +341,21 @@ class SimpleImputer(_BaseImputer, BaseEstimator,
     Columns which only contained missing values at :meth:`fit` are discarded
     upon :meth:`transform` if strategy is not "constant".
 
+    :meth:`partial_fit` keeps mergeable summaries of the data instead of the
+    data itself: running sums for "mean", a quantile sketch for "median" and
+    a Misra-Gries frequent items sketch for "most_frequent". The median and
+    most frequent values are therefore approximate once a feature received
+    more than `sketch_size` points or distinct values. Imputers fitted on
+    separate partitions can be combined with :meth:`merge`.
+
     """
 
     statistics_ = CumlArrayDescriptor()
 
     @_deprecate_pos_args(version="21.06")
     def __init__(self, *, missing_values=np.nan, strategy="mean",
-                 fill_value=None, copy=True, add_indicator=False):
+                 fill_value=None, copy=True, add_indicator=False,
+                 sketch_size=2048):
         super().__init__(
             missing_values=missing_values,
             add_indicator=add_indicator
@@ -242,15 +363,43 @@ class SimpleImputer(_BaseImputer, BaseEstimator,
         self.strategy = strategy
         self.fill_value = fill_value
         self.copy = copy
+        self.sketch_size = sketch_size
 
     def get_param_names(self):
         return super().get_param_names() + [
             "strategy",
             "fill_value",
             "verbose",
-            "copy"
+            "copy",
+            "sketch_size"
         ]
 
+    def _reset(self):
+        """Reset the state accumulated by partial_fit and merge."""
+        if hasattr(self, '_summary'):
+            del self._summary
+            del self.n_samples_seen_
+
+    def _get_fill_value(self, dtype):
+        # default fill_value is 0 for numerical input and "missing_value"
+        # otherwise
+        if self.fill_value is None:
+            if dtype.kind in ("i", "u", "f"):
+                fill_value = 0
+            else:
+                fill_value = "missing_value"
+        else:
+            fill_value = self.fill_value
+
+        # fill_value should be numerical in case of numerical input
+        if (self.strategy == "constant" and
+                dtype.kind in ("i", "u", "f") and
+                not isinstance(fill_value, numbers.Real)):
+            raise ValueError("'fill_value'={0} is invalid. Expected a "
+                             "numerical value when imputing numerical "
+                             "data".format(fill_value))
+        return fill_value
+
     def _validate_input(self, X, in_fit):
         allowed_strategies = ["mean", "median", "most_frequent", "constant"]
         if self.strategy not in allowed_strategies:
@@ -309,26 +458,11 @@ class SimpleImputer(_BaseImputer, BaseEstimator,
         if type(X) is list:
             X = np.asarray(X)
 
+        self._reset()
         X = self._validate_input(X, in_fit=True)
         super()._fit_indicator(X)
 
-        # default fill_value is 0 for numerical input and "missing_value"
-        # otherwise
-        if self.fill_value is None:
-            if X.dtype.kind in ("i", "u", "f"):
-                fill_value = 0
-            else:
-                fill_value = "missing_value"
-        else:
-            fill_value = self.fill_value
-
-        # fill_value should be numerical in case of numerical input
-        if (self.strategy == "constant" and
-                X.dtype.kind in ("i", "u", "f") and
-                not isinstance(fill_value, numbers.Real)):
-            raise ValueError("'fill_value'={0} is invalid. Expected a "
-                             "numerical value when imputing numerical "
-                             "data".format(fill_value))
+        fill_value = self._get_fill_value(X.dtype)
 
         if sparse.issparse(X):
             # missing_values = 0 not allowed with sparse data as it would
@@ -349,6 +483,93 @@ class SimpleImputer(_BaseImputer, BaseEstimator,
                                                fill_value)
         return self
 
+    def partial_fit(self, X, y=None) -> "SimpleImputer":
+        """Update the imputer statistics with a chunk of samples.
+
+        Unlike :meth:`fit`, only a summary of the data seen so far is kept,
+        so the imputer can be fitted on data that does not fit in memory
+        at once. See the Notes section of the class for the accuracy of
+        the resulting statistics. Calling :meth:`fit` discards the summary.
+
+        Parameters
+        ----------
+        X : {array-like, sparse matrix}, shape (n_samples, n_features)
+            Input data, where ``n_samples`` is the number of samples and
+            ``n_features`` is the number of features.
+
+        Returns
+        -------
+        self : SimpleImputer
+        """
+
+        if type(X) is list:
+            X = np.asarray(X)
+
+        first_pass = not hasattr(self, '_summary')
+        X = self._validate_input(X, in_fit=first_pass)
+        if (sparse.issparse(X) and self.strategy != "constant" and
+                self.missing_values == 0):
+            raise ValueError("Imputation not possible when missing_values "
+                             "== 0 and input is sparse. Provide a dense "
+                             "array instead.")
+        if first_pass:
+            self._summary = _ColumnSummary(self.strategy, X.shape[1],
+                                           self.sketch_size)
+            self.n_samples_seen_ = 0
+            super()._fit_indicator(X)
+        else:
+            super()._partial_fit_indicator(X)
+
+        self._summary.update(X, self.missing_values)
+        self.n_samples_seen_ += X.shape[0]
+        self.statistics_ = self._summary.statistics(
+            self._get_fill_value(X.dtype))
+        return self
+
+    def merge(self, other) -> "SimpleImputer":
+        """Merge the state of another imputer fitted with partial_fit.
+
+        This combines imputers fitted on separate partitions of a dataset,
+        e.g. by Dask workers, into the imputer that :meth:`partial_fit`
+        would have produced over all the partitions.
+
+        Parameters
+        ----------
+        other : SimpleImputer
+            Imputer with the same parameters, fitted with
+            :meth:`partial_fit` on the same features.
+
+        Returns
+        -------
+        self : SimpleImputer
+        """
+        if not hasattr(other, '_summary'):
+            raise ValueError("Only imputers fitted with partial_fit can be "
+                             "merged")
+        if not hasattr(self, '_summary'):
+            self._summary = _ColumnSummary(self.strategy,
+                                           other._summary.n_features,
+                                           self.sketch_size)
+            self.n_samples_seen_ = 0
+            self.n_features_in_ = other.n_features_in_
+        if self.add_indicator:
+            with cuml.using_output_type("cupy"):
+                other_features = other.indicator_.features_
+            if hasattr(self, 'indicator_'):
+                with cuml.using_output_type("cupy"):
+                    other_features = np.union1d(self.indicator_.features_,
+                                                other_features)
+            self.indicator_ = copy.deepcopy(other.indicator_)
+            with cuml.using_output_type("cupy"):
+                self.indicator_.features_ = other_features
+
+        self._summary.merge(other._summary)
+        self.n_samples_seen_ += other.n_samples_seen_
+        if self._summary.dtype is not None:
+            self.statistics_ = self._summary.statistics(
+                self._get_fill_value(self._summary.dtype))
+        return self
+
     def _sparse_fit(self, X, strategy, missing_values, fill_value):
         """Fit the transformer on sparse data."""
         mask_data = _get_mask(X.data, missing_values)
@@ -29,6 +29,7 @@ from cuml.benchmark.bench_helper_funcs import (
     _treelite_fil_accuracy_score,
     _training_data_to_numpy,
     _build_mnmg_umap,
+    _build_host_preprocessing_pipeline,
 )
 from cuml.preprocessing import (
     StandardScaler,
@@ -38,6 +39,8 @@ from cuml.preprocessing import (
     SimpleImputer,
     RobustScaler,
     PolynomialFeatures,
+    OneHotEncoder,
+    OrdinalEncoder,
 )
 import tempfile
 import cuml
@@ -48,12 +51,16 @@ import sklearn.neighbors
 import sklearn.ensemble
 import sklearn.random_projection
 import sklearn.naive_bayes
+import sklearn.pipeline
+import sklearn.feature_extraction.text
 from sklearn import metrics
 from sklearn.impute import SimpleImputer as skSimpleImputer
 import cuml.metrics
 import cuml.decomposition
+import cuml.feature_extraction.text
 import cuml.experimental
 import cuml.naive_bayes
+import cuml.pipeline
 from cuml.dask import (
     neighbors,
     cluster,
@@ -65,6 +72,7 @@ from cuml.internals.import_utils import has_hdbscan, has_umap
 from cuml.internals.safe_imports import cpu_only_import
 
 np = cpu_only_import("numpy")
+pd = cpu_only_import("pandas")
 
 
 if has_umap():
@@ -224,6 +232,21 @@ def _numpy_format_hook(data):
     return _training_data_to_numpy(data[0], data[1])
 
 
+def _categorical_host_hook(data):
+    """Helper function quantizing features into high-cardinality categories
+    held in a numpy array"""
+    X, y = _training_data_to_numpy(data[0], data[1])
+    return (np.asarray(X) * 1000).astype(np.int64), y
+
+
+def _text_host_hook(data):
+    """Helper function turning each row into a document whose words are its
+    quantized features, held in a pandas Series"""
+    X, y = _training_data_to_numpy(data[0], data[1])
+    words = np.char.add("w", (np.asarray(X) * 10).astype(np.int64).astype(str))
+    return pd.DataFrame(words).agg(" ".join, axis=1), y
+
+
 def all_algorithms():
     """Returns all defined AlgorithmPair objects"""
     algorithms = [
@@ -699,6 +722,68 @@ def all_algorithms():
             accepts_labels=False,
             bench_func=fit_transform,
         ),
+        AlgorithmPair(
+            sklearn.preprocessing.OneHotEncoder,
+            OneHotEncoder,
+            shared_args=dict(handle_unknown="ignore"),
+            name="OneHotEncoder-Host",
+            accepts_labels=False,
+            cpu_data_prep_hook=_categorical_host_hook,
+            cuml_data_prep_hook=_categorical_host_hook,
+            bench_func=fit_transform,
+        ),
+        AlgorithmPair(
+            sklearn.preprocessing.OrdinalEncoder,
+            OrdinalEncoder,
+            shared_args=dict(),
+            name="OrdinalEncoder-Host",
+            accepts_labels=False,
+            cpu_data_prep_hook=_categorical_host_hook,
+            cuml_data_prep_hook=_categorical_host_hook,
+            bench_func=fit_transform,
+        ),
+        AlgorithmPair(
+            sklearn.feature_extraction.text.CountVectorizer,
+            cuml.feature_extraction.text.CountVectorizer,
+            shared_args=dict(ngram_range=(1, 2)),
+            name="CountVectorizer-Host",
+            accepts_labels=False,
+            cpu_data_prep_hook=_text_host_hook,
+            cuml_data_prep_hook=_text_host_hook,
+            bench_func=fit_transform,
+        ),
+        AlgorithmPair(
+            sklearn.feature_extraction.text.TfidfVectorizer,
+            cuml.feature_extraction.text.TfidfVectorizer,
+            shared_args=dict(),
+            name="TfidfVectorizer-Host",
+            accepts_labels=False,
+            cpu_data_prep_hook=_text_host_hook,
+            cuml_data_prep_hook=_text_host_hook,
+            bench_func=fit_transform,
+        ),
+        AlgorithmPair(
+            sklearn.feature_extraction.text.HashingVectorizer,
+            cuml.feature_extraction.text.HashingVectorizer,
+            shared_args=dict(ngram_range=(1, 2)),
+            name="HashingVectorizer-Host",
+            accepts_labels=False,
+            cpu_data_prep_hook=_text_host_hook,
+            cuml_data_prep_hook=_text_host_hook,
+            bench_func=fit_transform,
+        ),
+        AlgorithmPair(
+            sklearn.pipeline.Pipeline,
+            cuml.pipeline.FusedPipeline,
+            shared_args=dict(),
+            name="FusedPipeline-Host",
+            accepts_labels=False,
+            cpu_data_prep_hook=_numpy_format_hook,
+            cuml_data_prep_hook=_numpy_format_hook,
+            setup_cpu_func=_build_host_preprocessing_pipeline,
+            setup_cuml_func=_build_host_preprocessing_pipeline,
+            bench_func=transform,
+        ),
         AlgorithmPair(
             None,
             cuml.dask.neighbors.KNeighborsClassifier,
@@ -360,6 +360,25 @@ def _build_cpu_skl_classifier(m, data, args, tmpdir):
     return skl_model
 
 
+def _build_host_preprocessing_pipeline(m, data, args, tmpdir):
+    """Setup function fitting an imputer -> scaler -> normalizer chain with
+    the pipeline class `m` on host data, so that only transform is timed.
+
+    The unfused pipeline writes a full intermediate matrix per step while
+    the fused one reads the input once and writes the output once. The
+    peak memory of both is reported by `fused_pipeline_benchmark.py`."""
+    from sklearn.impute import SimpleImputer
+    from sklearn.preprocessing import Normalizer, StandardScaler
+
+    X, _ = _training_data_to_numpy(data[0], data[1])
+    steps = [
+        ("impute", SimpleImputer()),
+        ("scale", StandardScaler()),
+        ("normalize", Normalizer()),
+    ]
+    return m(steps, **args).fit(X)
+
+
 class GtilWrapper:
     """Helper class to provide interface to GTIL compatible with
     benchmarking functions"""
@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Script measuring the transform time and the peak host memory of an
+imputer -> scaler -> normalizer chain run by scikit-learn's Pipeline and by
+FusedPipeline on host arrays
+
+The peak memory is the largest amount of memory allocated during transform
+on top of what was allocated before, as traced by tracemalloc, and so
+includes the output matrix.
+
+Usage: python -m cuml.benchmark.fused_pipeline_benchmark [--n-samples N] ...
+"""
+import argparse
+import time
+import tracemalloc
+
+from cuml.internals.safe_imports import cpu_only_import
+from cuml.pipeline import FusedPipeline
+from sklearn.impute import SimpleImputer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import Normalizer, StandardScaler
+
+np = cpu_only_import("numpy")
+pd = cpu_only_import("pandas")
+
+
+def make_steps():
+    return [
+        ("impute", SimpleImputer()),
+        ("scale", StandardScaler()),
+        ("normalize", Normalizer()),
+    ]
+
+
+def measure(model, X, n_reps):
+    """Best transform time over `n_reps` runs and peak traced memory"""
+    timings = []
+    for _ in range(n_reps):
+        start = time.perf_counter()
+        model.transform(X)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        model.transform(X)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak
+
+
+def run(n_samples, n_features, n_reps=3, seed=0):
+    rng = np.random.RandomState(seed)
+    X = rng.randn(n_samples, n_features)
+    X[rng.rand(n_samples, n_features) < 0.01] = np.nan
+    input_mb = X.nbytes / 2**20
+
+    results = []
+    for name, cls in [
+        ("Pipeline", Pipeline),
+        ("FusedPipeline", FusedPipeline),
+    ]:
+        model = cls(make_steps()).fit(X)
+        transform_time, peak = measure(model, X, n_reps)
+        results.append(
+            dict(
+                pipeline=name,
+                transform_time=transform_time,
+                peak_mb=peak / 2**20,
+                peak_over_input=peak / 2**20 / input_mb,
+            )
+        )
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the transform of FusedPipeline on host"
+    )
+    parser.add_argument("--n-samples", type=int, default=400000)
+    parser.add_argument("--n-features", type=int, default=50)
+    parser.add_argument("--n-reps", type=int, default=3)
+    parser.add_argument("--csv", help="Write the results to this file")
+    args = parser.parse_args()
+
+    results = run(args.n_samples, args.n_features, args.n_reps)
+    print(results.to_string(index=False))
+    if args.csv:
+        results.to_csv(args.csv, index=False)
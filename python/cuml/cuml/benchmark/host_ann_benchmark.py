@@ -0,0 +1,119 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Script measuring the fit and query times and the recall of the host
+IVF-Flat and IVF-PQ indexes of NearestNeighbors
+
+The recall is the fraction of the exact k nearest neighbors, found by a
+scikit-learn brute force search, returned by the approximate search.
+
+Usage: python -m cuml.benchmark.host_ann_benchmark [--n-samples N] ...
+"""
+import argparse
+import time
+
+from cuml.common.device_selection import using_device_type
+from cuml.internals.safe_imports import cpu_only_import
+from cuml.neighbors import NearestNeighbors
+from sklearn.datasets import make_blobs
+from sklearn.neighbors import NearestNeighbors as skNearestNeighbors
+
+np = cpu_only_import("numpy")
+pd = cpu_only_import("pandas")
+
+CONFIGS = [
+    ("ivfflat", dict(nlist=256, nprobe=8)),
+    ("ivfflat", dict(nlist=256, nprobe=32)),
+    ("ivfpq", dict(nlist=256, nprobe=16, M=16, n_bits=8)),
+    ("ivfpq", dict(nlist=256, nprobe=32, M=32, n_bits=8)),
+]
+
+
+def recall(indices, ref_indices):
+    hits = [
+        len(np.intersect1d(row, ref_row))
+        for row, ref_row in zip(indices, ref_indices)
+    ]
+    return np.sum(hits) / ref_indices.size
+
+
+def run(n_samples, n_features, n_queries, n_neighbors, seed=0):
+    X, _ = make_blobs(
+        n_samples,
+        n_features=n_features,
+        centers=200,
+        cluster_std=4,
+        random_state=seed,
+    )
+    X = X.astype(np.float32)
+    noise = np.random.RandomState(seed + 1).randn(n_queries, n_features)
+    Q = X[:n_queries] + noise.astype(np.float32)
+
+    start = time.perf_counter()
+    model = skNearestNeighbors(n_neighbors=n_neighbors, algorithm="brute")
+    ref_indices = model.fit(X).kneighbors(Q, return_distance=False)
+    results = [
+        dict(
+            algo="sklearn-brute",
+            params="",
+            fit_time=0.0,
+            query_time=time.perf_counter() - start,
+            recall=1.0,
+        )
+    ]
+
+    for algo, algo_params in CONFIGS:
+        with using_device_type("cpu"):
+            model = NearestNeighbors(
+                n_neighbors=n_neighbors,
+                algorithm=algo,
+                algo_params=algo_params,
+                output_type="numpy",
+            )
+            start = time.perf_counter()
+            model.fit(X)
+            fit_time = time.perf_counter() - start
+            start = time.perf_counter()
+            indices = model.kneighbors(Q, return_distance=False)
+            query_time = time.perf_counter() - start
+        results.append(
+            dict(
+                algo=algo,
+                params=repr(algo_params),
+                fit_time=fit_time,
+                query_time=query_time,
+                recall=recall(indices, ref_indices),
+            )
+        )
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the host IVF indexes of NearestNeighbors"
+    )
+    parser.add_argument("--n-samples", type=int, default=200000)
+    parser.add_argument("--n-features", type=int, default=64)
+    parser.add_argument("--n-queries", type=int, default=2000)
+    parser.add_argument("--n-neighbors", type=int, default=10)
+    parser.add_argument("--csv", help="Write the results to this file")
+    args = parser.parse_args()
+
+    results = run(
+        args.n_samples, args.n_features, args.n_queries, args.n_neighbors
+    )
+    print(results.to_string(index=False))
+    if args.csv:
+        results.to_csv(args.csv, index=False)
@@ -1,4 +1,4 @@
-# Copyright (c) 2021-2023, NVIDIA CORPORATION.
+# Copyright (c) 2021-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -34,6 +34,9 @@ from cuml.internals.api_decorators import enable_device_interop
 from cuml.internals.mixins import ClusterMixin
 from cuml.internals.mixins import CMajorInputTagMixin
 from cuml.internals.import_utils import has_hdbscan
+from cuml.internals.device_type import DeviceType
+from cuml.internals.global_settings import GlobalSettings
+from cuml.neighbors.knn_graph import KNNGraph, connected_distances
 import cuml
 
 
@@ -467,6 +470,16 @@ class HDBSCAN(UniversalBase, ClusterMixin, CMajorInputTagMixin):
         be available if `gen_min_span_tree` was set to True on object creation.
         Even then in some optimized cases a tree may not be generated.
 
+    Notes
+    -----
+    A :class:`cuml.neighbors.KNNGraph` of the samples can be given to
+    ``fit`` under :py:func:`cuml.common.device_selection.using_device_type`
+    ``"cpu"``, its symmetrized distances are then clustered by the hdbscan
+    package with ``metric='precomputed'`` instead of the samples, see
+    :func:`cuml.neighbors.knn_graph.connected_distances`. The graph must
+    have more than ``min_samples`` neighbors per sample. On device, the
+    neighbors are always searched again.
+
     """
     _cpu_estimator_import_path = 'hdbscan.HDBSCAN'
 
@@ -751,12 +764,23 @@ class HDBSCAN(UniversalBase, ClusterMixin, CMajorInputTagMixin):
             else:
                 self.inverse_label_map = CumlArray.empty((0,), dtype="int32")
 
-    @generate_docstring()
+    @generate_docstring(skip_parameters_heading=True)
     @enable_device_interop
-    def fit(self, X, y=None, convert_dtype=True) -> "HDBSCAN":
+    def fit(self, X, y=None, convert_dtype=True,
+            knn_graph=None) -> "HDBSCAN":
         """
         Fit HDBSCAN model from features.
+
+        Parameters
+        ----------
+        knn_graph : cuml.neighbors.KNNGraph, optional
+            Precomputed neighbors of the samples of X, only used with the
+            ``"cpu"`` device type.
         """
+        if knn_graph is not None:
+            knn_graph.validate(X.shape[0], self.metric)
+            warn("HDBSCAN searches the neighbors on device, knn_graph is "
+                 "only used with the 'cpu' device type")
 
         X_m, n_rows, n_cols, self.dtype = \
             input_to_cuml_array(X, order='C',
@@ -875,12 +899,12 @@ class HDBSCAN(UniversalBase, ClusterMixin, CMajorInputTagMixin):
                                        'description': 'Cluster indexes',
                                        'shape': '(n_samples, 1)'})
     @enable_device_interop
-    def fit_predict(self, X, y=None) -> CumlArray:
+    def fit_predict(self, X, y=None, knn_graph=None) -> CumlArray:
         """
         Fit the HDBSCAN model from features and return
         cluster labels.
         """
-        return self.fit(X).labels_
+        return self.fit(X, knn_graph=knn_graph).labels_
 
     def _extract_clusters(self, condensed_tree):
         parents, _n_edges, _, _ = \
@@ -1112,6 +1136,36 @@ class HDBSCAN(UniversalBase, ClusterMixin, CMajorInputTagMixin):
 
             self._cpu_to_gpu_interop_prepped = True
 
+    def dispatch_func(self, func_name, gpu_func, *args, **kwargs):
+        knn_graph = kwargs.pop("knn_graph", None)
+        if knn_graph is None or func_name not in ["fit", "fit_predict"] or \
+                GlobalSettings().device_type is not DeviceType.host:
+            if knn_graph is not None:
+                kwargs["knn_graph"] = knn_graph
+            return super().dispatch_func(func_name, gpu_func, *args, **kwargs)
+
+        X = args[0] if args else kwargs["X"]
+        # the core distances need min_samples neighbors besides the sample
+        knn_graph.validate(X.shape[0], self.metric, self.min_samples + 1)
+        if self.prediction_data:
+            raise ValueError("Prediction data cannot be generated from a "
+                             "knn_graph, fit the samples instead")
+        distances = connected_distances(knn_graph, X)
+
+        if not hasattr(self, '_cpu_model'):
+            self.import_cpu_model()
+            self.build_cpu_model()
+        self._cpu_model.metric = "precomputed"
+        try:
+            self._cpu_model.fit(distances)
+        finally:
+            self._cpu_model.metric = self.metric
+
+        self._set_output_type(X)
+        self._set_output_mem_type(X)
+        self.cpu_to_gpu()
+        return self if func_name == "fit" else self._cpu_model.labels_
+
     def get_param_names(self):
         return super().get_param_names() + [
             "metric",
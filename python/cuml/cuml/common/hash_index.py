@@ -0,0 +1,232 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from cuml.internals.safe_imports import cpu_only_import
+
+np = cpu_only_import("numpy")
+pd = cpu_only_import("pandas")
+
+
+_EMPTY = -1
+
+
+def _mix64(x):
+    """splitmix64 finalizer applied element-wise to a uint64 array."""
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def hash_values(values):
+    """
+    Hash a 1-d host array to uint64 in a single vectorized pass.
+
+    Numeric, boolean and datetime values are hashed from their bit pattern,
+    everything else (strings, mixed objects) through
+    :func:`pandas.util.hash_array`.
+
+    Parameters
+    ----------
+    values : numpy.ndarray of shape (n,)
+
+    Returns
+    -------
+    hashes : numpy.ndarray of shape (n,), dtype uint64
+    """
+    values = np.asarray(values)
+    kind = values.dtype.kind
+    if kind in "biu":
+        bits = values.astype(np.int64, copy=False).view(np.uint64)
+    elif kind == "f":
+        # adding 0.0 folds -0.0 onto 0.0 so both hash identically
+        bits = (values.astype(np.float64, copy=False) + 0.0).view(np.uint64)
+    elif kind in "mM":
+        bits = values.view(np.int64).view(np.uint64)
+    else:
+        return pd.util.hash_array(values.astype(object, copy=False))
+    with np.errstate(over="ignore"):
+        return _mix64(bits)
+
+
+def _narrows_integers(src, dst):
+    """Whether casting integers of dtype ``src`` to ``dst`` can wrap."""
+    return src.kind in "iu" and dst.kind in "iu" and not np.can_cast(src, dst)
+
+
+class HashIndex:
+    """
+    Open-addressing (linear probing) hash table mapping a set of unique keys
+    to their position in ``keys``.
+
+    The table is built and probed with vectorized NumPy operations: every
+    probing round handles all pending keys at once, so the number of Python
+    level iterations is bounded by the longest probe sequence rather than by
+    the number of keys.
+
+    Parameters
+    ----------
+    keys : array-like of shape (n_keys,)
+        Unique keys. ``keys[i]`` is assigned code ``i``.
+    load_factor : float, default=0.5
+        Maximum ratio of keys to slots.
+
+    Attributes
+    ----------
+    keys : numpy.ndarray of shape (n_keys,)
+        The indexed keys, in code order.
+    """
+
+    def __init__(self, keys, load_factor=0.5):
+        if not 0.0 < load_factor < 1.0:
+            raise ValueError(
+                "load_factor must be in (0, 1), got {}".format(load_factor)
+            )
+        self.load_factor = load_factor
+        self.keys = np.asarray(keys)
+        self._slots = np.full(8, _EMPTY, dtype=np.int64)
+        self._max_probe = 0
+        self._rehash()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add(self, keys):
+        """
+        Append new unique keys, assigning them the next codes.
+
+        Existing codes are left unchanged. The table is only rebuilt when
+        the load factor would be exceeded.
+
+        Parameters
+        ----------
+        keys : array-like of shape (n_new,)
+            Keys that are not in the index yet.
+        """
+        keys = np.asarray(keys)
+        if not len(keys):
+            return
+        n_keys = len(self.keys)
+        self.keys = np.concatenate([self.keys, keys])
+        if len(self._slots) * self.load_factor < len(self.keys):
+            self._rehash()
+        else:
+            self._insert(np.arange(n_keys, len(self.keys), dtype=np.int64))
+
+    def _rehash(self):
+        capacity = max(len(self._slots), 8)
+        while capacity * self.load_factor < len(self.keys):
+            capacity *= 2
+        self._slots = np.full(capacity, _EMPTY, dtype=np.int64)
+        self._max_probe = 0
+        self._insert(np.arange(len(self.keys), dtype=np.int64))
+
+    def _insert(self, codes):
+        mask = np.uint64(len(self._slots) - 1)
+        hashes = hash_values(self.keys[codes])
+        probe = 0
+        while codes.size:
+            pos = ((hashes + np.uint64(probe)) & mask).astype(np.int64)
+            free = self._slots[pos] == _EMPTY
+            # several pending keys may target the same free slot: the first
+            # one wins and the others keep probing
+            slot, first = np.unique(pos[free], return_index=True)
+            placed = np.flatnonzero(free)[first]
+            self._slots[slot] = codes[placed]
+            keep = np.ones(codes.size, dtype=bool)
+            keep[placed] = False
+            codes, hashes = codes[keep], hashes[keep]
+            probe += 1
+        self._max_probe = max(self._max_probe, probe)
+
+    def _coerce(self, values):
+        """Cast values so that equal keys and values hash identically."""
+        values = np.asarray(values)
+        if values.dtype == self.keys.dtype:
+            return values
+        if self.keys.dtype.kind == "O":
+            return values.astype(object)
+        if (
+            values.dtype.kind in "biuf"
+            and self.keys.dtype.kind in "biuf"
+            and np.can_cast(values.dtype, self.keys.dtype, "same_kind")
+            and not _narrows_integers(values.dtype, self.keys.dtype)
+        ):
+            return values.astype(self.keys.dtype)
+        return values
+
+    def lookup(self, values, missing=-1):
+        """
+        Return the code of each value, or ``missing`` for unknown values.
+
+        Parameters
+        ----------
+        values : array-like of shape (n,)
+        missing : int, default=-1
+            Reserved code returned for values that are not in the index.
+
+        Returns
+        -------
+        codes : numpy.ndarray of shape (n,), dtype int64
+        """
+        values = self._coerce(values)
+        out = np.full(len(values), missing, dtype=np.int64)
+        if len(self.keys) == 0 or len(values) == 0:
+            return out
+        if values.dtype.kind == "f" and self.keys.dtype.kind in "iu":
+            # integral floats are equal to the integer keys of same value,
+            # other floats (fractional, NaN, out of range) are unknown
+            info = np.iinfo(self.keys.dtype)
+            integral = (
+                (values == np.floor(values))
+                & (values >= info.min)
+                & (values < info.max + 1.0)
+            )
+            out[integral] = self.lookup(
+                values[integral].astype(self.keys.dtype), missing
+            )
+            return out
+        if _narrows_integers(values.dtype, self.keys.dtype):
+            # integers out of the range of the keys would wrap around when
+            # cast, they are unknown
+            cast = values.astype(self.keys.dtype)
+            exact = (cast.astype(values.dtype) == values) & (
+                (cast < 0) == (values < 0)
+            )
+            out[exact] = self.lookup(cast[exact], missing)
+            return out
+        mask = np.uint64(len(self._slots) - 1)
+        hashes = hash_values(values)
+        pending = np.arange(len(values))
+        for probe in range(self._max_probe):
+            pos = ((hashes + np.uint64(probe)) & mask).astype(np.int64)
+            code = self._slots[pos]
+            occupied = code != _EMPTY
+            hit = occupied.copy()
+            hit[occupied] = (
+                self.keys[code[occupied]] == values[pending[occupied]]
+            )
+            out[pending[hit]] = code[hit]
+            keep = occupied & ~hit
+            pending, hashes = pending[keep], hashes[keep]
+            if not pending.size:
+                break
+        return out
+
+    def contains(self, values):
+        """Boolean mask of the values present in the index."""
+        return self.lookup(values) != -1
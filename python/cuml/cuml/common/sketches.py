@@ -0,0 +1,372 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Mergeable summaries of data streams.
+
+The summaries in this module can be updated chunk by chunk and merged with
+summaries built independently (e.g. on other partitions), the result being
+the same as a summary built over the concatenated data up to the documented
+approximation. They work on NumPy or CuPy arrays, following the array type
+of the data they are fed, except for :class:`CountMinSketch` which hashes
+its items on host.
+"""
+
+from cuml.common.hash_index import _mix64, hash_values
+from cuml.internals.safe_imports import cpu_only_import, gpu_only_import
+
+np = cpu_only_import("numpy")
+cp = gpu_only_import("cupy")
+
+
+def _get_namespace(*arrays):
+    """Return the array module (cupy or numpy) of the given arrays."""
+    for a in arrays:
+        if a is not None and hasattr(a, "__cuda_array_interface__"):
+            return cp
+    return np
+
+
+class QuantileSketch:
+    """
+    Weighted quantile summary of each column of a stream of 2D arrays.
+
+    Each column is summarized by at most ``size`` weighted points, kept in
+    a ``(size, n_columns)`` pair of arrays so that all columns are updated
+    with a handful of vectorized operations. As long as a column received
+    fewer than ``size`` points the summary holds them exactly. Beyond that,
+    points are compacted into ``size`` bins of about equal weight, each
+    represented by its weighted median, which keeps the rank error of a
+    quantile query around ``total_weight / size`` per compaction level.
+
+    Parameters
+    ----------
+    n_columns : int
+        Number of columns summarized.
+    size : int, default=2048
+        Maximum number of points kept per column.
+    """
+
+    def __init__(self, n_columns, size=2048):
+        if size < 2:
+            raise ValueError("size must be at least 2, got {}".format(size))
+        self.n_columns = n_columns
+        self.size = size
+        self.values = None
+        self.weights = None
+
+    @property
+    def total_weight(self):
+        """Total weight of the points seen, per column."""
+        if self.weights is None:
+            return np.zeros(self.n_columns)
+        return self.weights.sum(axis=0)
+
+    def update(self, values, weights=None):
+        """
+        Add the points of a 2D chunk to the summary.
+
+        Parameters
+        ----------
+        values : array of shape (n_points, n_columns)
+        weights : array of shape (n_points, n_columns), default=None
+            Non-negative integer weights of the points, 1 if None. Points
+            with a zero weight are ignored.
+        """
+        xp = _get_namespace(values)
+        values = xp.asarray(values, dtype=xp.float64)
+        if weights is None:
+            weights = xp.ones(values.shape, dtype=xp.float64)
+        else:
+            weights = xp.asarray(weights, dtype=xp.float64)
+        self._add(values, weights)
+        return self
+
+    def merge(self, other):
+        """Merge the summary of another chunk of the same columns."""
+        if other.n_columns != self.n_columns:
+            raise ValueError(
+                "Cannot merge a sketch of {} columns into a sketch of {} "
+                "columns".format(other.n_columns, self.n_columns)
+            )
+        if other.values is not None:
+            self._add(other.values, other.weights)
+        return self
+
+    def _add(self, values, weights):
+        if self.values is not None:
+            xp = _get_namespace(self.values, values)
+            values = xp.concatenate([xp.asarray(self.values), values])
+            weights = xp.concatenate([xp.asarray(self.weights), weights])
+        self.values, self.weights = self._sorted(values, weights)
+        if len(self.values) > self.size:
+            self._compact()
+
+    @staticmethod
+    def _sorted(values, weights):
+        xp = _get_namespace(values)
+        # points without weight are sorted last and never selected
+        values = xp.where(weights > 0, values, xp.nan)
+        order = xp.argsort(values, axis=0)
+        return (
+            xp.take_along_axis(values, order, axis=0),
+            xp.take_along_axis(weights, order, axis=0),
+        )
+
+    def _compact(self):
+        """Reduce each column to ``size`` bins of about equal weight."""
+        xp = _get_namespace(self.values)
+        values, weights = self.values, self.weights
+        n_points, n_columns = values.shape
+        cum = xp.cumsum(weights, axis=0)
+        total = cum[-1]
+        scale = xp.where(total > 0, self.size / xp.maximum(total, 1), 0)
+        bins = xp.floor((cum - weights) * scale).astype(xp.int64)
+        bins = xp.minimum(bins, self.size - 1)
+
+        cols = xp.broadcast_to(xp.arange(n_columns), bins.shape)
+        cells = (bins * n_columns + cols).ravel()
+        n_cells = self.size * n_columns
+        bin_weight = xp.bincount(
+            cells, weights=weights.ravel(), minlength=n_cells
+        ).reshape(self.size, n_columns)
+        bin_start = xp.cumsum(bin_weight, axis=0) - bin_weight
+
+        # each bin is represented by the point straddling its weighted
+        # middle, which is unique for a non-empty bin
+        middle = (bin_start + bin_weight / 2)[bins, cols]
+        chosen = (weights > 0) & (cum - weights < middle) & (cum >= middle)
+        bin_value = xp.full(n_cells, xp.nan)
+        bin_value[cells[chosen.ravel()]] = values.ravel()[chosen.ravel()]
+
+        self.values = bin_value.reshape(self.size, n_columns)
+        self.weights = bin_weight
+
+    def _value_at_rank(self, rank):
+        """Value of the point holding the given 0-based rank, per column."""
+        xp = _get_namespace(self.values)
+        cum = xp.cumsum(self.weights, axis=0)
+        idx = (cum <= rank).sum(axis=0)
+        idx = xp.minimum(idx, len(self.values) - 1)
+        return self.values[idx, xp.arange(self.n_columns)]
+
+    def median(self):
+        """
+        Median of each column, NaN for the columns without any point.
+
+        For an even number of points the two middle values are averaged.
+        The result is exact while no compaction happened.
+        """
+        if self.values is None:
+            return np.full(self.n_columns, np.nan)
+        xp = _get_namespace(self.values)
+        total = self.weights.sum(axis=0)
+        low = self._value_at_rank(xp.floor((total - 1) / 2))
+        high = self._value_at_rank(xp.floor(total / 2))
+        return xp.where(total > 0, (low + high) / 2, xp.nan)
+
+    def quantile(self, q):
+        """
+        Lower ``q``-quantile of each column, NaN for empty columns.
+
+        Parameters
+        ----------
+        q : float in [0, 1]
+        """
+        if self.values is None:
+            return np.full(self.n_columns, np.nan)
+        xp = _get_namespace(self.values)
+        total = self.weights.sum(axis=0)
+        value = self._value_at_rank(xp.floor(q * xp.maximum(total - 1, 0)))
+        return xp.where(total > 0, value, xp.nan)
+
+
+class FrequentItemsSketch:
+    """
+    Misra-Gries summary of the most frequent items of a 1D stream.
+
+    At most ``size`` items are tracked with a count that under-estimates
+    their true count by at most ``n / (size + 1)``, ``n`` being the total
+    count seen. When fewer than ``size`` distinct items have been seen, the
+    counts are exact. Summaries of disjoint chunks can be merged with the
+    same guarantee.
+
+    Parameters
+    ----------
+    size : int, default=1024
+        Maximum number of items tracked.
+    """
+
+    def __init__(self, size=1024):
+        if size < 1:
+            raise ValueError("size must be at least 1, got {}".format(size))
+        self.size = size
+        self.items = None
+        self.counts = None
+
+    def update(self, items, counts=None):
+        """
+        Add a chunk of items to the summary.
+
+        Parameters
+        ----------
+        items : array of shape (n_items,)
+        counts : array of shape (n_items,), default=None
+            Number of occurrences of each item, 1 if None.
+        """
+        xp = _get_namespace(items)
+        items = xp.asarray(items)
+        if counts is None:
+            counts = xp.ones(len(items), dtype=xp.float64)
+        self._add(items, xp.asarray(counts, dtype=xp.float64))
+        return self
+
+    def merge(self, other):
+        """Merge the summary of another, disjoint, chunk of the stream."""
+        if other.items is not None:
+            self._add(other.items, other.counts)
+        return self
+
+    def _add(self, items, counts):
+        xp = _get_namespace(items)
+        if self.items is not None:
+            items = xp.concatenate([xp.asarray(self.items), items])
+            counts = xp.concatenate([xp.asarray(self.counts), counts])
+        if not len(items):
+            return
+        items, inverse = xp.unique(items, return_inverse=True)
+        counts = xp.bincount(inverse.ravel(), weights=counts)
+        if len(items) > self.size:
+            # subtracting the (size + 1)-th largest count from every item
+            # keeps at most `size` of them, see Agarwal et al.,
+            # "Mergeable summaries", PODS 2012
+            kth = len(counts) - self.size - 1
+            counts = counts - xp.partition(counts, kth)[kth]
+            keep = counts > 0
+            items, counts = items[keep], counts[keep]
+        self.items, self.counts = items, counts
+
+    def most_frequent(self, default=None):
+        """
+        Item with the largest count, the smallest one in case of ties.
+
+        Returns ``default`` if no item has been seen.
+        """
+        if self.items is None or not len(self.items):
+            return default
+        # items are kept sorted by `unique`, argmax returns the first max
+        return self.items[int(self.counts.argmax())]
+
+
+class CountMinSketch:
+    """
+    Count-min sketch of the counts of the items of a 1D stream.
+
+    Counts are accumulated in a ``(depth, width)`` table, each row being
+    indexed by an independent hash of the items, so that the memory used
+    does not depend on the number of distinct items. The estimated count of
+    an item, the minimum of its cells, never under-estimates its true count
+    and over-estimates it by at most ``e * n / width`` with probability at
+    least ``1 - exp(-depth)``, ``n`` being the total count seen. Sketches of
+    the same shape and seed can be merged.
+
+    Parameters
+    ----------
+    width : int, default=65536
+        Number of cells per row.
+    depth : int, default=4
+        Number of rows, i.e. of independent hash functions.
+    seed : int, default=0
+        Seed of the hash functions.
+    """
+
+    def __init__(self, width=65536, depth=4, seed=0):
+        if width < 1 or depth < 1:
+            raise ValueError(
+                "width and depth must be at least 1, got {} and {}".format(
+                    width, depth
+                )
+            )
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        self.table = np.zeros((depth, width), dtype=np.float64)
+        self._seeds = np.random.default_rng(seed).integers(
+            0, np.iinfo(np.uint64).max, size=depth, dtype=np.uint64
+        )
+
+    @property
+    def total_count(self):
+        """Total count of the items seen."""
+        return self.table[0].sum()
+
+    def _cells(self, items):
+        hashes = hash_values(items)
+        with np.errstate(over="ignore"):
+            return [
+                (_mix64(hashes ^ seed) % np.uint64(self.width)).astype(
+                    np.int64
+                )
+                for seed in self._seeds
+            ]
+
+    def update(self, items, counts=None):
+        """
+        Add a chunk of items to the summary.
+
+        Parameters
+        ----------
+        items : array of shape (n_items,)
+        counts : array of shape (n_items,), default=None
+            Number of occurrences of each item, 1 if None.
+        """
+        items = np.asarray(items)
+        if counts is not None:
+            counts = np.asarray(counts, dtype=np.float64)
+        for row, cells in zip(self.table, self._cells(items)):
+            row += np.bincount(cells, weights=counts, minlength=self.width)
+        return self
+
+    def merge(self, other):
+        """Merge the summary of another chunk of the stream."""
+        if (other.width, other.depth, other.seed) != (
+            self.width,
+            self.depth,
+            self.seed,
+        ):
+            raise ValueError(
+                "Only count-min sketches with the same width, depth and "
+                "seed can be merged"
+            )
+        self.table += other.table
+        return self
+
+    def query(self, items):
+        """
+        Estimated count of each item.
+
+        Parameters
+        ----------
+        items : array of shape (n_items,)
+
+        Returns
+        -------
+        counts : numpy.ndarray of shape (n_items,)
+        """
+        items = np.asarray(items)
+        estimates = np.full(len(items), np.inf)
+        for row, cells in zip(self.table, self._cells(items)):
+            np.minimum(estimates, row[cells], out=estimates)
+        return estimates
@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2020-2023, NVIDIA CORPORATION.
+# Copyright (c) 2020-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -96,12 +96,31 @@ def _map_l2_norm_kernel(dtype):
     return cuda_kernel_factory(map_kernel_str, dtype, "map_l2_norm_kernel")
 
 
+def _csr_row_normalize_host(X, norm):
+    """Row normalize a scipy csr matrix in place"""
+    n_rows = X.shape[0]
+    rows = np.repeat(np.arange(n_rows), np.diff(X.indptr))
+    if norm == "l1":
+        values = np.abs(X.data)
+    else:
+        values = np.square(X.data)
+    norms = np.bincount(rows, weights=values, minlength=n_rows)
+    if norm == "l2":
+        norms = np.sqrt(norms)
+    norms[norms == 0.0] = 1.0
+    X.data /= norms[rows].astype(X.dtype, copy=False)
+    return X
+
+
 @cuml.internals.api_return_any()
 def csr_row_normalize_l1(X, inplace=True):
     """Row normalize for csr matrix using the l1 norm"""
     if not inplace:
         X = X.copy()
 
+    if isinstance(X, csr_matrix):
+        return _csr_row_normalize_host(X, "l1")
+
     kernel = _map_l1_norm_kernel((X.dtype, X.indices.dtype, X.indptr.dtype))
     kernel(
         (math.ceil(X.shape[0] / 32),),
@@ -118,6 +137,9 @@ def csr_row_normalize_l2(X, inplace=True):
     if not inplace:
         X = X.copy()
 
+    if isinstance(X, csr_matrix):
+        return _csr_row_normalize_host(X, "l2")
+
     kernel = _map_l2_norm_kernel((X.dtype, X.indices.dtype, X.indptr.dtype))
     kernel(
         (math.ceil(X.shape[0] / 32),),
@@ -269,14 +291,20 @@ def extract_knn_infos(knn_info, n_neighbors):
               shape (n_samples, n_neighbors)
             - Pairwise distances dense array of shape (n_samples, n_samples)
             - KNN graph sparse array (preferably CSR/COO)
+            - :class:`cuml.neighbors.KNNGraph`, truncated to n_neighbors
         n_neighbors: number of nearest neighbors
     """
+    from cuml.neighbors.knn_graph import KNNGraph
+
     if knn_info is None:
         # no KNN was provided
         return None
 
     deepcopy = False
-    if isinstance(knn_info, tuple):
+    if isinstance(knn_info, KNNGraph):
+        graph = knn_info.truncate(n_neighbors)
+        results = graph.indices, graph.distances
+    elif isinstance(knn_info, tuple):
         # dists and indices provided as a tuple
         results = knn_info
     else:
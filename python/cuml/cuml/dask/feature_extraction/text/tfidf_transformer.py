@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2020-2023, NVIDIA CORPORATION.
+# Copyright (c) 2020-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -110,8 +110,7 @@ class TfidfTransformer(BaseEstimator, DelayedTransformMixin):
         modela = first(models)
         if modela.use_idf:
             for model in models[1:]:
-                modela.__n_samples += model.__n_samples
-                modela.__df += model.__df
+                modela._merge_doc_stats(model)
         return modela
 
     @staticmethod
@@ -0,0 +1,727 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Host (CPU) tokenization and counting engine of the text vectorizers.
+
+Documents are held as an Arrow string column and split into blocks that are
+analyzed concurrently on a thread pool: the Arrow compute kernels and the
+NumPy sorts doing the heavy lifting release the GIL. Each block is turned
+into a flat buffer of tokens with the id of the document they come from,
+encoded against a block-local vocabulary through a hash table and counted
+into a block-local CSR matrix. The blocks are finally remapped onto the
+global vocabulary and stacked into a single ``scipy.sparse.csr_matrix``.
+The hashing vectorizer instead maps the terms of each block to their
+column through a vectorized MurmurHash3, so that the blocks are
+independent and can be streamed.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from cuml.internals.safe_imports import cpu_only_import
+
+np = cpu_only_import("numpy")
+pd = cpu_only_import("pandas")
+pa = cpu_only_import("pyarrow")
+pc = cpu_only_import("pyarrow.compute")
+sp = cpu_only_import("scipy.sparse")
+
+
+# Same token definition as the device preprocessing: runs of alphanumeric
+# characters and underscores, i.e. sklearn's default token_pattern.
+_NON_WORD_PATTERN = r"[^\p{L}\p{N}_]+"
+
+_BLOCK_SIZE = 8192
+
+
+def to_arrow_strings(docs):
+    """
+    Convert a column of documents to an Arrow ``large_string`` array.
+
+    Accepts pandas, cuDF and Arrow columns as well as any sequence of
+    strings. Missing documents are replaced with empty strings.
+    """
+    if isinstance(docs, (pa.Array, pa.ChunkedArray)):
+        arr = docs
+    elif isinstance(docs, pd.Series):
+        arr = pa.array(docs, from_pandas=True)
+    elif hasattr(docs, "to_arrow"):
+        # cudf.Series
+        arr = docs.to_arrow()
+    else:
+        arr = pa.array(list(docs), type=pa.large_string(), from_pandas=True)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    if pa.types.is_dictionary(arr.type):
+        arr = arr.dictionary_decode()
+    return pc.fill_null(arr.cast(pa.large_string()), "")
+
+
+def _to_arrow(values):
+    if isinstance(values, (pa.Array, pa.ChunkedArray)):
+        arr = values
+    elif isinstance(values, pd.Series):
+        arr = pa.array(values, from_pandas=True)
+    elif hasattr(values, "to_arrow"):
+        # cudf.Series
+        arr = values.to_arrow()
+    else:
+        arr = pa.array(list(values), from_pandas=True)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    return arr
+
+
+def _token_type(value_type):
+    """Normalized Arrow type of pre-tokenized tokens: int64 or strings."""
+    if pa.types.is_integer(value_type):
+        return pa.int64()
+    if pa.types.is_string(value_type) or pa.types.is_large_string(value_type):
+        return pa.large_string()
+    raise TypeError(
+        "Pre-tokenized documents must hold string or integer tokens, got "
+        "{}".format(value_type)
+    )
+
+
+def to_arrow_token_lists(docs, ngram_range=(1, 1)):
+    """
+    Convert pre-tokenized documents to an Arrow ``large_list`` array.
+
+    Accepts Arrow (or cuDF) ``list<string>`` and ``list<integer>`` columns,
+    any sequence of lists of tokens, or an ``(offsets, values)`` pair of
+    arrays, the tokens of document ``i`` being
+    ``values[offsets[i]:offsets[i + 1]]``. Tokens are cast to
+    ``large_string`` or ``int64``. Missing documents have no tokens.
+
+    Raises a ValueError for n-grams of integer tokens, which have no string
+    representation.
+    """
+    if isinstance(docs, tuple):
+        offsets, values = docs
+        offsets = pa.array(np.asarray(offsets, dtype=np.int64))
+        values = pa.array(values)
+        arr = pa.LargeListArray.from_arrays(
+            offsets, values.cast(_token_type(values.type))
+        )
+    else:
+        arr = _to_arrow(docs)
+        if not (
+            pa.types.is_list(arr.type) or pa.types.is_large_list(arr.type)
+        ):
+            raise TypeError(
+                "analyzer='pretokenized' expects lists of tokens, got "
+                "documents of type {}".format(arr.type)
+            )
+        value_type = arr.type.value_type
+        if pa.types.is_dictionary(value_type):
+            value_type = value_type.value_type
+        arr = arr.cast(pa.large_list(_token_type(value_type)))
+    if pa.types.is_integer(arr.type.value_type) and ngram_range[1] > 1:
+        raise ValueError(
+            "n-grams of integer tokens are not supported, got "
+            "ngram_range={}".format(ngram_range)
+        )
+    return arr
+
+
+def to_arrow_terms(terms):
+    """
+    Convert a vocabulary of pre-tokenized terms to the Arrow type of the
+    tokens of `to_arrow_token_lists`.
+    """
+    arr = _to_arrow(terms)
+    if pa.types.is_dictionary(arr.type):
+        arr = arr.dictionary_decode()
+    return arr.cast(_token_type(arr.type))
+
+
+def to_pandas_terms(terms):
+    """pandas Series of an Arrow array of terms, strings as objects."""
+    if pa.types.is_integer(terms.type):
+        return pd.Series(terms.to_numpy(zero_copy_only=False))
+    return pd.Series(terms.to_pylist(), dtype=object)
+
+
+def _large_scalar(value):
+    return pa.scalar(value, type=pa.large_string())
+
+
+def _encode(tokens, sort=True):
+    """
+    Encode tokens against their sorted unique values.
+
+    Returns
+    -------
+    terms : pyarrow.Array
+        Sorted unique tokens, in order of first appearance if not ``sort``.
+    codes : numpy.ndarray of int64
+        Position of each token in ``terms``.
+    """
+    encoded = pc.dictionary_encode(tokens)
+    terms = encoded.dictionary
+    if not sort:
+        return terms, encoded.indices.to_numpy(zero_copy_only=False).astype(
+            np.int64
+        )
+    order = pc.sort_indices(terms).to_numpy()
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    codes = rank[encoded.indices.to_numpy(zero_copy_only=False)]
+    return terms.take(pa.array(order)), codes
+
+
+def _split(strings, doc_ids, pattern=None, delimiter=" ", min_len=1):
+    """
+    Tokenize strings into a flat array of tokens and their document ids.
+
+    Tokens are separated by runs matching ``pattern`` if given, by
+    ``delimiter`` otherwise. Tokens shorter than ``min_len`` characters
+    are dropped.
+    """
+    if pattern is not None:
+        lists = pc.split_pattern_regex(strings, pattern=pattern)
+    else:
+        lists = pc.split_pattern(strings, pattern=delimiter)
+    lengths = pc.list_value_length(lists).to_numpy(zero_copy_only=False)
+    tokens = pc.list_flatten(lists)
+    doc_ids = np.repeat(doc_ids, lengths)
+    keep = pc.greater_equal(pc.utf8_length(tokens), min_len)
+    return tokens.filter(keep), doc_ids[keep.to_numpy(zero_copy_only=False)]
+
+
+def _encode_word_ngrams(
+    tokens, doc_ids, ngram_range, stop_words=None, sort=True
+):
+    """
+    Encode the word n-grams of a flat array of tokens.
+
+    Tokens are dictionary encoded once and everything downstream works on
+    their integer ids: stop words are dropped by looking up the distinct
+    tokens of the block in the hashed ``stop_words`` set, and the n-grams
+    are deduplicated as tuples of ids. Strings are only built for the
+    distinct n-grams, never for each of their occurrences.
+
+    Returns
+    -------
+    encodings : list of ``(terms, codes, doc_ids)`` triplets
+        One per n-gram size, see `_encode`.
+    """
+    encoded = pc.dictionary_encode(tokens)
+    words = encoded.dictionary
+    ids = encoded.indices.to_numpy(zero_copy_only=False).astype(np.int64)
+    if stop_words is not None and len(words):
+        is_stop = pc.is_in(words, value_set=stop_words)
+        keep = ~is_stop.to_numpy(zero_copy_only=False)[ids]
+        ids, doc_ids = ids[keep], doc_ids[keep]
+    bits = max(int(len(words)).bit_length(), 1)
+    min_n, max_n = ngram_range
+    encodings = []
+    for n in range(min_n, max_n + 1):
+        n_windows = max(len(ids) - n + 1, 0)
+        same_doc = doc_ids[:n_windows] == doc_ids[n - 1 : n - 1 + n_windows]
+        windows = [ids[i : i + n_windows][same_doc] for i in range(n)]
+        if n * bits <= 64:
+            # rolling key of base 2**bits, exact as it fits in 64 bits
+            keys = np.zeros(len(windows[0]), dtype=np.uint64)
+            for window in windows:
+                keys <<= np.uint64(bits)
+                keys |= window.astype(np.uint64)
+            unique_keys, codes = _encode(pa.array(keys), sort=False)
+            unique_keys = unique_keys.to_numpy()
+            mask = np.uint64((1 << bits) - 1)
+            first_ids = [
+                ((unique_keys >> np.uint64(bits * (n - 1 - i))) & mask)
+                for i in range(n)
+            ]
+        else:
+            first, codes = _unique_rows(np.stack(windows, axis=1), bits=bits)
+            first_ids = [window[first] for window in windows]
+        parts = [words.take(pa.array(first_ids[i])) for i in range(n)]
+        if n == 1:
+            terms = parts[0]
+        else:
+            terms = pc.binary_join_element_wise(*parts, _large_scalar(" "))
+        if sort:
+            order = pc.sort_indices(terms).to_numpy()
+            rank = np.empty(len(order), dtype=np.int64)
+            rank[order] = np.arange(len(order))
+            terms, codes = terms.take(pa.array(order)), rank[codes]
+        encodings.append((terms, codes, doc_ids[:n_windows][same_doc]))
+    return encodings
+
+
+def _codepoints(strings):
+    """Code points of the concatenation of strings."""
+    offsets = np.frombuffer(strings.buffers()[1], dtype=np.int64)
+    offsets = offsets[strings.offset : strings.offset + len(strings) + 1]
+    data = strings.buffers()[2]
+    if data is None:
+        return np.empty(0, dtype=np.uint32)
+    text = data.to_pybytes()[offsets[0] : offsets[-1]].decode("utf-8")
+    return np.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+
+
+def _rotl32(x, r):
+    return (x << np.uint32(r)) | (x >> np.uint32(32 - r))
+
+
+def murmurhash3_32(strings, seed=0):
+    """
+    Signed 32-bit MurmurHash3 of the UTF-8 bytes of each string.
+
+    Vectorized equivalent of ``sklearn.utils.murmurhash3_32`` (the hash
+    used by sklearn's ``HashingVectorizer``): the 4-byte blocks of all the
+    strings are mixed at once, the longest strings being processed first so
+    that the strings still having a block to mix form a prefix.
+
+    Parameters
+    ----------
+    strings : pyarrow.Array of strings
+    seed : int, default=0
+
+    Returns
+    -------
+    hashes : numpy.ndarray of shape (len(strings),), dtype int32
+    """
+    c1, c2 = np.uint32(0xCC9E2D51), np.uint32(0x1B873593)
+    strings = strings.cast(pa.large_string())
+    offsets = np.frombuffer(strings.buffers()[1], dtype=np.int64)
+    offsets = offsets[strings.offset : strings.offset + len(strings) + 1]
+    buffer = strings.buffers()[2]
+    data = np.zeros(offsets[-1] + 8, dtype=np.uint8)
+    if buffer is not None:
+        data[: offsets[-1]] = np.frombuffer(buffer, np.uint8)[: offsets[-1]]
+    # little-endian words starting at each of the 4 possible alignments,
+    # the word starting at byte p being words[p % 4, p // 4]
+    n_words = len(data) // 4 - 1
+    words = np.stack([data[a : a + 4 * n_words].view("<u4") for a in range(4)])
+    starts, lengths = offsets[:-1], np.diff(offsets)
+    n_blocks = lengths // 4
+
+    order = np.argsort(-n_blocks, kind="stable")
+    h = np.full(len(strings), seed, dtype=np.uint32)
+    sorted_starts = starts[order]
+    sorted_h = h[order]
+    n_active = np.bincount(n_blocks, minlength=1)[::-1].cumsum()[::-1]
+    for block in range(1, len(n_active)):
+        m = n_active[block]
+        pos = sorted_starts[:m] + 4 * (block - 1)
+        k = _rotl32(words[pos & 3, pos >> 2] * c1, 15) * c2
+        hm = _rotl32(sorted_h[:m] ^ k, 13)
+        sorted_h[:m] = hm * np.uint32(5) + np.uint32(0xE6546B64)
+    h[order] = sorted_h
+
+    tail = lengths % 4
+    tail_starts = starts + 4 * n_blocks
+    has = tail > 0
+    tail_mask = (np.uint32(1) << (8 * tail[has]).astype(np.uint32)) - 1
+    pos = tail_starts[has]
+    k = words[pos & 3, pos >> 2] & tail_mask.astype(np.uint32)
+    h[has] ^= _rotl32(k * c1, 15) * c2
+
+    h ^= lengths.astype(np.uint32)
+    h ^= h >> np.uint32(16)
+    h *= np.uint32(0x85EBCA6B)
+    h ^= h >> np.uint32(13)
+    h *= np.uint32(0xC2B2AE35)
+    h ^= h >> np.uint32(16)
+    return h.view(np.int32)
+
+
+def _unique_rows(windows, bits=21):
+    """
+    Sorted unique rows of a 2D array of non-negative integers below
+    ``2**bits``, as in ``np.unique`` with ``return_index`` and
+    ``return_inverse``.
+
+    Rows are packed as many values per uint64 word as fit, most significant
+    first, and compared word by word: the order of the rows is the
+    lexicographic order of their values. The default packs 3 code points
+    per word.
+    """
+    n_rows, n = windows.shape
+    per_word = max(64 // bits, 1)
+    words = []
+    for start in range(0, n, per_word):
+        word = np.zeros(n_rows, dtype=np.uint64)
+        for i in range(start, min(start + per_word, n)):
+            word <<= np.uint64(bits)
+            word |= windows[:, i].astype(np.uint64)
+        words.append(word)
+    if len(words) == 1:
+        _, index, inverse = np.unique(
+            words[0], return_index=True, return_inverse=True
+        )
+        return index, inverse.ravel()
+    # np.lexsort sorts by the last key first
+    order = np.lexsort(words[::-1])
+    new_row = np.zeros(n_rows, dtype=bool)
+    new_row[:1] = True
+    for word in words:
+        sorted_word = word[order]
+        new_row[1:] |= sorted_word[1:] != sorted_word[:-1]
+    inverse = np.empty(n_rows, dtype=np.int64)
+    inverse[order] = np.cumsum(new_row) - 1
+    return order[new_row], inverse
+
+
+def _char_ngrams(strings, doc_ids, n, keep_short=False):
+    """
+    Character n-grams of each string, encoded as in :func:`_encode`.
+
+    The code points of all strings are laid out in a single buffer and each
+    n-gram is a fixed-width window of it, so that n-grams are deduplicated
+    by sorting integer keys rather than Python strings. If ``keep_short``,
+    strings shorter than ``n`` characters produce a single n-gram,
+    themselves.
+    """
+    lengths = pc.utf8_length(strings).to_numpy(zero_copy_only=False)
+    lengths = lengths.astype(np.int64)
+    cps = _codepoints(strings)
+    starts = np.cumsum(lengths) - lengths
+    n_windows = np.maximum(lengths - n + 1, 0)
+    if keep_short:
+        n_windows[(lengths > 0) & (lengths < n)] = 1
+    total = int(n_windows.sum())
+    window_starts = np.arange(total) + np.repeat(
+        starts - (np.cumsum(n_windows) - n_windows), n_windows
+    )
+    ends = np.repeat(starts + lengths, n_windows)
+    # windows of short strings are padded with NUL code points, which sort
+    # before any character and are stripped when converting back to str
+    windows = np.zeros((total, n), dtype=np.uint32)
+    for i in range(n):
+        positions = window_starts + i
+        inside = positions < ends
+        windows[inside, i] = cps[positions[inside]]
+    index, codes = _unique_rows(windows)
+    terms = np.ascontiguousarray(windows[index]).view("U%d" % n)
+    return (
+        pa.array(terms.ravel(), type=pa.large_string()),
+        codes.astype(np.int64, copy=False),
+        np.repeat(doc_ids, n_windows),
+    )
+
+
+def _merge_encodings(encodings, sort=True):
+    """Merge ``(terms, codes, doc_ids)`` triplets into a single one."""
+    if len(encodings) == 1:
+        return encodings[0]
+    terms = pa.concat_arrays([terms for terms, _, _ in encodings])
+    merged, remap = _encode(terms, sort=sort)
+    codes, offset = [], 0
+    for block_terms, block_codes, _ in encodings:
+        codes.append(remap[offset : offset + len(block_terms)][block_codes])
+        offset += len(block_terms)
+    doc_ids = np.concatenate([doc_ids for _, _, doc_ids in encodings])
+    return merged, np.concatenate(codes), doc_ids
+
+
+def _count(codes, doc_ids, n_docs, n_terms):
+    """CSR matrix of the number of occurrences of each code per document."""
+    keys, counts = np.unique(doc_ids * n_terms + codes, return_counts=True)
+    rows = keys // max(n_terms, 1)
+    indptr = np.zeros(n_docs + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_docs), out=indptr[1:])
+    return sp.csr_matrix(
+        (counts, keys - rows * n_terms, indptr), shape=(n_docs, n_terms)
+    )
+
+
+def _remap_columns(X, mapping, n_features, dtype):
+    """
+    Relabel the columns of ``X`` through ``mapping``, dropping the columns
+    mapped to -1.
+    """
+    indices = mapping[X.indices]
+    data = X.data
+    indptr = X.indptr
+    keep = indices >= 0
+    if not keep.all():
+        rows = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))
+        indices, data = indices[keep], data[keep]
+        indptr = np.zeros_like(X.indptr)
+        np.cumsum(
+            np.bincount(rows[keep], minlength=X.shape[0]), out=indptr[1:]
+        )
+    X = sp.csr_matrix(
+        (data.astype(dtype), indices, indptr), shape=(X.shape[0], n_features)
+    )
+    X.sort_indices()
+    return X
+
+
+def imap_ordered(func, batches, n_workers=None):
+    """
+    Lazily apply ``func`` to an iterable of batches on a thread pool.
+
+    Results are yielded in order. At most two batches per worker are in
+    flight, so that the memory used does not depend on the length of
+    ``batches``.
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers <= 1:
+        for batch in batches:
+            yield func(batch)
+        return
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        pending = deque()
+        for batch in batches:
+            pending.append(executor.submit(func, batch))
+            if len(pending) >= 2 * n_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class HostAnalyzer:
+    """
+    Tokenize and count documents on host.
+
+    The semantics are the ones of the device implementation of the
+    vectorizers:
+
+    - with the default preprocessing, the 'word' analyzer keeps the tokens
+      of at least two alphanumeric (or underscore) characters, after
+      optional lowercasing. A custom preprocessor replaces that step and
+      its output is tokenized on ``delimiter``.
+    - stop words are only removed by the 'word' analyzer. The 'word'
+      analyzer tokenizes each block once and filters stop words and builds
+      n-grams on token ids, see `_encode_word_ngrams`.
+    - the 'char' analyzer builds n-grams over the whole document, the
+      'char_wb' analyzer over the ``delimiter`` separated tokens padded with
+      ``delimiter`` on both sides (except for unigrams).
+    - the 'pretokenized' analyzer takes lists of tokens, see
+      `to_arrow_token_lists`, and counts their n-grams as they are: the
+      preprocessing and the stop words do not apply.
+
+    Parameters
+    ----------
+    analyzer : {'word', 'char', 'char_wb', 'pretokenized'}
+    ngram_range : tuple (min_n, max_n)
+    lowercase : bool
+    preprocessor : callable or None
+        Applied once to the whole column, as a ``pandas.Series``.
+    stop_words : list or None
+    delimiter : str
+    n_workers : int or None
+        Number of threads, all the cores if None.
+    """
+
+    def __init__(
+        self,
+        analyzer="word",
+        ngram_range=(1, 1),
+        lowercase=True,
+        preprocessor=None,
+        stop_words=None,
+        delimiter=" ",
+        n_workers=None,
+    ):
+        self.analyzer = analyzer
+        self.ngram_range = ngram_range
+        self.lowercase = lowercase
+        self.preprocessor = preprocessor
+        self.stop_words = stop_words
+        self.delimiter = delimiter
+        self.n_workers = n_workers
+        self._stop_words = None
+        if stop_words is not None:
+            self._stop_words = pa.array(
+                list(stop_words), type=pa.large_string()
+            )
+
+    def _preprocess(self, docs):
+        if self.analyzer == "pretokenized":
+            return to_arrow_token_lists(docs, self.ngram_range)
+        docs = to_arrow_strings(docs)
+        if self.preprocessor is not None:
+            docs = to_arrow_strings(self.preprocessor(docs.to_pandas()))
+        elif self.lowercase:
+            docs = pc.utf8_lower(docs)
+        return docs
+
+    def _tokenize_words(self, docs, doc_ids):
+        if self.preprocessor is None:
+            return _split(docs, doc_ids, pattern=_NON_WORD_PATTERN, min_len=2)
+        return _split(docs, doc_ids, delimiter=self.delimiter)
+
+    def analyze_block(self, docs, sort=True):
+        """
+        Analyze a block of preprocessed documents.
+
+        Returns
+        -------
+        terms : pyarrow.Array
+            Unique n-grams of the block, sorted if ``sort``.
+        counts : scipy.sparse.csr_matrix of shape (len(docs), len(terms))
+            Number of occurrences of each n-gram in each document.
+        """
+        min_n, max_n = self.ngram_range
+        doc_ids = np.arange(len(docs), dtype=np.int64)
+        encodings = []
+        if self.analyzer == "word":
+            tokens, token_doc_ids = self._tokenize_words(docs, doc_ids)
+            encodings = _encode_word_ngrams(
+                tokens,
+                token_doc_ids,
+                self.ngram_range,
+                stop_words=self._stop_words,
+                # several sizes are sorted at once when they are merged
+                sort=sort and min_n == max_n,
+            )
+        elif self.analyzer == "pretokenized":
+            lengths = pc.fill_null(pc.list_value_length(docs), 0)
+            tokens = pc.list_flatten(docs)
+            token_doc_ids = np.repeat(doc_ids, lengths.to_numpy())
+            if tokens.null_count:
+                valid = tokens.is_valid()
+                tokens = tokens.filter(valid)
+                token_doc_ids = token_doc_ids[
+                    valid.to_numpy(zero_copy_only=False)
+                ]
+            encodings = _encode_word_ngrams(
+                tokens,
+                token_doc_ids,
+                self.ngram_range,
+                sort=sort and min_n == max_n,
+            )
+        else:
+            if self.analyzer == "char_wb" and max_n > 1:
+                tokens, token_doc_ids = _split(
+                    docs, doc_ids, delimiter=self.delimiter
+                )
+                delimiter = _large_scalar(self.delimiter)
+                padded = pc.binary_join_element_wise(
+                    delimiter, tokens, delimiter, _large_scalar("")
+                )
+            for n in range(min_n, max_n + 1):
+                if self.analyzer == "char" or n == 1:
+                    encodings.append(_char_ngrams(docs, doc_ids, n))
+                else:
+                    # as in sklearn, a token shorter than the smallest n
+                    # is counted once, as a whole
+                    encodings.append(
+                        _char_ngrams(
+                            padded, token_doc_ids, n, keep_short=n == min_n
+                        )
+                    )
+        terms, codes, doc_ids = _merge_encodings(encodings, sort=sort)
+        return terms, _count(codes, doc_ids, len(docs), len(terms))
+
+    def hash_block(
+        self, docs, n_features, alternate_sign=True, dtype=np.float32
+    ):
+        """
+        Hash the n-grams of a block of preprocessed documents.
+
+        Each n-gram is mapped to column ``abs(h) % n_features`` with sign
+        ``h >= 0`` if ``alternate_sign``, ``h`` being its
+        :func:`murmurhash3_32`, as in sklearn's ``HashingVectorizer``.
+
+        Returns
+        -------
+        X : scipy.sparse.csr_matrix of shape (len(docs), n_features)
+        """
+        # the columns only depend on the hashes, not on the order of terms
+        terms, counts = self.analyze_block(docs, sort=False)
+        # abs in int64 as abs(-2**31) overflows int32
+        h = murmurhash3_32(terms).astype(np.int64)
+        columns = np.abs(h) % n_features
+        data = counts.data.astype(dtype)
+        if alternate_sign:
+            data *= np.where(h >= 0, 1, -1)[counts.indices]
+        X = sp.csr_matrix(
+            (data, columns[counts.indices], counts.indptr),
+            shape=(len(docs), n_features),
+        )
+        X.sum_duplicates()
+        return X
+
+    def hash(
+        self, raw_documents, n_features, alternate_sign=True, dtype=np.float32
+    ):
+        """
+        Hash the n-grams of each document, see `hash_block`.
+
+        Returns
+        -------
+        X : scipy.sparse.csr_matrix of shape (n_docs, n_features)
+        """
+        docs = self._preprocess(raw_documents)
+        blocks = self._map_blocks(
+            lambda block: self.hash_block(
+                block, n_features, alternate_sign, dtype
+            ),
+            docs,
+        )
+        if not blocks:
+            return sp.csr_matrix((0, n_features), dtype=dtype)
+        return sp.vstack(blocks, format="csr")
+
+    def _map_blocks(self, func, docs):
+        blocks = [
+            docs.slice(start, _BLOCK_SIZE)
+            for start in range(0, len(docs), _BLOCK_SIZE)
+        ]
+        n_workers = min(len(blocks), self.n_workers or os.cpu_count() or 1)
+        if n_workers <= 1:
+            return [func(block) for block in blocks]
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(func, blocks))
+
+    def count(self, raw_documents, vocabulary=None, dtype=np.float32):
+        """
+        Count the n-grams of each document.
+
+        Parameters
+        ----------
+        raw_documents : column of str
+        vocabulary : pyarrow.Array or None
+            Terms to count, in column order. If None, all the n-grams are
+            counted in lexicographic order.
+        dtype : numpy dtype
+            Type of the returned matrix.
+
+        Returns
+        -------
+        X : scipy.sparse.csr_matrix of shape (n_docs, len(vocabulary))
+        vocabulary : pyarrow.Array
+        """
+        docs = self._preprocess(raw_documents)
+        # the blocks are remapped onto the sorted vocabulary below, sorting
+        # their terms would be wasted
+        analyze_block = partial(self.analyze_block, sort=False)
+        blocks = self._map_blocks(analyze_block, docs)
+        if not blocks:
+            blocks = [analyze_block(docs)]
+        terms = pa.concat_arrays([terms for terms, _ in blocks])
+        if vocabulary is None:
+            vocabulary = pc.unique(terms)
+            vocabulary = vocabulary.take(pc.sort_indices(vocabulary))
+        mapping = pc.index_in(terms, value_set=vocabulary)
+        mapping = pc.fill_null(mapping, -1).to_numpy(zero_copy_only=False)
+        X, offset = [], 0
+        for block_terms, counts in blocks:
+            block_mapping = mapping[offset : offset + len(block_terms)]
+            X.append(
+                _remap_columns(counts, block_mapping, len(vocabulary), dtype)
+            )
+            offset += len(block_terms)
+        return sp.vstack(X, format="csr"), vocabulary
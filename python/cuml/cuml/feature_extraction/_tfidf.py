@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2019-2023, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,33 +15,36 @@
 #
 from cuml import Base
 from cuml.internals.array import CumlArray
-from cuml.common.sparsefuncs import csr_diag_mul
+from cuml.common.sparsefuncs import _csr_row_normalize_host, csr_diag_mul
 from cuml.common.sparsefuncs import csr_row_normalize_l1, csr_row_normalize_l2
 import cuml.internals
 from cuml.common.exceptions import NotFittedError
-from cuml.internals.safe_imports import gpu_only_import
+from cuml.internals.device_type import DeviceType
+from cuml.internals.global_settings import GlobalSettings
+from cuml.internals.safe_imports import cpu_only_import, gpu_only_import
 
 cp = gpu_only_import("cupy")
 cupyx = gpu_only_import("cupyx")
+np = cpu_only_import("numpy")
+scipy_sparse = cpu_only_import("scipy.sparse")
 
 
 def _sparse_document_frequency(X):
     """Count the number of non-zero values for each feature in sparse X."""
-    if cupyx.scipy.sparse.isspmatrix_csr(X):
-        return cp.bincount(X.indices, minlength=X.shape[1])
+    xp = np if scipy_sparse.issparse(X) else cp
+    if X.format == "csr":
+        return xp.bincount(X.indices, minlength=X.shape[1])
     else:
-        return cp.diff(X.indptr)
+        return xp.diff(X.indptr)
 
 
 def _get_dtype(X):
     """
     Returns the valid dtype for tf-idf transformer
     """
-    import numpy as np
-
     FLOAT_DTYPES = (np.float64, np.float32, np.float16)
 
-    dtype = X.dtype if X.dtype in FLOAT_DTYPES else cp.float32
+    dtype = X.dtype if X.dtype in FLOAT_DTYPES else np.float32
     return dtype
 
 
@@ -121,6 +124,13 @@ class TfidfTransformer(Base):
         The inverse document frequency (IDF) vector; only defined
         if ``use_idf`` is True.
 
+    Notes
+    -----
+    The number of documents and the document frequencies are kept once
+    fitted, so that `partial_fit` can update them with new documents and
+    `merge` can combine transformers fitted on disjoint sets of documents,
+    the idf being the one that `fit` would learn over all of them.
+
     """
 
     def __init__(
@@ -150,36 +160,61 @@ class TfidfTransformer(Base):
         n_features
         df(document frequency)
         """
+        if not hasattr(self, "_host"):
+            self._host = scipy_sparse.issparse(X) or isinstance(X, np.ndarray)
         # Should not have a cost if already sparse
         output_dtype = _get_dtype(X)
         X = self._convert_to_csr(X, output_dtype)
         n_samples, n_features = X.shape
+        # counts are kept exact, the idf is cast to the output dtype
         df = _sparse_document_frequency(X)
-        df = df.astype(output_dtype, copy=False)
-        self.__df = CumlArray(df)
+        self.__df = df if self._host else CumlArray(df)
         self.__n_samples = n_samples
         self.__n_features = n_features
+        self.__dtype = output_dtype
 
         return
 
+    def _get_df(self, host):
+        """Document frequencies as a NumPy (host) or CuPy array."""
+        if self._host:
+            return self.__df if host else cp.asarray(self.__df)
+        df = self.__df.to_output("cupy")
+        return cp.asnumpy(df) if host else df
+
+    def _has_doc_stats(self):
+        return hasattr(self, "_TfidfTransformer__df")
+
+    def _merge_doc_stats(self, other):
+        """Add the document statistics of ``other`` to the ones of self."""
+        if other.__n_features != self.__n_features:
+            raise ValueError(
+                "Cannot merge the statistics of %d features into the "
+                "statistics of %d features"
+                % (other.__n_features, self.__n_features)
+            )
+        df = self._get_df(self._host) + other._get_df(self._host)
+        self.__df = df if self._host else CumlArray(df)
+        self.__n_samples += other.__n_samples
+
     def _set_idf_diag(self):
         """
         Sets idf_diagonal sparse array
         """
         # perform idf smoothing if required
-        df = self.__df.to_output("cupy") + int(self.smooth_idf)
+        xp = np if self._host else cp
+        sparse = scipy_sparse if self._host else cupyx.scipy.sparse
+        df = self._get_df(self._host) + int(self.smooth_idf)
         n_samples = self.__n_samples + int(self.smooth_idf)
 
         # log+1 instead of log makes sure terms with zero idf don't get
         # suppressed entirely.
-        idf = cp.log(n_samples / df) + 1
-        self._idf_diag = cupyx.scipy.sparse.dia_matrix(
+        idf = xp.log(n_samples / df) + 1
+        self._idf_diag = sparse.dia_matrix(
             (idf, 0),
             shape=(self.__n_features, self.__n_features),
-            dtype=df.dtype,
+            dtype=self.__dtype,
         )
-        # Free up memory occupied by below
-        del self.__df
 
     @cuml.internals.api_base_return_any_skipall
     def fit(self, X) -> "TfidfTransformer":
@@ -190,6 +225,7 @@ class TfidfTransformer(Base):
         X : array-like of shape n_samples, n_features
             A matrix of term/token counts.
         """
+        self._host = GlobalSettings().device_type is DeviceType.host
         output_dtype = _get_dtype(X)
         X = self._convert_to_csr(X, output_dtype)
         if self.use_idf:
@@ -198,6 +234,58 @@ class TfidfTransformer(Base):
 
         return self
 
+    @cuml.internals.api_base_return_any_skipall
+    def partial_fit(self, X) -> "TfidfTransformer":
+        """Update the idf vector with a batch of documents.
+
+        The number of documents and the document frequencies are
+        accumulated over all the batches seen since the last `fit`.
+
+        Parameters
+        ----------
+        X : array-like of shape n_samples, n_features
+            A matrix of term/token counts.
+        """
+        if not hasattr(self, "_host"):
+            self._host = GlobalSettings().device_type is DeviceType.host
+        if not self.use_idf:
+            return self
+        if not self._has_doc_stats():
+            self._set_doc_stats(X)
+        else:
+            batch = TfidfTransformer()
+            batch._host = self._host
+            batch._set_doc_stats(X)
+            self._merge_doc_stats(batch)
+        self._set_idf_diag()
+        return self
+
+    def merge(self, other):
+        """Merge a transformer fitted on other documents into this one.
+
+        The idf becomes the one learnt by `fit` over the documents seen by
+        both transformers.
+
+        Parameters
+        ----------
+        other : TfidfTransformer
+            Transformer fitted on the same features.
+
+        Returns
+        -------
+        self
+        """
+        if self.use_idf:
+            for model in (self, other):
+                if not model._has_doc_stats():
+                    raise NotFittedError(
+                        "Only fitted TfidfTransformer instances can be "
+                        "merged."
+                    )
+            self._merge_doc_stats(other)
+            self._set_idf_diag()
+        return self
+
     @cuml.internals.api_base_return_any_skipall
     def transform(self, X, copy=True):
         """Transform a count matrix to a tf or tf-idf representation
@@ -214,21 +302,24 @@ class TfidfTransformer(Base):
         -------
         vectors : array-like of shape (n_samples, n_features)
         """
-        if copy:
-            X = X.copy()
+        if hasattr(self, "_idf_diag"):
+            # follow the memory of the fitted idf
+            self._host = scipy_sparse.issparse(self._idf_diag)
+        elif not hasattr(self, "_host"):
+            self._host = GlobalSettings().device_type is DeviceType.host
 
         dtype = _get_dtype(X)
 
-        X = self._convert_to_csr(X, dtype)
-        if X.dtype != dtype:
-            X = X.astype(dtype)
+        X_csr = self._convert_to_csr(X, dtype)
+        if X_csr.dtype != dtype:
+            X_csr = X_csr.astype(dtype)
+        elif copy and X_csr is X:
+            # conversions already copy X
+            X_csr = X.copy()
+        X = X_csr
 
         n_samples, n_features = X.shape
 
-        if self.sublinear_tf:
-            cp.log(X.data, X.data)
-            X.data += 1
-
         if self.use_idf:
             self._check_is_idf_fitted()
 
@@ -240,6 +331,14 @@ class TfidfTransformer(Base):
                     % (n_features, expected_n_features)
                 )
 
+        if self._host:
+            return self._transform_host(X)
+
+        if self.sublinear_tf:
+            cp.log(X.data, X.data)
+            X.data += 1
+
+        if self.use_idf:
             csr_diag_mul(X, self._idf_diag, inplace=True)
 
         if self.norm:
@@ -250,6 +349,21 @@ class TfidfTransformer(Base):
 
         return X
 
+    def _transform_host(self, X):
+        """
+        Weight and normalize the values of a scipy CSR matrix in place.
+        """
+        data = X.data
+        if self.sublinear_tf:
+            np.log(data, out=data)
+            data += 1
+        if self.use_idf:
+            idf = self._idf_diag.data[0].astype(data.dtype, copy=False)
+            data *= idf[X.indices]
+        if self.norm:
+            _csr_row_normalize_host(X, self.norm)
+        return X
+
     @cuml.internals.api_base_return_any_skipall
     def fit_transform(self, X, copy=True):
         """
@@ -280,6 +394,10 @@ class TfidfTransformer(Base):
 
     def _convert_to_csr(self, X, dtype):
         """Convert array to CSR format if it not sparse nor CSR."""
+        if self._host:
+            if scipy_sparse.issparse(X):
+                return X.tocsr()
+            return scipy_sparse.csr_matrix(np.asarray(X, dtype=dtype))
         if not cupyx.scipy.sparse.isspmatrix_csr(X):
             if not cupyx.scipy.sparse.issparse(X):
                 X = cupyx.scipy.sparse.csr_matrix(X.astype(dtype))
@@ -295,10 +413,17 @@ class TfidfTransformer(Base):
 
     @idf_.setter
     def idf_(self, value):
-        value = cp.asarray(value, dtype=cp.float32)
+        host = getattr(self, "_host", None)
+        if host is None:
+            host = GlobalSettings().device_type is DeviceType.host
+        if host and not hasattr(value, "__cuda_array_interface__"):
+            xp, sparse = np, scipy_sparse
+        else:
+            xp, sparse = cp, cupyx.scipy.sparse
+        value = xp.asarray(value, dtype=np.float32)
         n_features = value.shape[0]
-        self._idf_diag = cupyx.scipy.sparse.dia_matrix(
-            (value, 0), shape=(n_features, n_features), dtype=cp.float32
+        self._idf_diag = sparse.dia_matrix(
+            (value, 0), shape=(n_features, n_features), dtype=np.float32
         )
 
     def get_param_names(self):
@@ -1,4 +1,4 @@
-# Copyright (c) 2020-2023, NVIDIA CORPORATION.
+# Copyright (c) 2020-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -29,9 +29,10 @@
 from cuml.feature_extraction._vectorizers import CountVectorizer
 from cuml.feature_extraction._tfidf import TfidfTransformer
 
-from cuml.internals.safe_imports import gpu_only_import
+from cuml.internals.safe_imports import cpu_only_import
 
-cp = gpu_only_import("cupy")
+np = cpu_only_import("numpy")
+pd = cpu_only_import("pandas")
 
 
 class TfidfVectorizer(CountVectorizer):
@@ -60,11 +61,18 @@ class TfidfVectorizer(CountVectorizer):
         such that min_n <= n <= max_n will be used. For example an
         ``ngram_range`` of ``(1, 1)`` means only unigrams, ``(1, 2)`` means
         unigrams and bigrams, and ``(2, 2)`` means only bigrams.
-    analyzer : string, {'word', 'char', 'char_wb'}, default='word'
+    analyzer : {'word', 'char', 'char_wb', 'pretokenized'}, default='word'
         Whether the feature should be made of word n-gram or character
         n-grams.
         Option 'char_wb' creates character n-grams only from text inside
         word boundaries; n-grams at the edges of words are padded with space.
+        Option 'pretokenized' takes documents that are already tokenized:
+        a column of lists of string or integer tokens (e.g. an Arrow or
+        cuDF ``list<string>`` or ``list<int32>`` column), or a pair of
+        ``(offsets, values)`` arrays, the tokens of document ``i`` being
+        ``values[offsets[i]:offsets[i + 1]]``. The tokens are counted as
+        they are, without preprocessing nor stop words removal, and word
+        n-grams are only supported for string tokens.
     max_df : float in range [0.0, 1.0] or int, default=1.0
         When building the vocabulary ignore terms that have a document
         frequency strictly higher than the given threshold (corpus-specific
@@ -109,15 +117,18 @@ class TfidfVectorizer(CountVectorizer):
         exactly once. Prevents zero divisions.
     sublinear_tf : bool, default=False
         Apply sublinear tf scaling, i.e. replace tf with 1 + log(tf).
+    sketch_size : int, default=262144
+        Maximum number of distinct terms whose document frequency is tracked
+        by `partial_fit`. Unused by `fit`.
 
     Attributes
     ----------
     idf_ : array of shape (n_features)
         The inverse document frequency (IDF) vector; only defined
         if  `use_idf` is True.
-    vocabulary_ : cudf.Series[str]
+    vocabulary_ : cudf.Series[str] or pandas.Series[str]
         Array mapping from feature integer indices to feature name.
-    stop_words_ : cudf.Series[str]
+    stop_words_ : cudf.Series[str] or pandas.Series[str]
         Terms that were ignored because they either:
           - occurred in too many documents (`max_df`)
           - occurred in too few documents (`min_df`)
@@ -127,6 +138,10 @@ class TfidfVectorizer(CountVectorizer):
 
     Notes
     -----
+    Like :class:`CountVectorizer`, the vectorizer runs on host, returning
+    ``scipy.sparse.csr_matrix`` matrices, when the global device type is
+    ``'cpu'`` at fit time.
+
     The ``stop_words_`` attribute can get large and increase the model size
     when pickling. This attribute is provided only for introspection and can
     be safely removed using delattr or set to None before pickling.
@@ -153,12 +168,13 @@ class TfidfVectorizer(CountVectorizer):
         max_features=None,
         vocabulary=None,
         binary=False,
-        dtype=cp.float32,
+        dtype=np.float32,
         delimiter=" ",
         norm="l2",
         use_idf=True,
         smooth_idf=True,
         sublinear_tf=False,
+        sketch_size=2**18,
     ):
 
         super().__init__(
@@ -180,6 +196,7 @@ class TfidfVectorizer(CountVectorizer):
             binary=binary,
             dtype=dtype,
             delimiter=delimiter,
+            sketch_size=sketch_size,
         )
 
         self._tfidf = TfidfTransformer(
@@ -256,6 +273,38 @@ class TfidfVectorizer(CountVectorizer):
         self._tfidf.fit(X)
         return self
 
+    def partial_fit(self, raw_documents, y=None):
+        """Update the vocabulary and idf with a batch of documents.
+
+        The idf is computed from the document frequencies accumulated over
+        all the batches seen so far. They are estimated by the bounded
+        memory summary described in the Notes section of
+        :class:`CountVectorizer`, or counted exactly when a vocabulary is
+        given.
+
+        Parameters
+        ----------
+        raw_documents : cudf.Series or pd.Series
+           A Series of string documents
+        y : None
+            Ignored.
+
+        Returns
+        -------
+        self : object
+            Fitted vectorizer.
+        """
+        super().partial_fit(raw_documents)
+        if self._fixed_vocabulary:
+            self._tfidf.partial_fit(super().transform(raw_documents))
+            return self
+        self._tfidf._host = isinstance(self.vocabulary_, pd.Series)
+        if self.use_idf:
+            smooth = int(self.smooth_idf)
+            n_samples = self.n_samples_seen_ + smooth
+            self.idf_ = np.log(n_samples / (self._vocabulary_df + smooth)) + 1
+        return self
+
     def fit_transform(self, raw_documents, y=None):
         """Learn vocabulary and idf, return document-term matrix.
         This is equivalent to fit followed by transform, but more efficiently
@@ -270,7 +319,7 @@ class TfidfVectorizer(CountVectorizer):
 
         Returns
         -------
-        X : cupy csr array of shape (n_samples, n_features)
+        X : cupy or scipy csr array of shape (n_samples, n_features)
             Tf-idf-weighted document-term matrix.
         """
         X = super().fit_transform(raw_documents)
@@ -291,7 +340,7 @@ class TfidfVectorizer(CountVectorizer):
 
         Returns
         -------
-        X : cupy csr array of shape (n_samples, n_features)
+        X : cupy or scipy csr array of shape (n_samples, n_features)
             Tf-idf-weighted document-term matrix.
         """
         X = super().transform(raw_documents)
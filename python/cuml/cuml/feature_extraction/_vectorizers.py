@@ -1,4 +1,4 @@
-# Copyright (c) 2020-2023, NVIDIA CORPORATION.
+# Copyright (c) 2020-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -14,22 +14,38 @@
 #
 from cuml.internals.safe_imports import cpu_only_import
 import cuml.internals.logger as logger
-from cudf.utils.dtypes import min_signed_type
-from cuml.internals.type_utils import CUPY_SPARSE_DTYPES
 import numbers
 from cuml.internals.safe_imports import gpu_only_import
 from functools import partial
+from itertools import islice
 from cuml.common.sparsefuncs import create_csr_matrix_from_count_df
 from cuml.common.sparsefuncs import csr_row_normalize_l1, csr_row_normalize_l2
+from cuml.feature_extraction._host_text import (
+    HostAnalyzer,
+    imap_ordered,
+    to_arrow_strings,
+    to_arrow_terms,
+    to_arrow_token_lists,
+    to_pandas_terms,
+)
 from cuml.feature_extraction._stop_words import ENGLISH_STOP_WORDS
 from cuml.common.exceptions import NotFittedError
+from cuml.common.sketches import CountMinSketch, FrequentItemsSketch
+from cuml.internals.device_type import DeviceType
+from cuml.internals.global_settings import GlobalSettings
 from cuml.internals.safe_imports import gpu_only_import_from
 
 Series = gpu_only_import_from("cudf", "Series")
+min_signed_type = gpu_only_import_from("cudf.utils.dtypes", "min_signed_type")
 
 cp = gpu_only_import("cupy")
 cudf = gpu_only_import("cudf")
+np = cpu_only_import("numpy")
 pd = cpu_only_import("pandas")
+pa = cpu_only_import("pyarrow")
+
+# dtypes supported by both cupyx.scipy.sparse and scipy.sparse matrices
+SPARSE_DTYPES = [np.float32, np.float64, np.complex64, np.complex128]
 
 
 def _preprocess(
@@ -85,6 +101,25 @@ def _preprocess(
     return doc
 
 
+def _iter_batches(documents, batch_size):
+    """
+    Split a column, or any iterable, of documents into batches.
+
+    Columns are sliced, other iterables are consumed lazily into lists.
+    """
+    if hasattr(documents, "__len__") and hasattr(documents, "__getitem__"):
+        rows = documents.iloc if hasattr(documents, "iloc") else documents
+        for start in range(0, len(documents), batch_size):
+            yield rows[start : start + batch_size]
+        return
+    documents = iter(documents)
+    while True:
+        batch = list(islice(documents, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
 class _VectorizerMixin:
     """
     Provides common code for text vectorizers (tokenization logic).
@@ -127,6 +162,26 @@ class _VectorizerMixin:
             )
         return lambda doc: self._remove_stop_words(preprocess(doc))
 
+    def _host_device(self):
+        return GlobalSettings().device_type is DeviceType.host
+
+    def _build_host_analyzer(self, n_workers=None):
+        """
+        Return the host engine tokenizing and counting the documents.
+        """
+        stop_words = None
+        if self.analyzer == "word":
+            stop_words = self._get_stop_words()
+        return HostAnalyzer(
+            analyzer=self.analyzer,
+            ngram_range=self.ngram_range,
+            lowercase=self.lowercase,
+            preprocessor=self.preprocessor,
+            stop_words=stop_words,
+            delimiter=self.delimiter,
+            n_workers=n_workers,
+        )
+
     def _get_stop_words(self):
         """
         Build or fetch the effective stop words list.
@@ -236,6 +291,9 @@ class _VectorizerMixin:
         Creates a tokenized DataFrame from a string Series.
         Each row describes the token string and the corresponding document id.
         """
+        if self.analyzer == "pretokenized":
+            return self._create_pretokenized_df(docs)
+
         min_n, max_n = self.ngram_range
 
         doc_id = cp.arange(start=0, stop=len(docs), dtype=cp.int32)
@@ -250,6 +308,66 @@ class _VectorizerMixin:
 
         return tokenized_df
 
+    def _device_token_lists(self, raw_documents):
+        """
+        Pre-tokenized documents as a cudf Series of lists of tokens.
+
+        Inputs that are not already such a Series are converted through
+        `to_arrow_token_lists`.
+        """
+        if isinstance(getattr(raw_documents, "dtype", None), cudf.ListDtype):
+            return raw_documents
+        arr = to_arrow_token_lists(raw_documents)
+        value_type = arr.type.value_type
+        if pa.types.is_large_string(value_type):
+            value_type = pa.string()
+        return Series.from_arrow(arr.cast(pa.list_(value_type)))
+
+    def _create_pretokenized_df(self, docs):
+        """
+        Creates a tokenized DataFrame from a Series of lists of tokens,
+        skipping the tokenization: n-grams are built by joining the tokens
+        of consecutive rows that belong to the same document.
+        """
+        min_n, max_n = self.ngram_range
+
+        lengths = docs.list.len().fillna(0)
+        doc_id = Series(cp.arange(len(docs), dtype=cp.int32))
+        doc_id = doc_id.repeat(lengths).reset_index(drop=True)
+        tokens = docs.list.leaves.reset_index(drop=True)
+        if tokens.dtype.kind in "iu" and max_n > 1:
+            raise ValueError(
+                "n-grams of integer tokens are not supported, got "
+                "ngram_range={}".format(self.ngram_range)
+            )
+        valid = tokens.notna()
+        tokens = tokens[valid].reset_index(drop=True)
+        doc_id = doc_id[valid].reset_index(drop=True)
+
+        tokenized_df_ls = []
+        for n in range(min_n, max_n + 1):
+            n_windows = max(len(tokens) - n + 1, 0)
+            doc_id_values = doc_id.values
+            same_doc = (
+                doc_id_values[:n_windows]
+                == doc_id_values[n - 1 : n - 1 + n_windows]
+            )
+            parts = [
+                tokens.iloc[i : i + n_windows].reset_index(drop=True)[same_doc]
+                for i in range(n)
+            ]
+            ngram_sr = parts[0]
+            if n > 1:
+                ngram_sr = ngram_sr.str.cat(others=parts[1:], sep=" ")
+            tokenized_df = cudf.DataFrame()
+            tokenized_df["doc_id"] = doc_id.iloc[:n_windows].reset_index(
+                drop=True
+            )[same_doc]
+            tokenized_df["token"] = ngram_sr
+            tokenized_df_ls.append(tokenized_df)
+        tokenized_df = cudf.concat(tokenized_df_ls)
+        return tokenized_df.reset_index(drop=True)
+
     def _compute_empty_doc_ids(self, count_df, n_doc):
         """
         Compute empty docs ids using the remaining docs, given the total number
@@ -355,11 +473,18 @@ class CountVectorizer(_VectorizerMixin):
         such that min_n <= n <= max_n will be used. For example an
         ``ngram_range`` of ``(1, 1)`` means only unigrams, ``(1, 2)`` means
         unigrams and bigrams, and ``(2, 2)`` means only bigrams.
-    analyzer : string, {'word', 'char', 'char_wb'}
+    analyzer : string, {'word', 'char', 'char_wb', 'pretokenized'}
         Whether the feature should be made of word n-gram or character
         n-grams.
         Option 'char_wb' creates character n-grams only from text inside
         word boundaries; n-grams at the edges of words are padded with space.
+        Option 'pretokenized' takes documents that are already tokenized:
+        a column of lists of string or integer tokens (e.g. an Arrow or
+        cuDF ``list<string>`` or ``list<int32>`` column), or a pair of
+        ``(offsets, values)`` arrays, the tokens of document ``i`` being
+        ``values[offsets[i]:offsets[i + 1]]``. The tokens are counted as
+        they are, without preprocessing nor stop words removal, and word
+        n-grams are only supported for string tokens.
     max_df : float in range [0.0, 1.0] or int, default=1.0
         When building the vocabulary ignore terms that have a document
         frequency strictly higher than the given threshold (corpus-specific
@@ -389,18 +514,52 @@ class CountVectorizer(_VectorizerMixin):
     delimiter : str, whitespace by default
         String used as a replacement for stop words if stop_words is not None.
         Typically the delimiting character between words is a good choice.
+    sketch_size : int, default=262144
+        Maximum number of distinct terms whose document frequency is tracked
+        by `partial_fit`. Unused by `fit`.
 
     Attributes
     ----------
-    vocabulary_ : cudf.Series[str]
+    vocabulary_ : cudf.Series[str] or pandas.Series[str]
         Array mapping from feature integer indices to feature name.
-    stop_words_ : cudf.Series[str]
+    stop_words_ : cudf.Series[str] or pandas.Series[str]
         Terms that were ignored because they either:
           - occurred in too many documents (`max_df`)
           - occurred in too few documents (`min_df`)
           - were cut off by feature selection (`max_features`).
 
-        This is only available if no vocabulary was given.
+        This is only available if no vocabulary was given. After
+        `partial_fit`, only the pruned terms still tracked by the summary
+        are listed.
+    n_samples_seen_ : int
+        Number of documents seen by `partial_fit`.
+
+    Notes
+    -----
+    `partial_fit` learns the vocabulary from batches of documents in bounded
+    memory. The document frequency of the terms is accumulated in a
+    Misra-Gries summary of at most ``sketch_size`` terms. Let ``N`` be the
+    total number of (document, term) pairs seen. Each tracked term's
+    estimated frequency ``df_est`` satisfies
+    ``df - N / (sketch_size + 1) <= df_est <= df``. Every term with
+    ``df > N / (sketch_size + 1)`` is tracked. The counts are exact while
+    fewer than ``sketch_size`` distinct terms have been seen, and the
+    vocabulary is then the same as the one learnt by `fit` over all the
+    batches. ``min_df`` and ``max_df`` are applied to ``df_est``. For
+    ``max_features``, term frequencies come from a count-min sketch of
+    ``sketch_size`` cells per row. It over-estimates the frequency ``T`` of
+    a term by at most ``e * T_total / sketch_size`` with probability at
+    least ``1 - exp(-4)``, where ``T_total`` is the total number of terms
+    seen.
+
+    When the global device type is ``'cpu'`` at fit time (see
+    :py:func:`cuml.common.device_selection.using_device_type`), the
+    vectorizer runs on host and does not need cuDF: documents can be given
+    as a pandas or cuDF Series, a pyarrow array or a list of strings. They
+    are tokenized with pyarrow compute kernels and counted on a thread pool,
+    one block of documents per task. ``vocabulary_`` and ``stop_words_`` are
+    then pandas Series, the document-term matrices are
+    ``scipy.sparse.csr_matrix`` and ``transform`` keeps running on host.
 
     """
 
@@ -422,8 +581,9 @@ class CountVectorizer(_VectorizerMixin):
         max_features=None,
         vocabulary=None,
         binary=False,
-        dtype=cp.float32,
+        dtype=np.float32,
         delimiter=" ",
+        sketch_size=2**18,
     ):
         self.preprocessor = preprocessor
         self.analyzer = analyzer
@@ -445,9 +605,14 @@ class CountVectorizer(_VectorizerMixin):
         self.binary = binary
         self.dtype = dtype
         self.delimiter = delimiter
-        if dtype not in CUPY_SPARSE_DTYPES:
-            msg = f"Expected dtype in {CUPY_SPARSE_DTYPES}, got {dtype}"
+        if dtype not in SPARSE_DTYPES:
+            msg = f"Expected dtype in {SPARSE_DTYPES}, got {dtype}"
             raise ValueError(msg)
+        self.sketch_size = sketch_size
+        if not isinstance(sketch_size, numbers.Integral) or sketch_size <= 0:
+            raise ValueError(
+                "sketch_size=%r, should be a positive integer" % sketch_size
+            )
 
         sklearn_params = {
             "input": input,
@@ -542,7 +707,108 @@ class CountVectorizer(_VectorizerMixin):
 
         return count_df
 
+    def _limit_features_host(self, X, vocab, high, low, limit):
+        """
+        Host counterpart of `_limit_features` working on a scipy csr matrix.
+        """
+        if high is None and low is None and limit is None:
+            self.stop_words_ = None
+            return X
+
+        document_frequency = np.bincount(X.indices, minlength=len(vocab))
+
+        mask = np.ones(len(document_frequency), dtype=bool)
+        if high is not None:
+            mask &= document_frequency <= high
+        if low is not None:
+            mask &= document_frequency >= low
+        if limit is not None and mask.sum() > limit:
+            term_frequency = np.bincount(
+                X.indices, weights=X.data, minlength=len(vocab)
+            )
+            mask_inds = (-term_frequency[mask]).argsort(kind="stable")[:limit]
+            new_mask = np.zeros(len(document_frequency), dtype=bool)
+            new_mask[np.where(mask)[0][mask_inds]] = True
+            mask = new_mask
+
+        keep_idx = np.where(mask)[0]
+        if keep_idx.shape[0] == 0:
+            raise ValueError(
+                "After pruning, no terms remain. Try a lower"
+                " min_df or a higher max_df."
+            )
+
+        if len(vocab) - keep_idx.shape[0] != 0:
+            X = X[:, keep_idx]
+
+        self.stop_words_ = vocab[~mask].reset_index(drop=True)
+        self.vocabulary_ = vocab[mask].reset_index(drop=True)
+
+        return X
+
+    def _doc_count_limits(self, n_doc):
+        """
+        Absolute document frequency bounds from `max_df` and `min_df`.
+        """
+        max_doc_count = (
+            self.max_df
+            if isinstance(self.max_df, numbers.Integral)
+            else self.max_df * n_doc
+        )
+        min_doc_count = (
+            self.min_df
+            if isinstance(self.min_df, numbers.Integral)
+            else self.min_df * n_doc
+        )
+        if max_doc_count < min_doc_count:
+            raise ValueError("max_df corresponds to < documents than min_df")
+        return max_doc_count, min_doc_count
+
+    def _to_arrow_vocabulary(self, vocabulary):
+        if self.analyzer == "pretokenized":
+            return to_arrow_terms(vocabulary)
+        return to_arrow_strings(vocabulary)
+
+    def _host_vocabulary(self):
+        """
+        Fixed vocabulary as a pandas Series of strings, or of integers for
+        pre-tokenized integer tokens.
+        """
+        return to_pandas_terms(self._to_arrow_vocabulary(self.vocabulary))
+
+    def _count_host(self, raw_documents, vocabulary=None):
+        if vocabulary is not None:
+            vocabulary = self._to_arrow_vocabulary(vocabulary)
+        X, vocabulary = self._build_host_analyzer().count(
+            raw_documents, vocabulary, dtype=self.dtype
+        )
+        if self.binary:
+            X.data.fill(1)
+        return X, vocabulary
+
+    def _fit_transform_host(self, raw_documents):
+        """
+        Host implementation of `fit_transform`, see `HostAnalyzer`.
+        """
+        if self._fixed_vocabulary:
+            self.vocabulary_ = self._host_vocabulary()
+            X, _ = self._count_host(raw_documents, self.vocabulary_)
+            return X
+
+        X, vocabulary = self._count_host(raw_documents)
+        self.vocabulary_ = to_pandas_terms(vocabulary)
+        max_doc_count, min_doc_count = self._doc_count_limits(X.shape[0])
+        return self._limit_features_host(
+            X,
+            self.vocabulary_,
+            max_doc_count,
+            min_doc_count,
+            self.max_features,
+        )
+
     def _preprocess(self, raw_documents):
+        if self.analyzer == "pretokenized":
+            return self._device_token_lists(raw_documents)
         preprocess = self.build_preprocessor()
         return preprocess(raw_documents)
 
@@ -566,6 +832,131 @@ class CountVectorizer(_VectorizerMixin):
         self.fit_transform(raw_documents)
         return self
 
+    def _batch_frequencies(self, raw_documents, host):
+        """
+        Document and term frequencies of the terms of a batch of documents.
+
+        Returns
+        -------
+        terms : numpy.ndarray of str
+        df, tf : numpy.ndarray of shape (n_terms,)
+        n_doc : int
+        """
+        if host:
+            X, terms = self._build_host_analyzer().count(
+                raw_documents, dtype=np.float64
+            )
+            df = np.bincount(X.indices, minlength=len(terms))
+            tf = np.bincount(X.indices, weights=X.data, minlength=len(terms))
+            return terms.to_numpy(zero_copy_only=False), df, tf, X.shape[0]
+
+        docs = self._preprocess(raw_documents)
+        n_doc = len(docs)
+        tokenized_df = self._create_tokenized_df(docs)
+        count_df = (
+            tokenized_df[["doc_id", "token"]]
+            .groupby(["doc_id", "token"], sort=True)
+            .size()
+            .reset_index()
+            .rename({0: "count"}, axis=1)
+        )
+        terms = count_df["token"].unique().sort_values()
+        return (
+            terms.to_arrow().to_numpy(zero_copy_only=False),
+            cp.asnumpy(_document_frequency(count_df)),
+            cp.asnumpy(_term_frequency(count_df)),
+            n_doc,
+        )
+
+    def _reset_stream(self):
+        for attr in (
+            "_df_sketch",
+            "_tf_sketch",
+            "_vocabulary_df",
+            "n_samples_seen_",
+        ):
+            self.__dict__.pop(attr, None)
+
+    def partial_fit(self, raw_documents, y=None):
+        """
+        Update the vocabulary with a batch of documents.
+
+        The vocabulary is learnt in bounded memory from the document
+        frequencies accumulated over all the batches seen so far (see the
+        Notes section), and updated after each batch so that the vectorizer
+        can be used in between. Unlike `fit`, no error is raised while no
+        term satisfies ``min_df`` and ``max_df``.
+
+        Parameters
+        ----------
+        raw_documents : cudf.Series or pd.Series
+            A Series of string documents
+        y : None
+            Ignored.
+
+        Returns
+        -------
+        self
+        """
+        self._warn_for_unused_params()
+        self._validate_params()
+
+        self._fixed_vocabulary = self.vocabulary is not None
+        if self._fixed_vocabulary:
+            if not hasattr(self, "n_samples_seen_"):
+                if self._host_device():
+                    self.vocabulary_ = self._host_vocabulary()
+                else:
+                    self.vocabulary_ = self.vocabulary
+                self.n_samples_seen_ = 0
+            if isinstance(raw_documents, tuple):
+                # (offsets, values) pair of pre-tokenized documents
+                self.n_samples_seen_ += len(raw_documents[0]) - 1
+            else:
+                self.n_samples_seen_ += len(raw_documents)
+            return self
+
+        if hasattr(self, "_df_sketch"):
+            host = isinstance(self.vocabulary_, pd.Series)
+        else:
+            host = self._host_device()
+            self._df_sketch = FrequentItemsSketch(size=self.sketch_size)
+            self._tf_sketch = CountMinSketch(width=self.sketch_size)
+            self.n_samples_seen_ = 0
+
+        terms, df, tf, n_doc = self._batch_frequencies(raw_documents, host)
+        self._df_sketch.update(terms, df)
+        self._tf_sketch.update(terms, tf)
+        self.n_samples_seen_ += n_doc
+
+        terms = self._df_sketch.items
+        if terms is None:
+            terms = np.empty(0, dtype=object)
+        df = self._df_sketch.counts
+        max_doc_count, min_doc_count = self._doc_count_limits(
+            self.n_samples_seen_
+        )
+        mask = (df <= max_doc_count) & (df >= min_doc_count)
+        limit = self.max_features
+        if limit is not None and mask.sum() > limit:
+            term_frequency = self._tf_sketch.query(terms[mask])
+            mask_inds = (-term_frequency).argsort(kind="stable")[:limit]
+            new_mask = np.zeros(len(terms), dtype=bool)
+            new_mask[np.where(mask)[0][mask_inds]] = True
+            mask = new_mask
+
+        self._vocabulary_df = df[mask]
+        vocabulary = pd.Series(terms[mask])
+        stop_words = pd.Series(terms[~mask])
+        if host:
+            self.vocabulary_, self.stop_words_ = vocabulary, stop_words
+        else:
+            self.vocabulary_, self.stop_words_ = (
+                Series(vocabulary),
+                Series(stop_words),
+            )
+        return self
+
     def fit_transform(self, raw_documents, y=None):
         """
         Build the vocabulary and return document-term matrix.
@@ -582,14 +973,18 @@ class CountVectorizer(_VectorizerMixin):
 
         Returns
         -------
-        X : cupy csr array of shape (n_samples, n_features)
+        X : cupy or scipy csr array of shape (n_samples, n_features)
             Document-term matrix.
         """
         self._warn_for_unused_params()
         self._validate_params()
+        self._reset_stream()
 
         self._fixed_vocabulary = self.vocabulary is not None
 
+        if self._host_device():
+            return self._fit_transform_host(raw_documents)
+
         docs = self._preprocess(raw_documents)
         n_doc = len(docs)
 
@@ -605,20 +1000,7 @@ class CountVectorizer(_VectorizerMixin):
         count_df = self._count_vocab(tokenized_df)
 
         if not self._fixed_vocabulary:
-            max_doc_count = (
-                self.max_df
-                if isinstance(self.max_df, numbers.Integral)
-                else self.max_df * n_doc
-            )
-            min_doc_count = (
-                self.min_df
-                if isinstance(self.min_df, numbers.Integral)
-                else self.min_df * n_doc
-            )
-            if max_doc_count < min_doc_count:
-                raise ValueError(
-                    "max_df corresponds to < documents than min_df"
-                )
+            max_doc_count, min_doc_count = self._doc_count_limits(n_doc)
             count_df = self._limit_features(
                 count_df,
                 self.vocabulary_,
@@ -654,14 +1036,20 @@ class CountVectorizer(_VectorizerMixin):
 
         Returns
         -------
-        X : cupy csr array of shape (n_samples, n_features)
+        X : cupy or scipy csr array of shape (n_samples, n_features)
             Document-term matrix.
         """
         if not hasattr(self, "vocabulary_"):
-            if self.vocabulary is not None:
-                self.vocabulary_ = self.vocabulary
-            else:
+            if self.vocabulary is None:
                 raise NotFittedError()
+            elif self._host_device():
+                self.vocabulary_ = self._host_vocabulary()
+            else:
+                self.vocabulary_ = self.vocabulary
+
+        if isinstance(self.vocabulary_, pd.Series):
+            X, _ = self._count_host(raw_documents, self.vocabulary_)
+            return X
 
         docs = self._preprocess(raw_documents)
         n_doc = len(docs)
@@ -693,6 +1081,9 @@ class CountVectorizer(_VectorizerMixin):
         X_inv : list of cudf.Series of shape (n_samples,)
             List of Series of terms.
         """
+        if isinstance(self.vocabulary_, pd.Series):
+            vocab = self.vocabulary_
+            return [vocab.iloc[X[i, :].indices] for i in range(X.shape[0])]
         vocab = Series(self.vocabulary_)
         return [vocab[X[i, :].indices] for i in range(X.shape[0])]
 
@@ -745,6 +1136,13 @@ class HashingVectorizer(_VectorizerMixin):
 
     The hash function employed is the signed 32-bit version of Murmurhash3.
 
+    On host (see :py:func:`cuml.common.device_selection.using_device_type`)
+    the documents are tokenized and hashed by blocks on a thread pool and a
+    scipy.sparse CSR matrix is returned. The tokens are hashed with the
+    same MurmurHash3 as scikit-learn's ``HashingVectorizer``, which yields
+    the same features for the same tokens. `transform_iter` vectorizes
+    a stream of documents batch by batch in constant memory.
+
     Parameters
     ----------
     lowercase : bool, default=True
@@ -831,7 +1229,7 @@ class HashingVectorizer(_VectorizerMixin):
         binary=False,
         norm="l2",
         alternate_sign=True,
-        dtype=cp.float32,
+        dtype=np.float32,
         delimiter=" ",
     ):
         self.preprocessor = preprocessor
@@ -846,9 +1244,13 @@ class HashingVectorizer(_VectorizerMixin):
         self.dtype = dtype
         self.delimiter = delimiter
 
-        if dtype not in CUPY_SPARSE_DTYPES:
-            msg = f"Expected dtype in {CUPY_SPARSE_DTYPES}, got {dtype}"
+        if dtype not in SPARSE_DTYPES:
+            msg = f"Expected dtype in {SPARSE_DTYPES}, got {dtype}"
             raise ValueError(msg)
+        if analyzer == "pretokenized":
+            raise ValueError(
+                "HashingVectorizer does not support analyzer='pretokenized'"
+            )
 
         if self.norm not in ("l1", "l2", None):
             raise ValueError(f"{self.norm} is not a supported norm")
@@ -938,7 +1340,7 @@ class HashingVectorizer(_VectorizerMixin):
 
         Returns
         -------
-        X : sparse CuPy CSR matrix of shape (n_samples, n_features)
+        X : cupy or scipy csr array of shape (n_samples, n_features)
             Document-term matrix.
         """
         return self.fit(X, y).transform(X)
@@ -957,9 +1359,11 @@ class HashingVectorizer(_VectorizerMixin):
 
         Returns
         -------
-        X : sparse CuPy CSR matrix of shape (n_samples, n_features)
+        X : cupy or scipy csr array of shape (n_samples, n_features)
             Document-term matrix.
         """
+        if self._host_device():
+            return self._transform_host(raw_documents)
         docs = self._preprocess(raw_documents)
         del raw_documents
         n_doc = len(docs)
@@ -971,7 +1375,9 @@ class HashingVectorizer(_VectorizerMixin):
         X = create_csr_matrix_from_count_df(
             count_df, empty_doc_ids, n_doc, self.n_features, dtype=self.dtype
         )
+        return self._finalize(X)
 
+    def _finalize(self, X):
         if self.binary:
             X.data.fill(1)
         if self.norm:
@@ -981,3 +1387,55 @@ class HashingVectorizer(_VectorizerMixin):
                 csr_row_normalize_l2(X, inplace=True)
 
         return X
+
+    def _transform_host(self, raw_documents, analyzer=None):
+        if analyzer is None:
+            analyzer = self._build_host_analyzer()
+        X = analyzer.hash(
+            raw_documents,
+            self.n_features,
+            alternate_sign=self.alternate_sign,
+            dtype=self.dtype,
+        )
+        return self._finalize(X)
+
+    def transform_iter(self, documents, batch_size=8192):
+        """
+        Lazily transform a stream of documents, batch by batch.
+
+        The memory used only depends on ``batch_size``, which makes it
+        possible to vectorize unbounded streams. On host, the batches are
+        vectorized concurrently on a thread pool.
+
+        Parameters
+        ----------
+        documents : cudf.Series, pd.Series or iterable of str
+            Documents to vectorize. Series are sliced, other iterables are
+            consumed lazily.
+        batch_size : int, default=8192
+            Number of documents per batch.
+
+        Yields
+        ------
+        X : cupy or scipy csr array of shape (batch_size, n_features)
+            Document-term matrix of each batch, in order. The last one
+            may hold fewer documents.
+        """
+        if not isinstance(batch_size, numbers.Integral) or batch_size <= 0:
+            raise ValueError(
+                "batch_size=%r, should be a positive integer" % batch_size
+            )
+        self._warn_for_unused_params()
+        self._validate_params()
+        batches = _iter_batches(documents, batch_size)
+        if self._host_device():
+            # batches are spread over the threads, each one analyzed at once
+            analyzer = self._build_host_analyzer(n_workers=1)
+            yield from imap_ordered(
+                partial(self._transform_host, analyzer=analyzer), batches
+            )
+        else:
+            for batch in batches:
+                if not isinstance(batch, (Series, pd.Series)):
+                    batch = Series(batch)
+                yield self.transform(batch)
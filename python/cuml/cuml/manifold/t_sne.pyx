@@ -38,6 +38,7 @@ from cuml.common.doc_utils import generate_docstring
 from cuml.common import input_to_cuml_array
 from cuml.internals.mixins import CMajorInputTagMixin
 from cuml.common.sparsefuncs import extract_knn_infos
+from cuml.neighbors.knn_graph import KNNGraph
 from cuml.metrics.distance_type cimport DistanceType
 rmm = gpu_only_import('rmm')
 
@@ -205,8 +206,9 @@ class TSNE(Base,
     precomputed_knn : array / sparse array / tuple, optional (device or host)
         Either one of a tuple (indices, distances) of
         arrays of shape (n_samples, n_neighbors), a pairwise distances
-        dense array of shape (n_samples, n_samples) or a KNN graph
-        sparse array (preferably CSR/COO). This feature allows
+        dense array of shape (n_samples, n_samples), a KNN graph
+        sparse array (preferably CSR/COO) or a
+        :class:`cuml.neighbors.KNNGraph`. This feature allows
         the precomputation of the KNN outside of TSNE
         and also allows the use of a custom distance function. This function
         should match the metric used to train the TSNE embeedings.
@@ -399,6 +401,8 @@ class TSNE(Base,
 
         self.sparse_fit = False
 
+        if isinstance(precomputed_knn, KNNGraph):
+            precomputed_knn.validate(metric=metric)
         self.precomputed_knn = extract_knn_infos(precomputed_knn,
                                                  n_neighbors)
 
@@ -414,8 +418,9 @@ class TSNE(Base,
         knn_graph : array / sparse array / tuple, optional (device or host)
         Either one of a tuple (indices, distances) of
         arrays of shape (n_samples, n_neighbors), a pairwise distances
-        dense array of shape (n_samples, n_samples) or a KNN graph
-        sparse array (preferably CSR/COO). This feature allows
+        dense array of shape (n_samples, n_samples), a KNN graph
+        sparse array (preferably CSR/COO) or a
+        :class:`cuml.neighbors.KNNGraph`. This feature allows
         the precomputation of the KNN outside of TSNE
         and also allows the use of a custom distance function. This function
         should match the metric used to train the TSNE embeedings.
@@ -429,6 +434,9 @@ class TSNE(Base,
         if len(X.shape) != 2:
             raise ValueError("data should be two dimensional")
 
+        if isinstance(knn_graph, KNNGraph):
+            knn_graph.validate(X.shape[0], self.metric)
+
         if is_sparse(X):
 
             self.X_m = SparseCumlArray(X, convert_to_dtype=cupy.float32,
@@ -28,6 +28,7 @@ cupy = gpu_only_import('cupy')
 cupyx = gpu_only_import('cupyx')
 
 from cuml.common.sparsefuncs import extract_knn_infos
+from cuml.neighbors.knn_graph import KNNGraph
 from cuml.internals.safe_imports import gpu_only_import_from
 cp_csr_matrix = gpu_only_import_from('cupyx.scipy.sparse', 'csr_matrix')
 cp_coo_matrix = gpu_only_import_from('cupyx.scipy.sparse', 'coo_matrix')
@@ -38,6 +39,8 @@ from cuml.internals.base import UniversalBase
 from cuml.common.doc_utils import generate_docstring
 from cuml.internals import logger
 from cuml.internals.available_devices import is_cuda_available
+from cuml.internals.device_type import DeviceType
+from cuml.internals.global_settings import GlobalSettings
 from cuml.internals.input_utils import input_to_cuml_array
 from cuml.internals.array import CumlArray
 from cuml.internals.array_sparse import SparseCumlArray
@@ -240,8 +243,9 @@ class UMAP(UniversalBase,
     precomputed_knn : array / sparse array / tuple, optional (device or host)
         Either one of a tuple (indices, distances) of
         arrays of shape (n_samples, n_neighbors), a pairwise distances
-        dense array of shape (n_samples, n_samples) or a KNN graph
-        sparse array (preferably CSR/COO). This feature allows
+        dense array of shape (n_samples, n_samples), a KNN graph
+        sparse array (preferably CSR/COO) or a
+        :class:`cuml.neighbors.KNNGraph`. This feature allows
         the precomputation of the KNN outside of UMAP
         and also allows the use of a custom distance function. This function
         should match the metric used to train the UMAP embeedings.
@@ -428,6 +432,8 @@ class UMAP(UniversalBase,
         self._input_hash = None
         self._small_data = False
 
+        if isinstance(precomputed_knn, KNNGraph):
+            precomputed_knn.validate(metric=metric)
         self.precomputed_knn = extract_knn_infos(precomputed_knn,
                                                  n_neighbors)
 
@@ -546,8 +552,9 @@ class UMAP(UniversalBase,
         knn_graph : array / sparse array / tuple, optional (device or host)
         Either one of a tuple (indices, distances) of
         arrays of shape (n_samples, n_neighbors), a pairwise distances
-        dense array of shape (n_samples, n_samples) or a KNN graph
-        sparse array (preferably CSR/COO). This feature allows
+        dense array of shape (n_samples, n_samples), a KNN graph
+        sparse array (preferably CSR/COO) or a
+        :class:`cuml.neighbors.KNNGraph`. This feature allows
         the precomputation of the KNN outside of UMAP
         and also allows the use of a custom distance function. This function
         should match the metric used to train the UMAP embeedings.
@@ -556,6 +563,9 @@ class UMAP(UniversalBase,
         if len(X.shape) != 2:
             raise ValueError("data should be two dimensional")
 
+        if isinstance(knn_graph, KNNGraph):
+            knn_graph.validate(X.shape[0], self.metric)
+
         if y is not None and knn_graph is not None\
                 and self.target_metric != "categorical":
             raise ValueError("Cannot provide a KNN graph when in \
@@ -874,5 +884,28 @@ class UMAP(UniversalBase,
             "build_kwds"
         ]
 
+    def dispatch_func(self, func_name, gpu_func, *args, **kwargs):
+        knn_graph = kwargs.get("knn_graph")
+        if not isinstance(knn_graph, KNNGraph) or \
+                func_name not in ["fit", "fit_transform"] or \
+                GlobalSettings().device_type is not DeviceType.host:
+            return super().dispatch_func(func_name, gpu_func, *args, **kwargs)
+
+        # umap-learn takes the neighbors as its precomputed_knn parameter
+        X = args[0] if args else kwargs["X"]
+        graph = knn_graph.validate(X.shape[0], self.metric, self.n_neighbors)
+        graph = graph.to_host()
+        del kwargs["knn_graph"]
+        if not hasattr(self, "_cpu_model"):
+            self.import_cpu_model()
+            self.build_cpu_model()
+        precomputed_knn = self._cpu_model.precomputed_knn
+        self._cpu_model.precomputed_knn = (graph.indices, graph.distances,
+                                           None)
+        try:
+            return super().dispatch_func(func_name, gpu_func, *args, **kwargs)
+        finally:
+            self._cpu_model.precomputed_knn = precomputed_knn
+
     def get_attr_names(self):
         return ['_raw_data', 'embedding_', '_input_hash', '_small_data']
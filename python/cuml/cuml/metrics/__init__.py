@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2019-2023, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -24,6 +24,9 @@ from cuml.metrics.cluster.adjusted_rand_index import adjusted_rand_score
 from cuml.metrics._ranking import roc_auc_score
 from cuml.metrics._ranking import precision_recall_curve
 from cuml.metrics._classification import log_loss
+from cuml.metrics._accumulators import ConfusionMatrixAccumulator
+from cuml.metrics._accumulators import LogLossAccumulator
+from cuml.metrics._accumulators import ROCAccumulator
 from cuml.metrics.cluster.homogeneity_score import (
     cython_homogeneity_score as homogeneity_score,
 )
@@ -40,6 +43,7 @@ from cuml.metrics.pairwise_distances import sparse_pairwise_distances
 from cuml.metrics.pairwise_distances import nan_euclidean_distances
 from cuml.metrics.pairwise_distances import PAIRWISE_DISTANCE_METRICS
 from cuml.metrics.pairwise_distances import PAIRWISE_DISTANCE_SPARSE_METRICS
+from cuml.metrics._pairwise_reduce import pairwise_distances_reduce
 from cuml.metrics.pairwise_kernels import pairwise_kernels
 from cuml.metrics.pairwise_kernels import PAIRWISE_KERNEL_FUNCTIONS
 from cuml.metrics.hinge_loss import hinge_loss
@@ -57,6 +61,9 @@ __all__ = [
     "roc_auc_score",
     "precision_recall_curve",
     "log_loss",
+    "ConfusionMatrixAccumulator",
+    "LogLossAccumulator",
+    "ROCAccumulator",
     "homogeneity_score",
     "completeness_score",
     "mutual_info_score",
@@ -65,6 +72,7 @@ __all__ = [
     "nan_euclidean_distances",
     "pairwise_distances",
     "sparse_pairwise_distances",
+    "pairwise_distances_reduce",
     "pairwise_kernels",
     "hinge_loss",
     "kl_divergence",
@@ -0,0 +1,561 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Streaming accumulators of classification metrics.
+
+An accumulator is fed chunks of labels and predictions with ``update`` and
+can be merged with accumulators fed other chunks, e.g. the partitions of a
+Dask collection, with ``merge``; ``result`` then gives the metric over all
+the chunks. Merging is associative and commutative and accumulators are
+picklable, so that they can be used as the chunk and combine steps of a
+tree reduction::
+
+    parts = [
+        dask.delayed(lambda t, p: LogLossAccumulator().update(t, p))(t, p)
+        for t, p in zip(y_true_parts, y_pred_parts)
+    ]
+    loss = dask.delayed(functools.reduce)(
+        LogLossAccumulator.merge, parts
+    ).compute().result()
+
+The accumulators work on NumPy or CuPy arrays, following the array type of
+the data they are fed.
+"""
+
+from cuml.common.sketches import _get_namespace
+from cuml.internals.safe_imports import cpu_only_import
+
+np = cpu_only_import("numpy")
+
+
+def _check_lengths(*arrays):
+    lengths = {len(a) for a in arrays if a is not None}
+    if len(lengths) > 1:
+        raise ValueError(
+            "Found input variables with inconsistent numbers of samples: "
+            "{}".format(sorted(lengths))
+        )
+
+
+class ConfusionMatrixAccumulator:
+    """
+    Exact confusion matrix of a stream of labels and predictions.
+
+    Parameters
+    ----------
+    labels : array-like of shape (n_classes,), default=None
+        Labels indexing the matrix, in this order. Samples whose true or
+        predicted label is not in ``labels`` are ignored. If None, the
+        sorted labels seen in the true or predicted labels of all the
+        chunks are used, as in :func:`cuml.metrics.confusion_matrix`.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        >>> import numpy as np
+        >>> from cuml.metrics import ConfusionMatrixAccumulator
+        >>> acc = ConfusionMatrixAccumulator()
+        >>> acc = acc.update(np.array([0, 1, 1]), np.array([0, 1, 0]))
+        >>> other = ConfusionMatrixAccumulator().update(
+        ...     np.array([2]), np.array([2])
+        ... )
+        >>> acc.merge(other).result()
+        array([[1, 0, 0],
+               [1, 1, 0],
+               [0, 0, 1]])
+    """
+
+    def __init__(self, labels=None):
+        self._fixed = labels is not None
+        self.labels = None
+        self.matrix = None
+        if self._fixed:
+            xp = _get_namespace(labels)
+            self.labels = xp.asarray(labels)
+            if not len(self.labels):
+                raise ValueError("labels must not be empty")
+            if len(xp.unique(self.labels)) != len(self.labels):
+                raise ValueError("labels must be unique")
+            self.matrix = xp.zeros((len(self.labels),) * 2, dtype=xp.int64)
+
+    def update(self, y_true, y_pred, sample_weight=None):
+        """
+        Add a chunk of samples to the matrix.
+
+        Parameters
+        ----------
+        y_true : array of shape (n_samples,)
+            True labels.
+        y_pred : array of shape (n_samples,)
+            Predicted labels.
+        sample_weight : array of shape (n_samples,), default=None
+            Weights of the samples. The matrix holds integer counts until
+            weights are given.
+        """
+        xp = _get_namespace(y_true, y_pred, sample_weight, self.labels)
+        y_true = xp.asarray(y_true).ravel()
+        y_pred = xp.asarray(y_pred).ravel()
+        if sample_weight is not None:
+            sample_weight = xp.asarray(sample_weight, dtype=xp.float64)
+        _check_lengths(y_true, y_pred, sample_weight)
+        if not len(y_true):
+            return self
+
+        if not self._fixed:
+            self._extend(xp.unique(xp.concatenate([y_true, y_pred])))
+        labels = xp.asarray(self.labels)
+        order = xp.argsort(labels)
+        sorted_labels = labels[order]
+        n_labels = len(labels)
+
+        def codes(y):
+            pos = xp.minimum(xp.searchsorted(sorted_labels, y), n_labels - 1)
+            return order[pos], sorted_labels[pos] == y
+
+        true_codes, true_known = codes(y_true)
+        pred_codes, pred_known = codes(y_pred)
+        known = true_known & pred_known
+        cells = true_codes[known] * n_labels + pred_codes[known]
+        if sample_weight is not None:
+            sample_weight = sample_weight[known]
+        counts = xp.bincount(
+            cells, weights=sample_weight, minlength=n_labels**2
+        ).reshape(n_labels, n_labels)
+        self._add(counts)
+        return self
+
+    def _extend(self, new_labels):
+        """Add labels to the dynamic labels, keeping them sorted."""
+        if self.labels is None:
+            self.labels = new_labels
+            self.matrix = _get_namespace(new_labels).zeros(
+                (len(new_labels),) * 2, dtype=np.int64
+            )
+            return
+        xp = _get_namespace(self.labels, new_labels)
+        old_labels = xp.asarray(self.labels)
+        labels = xp.union1d(old_labels, new_labels)
+        if len(labels) == len(old_labels):
+            return
+        pos = xp.searchsorted(labels, old_labels)
+        matrix = xp.zeros((len(labels),) * 2, dtype=self.matrix.dtype)
+        matrix[xp.ix_(pos, pos)] = xp.asarray(self.matrix)
+        self.labels, self.matrix = labels, matrix
+
+    def _add(self, counts):
+        xp = _get_namespace(self.matrix, counts)
+        matrix = xp.asarray(self.matrix)
+        if counts.dtype.kind == "f" and matrix.dtype.kind != "f":
+            matrix = matrix.astype(xp.float64)
+        elif counts.dtype.kind != "f":
+            counts = counts.astype(matrix.dtype)
+        self.matrix = matrix + counts
+
+    def merge(self, other):
+        """Merge the matrix of another chunk of samples."""
+        if self._fixed != other._fixed:
+            raise ValueError(
+                "Cannot merge an accumulator with fixed labels and an "
+                "accumulator with inferred labels"
+            )
+        if other.labels is None:
+            return self
+        if self._fixed:
+            xp = _get_namespace(self.labels, other.labels)
+            if len(self.labels) != len(other.labels) or not bool(
+                xp.all(xp.asarray(self.labels) == xp.asarray(other.labels))
+            ):
+                raise ValueError(
+                    "Only accumulators with the same labels can be merged"
+                )
+            self._add(other.matrix)
+            return self
+        self._extend(other.labels)
+        xp = _get_namespace(self.labels, other.labels)
+        pos = xp.searchsorted(
+            xp.asarray(self.labels), xp.asarray(other.labels)
+        )
+        counts = xp.zeros(self.matrix.shape, dtype=other.matrix.dtype)
+        counts[xp.ix_(pos, pos)] = xp.asarray(other.matrix)
+        self._add(counts)
+        return self
+
+    def result(self, normalize=None):
+        """
+        Confusion matrix of all the samples.
+
+        Parameters
+        ----------
+        normalize : {'true', 'pred', 'all'}, default=None
+            Normalize the matrix over the true labels (rows), the predicted
+            labels (columns) or all the samples.
+
+        Returns
+        -------
+        C : array of shape (n_classes, n_classes)
+            Number of samples of true label ``labels[i]`` predicted as
+            ``labels[j]``.
+        """
+        if normalize not in ["true", "pred", "all", None]:
+            raise ValueError(
+                "normalize must be one of "
+                f"{{'true', 'pred', 'all', None}}, got {normalize}."
+            )
+        if self.matrix is None:
+            raise ValueError("No sample has been accumulated")
+        xp = _get_namespace(self.matrix)
+        cm = self.matrix
+        if normalize is None:
+            return cm.copy()
+        with np.errstate(all="ignore"):
+            if normalize == "true":
+                cm = cm / cm.sum(axis=1, keepdims=True)
+            elif normalize == "pred":
+                cm = cm / cm.sum(axis=0, keepdims=True)
+            else:
+                cm = cm / cm.sum()
+        return xp.nan_to_num(cm)
+
+    def accuracy(self):
+        """Fraction of the samples, or of their weight, correctly predicted."""
+        if self.matrix is None:
+            raise ValueError("No sample has been accumulated")
+        xp = _get_namespace(self.matrix)
+        return float(xp.trace(self.matrix) / self.matrix.sum())
+
+
+class LogLossAccumulator:
+    """
+    Exact log loss of a stream of labels and predicted probabilities.
+
+    The loss of each chunk is computed as in :func:`cuml.metrics.log_loss`
+    and summed in float64 with the weight of its samples, so that the
+    result only differs from the loss of the concatenated chunks by
+    floating point rounding.
+
+    Parameters
+    ----------
+    eps : float, default=1e-15
+        Predicted probabilities are clipped to ``[eps, 1 - eps]``.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        >>> import numpy as np
+        >>> from cuml.metrics import LogLossAccumulator
+        >>> acc = LogLossAccumulator().update(
+        ...     np.array([0, 1]), np.array([[0.9, 0.1], [0.2, 0.8]])
+        ... )
+        >>> print(round(acc.result(), 4))
+        0.1643
+    """
+
+    def __init__(self, eps=1e-15):
+        self.eps = eps
+        self.n_columns = None
+        self.loss = 0.0
+        self.weight = 0.0
+
+    def update(self, y_true, y_pred, sample_weight=None):
+        """
+        Add a chunk of samples to the loss.
+
+        Parameters
+        ----------
+        y_true : array of shape (n_samples,)
+            Integer true labels, from 0 to ``n_classes - 1``.
+        y_pred : array of shape (n_samples,) or (n_samples, n_classes)
+            Predicted probabilities of the classes, of the positive class
+            for 1D binary predictions. The number of columns must be the
+            same in all the chunks.
+        sample_weight : array of shape (n_samples,), default=None
+            Weights of the samples.
+        """
+        xp = _get_namespace(y_true, y_pred, sample_weight)
+        y_true = xp.asarray(y_true).ravel()
+        y_pred = xp.asarray(y_pred, dtype=xp.float64)
+        if sample_weight is not None:
+            sample_weight = xp.asarray(sample_weight, dtype=xp.float64)
+        _check_lengths(y_true, y_pred, sample_weight)
+        if not len(y_true):
+            return self
+
+        if y_true.dtype.kind == "f" and bool(
+            xp.any(y_true != y_true.astype(int))
+        ):
+            raise ValueError("'y_true' can only have integer values")
+        if bool(y_true.min() < 0):
+            raise ValueError("'y_true' cannot have negative values")
+
+        y_pred = xp.clip(y_pred, self.eps, 1 - self.eps)
+        if y_pred.ndim == 1:
+            y_pred = xp.expand_dims(y_pred, axis=1)
+        if y_pred.shape[1] == 1:
+            y_pred = xp.hstack([1 - y_pred, y_pred])
+        if self.n_columns is not None and y_pred.shape[1] != self.n_columns:
+            raise ValueError(
+                "y_pred has {} columns, the previous chunks had {}".format(
+                    y_pred.shape[1], self.n_columns
+                )
+            )
+        y_true = y_true.astype(xp.int64)
+        if int(y_true.max()) >= y_pred.shape[1]:
+            raise ValueError(
+                "The shape of y_pred doesn't match the number of classes"
+            )
+
+        y_pred /= y_pred.sum(axis=1, keepdims=True)
+        loss = -xp.log(y_pred[xp.arange(len(y_true)), y_true])
+        if sample_weight is None:
+            self.loss += float(loss.sum())
+            self.weight += len(loss)
+        else:
+            self.loss += float((loss * sample_weight).sum())
+            self.weight += float(sample_weight.sum())
+        self.n_columns = y_pred.shape[1]
+        return self
+
+    def merge(self, other):
+        """Merge the loss of another chunk of samples."""
+        if other.eps != self.eps:
+            raise ValueError(
+                "Only accumulators with the same eps can be merged"
+            )
+        if other.n_columns is None:
+            return self
+        if self.n_columns is not None and other.n_columns != self.n_columns:
+            raise ValueError(
+                "Cannot merge the loss of {} classes into the loss of {} "
+                "classes".format(other.n_columns, self.n_columns)
+            )
+        self.n_columns = other.n_columns
+        self.loss += other.loss
+        self.weight += other.weight
+        return self
+
+    def result(self, normalize=True):
+        """
+        Log loss of all the samples.
+
+        Parameters
+        ----------
+        normalize : bool, default=True
+            Return the mean loss per sample, or per unit of weight, instead
+            of the sum of the losses.
+        """
+        if self.n_columns is None:
+            raise ValueError("No sample has been accumulated")
+        if normalize:
+            return self.loss / self.weight
+        return self.loss
+
+
+class ROCAccumulator:
+    """
+    Area under the ROC curve of a stream of binary labels and scores.
+
+    The scores of the positive and negative samples are accumulated in two
+    weighted histograms of ``n_bins`` equal bins over ``score_range``, so
+    that the memory used does not depend on the number of samples and no
+    sort is needed. Pairs of a positive and a negative sample in different
+    bins are ranked exactly; pairs in the same bin count for one half,
+    as tied scores do in :func:`cuml.metrics.roc_auc_score`. The smallest
+    and largest score of each bin are tracked too: a bin whose scores are
+    all equal only holds true ties, so that the area is exact when no bin
+    holds two distinct scores, e.g. for scores on a coarser grid than the
+    bins. Otherwise the error is at most :meth:`error_bound`.
+
+    Scores outside of ``score_range`` are counted in the first or last bin.
+
+    Parameters
+    ----------
+    n_bins : int, default=65536
+        Number of bins of the histograms.
+    score_range : tuple of float, default=(0.0, 1.0)
+        Range of the scores, the probabilities of the positive class by
+        default.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        >>> import numpy as np
+        >>> from cuml.metrics import ROCAccumulator
+        >>> acc = ROCAccumulator().update(
+        ...     np.array([0, 0, 1, 1]), np.array([0.1, 0.4, 0.35, 0.8])
+        ... )
+        >>> acc.result(), acc.error_bound()
+        (0.75, 0.0)
+    """
+
+    def __init__(self, n_bins=65536, score_range=(0.0, 1.0)):
+        low, high = score_range
+        if n_bins < 1:
+            raise ValueError(
+                "n_bins must be at least 1, got {}".format(n_bins)
+            )
+        if not high > low:
+            raise ValueError(
+                "score_range must be an increasing pair, got {}".format(
+                    score_range
+                )
+            )
+        self.n_bins = n_bins
+        self.score_range = (float(low), float(high))
+        self.positives = np.zeros(n_bins)
+        self.negatives = np.zeros(n_bins)
+        self.bin_min = np.full(n_bins, np.inf)
+        self.bin_max = np.full(n_bins, -np.inf)
+
+    def update(self, y_true, y_score, sample_weight=None):
+        """
+        Add a chunk of samples to the histograms.
+
+        Parameters
+        ----------
+        y_true : array of shape (n_samples,)
+            True labels, 0 or 1.
+        y_score : array of shape (n_samples,)
+            Scores of the positive class.
+        sample_weight : array of shape (n_samples,), default=None
+            Weights of the samples.
+        """
+        xp = _get_namespace(y_true, y_score, sample_weight, self.positives)
+        y_true = xp.asarray(y_true).ravel()
+        y_score = xp.asarray(y_score, dtype=xp.float64).ravel()
+        if sample_weight is not None:
+            sample_weight = xp.asarray(sample_weight, dtype=xp.float64)
+        _check_lengths(y_true, y_score, sample_weight)
+        if not len(y_true):
+            return self
+        if bool(xp.any((y_true != 0) & (y_true != 1))):
+            raise ValueError("y_true can only contain 0 and 1")
+        if bool(xp.isnan(y_score).any()):
+            raise ValueError("y_score cannot contain NaN")
+
+        low, high = self.score_range
+        bins = xp.floor((y_score - low) * (self.n_bins / (high - low)))
+        bins = xp.clip(bins, 0, self.n_bins - 1).astype(xp.int64)
+        positive = y_true == 1
+        weights = (
+            xp.ones(len(bins)) if sample_weight is None else sample_weight
+        )
+        self._to(xp)
+        self.positives += xp.bincount(
+            bins, weights=weights * positive, minlength=self.n_bins
+        )
+        self.negatives += xp.bincount(
+            bins, weights=weights * ~positive, minlength=self.n_bins
+        )
+        if xp is np:
+            np.minimum.at(self.bin_min, bins, y_score)
+            np.maximum.at(self.bin_max, bins, y_score)
+        else:
+            import cupyx
+
+            cupyx.scatter_min(self.bin_min, bins, y_score)
+            cupyx.scatter_max(self.bin_max, bins, y_score)
+        return self
+
+    def _to(self, xp):
+        """Move the histograms to the array library of new data."""
+        if xp is not np:
+            self.positives = xp.asarray(self.positives)
+            self.negatives = xp.asarray(self.negatives)
+            self.bin_min = xp.asarray(self.bin_min)
+            self.bin_max = xp.asarray(self.bin_max)
+
+    def merge(self, other):
+        """Merge the histograms of another chunk of samples."""
+        if (other.n_bins, other.score_range) != (
+            self.n_bins,
+            self.score_range,
+        ):
+            raise ValueError(
+                "Only accumulators with the same n_bins and score_range "
+                "can be merged"
+            )
+        xp = _get_namespace(self.positives, other.positives)
+        self._to(xp)
+        self.positives += xp.asarray(other.positives)
+        self.negatives += xp.asarray(other.negatives)
+        xp.minimum(self.bin_min, xp.asarray(other.bin_min), out=self.bin_min)
+        xp.maximum(self.bin_max, xp.asarray(other.bin_max), out=self.bin_max)
+        return self
+
+    def _totals(self):
+        n_pos = float(self.positives.sum())
+        n_neg = float(self.negatives.sum())
+        if n_pos == 0 or n_neg == 0:
+            raise ValueError(
+                "Only one class present in y_true. ROC AUC score is not "
+                "defined in that case."
+            )
+        return n_pos, n_neg
+
+    def result(self):
+        """Area under the ROC curve of all the samples."""
+        n_pos, n_neg = self._totals()
+        xp = _get_namespace(self.positives)
+        below = xp.cumsum(self.negatives) - self.negatives
+        pairs = self.positives * (below + self.negatives / 2)
+        return float(pairs.sum()) / (n_pos * n_neg)
+
+    def error_bound(self):
+        """
+        Bound of the error of :meth:`result`.
+
+        Half of the fraction of the positive-negative pairs falling in a
+        bin with distinct scores, the pairs that could be ranked either
+        way. Zero when the result is exact.
+        """
+        n_pos, n_neg = self._totals()
+        mixed = self.bin_max > self.bin_min
+        pairs = (self.positives * self.negatives)[mixed]
+        return float(pairs.sum()) / (2 * n_pos * n_neg)
+
+    def roc_curve(self):
+        """
+        ROC curve at the lower edges of the non-empty bins.
+
+        Returns
+        -------
+        fpr : array
+            Increasing false positive rates, starting from 0.
+        tpr : array
+            Increasing true positive rates, starting from 0.
+        thresholds : array
+            Decreasing thresholds, the samples with a score in a bin at or
+            above the threshold being predicted positive. The first one is
+            ``inf``.
+        """
+        n_pos, n_neg = self._totals()
+        xp = _get_namespace(self.positives)
+        low, high = self.score_range
+        edges = low + xp.arange(self.n_bins) * ((high - low) / self.n_bins)
+        filled = (self.positives + self.negatives) > 0
+        tps = xp.cumsum(self.positives[filled][::-1])
+        fps = xp.cumsum(self.negatives[filled][::-1])
+        zero = xp.zeros(1)
+        fpr = xp.concatenate([zero, fps / n_neg])
+        tpr = xp.concatenate([zero, tps / n_pos])
+        thresholds = xp.concatenate([xp.full(1, xp.inf), edges[filled][::-1]])
+        return fpr, tpr, thresholds
@@ -0,0 +1,458 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import cuml.internals
+from cuml.common import has_scipy
+from cuml.internals.device_type import DeviceType
+from cuml.internals.global_settings import GlobalSettings
+from cuml.internals.input_utils import input_to_cupy_array
+from cuml.internals.input_utils import input_to_host_array
+from cuml.internals.safe_imports import cpu_only_import
+from cuml.internals.safe_imports import gpu_only_import
+from cuml.metrics.pairwise_distances import PAIRWISE_DISTANCE_METRICS
+from cuml.metrics.pairwise_distances import pairwise_distances
+
+cp = gpu_only_import("cupy")
+np = cpu_only_import("numpy")
+
+# rows of X reduced at once by a host thread or a device iteration
+_ROW_TILE = 256
+# distances computed at once for a tile of rows
+_MAX_TILE_ELEMENTS = 1 << 22
+
+REDUCTIONS = ["min", "argmin", "topk", "sum", "logsumexp"]
+
+# metrics computed on host by scipy's cdist, under their name in cdist
+_CDIST_METRICS = {
+    "cityblock": "cityblock",
+    "l1": "cityblock",
+    "manhattan": "cityblock",
+    "canberra": "canberra",
+    "chebyshev": "chebyshev",
+    "minkowski": "minkowski",
+    "hamming": "hamming",
+    "jensenshannon": "jensenshannon",
+}
+
+
+def _prepare(A, metric):
+    """
+    Per-row arrays of ``A`` from which the host distances of a tile are
+    computed, mostly with a matrix product, computed once for all tiles.
+    """
+    if metric in ("euclidean", "l2", "sqeuclidean"):
+        return A, np.einsum("ij,ij->i", A, A)
+    if metric in ("cosine", "correlation"):
+        if metric == "correlation":
+            A = A - A.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(A, axis=1, keepdims=True)
+        # zero rows are at distance 1 of every row
+        return (A / np.where(norms > 0, norms, 1),)
+    if metric == "hellinger":
+        return (np.sqrt(A),)
+    if metric == "russellrao":
+        return ((A != 0).astype(A.dtype),)
+    if metric == "kldivergence":
+        positive = A > 0
+        log = np.log(np.where(positive, A, 1))
+        return A, A * log, (A != 0).astype(A.dtype), log
+    if metric == "nan_euclidean":
+        present = ~np.isnan(A)
+        A = np.where(present, A, 0)
+        return A, A * A, present.astype(A.dtype)
+    return (A,)
+
+
+def _host_distances(x, y, metric, metric_arg):
+    """Distances between two tiles of rows prepared by :func:`_prepare`."""
+    if metric in ("euclidean", "l2", "sqeuclidean"):
+        (x, x_sq), (y, y_sq) = x, y
+        d = x @ y.T
+        d *= -2
+        d += x_sq[:, None]
+        d += y_sq
+        np.maximum(d, 0, out=d)
+        return d if metric == "sqeuclidean" else np.sqrt(d, out=d)
+    if metric in ("cosine", "correlation"):
+        return 1 - x[0] @ y[0].T
+    if metric == "hellinger":
+        d = 1 - x[0] @ y[0].T
+        return np.sqrt(np.maximum(d, 0, out=d), out=d)
+    if metric == "russellrao":
+        n_features = x[0].shape[1]
+        return (n_features - x[0] @ y[0].T) / n_features
+    if metric == "kldivergence":
+        # 0.5 * sum(x * log(x / y)) over the features where y != 0
+        return 0.5 * (x[1] @ y[2].T - x[0] @ y[3].T)
+    if metric == "nan_euclidean":
+        (x, x_sq, x_present), (y, y_sq, y_present) = x, y
+        d = x_sq @ y_present.T + x_present @ y_sq.T - 2 * (x @ y.T)
+        np.maximum(d, 0, out=d)
+        present = x_present @ y_present.T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d *= x.shape[1] / present
+        d[present == 0] = np.nan
+        return np.sqrt(d, out=d)
+    from scipy.spatial.distance import cdist
+
+    kwargs = {"p": metric_arg} if metric == "minkowski" else {}
+    d = cdist(x[0], y[0], metric=_CDIST_METRICS[metric], **kwargs)
+    return d.astype(x[0].dtype, copy=False)
+
+
+def _first_smallest(value, k, xp):
+    """
+    Columns of the ``k`` smallest values of each row of ``value``, the
+    first columns winning ties, in increasing order. NaN are the largest.
+    """
+    key = xp.where(xp.isnan(value), xp.inf, value)
+    kth = xp.partition(key, k - 1, axis=1)[:, k - 1 : k]
+    less = key < kth
+    # the first columns tied with the k-th value complete the k values
+    tie = key == kth
+    n_ties = k - less.sum(axis=1, keepdims=True)
+    keep = less | (tie & (xp.cumsum(tie, axis=1) <= n_ties))
+    return xp.nonzero(keep)[1].reshape(-1, k)
+
+
+class _Reduction:
+    """
+    Running reduction of the tiles of distances of a tile of rows, the
+    tiles of columns being fed in order. With ``ignore_nan``, NaN distances
+    are left out of the reduction.
+    """
+
+    def __init__(self, reduce, n_rows, dtype, k, gamma, xp, ignore_nan):
+        self.reduce = reduce
+        self.ignore_nan = ignore_nan
+        self.k = k
+        self.gamma = gamma
+        self.xp = xp
+        if reduce in ("min", "argmin"):
+            self.value = xp.full(n_rows, xp.inf, dtype=dtype)
+            self.index = xp.zeros(n_rows, dtype=xp.int64)
+        elif reduce == "topk":
+            self.value = xp.empty((n_rows, 0), dtype=dtype)
+            self.index = xp.empty((n_rows, 0), dtype=xp.int64)
+        elif reduce == "sum":
+            self.value = xp.zeros(n_rows, dtype=xp.float64)
+        else:
+            # running maximum and sum of the exponentials shifted by it
+            self.top = xp.full(n_rows, -xp.inf)
+            self.value = xp.zeros(n_rows, dtype=xp.float64)
+
+    def update(self, d, start):
+        """Add the distances ``d`` to the columns from ``start``."""
+        xp = self.xp
+        if self.ignore_nan:
+            if self.reduce == "sum":
+                self.value += xp.nansum(d, axis=1)
+                return
+            d = xp.where(xp.isnan(d), xp.inf, d)
+        if self.reduce in ("min", "argmin"):
+            idx = d.argmin(axis=1)
+            value = xp.take_along_axis(d, idx[:, None], axis=1)[:, 0]
+            # the first column wins on ties, as in argmin
+            better = value < self.value
+            self.value = xp.where(better, value, self.value)
+            self.index = xp.where(better, idx + start, self.index)
+        elif self.reduce == "topk":
+            # the candidates are kept in index order, so are their rows
+            # extended with the new columns
+            value = xp.concatenate([self.value, d], axis=1)
+            index = xp.concatenate(
+                [
+                    self.index,
+                    xp.broadcast_to(
+                        xp.arange(start, start + d.shape[1]), d.shape
+                    ),
+                ],
+                axis=1,
+            )
+            if value.shape[1] > self.k:
+                value, index = self._smallest(value, index)
+            self.value, self.index = value, index
+        elif self.reduce == "sum":
+            self.value += d.sum(axis=1)
+        else:
+            d = -self.gamma * d.astype(xp.float64)
+            top = xp.maximum(self.top, d.max(axis=1))
+            # keep the shift finite for the rows without any term yet
+            shift = xp.where(top > -xp.inf, top, 0)
+            self.value = self.value * xp.exp(self.top - shift) + xp.exp(
+                d - shift[:, None]
+            ).sum(axis=1)
+            self.top = top
+
+    def _smallest(self, value, index):
+        """
+        The ``k`` smallest values of each row, ties being broken by index,
+        in the order of the rows. NaN values are the largest.
+        """
+        xp = self.xp
+        k = self.k
+        part = xp.argpartition(value, k - 1, axis=1)
+        cols = part[:, :k]
+        kth = xp.take_along_axis(value, part[:, k - 1 : k], axis=1)
+        # argpartition picks arbitrary members of the ties with the k-th
+        # value, the few rows having some (or NaN) are selected again
+        ambiguous = (value <= kth).sum(axis=1) != k
+        if ambiguous.any():
+            rows = xp.nonzero(ambiguous)[0]
+            cols[rows] = _first_smallest(value[rows], k, xp)
+        cols = xp.sort(cols, axis=1)
+        return (
+            xp.take_along_axis(value, cols, axis=1),
+            xp.take_along_axis(index, cols, axis=1),
+        )
+
+    def result(self):
+        xp = self.xp
+        if self.reduce == "min":
+            return self.value
+        if self.reduce == "argmin":
+            return self.index
+        if self.reduce == "topk":
+            # by increasing distance, then index as the candidates are in
+            # index order
+            order = xp.argsort(self.value, axis=1, kind="stable")
+            return (
+                xp.take_along_axis(self.value, order, axis=1),
+                xp.take_along_axis(self.index, order, axis=1),
+            )
+        if self.reduce == "sum":
+            return self.value
+        with np.errstate(divide="ignore"):
+            return xp.log(self.value) + xp.where(
+                self.top > -xp.inf, self.top, 0
+            )
+
+
+def _concatenate(results, xp):
+    """Concatenate the results of the tiles of rows, arrays or tuples."""
+    if isinstance(results[0], tuple):
+        return tuple(
+            xp.concatenate([r[i] for r in results])
+            for i in range(len(results[0]))
+        )
+    return xp.concatenate(results)
+
+
+@cuml.internals.api_return_any()
+def pairwise_distances_reduce(
+    X,
+    Y=None,
+    metric="euclidean",
+    reduce="argmin",
+    *,
+    k=None,
+    gamma=1.0,
+    metric_arg=2,
+    convert_dtype=True,
+    n_workers=None,
+):
+    """
+    Reduce the distance matrix between ``X`` and ``Y`` row by row, without
+    holding it.
+
+    The matrix is computed by tiles of rows of ``X`` and columns of ``Y``,
+    of a bounded size, each tile being folded into a running reduction of
+    its rows. On host, the tiles of rows are reduced in parallel by a pool
+    of threads. On device, the tiles are computed with
+    :func:`cuml.metrics.pairwise_distances`.
+
+    Parameters
+    ----------
+    X : array-like of shape (n_samples_x, n_features)
+    Y : array-like of shape (n_samples_y, n_features), default=None
+        ``X`` if None.
+    metric : str, default='euclidean'
+        One of the metrics of ``PAIRWISE_DISTANCE_METRICS``.
+    reduce : str or callable, default='argmin'
+        Reduction of each row of the distance matrix:
+
+        - 'min': smallest distance, array of shape (n_samples_x,).
+        - 'argmin': index in ``Y`` of the smallest distance, the first
+          one in case of ties, array of shape (n_samples_x,).
+        - 'topk': ``k`` smallest distances and their indices in ``Y``, by
+          increasing distance, a pair of arrays of shape (n_samples_x, k).
+        - 'sum': sum of the distances, array of shape (n_samples_x,).
+        - 'logsumexp': ``log(sum(exp(-gamma * D)))``, array of shape
+          (n_samples_x,).
+        - a callable ``reduce(D_chunk, start)``, as in scikit-learn's
+          ``pairwise_distances_chunked``, given the distances of all of
+          ``Y`` for the rows of ``X`` from ``start`` and returning an
+          array, or a tuple of arrays, of the reductions of these rows.
+          Its results are concatenated. On host it is called from several
+          threads unless ``n_workers=1``.
+
+        The undefined 'nan_euclidean' distances, between rows without any
+        feature present in both, are left out of the built-in reductions.
+    k : int, default=None
+        Number of distances kept by 'topk'.
+    gamma : float, default=1.0
+        Scale of the distances of 'logsumexp'.
+    metric_arg : float, default=2
+        Order of the 'minkowski' metric.
+    convert_dtype : bool, default=True
+        Convert the inputs to float32, ``Y`` being converted to the dtype
+        of ``X`` in any case.
+    n_workers : int, default=None
+        Number of host threads, the number of CPUs if None.
+
+    Returns
+    -------
+    reduced : array or tuple of arrays
+        NumPy arrays on host, CuPy arrays on device.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        >>> import numpy as np
+        >>> from cuml.metrics import pairwise_distances_reduce
+        >>> X = np.array([[0.0, 0.0], [4.0, 4.0]])
+        >>> Y = np.array([[1.0, 0.0], [3.0, 3.0], [5.0, 5.0]])
+        >>> pairwise_distances_reduce(X, Y, reduce="argmin")
+        array([0, 1])
+    """
+    if metric not in PAIRWISE_DISTANCE_METRICS:
+        raise ValueError("Unknown metric: {}".format(metric))
+    if not callable(reduce) and reduce not in REDUCTIONS:
+        raise ValueError(
+            "reduce must be one of {} or a callable, got {!r}".format(
+                REDUCTIONS, reduce
+            )
+        )
+
+    host = GlobalSettings().device_type is DeviceType.host
+    xp, to_array = (
+        (np, input_to_host_array) if host else (cp, input_to_cupy_array)
+    )
+    X, n_x, n_features, dtype = to_array(
+        X,
+        order="C",
+        convert_to_dtype=np.float32 if convert_dtype else None,
+        check_dtype=[np.float32, np.float64],
+    )
+    if Y is None:
+        Y, n_y = X, n_x
+    else:
+        Y, n_y, n_features_y, _ = to_array(
+            Y, order="C", convert_to_dtype=dtype, check_dtype=[dtype]
+        )
+        if n_features_y != n_features:
+            raise ValueError(
+                "Incompatible dimension for X and Y matrices: X.shape[1] == "
+                "{} while Y.shape[1] == {}".format(n_features, n_features_y)
+            )
+    X = X.reshape(n_x, -1)
+    Y = Y.reshape(n_y, -1)
+    if reduce == "topk" and (k is None or not 1 <= k <= n_y):
+        raise ValueError(
+            "k must be between 1 and the {} rows of Y, got {}".format(n_y, k)
+        )
+    if metric == "russellrao" and host:
+        # as done by pairwise_distances on device
+        if not bool(((X == 0) | (X == 1)).all()):
+            warnings.warn("X was converted to boolean for metric russellrao")
+            X = (X != 0).astype(dtype)
+        if not bool(((Y == 0) | (Y == 1)).all()):
+            warnings.warn("Y was converted to boolean for metric russellrao")
+            Y = (Y != 0).astype(dtype)
+
+    if not n_x or not n_y:
+        raise ValueError("X and Y must have at least one row")
+
+    # the callbacks are given whole rows of the matrix
+    n_rows = _ROW_TILE
+    if callable(reduce):
+        n_rows = max(1, _MAX_TILE_ELEMENTS // n_y)
+        n_cols = n_y
+    else:
+        n_cols = max(1, _MAX_TILE_ELEMENTS // n_rows)
+    row_tiles = [(s, min(s + n_rows, n_x)) for s in range(0, n_x, n_rows)]
+    col_tiles = [(s, min(s + n_cols, n_y)) for s in range(0, n_y, n_cols)]
+
+    # the smallest euclidean distances are the square roots of the
+    # smallest squared distances, cheaper on host
+    squared = (
+        host
+        and metric in ("euclidean", "l2")
+        and reduce in ("min", "argmin", "topk")
+    )
+    if host:
+        if metric in _CDIST_METRICS:
+            has_scipy(raise_if_unavailable=True)
+        tile_metric = "sqeuclidean" if squared else metric
+        y_prep = _prepare(Y, tile_metric)
+
+        def prepare(x):
+            return _prepare(x, tile_metric)
+
+        def distances(x, start, stop):
+            y = tuple(a[start:stop] for a in y_prep)
+            return _host_distances(x, y, tile_metric, metric_arg)
+
+    else:
+
+        def prepare(x):
+            return x
+
+        def distances(x, start, stop):
+            d = pairwise_distances(
+                x,
+                Y[start:stop],
+                metric=metric,
+                metric_arg=metric_arg,
+                convert_dtype=False,
+            )
+            return cp.asarray(d, dtype=dtype)
+
+    def reduce_rows(rows):
+        x = prepare(X[rows[0] : rows[1]])
+        if callable(reduce):
+            return reduce(distances(x, 0, n_y), rows[0])
+        reduction = _Reduction(
+            reduce,
+            rows[1] - rows[0],
+            dtype,
+            k,
+            gamma,
+            xp,
+            ignore_nan=metric == "nan_euclidean",
+        )
+        for start, stop in col_tiles:
+            reduction.update(distances(x, start, stop), start)
+        if not squared or reduce == "argmin":
+            return reduction.result()
+        if reduce == "min":
+            return np.sqrt(reduction.result())
+        value, index = reduction.result()
+        return np.sqrt(value), index
+
+    if host:
+        n_workers = min(len(row_tiles), n_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(reduce_rows, row_tiles))
+    else:
+        results = [reduce_rows(rows) for rows in row_tiles]
+    return _concatenate(results, xp)
@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2020-2023, NVIDIA CORPORATION.
+# Copyright (c) 2020-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,16 +15,29 @@
 #
 
 import math
-from cuml.internals.input_utils import input_to_cupy_array
+import os
+from concurrent.futures import ThreadPoolExecutor
+from cuml.internals.input_utils import (
+    input_to_cupy_array,
+    input_to_host_array,
+)
 from cuml.internals.array import CumlArray
+from cuml.internals.device_type import DeviceType
+from cuml.internals.global_settings import GlobalSettings
 import cuml.internals
 from cuml.internals.safe_imports import cpu_only_import
 import typing
 from cuml.internals.safe_imports import gpu_only_import
 
 cp = gpu_only_import("cupy")
+cupyx = gpu_only_import("cupyx")
 np = cpu_only_import("numpy")
 
+# samples ranked at once by a thread of the host exact roc_auc_score
+_PARTITION_SIZE = 1 << 18
+# bins of the scores of all the classes of the host exact roc_auc_score
+_N_BUCKETS = 1 << 16
+
 
 @cuml.internals.api_return_generic(get_output_type=True)
 def precision_recall_curve(
@@ -120,28 +133,67 @@ def precision_recall_curve(
 
 
 @cuml.internals.api_return_any()
-def roc_auc_score(y_true, y_score):
+def roc_auc_score(
+    y_true,
+    y_score,
+    *,
+    average="macro",
+    sample_weight=None,
+    multi_class="raise",
+    labels=None,
+    n_bins=None,
+    return_error_bound=False,
+):
     """
     Compute Area Under the Receiver Operating Characteristic Curve (ROC AUC)
     from prediction scores.
 
-    .. note:: this implementation can only be used with binary classification.
+    The area is the fraction of the pairs of a positive and a negative
+    sample whose scores are ranked correctly, tied scores counting for one
+    half. It is computed exactly by default: on device by sorting the
+    scores, on host by a partitioned sort, the samples being spread in
+    buckets of scores that are sorted independently by a pool of threads.
+    With ``n_bins``, it is approximated without any sort from histograms of
+    the scores of the positive and negative samples.
 
     Parameters
     ----------
     y_true : array-like of shape (n_samples,)
-        True labels. The binary cases
-        expect labels with shape (n_samples,)
-    y_score : array-like of shape (n_samples,)
-        Target scores. In the binary cases, these can be either
-        probability estimates or non-thresholded decision values (as returned
-        by `decision_function` on some classifiers). The binary
-        case expects a shape (n_samples,), and the scores must be the scores of
-        the class with the greater label.
+        True labels. In the binary case the positive class is the greater
+        label.
+    y_score : array-like of shape (n_samples,) or (n_samples, n_classes)
+        Target scores. In the binary case, these can be either probability
+        estimates or non-thresholded decision values (as returned by
+        `decision_function` on some classifiers), of the class with the
+        greater label. In the multiclass case, the scores of each class,
+        in the order of the sorted labels.
+    average : {'macro', 'weighted'} or None, default='macro'
+        Multiclass only. Average of the one-vs-rest areas of the classes,
+        weighted by the prevalence of the classes for 'weighted'. If None,
+        the area of each class is returned.
+    sample_weight : array-like of shape (n_samples,), default=None
+        Weights of the samples.
+    multi_class : {'raise', 'ovr'}, default='raise'
+        Multiclass only. 'ovr' computes the area of each class against the
+        rest. All the classes are ranked at once, with a single sort.
+    labels : array-like of shape (n_classes,), default=None
+        Multiclass only. Labels of the columns of ``y_score``, the sorted
+        labels of ``y_true`` if None.
+    n_bins : int, default=None
+        If set, approximate the area from histograms of ``n_bins`` equal
+        bins between the smallest and largest score of each class. Pairs in
+        different bins are ranked exactly, pairs in a bin count for one
+        half, which is exact for the bins whose scores are all equal.
+    return_error_bound : bool, default=False
+        Also return a bound of the absolute error of the area, the half of
+        the fraction of the pairs in a bin holding distinct scores. Zero
+        for the exact computation.
 
     Returns
     -------
-        auc : float
+    auc : float or array of shape (n_classes,)
+    error_bound : float or array of shape (n_classes,)
+        Only returned if ``return_error_bound`` is True.
 
     Examples
     --------
@@ -153,17 +205,103 @@ def roc_auc_score(y_true, y_score):
     0.75
 
     """
-    y_true, n_rows, n_cols, ytype = input_to_cupy_array(
+    if GlobalSettings().device_type is DeviceType.host:
+        xp, to_array = np, input_to_host_array
+    else:
+        xp, to_array = cp, input_to_cupy_array
+    y_true, n_rows, _, _ = to_array(
         y_true, check_dtype=[np.int32, np.int64, np.float32, np.float64]
     )
-
-    y_score, _, _, _ = input_to_cupy_array(
+    y_score, _, _, _ = to_array(
         y_score,
         check_dtype=[np.int32, np.int64, np.float32, np.float64],
         check_rows=n_rows,
-        check_cols=n_cols,
     )
-    return _binary_roc_auc_score(y_true, y_score)
+    y_true = y_true.ravel()
+    weights = None
+    if sample_weight is not None:
+        weights = to_array(
+            sample_weight, convert_to_dtype=np.float64, check_rows=n_rows
+        ).array.ravel()
+
+    if y_true.dtype.kind == "f" and bool(xp.any(y_true != y_true.astype(int))):
+        raise ValueError("Continuous format of y_true  " "is not supported.")
+    if bool(xp.isnan(y_score).any()):
+        raise ValueError("Input contains NaN.")
+    if n_bins is not None and n_bins < 1:
+        raise ValueError("n_bins must be at least 1, got {}".format(n_bins))
+
+    multiclass = y_score.ndim == 2 and y_score.shape[1] > 1
+    if multiclass:
+        if multi_class != "ovr":
+            raise ValueError(
+                "multi_class must be 'ovr' for multiclass scores, got "
+                "{!r}".format(multi_class)
+            )
+        if average not in ("macro", "weighted", None):
+            raise ValueError(
+                "average must be 'macro', 'weighted' or None, got "
+                "{!r}".format(average)
+            )
+        classes = xp.unique(y_true) if labels is None else xp.asarray(labels)
+        if len(classes) != y_score.shape[1]:
+            raise ValueError(
+                "Number of classes in y_true not equal to the number of "
+                "columns in 'y_score'"
+            )
+        order = xp.argsort(classes)
+        codes = xp.minimum(
+            xp.searchsorted(classes[order], y_true), len(classes) - 1
+        )
+        if bool(xp.any(classes[order][codes] != y_true)):
+            raise ValueError("y_true contains labels not in 'labels'")
+        codes = order[codes]
+        scores = xp.ascontiguousarray(y_score.T, dtype=xp.float64)
+        positives = codes[None, :] == xp.arange(len(classes))[:, None]
+    else:
+        # the labels are not sorted, only two of them are expected
+        positives = y_true == y_true.max()
+        if bool(xp.any(~positives & (y_true != y_true.min()))):
+            raise ValueError(
+                "y_score must be of shape (n_samples, n_classes) for "
+                "multiclass y_true"
+            )
+        scores = y_score.astype(xp.float64).reshape(1, -1)
+        positives = positives.reshape(1, -1)
+
+    if weights is None:
+        n_pos = positives.sum(axis=1)
+        n_neg = positives.shape[1] - n_pos
+    else:
+        n_pos = (positives * weights).sum(axis=1)
+        n_neg = weights.sum() - n_pos
+    if bool(xp.any(n_pos == 0) or xp.any(n_neg == 0)):
+        raise ValueError(
+            "roc_auc_score cannot be used when "
+            "only one class present in y_true. ROC AUC score "
+            "is not defined in that case."
+        )
+
+    if n_bins is not None:
+        pairs, bound = _binned_pairs(scores, positives, weights, n_bins, xp)
+    elif xp is np:
+        pairs = _partitioned_pairs(scores, positives, weights)
+        bound = xp.zeros(len(scores))
+    else:
+        pairs = _sorted_pairs(scores, positives, weights, xp)
+        bound = xp.zeros(len(scores))
+    auc = pairs / (n_pos * n_neg)
+    bound = bound / (n_pos * n_neg)
+
+    if not multiclass:
+        auc, bound = float(auc[0]), float(bound[0])
+    elif average is not None:
+        prevalence = n_pos if average == "weighted" else xp.ones(len(auc))
+        auc = float((auc * prevalence).sum() / prevalence.sum())
+        bound = float((bound * prevalence).sum() / prevalence.sum())
+    if return_error_bound:
+        return auc, bound
+    return auc
 
 
 def _binary_clf_curve(y_true, y_score):
@@ -193,26 +331,6 @@ def _binary_clf_curve(y_true, y_score):
     return fps, tps, thresholds
 
 
-def _binary_roc_auc_score(y_true, y_score):
-    """Compute binary roc_auc_score using cupy"""
-
-    if cp.unique(y_true).shape[0] == 1:
-        raise ValueError(
-            "roc_auc_score cannot be used when "
-            "only one class present in y_true. ROC AUC score "
-            "is not defined in that case."
-        )
-
-    if cp.unique(y_score).shape[0] == 1:
-        return 0.5
-
-    fps, tps, thresholds = _binary_clf_curve(y_true, y_score)
-    tpr = tps / tps[-1]
-    fpr = fps / fps[-1]
-
-    return _calculate_area_under_curve(fpr, tpr).item()
-
-
 def _addup_x_in_group(group, x, result):
     addup_x_in_group_kernel = cp.RawKernel(
         r"""
@@ -244,9 +362,183 @@ def _group_same_scores(sorted_score):
     return group
 
 
-def _calculate_area_under_curve(fpr, tpr):
-    """helper function to calculate area under curve given fpr & tpr arrays"""
-    return (
-        cp.sum((fpr[1:] - fpr[:-1]) * (tpr[1:] + tpr[:-1])) / 2
-        + tpr[0] * fpr[0] / 2
+def _ranked_pairs(
+    sorted_score, pos_weight, neg_weight, segment, n_segments, xp
+):
+    """
+    Weight of the positive-negative pairs ranked correctly, ties counting
+    for one half, in each segment of samples sorted by increasing score.
+
+    ``segment`` holds the non-decreasing segment of each sample.
+    """
+    if not len(sorted_score):
+        return xp.zeros(n_segments)
+    new = xp.empty(len(sorted_score), dtype=bool)
+    new[0] = True
+    new[1:] = (sorted_score[1:] != sorted_score[:-1]) | (
+        segment[1:] != segment[:-1]
     )
+    group = xp.cumsum(new) - 1
+    pos = xp.bincount(group, weights=pos_weight)
+    neg = xp.bincount(group, weights=neg_weight)
+    group_segment = segment[new]
+    # negatives below each group of tied scores, in its segment only
+    below = xp.cumsum(neg) - neg
+    segment_neg = xp.bincount(group_segment, weights=neg, minlength=n_segments)
+    below -= (xp.cumsum(segment_neg) - segment_neg)[group_segment]
+    return xp.bincount(
+        group_segment, weights=pos * (below + neg / 2), minlength=n_segments
+    )
+
+
+def _sample_weights(positives, weights, xp):
+    """Weights of the positive and negative samples of each class."""
+    w = xp.ones(positives.shape[1]) if weights is None else weights
+    return positives * w, ~positives * w
+
+
+def _sorted_pairs(scores, positives, weights, xp):
+    """Ranked pairs of each row, the rows being sorted at once."""
+    n_rows, n_samples = scores.shape
+    order = xp.argsort(scores, axis=1)
+    pos_weight, neg_weight = _sample_weights(positives, weights, xp)
+    segment = xp.repeat(xp.arange(n_rows), n_samples)
+    return _ranked_pairs(
+        xp.take_along_axis(scores, order, axis=1).ravel(),
+        xp.take_along_axis(pos_weight, order, axis=1).ravel(),
+        xp.take_along_axis(neg_weight, order, axis=1).ravel(),
+        segment,
+        n_rows,
+        xp,
+    )
+
+
+def _bins(scores, n_bins, xp):
+    """Equal bins between the smallest and largest score of each row."""
+    low = scores.min(axis=1, keepdims=True)
+    high = scores.max(axis=1, keepdims=True)
+    scale = n_bins / xp.where(high > low, high - low, 1)
+    bins = ((scores - low) * scale).astype(xp.int64)
+    return xp.minimum(bins, n_bins - 1)
+
+
+def _histograms(keys, positives, weights, n_keys, xp):
+    """Weight of the positive and negative samples of each key."""
+    if weights is None:
+        total = xp.bincount(keys, minlength=n_keys)
+        pos = xp.bincount(keys[positives.ravel()], minlength=n_keys)
+        return pos.astype(xp.float64), (total - pos).astype(xp.float64)
+    pos_weight, neg_weight = _sample_weights(positives, weights, xp)
+    pos = xp.bincount(keys, weights=pos_weight.ravel(), minlength=n_keys)
+    neg = xp.bincount(keys, weights=neg_weight.ravel(), minlength=n_keys)
+    return pos, neg
+
+
+def _binned_pairs(scores, positives, weights, n_bins, xp):
+    """
+    Ranked pairs of each row approximated from histograms of the scores,
+    and the weight of the pairs that could be ranked either way.
+    """
+    n_rows = len(scores)
+    keys = _bins(scores, n_bins, xp) + xp.arange(n_rows)[:, None] * n_bins
+    keys = keys.ravel()
+    n_keys = n_rows * n_bins
+    pos, neg = _histograms(keys, positives, weights, n_keys, xp)
+
+    # the pairs of a bin whose scores are all equal are true ties
+    bin_min = xp.full(n_keys, xp.inf)
+    bin_max = xp.full(n_keys, -xp.inf)
+    if xp is np:
+        np.minimum.at(bin_min, keys, scores.ravel())
+        np.maximum.at(bin_max, keys, scores.ravel())
+    else:
+        cupyx.scatter_min(bin_min, keys, scores.ravel())
+        cupyx.scatter_max(bin_max, keys, scores.ravel())
+
+    pos = pos.reshape(n_rows, n_bins)
+    neg = neg.reshape(n_rows, n_bins)
+    below = xp.cumsum(neg, axis=1) - neg
+    pairs = (pos * (below + neg / 2)).sum(axis=1)
+    distinct = (bin_max > bin_min).reshape(n_rows, n_bins)
+    return pairs, (pos * neg * distinct).sum(axis=1) / 2
+
+
+def _partition_pairs(scores, positives, weights, idx):
+    """Ranked pairs of the samples ``idx`` of the flattened rows."""
+    s = scores[idx]
+    p = positives[idx]
+    if weights is None:
+        pos = np.sort(s[p])
+        neg = np.sort(s[~p])
+        left = np.searchsorted(neg, pos, side="left")
+        right = np.searchsorted(neg, pos, side="right")
+        return float(left.sum()) + float((right - left).sum()) / 2
+    order = np.argsort(s)
+    w = weights[idx[order] % len(weights)]
+    p = p[order]
+    segment = np.zeros(len(idx), dtype=np.int64)
+    return float(_ranked_pairs(s[order], w * p, w * ~p, segment, 1, np)[0])
+
+
+def _partitioned_pairs(scores, positives, weights, n_workers=None):
+    """
+    Exact ranked pairs of each row by a partitioned sort on host.
+
+    The samples are spread in equal bins of scores per row. The pairs in
+    different bins are counted from the histograms of the bins, the
+    samples of the bins holding both positives and negatives are gathered
+    by a counting sort of their bins, then ranked by partitions of whole
+    bins of a row, sorted in parallel.
+    """
+    n_rows, n_samples = scores.shape
+    n_bins = max(1, min(_N_BUCKETS // n_rows, n_samples))
+    keys = _bins(scores, n_bins, np) + np.arange(n_rows)[:, None] * n_bins
+    keys = keys.astype(np.uint16 if n_rows * n_bins <= 1 << 16 else np.int64)
+    keys = keys.ravel()
+    pos, neg = _histograms(keys, positives, weights, n_rows * n_bins, np)
+    pos = pos.reshape(n_rows, n_bins)
+    neg = neg.reshape(n_rows, n_bins)
+    pairs = (pos * (np.cumsum(neg, axis=1) - neg)).sum(axis=1)
+
+    mixed = ((pos > 0) & (neg > 0)).ravel()
+    mixed_keys = np.flatnonzero(mixed)
+    if not len(mixed_keys):
+        return pairs
+    counts = np.bincount(keys, minlength=len(mixed))[mixed_keys]
+    # stable argsort of 16 bits integers is a radix sort
+    sel = np.flatnonzero(mixed[keys])
+    sel = sel[np.argsort(keys[sel], kind="stable")]
+
+    # partitions of about _PARTITION_SIZE samples, not crossing rows
+    rows = mixed_keys // n_bins
+    start = np.cumsum(counts) - counts
+    offset = start - start[np.searchsorted(rows, rows)]
+    part = offset // _PARTITION_SIZE
+    new = np.empty(len(mixed_keys), dtype=bool)
+    new[0] = True
+    new[1:] = (rows[1:] != rows[:-1]) | (part[1:] != part[:-1])
+    part = np.cumsum(new) - 1
+    bounds = np.append(start[new], len(sel))
+
+    # the pairs of different bins of a partition are already counted
+    pos_m = pos.ravel()[mixed_keys]
+    neg_m = neg.ravel()[mixed_keys]
+    cum_neg = np.cumsum(neg_m) - neg_m
+    cum_neg -= cum_neg[np.searchsorted(part, part)]
+    pairs -= np.bincount(rows, weights=pos_m * cum_neg, minlength=n_rows)
+
+    flat_scores = scores.ravel()
+    flat_positives = positives.ravel()
+    n_workers = min(len(bounds) - 1, n_workers or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        within = executor.map(
+            lambda i: _partition_pairs(
+                flat_scores,
+                flat_positives,
+                weights,
+                sel[bounds[i] : bounds[i + 1]],
+            ),
+            range(len(bounds) - 1),
+        )
+        within = np.fromiter(within, dtype=np.float64)
+    return pairs + np.bincount(rows[new], weights=within, minlength=n_rows)
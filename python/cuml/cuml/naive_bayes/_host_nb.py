@@ -0,0 +1,172 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Host (CPU) engine of the naive Bayes estimators.
+
+The per-class feature counts of a chunk of samples are the product of a
+``(n_classes, n_samples)`` class indicator matrix with the chunk, i.e. a
+segment sum of the rows of each class computed by the SciPy sparse kernels.
+Sparse chunks are never densified, only their (class, feature) sums are
+added to the counters, which are kept in float64 so that they stay exact
+over very large numbers of samples.
+"""
+
+from cuml.internals.safe_imports import cpu_only_import
+
+np = cpu_only_import("numpy")
+sp = cpu_only_import("scipy.sparse")
+
+
+def is_host_array(X):
+    """Whether ``X`` is a NumPy array or a SciPy sparse matrix."""
+    return isinstance(X, np.ndarray) or sp.issparse(X)
+
+
+def to_host_X(X, convert_dtype=True):
+    """
+    Convert samples to a SciPy CSR matrix or a 2D NumPy array.
+
+    Sparse matrices must hold floating point values. Dense integer samples
+    are cast to float32 if ``convert_dtype``.
+    """
+    if sp.issparse(X):
+        if X.dtype not in (np.float32, np.float64):
+            raise ValueError(
+                "Only floating-point dtypes (float32 or "
+                "float64) are supported for sparse inputs."
+            )
+        return X.tocsr()
+    if hasattr(X, "to_numpy"):
+        # pandas or cuDF
+        X = X.to_numpy()
+    X = np.asarray(X)
+    if X.ndim != 2:
+        raise ValueError("Input samples should be a 2D array")
+    if convert_dtype and X.dtype.kind not in "f":
+        X = X.astype(np.float32)
+    return X
+
+
+def to_host_y(y):
+    """Convert labels to a 1D NumPy array."""
+    if hasattr(y, "to_numpy"):
+        y = y.to_numpy()
+    elif hasattr(y, "get"):
+        # CuPy
+        y = y.get()
+    return np.asarray(y).ravel()
+
+
+def encode_labels(y, classes):
+    """
+    Position of each label of ``y`` in the sorted array ``classes``.
+
+    Raises a ValueError for labels that are not in ``classes``.
+    """
+    codes = np.searchsorted(classes, y)
+    codes[codes == len(classes)] = 0
+    unknown = len(classes) == 0 or not np.array_equal(classes[codes], y)
+    if unknown:
+        raise ValueError(
+            "Labels %s are not in classes %s"
+            % (np.setdiff1d(y, classes), classes)
+        )
+    return codes
+
+
+def binarize(X, threshold):
+    """Map the values of ``X`` to 1 above ``threshold``, 0 otherwise."""
+    if sp.issparse(X):
+        X = X.copy()
+        X.data = (X.data > threshold).astype(X.dtype)
+        X.eliminate_zeros()
+        return X
+    return (X > threshold).astype(X.dtype)
+
+
+def _class_indicator(Y, n_classes):
+    """Sparse (n_classes, n_samples) matrix with a 1 at (Y[i], i)."""
+    n_samples = len(Y)
+    return sp.csr_matrix(
+        (np.ones(n_samples), (Y, np.arange(n_samples))),
+        shape=(n_classes, n_samples),
+    )
+
+
+def add_counts(feature_count, class_count, X, Y):
+    """
+    Add the per-class feature sums and sample counts of a chunk.
+
+    Parameters
+    ----------
+    feature_count : numpy.ndarray of shape (n_classes, n_features)
+        Updated in place.
+    class_count : numpy.ndarray of shape (n_classes,)
+        Updated in place.
+    X : scipy.sparse.csr_matrix or numpy.ndarray of shape \
+            (n_samples, n_features)
+    Y : numpy.ndarray of shape (n_samples,)
+        Class index of each sample.
+    """
+    n_classes = len(class_count)
+    sums = _class_indicator(Y, n_classes) @ X
+    if sp.issparse(sums) and sums.nnz * 8 < feature_count.size:
+        sums = sums.tocoo()
+        # (row, col) pairs are unique, the fancy-indexed add is exact
+        feature_count[sums.row, sums.col] += sums.data
+    elif sp.issparse(sums):
+        # densifying is cheaper than scattering many non-zeros
+        feature_count += sums.toarray()
+    else:
+        feature_count += sums
+    class_count += np.bincount(Y, minlength=n_classes)
+
+
+def class_moments(X, Y, n_classes):
+    """
+    Per-class sample count, feature means and sums of squared deviations.
+
+    Sparse chunks are summarized in a single pass over their non-zeros,
+    from the per-class sums of the values and of their squares. Dense
+    chunks are centered on the class means first, which is more accurate.
+
+    Parameters
+    ----------
+    X : scipy.sparse.csr_matrix or numpy.ndarray of shape \
+            (n_samples, n_features)
+    Y : numpy.ndarray of shape (n_samples,)
+        Class index of each sample.
+    n_classes : int
+
+    Returns
+    -------
+    count : numpy.ndarray of shape (n_classes, 1)
+    mean, m2 : numpy.ndarray of shape (n_classes, n_features)
+    """
+    indicator = _class_indicator(Y, n_classes)
+    count = np.bincount(Y, minlength=n_classes).astype(np.float64)
+    count = count.reshape(-1, 1)
+    X = X.astype(np.float64, copy=False)
+    sums = indicator @ X
+    if sp.issparse(X):
+        sums = sums.toarray()
+        mean = sums / np.maximum(count, 1)
+        squares = (indicator @ X.power(2)).toarray()
+        m2 = np.maximum(squares - sums * mean, 0)
+    else:
+        mean = sums / np.maximum(count, 1)
+        m2 = indicator @ (X - mean[Y]) ** 2
+    return count, mean, m2
@@ -25,9 +25,23 @@ from cuml.internals.mixins import ClassifierMixin
 from cuml.internals.base import Base
 from cuml.common.array_descriptor import CumlArrayDescriptor
 from cuml.common import CumlArray
+from cuml.internals.device_type import DeviceType
+from cuml.internals.global_settings import GlobalSettings
+from cuml.naive_bayes._host_nb import (
+    add_counts,
+    binarize as binarize_host,
+    class_moments,
+    encode_labels,
+    is_host_array,
+    to_host_X,
+    to_host_y,
+)
+import cuml.internals
 import math
+import typing
 import warnings
 from cuml.internals.safe_imports import (
+    cpu_only_import,
     gpu_only_import,
     gpu_only_import_from,
     null_decorator,
@@ -36,6 +50,8 @@ from cuml.internals.safe_imports import (
 nvtx_annotate = gpu_only_import_from("nvtx", "annotate", alt=null_decorator)
 cp = gpu_only_import("cupy")
 cupyx = gpu_only_import("cupyx")
+np = cpu_only_import("numpy")
+scipy_sparse = cpu_only_import("scipy.sparse")
 
 
 def count_features_coo_kernel(float_dtype, int_dtype):
@@ -151,6 +167,34 @@ def _convert_x_sparse(X):
     return cupyx.scipy.sparse.coo_matrix((data, (rows, cols)), shape=X.shape)
 
 
+def _is_sparse(X):
+    """Whether X is a SciPy or a CuPy sparse matrix."""
+    if is_host_array(X):
+        return scipy_sparse.issparse(X)
+    return cupyx.scipy.sparse.isspmatrix(X)
+
+
+def _combine_moments(n_a, mean_a, m2_a, n_b, mean_b, m2_b):
+    """
+    Sample count, mean and sum of squared deviations of the union of two
+    sets of samples, with the pairwise update of Chan, Golub and LeVeque.
+    """
+    n = n_a + n_b
+    # empty classes keep a zero mean
+    safe_n = n + (n == 0)
+    delta = mean_b - mean_a
+    mean = mean_a + delta * (n_b / safe_n)
+    m2 = m2_a + m2_b + delta**2 * (n_a * n_b / safe_n)
+    return n, mean, m2
+
+
+def _feature_variance(X):
+    """Variance of each feature, without densifying sparse matrices."""
+    if _is_sparse(X):
+        return X.power(2).mean(axis=0) - X.mean(axis=0) ** 2
+    return X.var(axis=0)
+
+
 class _BaseNB(Base, ClassifierMixin):
 
     classes_ = CumlArrayDescriptor()
@@ -168,20 +212,18 @@ class _BaseNB(Base, ClassifierMixin):
         """To be overridden in subclasses with the actual checks."""
         return X
 
-    @generate_docstring(
-        X="dense_sparse",
-        return_values={
-            "name": "y_hat",
-            "type": "dense",
-            "description": "Predicted values",
-            "shape": "(n_rows, 1)",
-        },
-    )
-    def predict(self, X, convert_dtype=True) -> CumlArray:
-        """
-        Perform classification on an array of test vectors X.
+    def _xp(self):
+        """Array module of the fitted attributes, NumPy for host models."""
+        return np if self.__dict__.get("_host") else cp
 
+    def _prepare_X(self, X, convert_dtype=True):
         """
+        Convert and check samples to predict, returning them with their
+        index. Host models take SciPy CSR matrices or NumPy arrays.
+        """
+        if self.__dict__.get("_host"):
+            return self._check_X(to_host_X(X, convert_dtype)), None
+
         if has_scipy():
             from scipy.sparse import isspmatrix as scipy_sparse_isspmatrix
         else:
@@ -205,56 +247,36 @@ class _BaseNB(Base, ClassifierMixin):
             # todo: improve index management for cupy based codebases
             X = X.array.to_output("cupy")
 
-        X = self._check_X(X)
-        jll = self._joint_log_likelihood(X)
-        indices = cp.argmax(jll, axis=1).astype(self.classes_.dtype)
-
-        y_hat = invert_labels(indices, classes=self.classes_)
-        y_hat = CumlArray(data=y_hat, index=index)
-        return y_hat
+        return self._check_X(X), index
 
     @generate_docstring(
         X="dense_sparse",
         return_values={
-            "name": "C",
+            "name": "y_hat",
             "type": "dense",
-            "description": (
-                "Returns the log-probability of the samples for each class in "
-                "the model. The columns correspond to the classes in sorted "
-                "order, as they appear in the attribute `classes_`."
-            ),
+            "description": "Predicted values",
             "shape": "(n_rows, 1)",
         },
     )
-    def predict_log_proba(self, X, convert_dtype=True) -> CumlArray:
+    def predict(self, X, convert_dtype=True) -> CumlArray:
         """
-        Return log-probability estimates for the test vector X.
+        Perform classification on an array of test vectors X.
 
         """
-        if has_scipy():
-            from scipy.sparse import isspmatrix as scipy_sparse_isspmatrix
-        else:
-            from cuml.internals.import_utils import (
-                dummy_function_always_false as scipy_sparse_isspmatrix,
-            )
+        X, index = self._prepare_X(X, convert_dtype)
+        jll = self._joint_log_likelihood(X)
+        if self.__dict__.get("_host"):
+            return CumlArray(data=self.classes_[jll.argmax(axis=1)])
 
-        # todo: use a sparse CumlArray style approach when ready
-        # https://github.com/rapidsai/cuml/issues/2216
-        if scipy_sparse_isspmatrix(X) or cupyx.scipy.sparse.isspmatrix(X):
-            X = _convert_x_sparse(X)
-            index = None
-        else:
-            X = input_to_cuml_array(
-                X,
-                order="K",
-                convert_to_dtype=(cp.float32 if convert_dtype else None),
-                check_dtype=[cp.float32, cp.float64, cp.int32],
-            )
-            index = X.index
-            # todo: improve index management for cupy based codebases
-            X = X.array.to_output("cupy")
+        indices = cp.argmax(jll, axis=1).astype(self.classes_.dtype)
+
+        y_hat = invert_labels(indices, classes=self.classes_)
+        y_hat = CumlArray(data=y_hat, index=index)
+        return y_hat
 
-        X = self._check_X(X)
+    def _normalized_log_proba(self, X):
+        """Normalized log-probabilities of prepared samples."""
+        xp = self._xp()
         jll = self._joint_log_likelihood(X)
 
         # normalize by P(X) = P(f_1, ..., f_n)
@@ -262,18 +284,72 @@ class _BaseNB(Base, ClassifierMixin):
         # Compute log(sum(exp()))
 
         # Subtract max in exp to prevent inf
-        a_max = cp.amax(jll, axis=1, keepdims=True)
+        a_max = xp.amax(jll, axis=1, keepdims=True)
 
-        exp = cp.exp(jll - a_max)
-        logsumexp = cp.log(cp.sum(exp, axis=1))
+        exp = xp.exp(jll - a_max)
+        logsumexp = xp.log(xp.sum(exp, axis=1))
 
-        a_max = cp.squeeze(a_max, axis=1)
+        a_max = xp.squeeze(a_max, axis=1)
 
         log_prob_x = a_max + logsumexp
 
         if log_prob_x.ndim < 2:
             log_prob_x = log_prob_x.reshape((1, log_prob_x.shape[0]))
-        result = jll - log_prob_x.T
+        return jll - log_prob_x.T
+
+    def _log_proba(self, X, convert_dtype=True, batch_size=None, exp=False):
+        """
+        Normalized log-probabilities of the samples, or probabilities if
+        `exp`, computed `batch_size` rows at a time, and their index.
+        """
+        X, index = self._prepare_X(X, convert_dtype)
+        xp = self._xp()
+        n_rows = X.shape[0]
+        if batch_size is None or batch_size >= n_rows:
+            result = self._normalized_log_proba(X)
+            return (xp.exp(result) if exp else result), index
+
+        if batch_size < 1:
+            raise ValueError(
+                "batch_size must be at least 1, got %d" % batch_size
+            )
+        if _is_sparse(X):
+            # COO matrices cannot be sliced by rows
+            X = X.tocsr()
+        result = xp.empty((n_rows, self.n_classes_))
+        for start in range(0, n_rows, batch_size):
+            stop = min(start + batch_size, n_rows)
+            block = self._normalized_log_proba(X[start:stop])
+            result[start:stop] = xp.exp(block) if exp else block
+        return result, index
+
+    @generate_docstring(
+        X="dense_sparse",
+        return_values={
+            "name": "C",
+            "type": "dense",
+            "description": (
+                "Returns the log-probability of the samples for each class in "
+                "the model. The columns correspond to the classes in sorted "
+                "order, as they appear in the attribute `classes_`."
+            ),
+            "shape": "(n_rows, 1)",
+        },
+    )
+    def predict_log_proba(
+        self, X, convert_dtype=True, batch_size=None
+    ) -> CumlArray:
+        """
+        Return log-probability estimates for the test vector X.
+
+        Parameters
+        ----------
+        batch_size : int, default=None
+            Number of rows processed at once, which bounds the memory used
+            by intermediate results to ``batch_size * n_classes`` values.
+            All rows are processed at once if None.
+        """
+        result, index = self._log_proba(X, convert_dtype, batch_size)
         result = CumlArray(data=result, index=index)
         return result
 
@@ -290,12 +366,114 @@ class _BaseNB(Base, ClassifierMixin):
             "shape": "(n_rows, 1)",
         },
     )
-    def predict_proba(self, X) -> CumlArray:
+    def predict_proba(self, X, batch_size=None) -> CumlArray:
         """
         Return probability estimates for the test vector X.
+
+        Parameters
+        ----------
+        batch_size : int, default=None
+            Number of rows processed at once, which bounds the memory used
+            by intermediate results to ``batch_size * n_classes`` values.
+            All rows are processed at once if None.
         """
-        result = cp.exp(self.predict_log_proba(X))
-        return result
+        result, index = self._log_proba(X, batch_size=batch_size, exp=True)
+        return CumlArray(data=result, index=index)
+
+    @generate_docstring(
+        X="dense_sparse",
+        return_values=[
+            {
+                "name": "classes",
+                "type": "dense",
+                "description": (
+                    "The k most probable classes of each sample, by "
+                    "decreasing probability."
+                ),
+                "shape": "(n_rows, k)",
+            },
+            {
+                "name": "log_proba",
+                "type": "dense",
+                "description": "The log-probability of these classes.",
+                "shape": "(n_rows, k)",
+            },
+        ],
+    )
+    def predict_topk(
+        self, X, k=5, class_batch_size=1024, convert_dtype=True
+    ) -> typing.Tuple[CumlArray, CumlArray]:
+        """
+        Return the k most probable classes of the test vectors X.
+
+        The joint log-likelihood is computed ``class_batch_size`` classes
+        at a time, keeping a running top-k and a running normalization
+        term, so that only ``n_rows * (k + class_batch_size)`` scores are
+        held at once rather than ``n_rows * n_classes``.
+
+        Parameters
+        ----------
+        k : int, default=5
+            Number of classes returned per sample, at most the number of
+            classes.
+        class_batch_size : int, default=1024
+            Number of classes processed at once.
+        """
+        n_classes = self.n_classes_
+        if not 1 <= k <= n_classes:
+            raise ValueError(
+                "k must be between 1 and the number of classes %d, got %d"
+                % (n_classes, k)
+            )
+        if class_batch_size < 1:
+            raise ValueError(
+                "class_batch_size must be at least 1, got %d"
+                % class_batch_size
+            )
+        X, index = self._prepare_X(X, convert_dtype)
+        xp = self._xp()
+        n_rows = X.shape[0]
+
+        top_scores = xp.empty((n_rows, 0))
+        top_indices = xp.empty((n_rows, 0), dtype=xp.int64)
+        # running log-sum-exp of the scores, as max + log(sum(exp(s - max)))
+        lse_max = xp.full(n_rows, -xp.inf)
+        lse_sum = xp.zeros(n_rows)
+
+        for start in range(0, n_classes, class_batch_size):
+            stop = min(start + class_batch_size, n_classes)
+            jll = self._joint_log_likelihood(X, slice(start, stop))
+
+            new_max = xp.maximum(lse_max, jll.max(axis=1))
+            shift = xp.where(xp.isfinite(new_max), new_max, 0)
+            lse_sum = lse_sum * xp.exp(lse_max - shift) + xp.exp(
+                jll - shift[:, None]
+            ).sum(axis=1)
+            lse_max = shift
+
+            scores = xp.concatenate([top_scores, jll], axis=1)
+            indices = xp.concatenate(
+                [
+                    top_indices,
+                    xp.broadcast_to(xp.arange(start, stop), jll.shape),
+                ],
+                axis=1,
+            )
+            if scores.shape[1] > k:
+                part = xp.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = xp.take_along_axis(scores, part, axis=1)
+                indices = xp.take_along_axis(indices, part, axis=1)
+            top_scores, top_indices = scores, indices
+
+        order = xp.argsort(-top_scores, axis=1)
+        top_scores = xp.take_along_axis(top_scores, order, axis=1)
+        top_indices = xp.take_along_axis(top_indices, order, axis=1)
+        log_proba = top_scores - (lse_max + xp.log(lse_sum))[:, None]
+        classes = xp.asarray(self.classes_)[top_indices]
+        return (
+            CumlArray(data=classes, index=index),
+            CumlArray(data=log_proba, index=index),
+        )
 
 
 class GaussianNB(_BaseNB):
@@ -307,6 +485,12 @@ class GaussianNB(_BaseNB):
 
         http://i.stanford.edu/pub/cstr/reports/cs/tr/79/773/CS-TR-79-773.pdf
 
+    The same update combines models fit on separate partitions of a dataset
+    with :meth:`merge`. When first fit under
+    :py:func:`cuml.common.device_selection.using_device_type` ``"cpu"``, the
+    model is trained on host from SciPy sparse matrices or NumPy arrays,
+    sparse matrices being summarized in a single pass over their non-zeros.
+
     Parameters
     ----------
     priors : array-like of shape (n_classes,)
@@ -388,11 +572,7 @@ class GaussianNB(_BaseNB):
             Currently sample weight is ignored.
         """
         return self._partial_fit(
-            X,
-            y,
-            _classes=cp.unique(y),
-            _refit=True,
-            sample_weight=sample_weight,
+            X, y, _refit=True, sample_weight=sample_weight
         )
 
     @nvtx_annotate(
@@ -414,11 +594,19 @@ class GaussianNB(_BaseNB):
                 dummy_function_always_false as scipy_sparse_isspmatrix,
             )
 
-        if getattr(self, "classes_") is None and _classes is None:
+        if _refit:
+            self.fit_called_ = False
+            self.classes_ = None
+        elif getattr(self, "classes_") is None and _classes is None:
             raise ValueError(
                 "classes must be passed on the first call " "to partial_fit."
             )
 
+        if not self.fit_called_:
+            self._host = GlobalSettings().device_type is DeviceType.host
+        if self.__dict__.get("_host"):
+            return self._partial_fit_host(X, y, _classes, convert_dtype)
+
         if scipy_sparse_isspmatrix(X) or cupyx.scipy.sparse.isspmatrix(X):
             X = _convert_x_sparse(X)
         else:
@@ -445,14 +633,6 @@ class GaussianNB(_BaseNB):
             )
 
         Y, label_classes = make_monotonic(y, classes=_classes, copy=True)
-        if _refit:
-            self.classes_ = None
-
-        def var_sparse(X, axis=0):
-            # Compute the variance on dense and sparse matrices
-            return ((X - X.mean(axis=axis)) ** 2).mean(axis=axis)
-
-        self.epsilon_ = self.var_smoothing * var_sparse(X).max()
 
         if not self.fit_called_:
             self.fit_called_ = True
@@ -491,6 +671,8 @@ class GaussianNB(_BaseNB):
         else:
             self.sigma_[:, :] -= self.epsilon_
 
+        self.epsilon_ = self.var_smoothing * _feature_variance(X).max()
+
         unique_y = cp.unique(y)
         unique_y_in_classes = cp.in1d(unique_y, cp.array(self.classes_))
 
@@ -510,6 +692,126 @@ class GaussianNB(_BaseNB):
 
         return self
 
+    def _partial_fit_host(self, X, y, classes=None, convert_dtype=True):
+        """
+        Host version of `_partial_fit`, taking SciPy sparse matrices or
+        NumPy arrays which are summarized in one pass.
+        """
+        X = to_host_X(X, convert_dtype)
+        y = to_host_y(y)
+        if X.shape[0] != y.shape[0]:
+            raise ValueError(
+                "Found %d samples but %d labels" % (X.shape[0], y.shape[0])
+            )
+
+        if not self.fit_called_:
+            self.fit_called_ = True
+            classes = to_host_y(y if classes is None else classes)
+            self.classes_ = np.unique(classes)
+            self.n_classes_ = len(self.classes_)
+            self.n_features_ = X.shape[1]
+            self.theta_ = np.zeros((self.n_classes_, self.n_features_))
+            self.sigma_ = np.zeros((self.n_classes_, self.n_features_))
+            self.class_count_ = np.zeros(self.n_classes_)
+            self.epsilon_ = 0.0
+
+            if self.priors is not None:
+                priors = to_host_y(self.priors)
+                if len(priors) != self.n_classes_:
+                    raise ValueError(
+                        "Number of priors must match number of" " classes."
+                    )
+                if not np.isclose(priors.sum(), 1):
+                    raise ValueError("The sum of the priors should be 1.")
+                if (priors < 0).any():
+                    raise ValueError("Priors must be non-negative.")
+                self.class_prior = priors
+        elif X.shape[1] != self.n_features_:
+            raise ValueError(
+                "Expected %d features but got %d"
+                % (self.n_features_, X.shape[1])
+            )
+
+        Y = encode_labels(y, self.classes_)
+        n_new, mean_new, m2_new = class_moments(X, Y, self.n_classes_)
+
+        # variance of the whole chunk, from the moments of its classes
+        n_chunk = max(n_new.sum(), 1)
+        mean_chunk = (n_new * mean_new).sum(axis=0) / n_chunk
+        var_chunk = (
+            m2_new.sum(axis=0)
+            + (n_new * (mean_new - mean_chunk) ** 2).sum(axis=0)
+        ) / n_chunk
+
+        self._set_moments(
+            *_combine_moments(*self._moments(), n_new, mean_new, m2_new),
+            epsilon=self.var_smoothing * var_chunk.max(),
+        )
+        return self
+
+    def _moments(self):
+        """
+        Per-class sample count, feature means and sums of squared
+        deviations of the samples seen so far.
+        """
+        n = self.class_count_.reshape(-1, 1)
+        return n, self.theta_, (self.sigma_ - self.epsilon_) * n
+
+    def _set_moments(self, n, mean, m2, epsilon):
+        """Set the fitted attributes from per-class moments."""
+        xp = self._xp()
+        self.class_count_ = n.ravel()
+        self.theta_ = mean
+        self.sigma_ = m2 / xp.maximum(n, 1) + epsilon
+        self.epsilon_ = epsilon
+        if self.priors is None:
+            self.class_prior = self.class_count_ / self.class_count_.sum()
+
+    @cuml.internals.api_base_return_any_skipall
+    def merge(self, other) -> "GaussianNB":
+        """
+        Merge the statistics of another model fit on other samples.
+
+        The per-class sample counts, feature means and sums of squared
+        deviations of both models are combined, so that the result is the
+        model fit on the samples of both, except for the variance smoothing
+        ``epsilon_`` which is the largest of both. This enables training
+        models on separate partitions of a dataset, for instance in
+        separate processes, and reducing them.
+
+        Parameters
+        ----------
+
+        other : GaussianNB
+            Model fit on the same classes and number of features, on the
+            same device.
+
+        Returns
+        -------
+
+        self : object
+        """
+        if not (self.fit_called_ and other.fit_called_):
+            raise ValueError("Only fitted models can be merged.")
+        if self.__dict__.get("_host") != other.__dict__.get("_host"):
+            raise ValueError(
+                "Cannot merge a model fit on host with a model fit on device."
+            )
+        xp = self._xp()
+        if self.n_features_ != other.n_features_ or not xp.array_equal(
+            xp.asarray(self.classes_), xp.asarray(other.classes_)
+        ):
+            raise ValueError(
+                "Only models fit on the same classes and number of features "
+                "can be merged."
+            )
+
+        n, mean, m2 = _combine_moments(*self._moments(), *other._moments())
+        self._set_moments(
+            n, mean, m2, epsilon=max(self.epsilon_, other.epsilon_)
+        )
+        return self
+
     def partial_fit(
         self, X, y, classes=None, sample_weight=None
     ) -> "GaussianNB":
@@ -707,28 +1009,53 @@ class GaussianNB(_BaseNB):
         total_var = total_ssd / n_total
         return total_mu, total_var
 
-    def _joint_log_likelihood(self, X):
+    def _joint_log_likelihood(self, X, classes=slice(None)):
+        xp = self._xp()
+        if _is_sparse(X):
+            return self._joint_log_likelihood_sparse(X, classes)
+
         joint_log_likelihood = []
 
-        for i in range(len(self.classes_)):
-            jointi = cp.log(self.class_prior[i])
+        for i in range(len(self.classes_))[classes]:
+            jointi = xp.log(self.class_prior[i])
 
-            n_ij = -0.5 * cp.sum(cp.log(2.0 * cp.pi * self.sigma_[i, :]))
+            n_ij = -0.5 * xp.sum(xp.log(2.0 * xp.pi * self.sigma_[i, :]))
 
             centered = (X - self.theta_[i, :]) ** 2
             zvals = centered / self.sigma_[i, :]
-            summed = cp.sum(zvals, axis=1)
+            summed = xp.sum(zvals, axis=1)
 
             n_ij = -(0.5 * summed) + n_ij
             joint_log_likelihood.append(jointi + n_ij)
 
-        return cp.array(joint_log_likelihood).T
+        return xp.array(joint_log_likelihood).T
+
+    def _joint_log_likelihood_sparse(self, X, classes=slice(None)):
+        """
+        Expand the squared distances to the class means so that only the
+        non-zeros of X are visited, in float64 to limit cancellations.
+        """
+        xp = self._xp()
+        X = X.astype(xp.float64)
+        theta, sigma = self.theta_[classes], self.sigma_[classes]
+        inv_sigma = 1.0 / sigma
+        squared = (
+            X.power(2).dot(inv_sigma.T)
+            - 2 * X.dot((theta * inv_sigma).T)
+            + (theta**2 * inv_sigma).sum(axis=1)
+        )
+        n_ij = -0.5 * xp.log(2.0 * xp.pi * sigma).sum(axis=1)
+        return xp.log(self.class_prior[classes]) + n_ij - 0.5 * squared
 
     def get_param_names(self):
         return super().get_param_names() + ["priors", "var_smoothing"]
 
 
 class _BaseDiscreteNB(_BaseNB):
+
+    # whether the estimator can be trained on host, see `_partial_fit_host`
+    _host_engine = True
+
     def __init__(
         self,
         *,
@@ -758,10 +1085,21 @@ class _BaseDiscreteNB(_BaseNB):
         # Needed until Base no longer assumed cumlHandle
         self.handle = None
 
+    def __getattr__(self, attr):
+        # log probabilities are only computed once they are needed after
+        # the counters changed, see `_invalidate_log_probs`
+        if attr in ("feature_log_prob_", "class_log_prior_") and (
+            self.__dict__.get("_log_probs_stale")
+        ):
+            self.update_log_probs()
+            return getattr(self, attr)
+        return super().__getattr__(attr)
+
     def _check_X_y(self, X, y):
         return X, y
 
     def _update_class_log_prior(self, class_prior=None):
+        xp = self._xp()
 
         if class_prior is not None:
 
@@ -770,18 +1108,29 @@ class _BaseDiscreteNB(_BaseNB):
                     "Number of classes must match " "number of priors"
                 )
 
-            self.class_log_prior_ = cp.log(class_prior)
+            if xp is np:
+                class_prior = class_prior.to_output("numpy")
+            self.class_log_prior_ = xp.log(class_prior)
 
         elif self.fit_prior:
-            log_class_count = cp.log(self.class_count_)
-            self.class_log_prior_ = log_class_count - cp.log(
+            log_class_count = xp.log(self.class_count_)
+            self.class_log_prior_ = log_class_count - xp.log(
                 self.class_count_.sum()
             )
         else:
-            self.class_log_prior_ = cp.full(
+            self.class_log_prior_ = xp.full(
                 self.n_classes_, -math.log(self.n_classes_)
             )
 
+    def _invalidate_log_probs(self):
+        """
+        Drop the log probabilities after the counters changed, they are
+        recomputed on their next access.
+        """
+        self.__dict__.pop("feature_log_prob_", None)
+        self.__dict__.pop("class_log_prior_", None)
+        self._log_probs_stale = True
+
     def partial_fit(
         self, X, y, classes=None, sample_weight=None
     ) -> "_BaseDiscreteNB":
@@ -799,6 +1148,14 @@ class _BaseDiscreteNB(_BaseNB):
         partial_fit on chunks of data that are as large as possible (as long
         as fitting in the memory budget) to hide the overhead.
 
+        The log probabilities are only recomputed when the model is used
+        after its counts changed, so that calling partial_fit on many small
+        chunks does not pay for them each time. When first fit under
+        :py:func:`cuml.common.device_selection.using_device_type` ``"cpu"``,
+        the model is trained on host from SciPy sparse matrices or NumPy
+        arrays, summing the counts of each chunk with sparse products, and
+        its fitted attributes are NumPy arrays (except for CategoricalNB).
+
         Parameters
         ----------
 
@@ -832,6 +1189,13 @@ class _BaseDiscreteNB(_BaseNB):
     def _partial_fit(
         self, X, y, sample_weight=None, _classes=None, convert_dtype=True
     ) -> "_BaseDiscreteNB":
+        if not self.fit_called_:
+            self._host = self._host_engine and (
+                GlobalSettings().device_type is DeviceType.host
+            )
+        if self.__dict__.get("_host"):
+            return self._partial_fit_host(X, y, _classes, convert_dtype)
+
         if has_scipy():
             from scipy.sparse import isspmatrix as scipy_sparse_isspmatrix
         else:
@@ -887,11 +1251,105 @@ class _BaseDiscreteNB(_BaseNB):
         else:
             self._count(X, Y, self.classes_)
 
-        self._update_feature_log_prob(self.alpha)
-        self._update_class_log_prior(class_prior=self.class_prior)
+        self._invalidate_log_probs()
 
         return self
 
+    def _partial_fit_host(self, X, y, classes=None, convert_dtype=True):
+        """
+        Host version of `_partial_fit`, taking SciPy sparse matrices or
+        NumPy arrays.
+        """
+        X = to_host_X(X, convert_dtype)
+        y = to_host_y(y)
+        if X.shape[0] != y.shape[0]:
+            raise ValueError(
+                "Found %d samples but %d labels" % (X.shape[0], y.shape[0])
+            )
+
+        if not self.fit_called_:
+            self.fit_called_ = True
+            classes = to_host_y(y if classes is None else classes)
+            self.classes_ = np.unique(classes)
+            self.n_classes_ = self.classes_.shape[0]
+            self.n_features_ = X.shape[1]
+            self.class_count_ = np.zeros(self.n_classes_)
+            self.feature_count_ = np.zeros((self.n_classes_, self.n_features_))
+        elif X.shape[1] != self.n_features_:
+            raise ValueError(
+                "Expected %d features but got %d"
+                % (self.n_features_, X.shape[1])
+            )
+
+        Y = encode_labels(y, self.classes_)
+        X, Y = self._check_X_y(X, Y)
+        self._count_host(X, Y)
+        self._invalidate_log_probs()
+
+        return self
+
+    def _count_host(self, X, Y):
+        """Add the counts of a host chunk, Y holding class indices."""
+        feature_count = self.feature_count_
+        class_count = self.class_count_
+        add_counts(feature_count, class_count, X, Y)
+        # assigned back so that the array descriptors drop their cache
+        self.feature_count_ = feature_count
+        self.class_count_ = class_count
+
+    @cuml.internals.api_base_return_any_skipall
+    def fit_iter(self, chunks, classes=None) -> "_BaseDiscreteNB":
+        """
+        Fit the model on a stream of ``(X, y)`` chunks.
+
+        This is equivalent to calling :meth:`partial_fit` on every chunk
+        after resetting the model, so that datasets larger than memory can
+        be streamed from disk. The log probabilities are only computed once
+        the model is used.
+
+        Parameters
+        ----------
+
+        chunks : iterable of (X, y) pairs
+            Training vectors and target values of each chunk, of any type
+            accepted by :meth:`partial_fit`.
+        classes : array-like of shape (n_classes), default=None
+            All the classes that can appear in the chunks. Required unless
+            the first chunk holds every class.
+
+        Returns
+        -------
+
+        self : object
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import numpy as np
+            import scipy.sparse
+            from cuml.common.device_selection import using_device_type
+            from cuml.naive_bayes import MultinomialNB
+
+            def chunks(paths):
+                for path in paths:
+                    yield (scipy.sparse.load_npz(path),
+                           np.load(path.replace(".npz", "_y.npy")))
+
+            with using_device_type("cpu"):
+                model = MultinomialNB().fit_iter(chunks(paths),
+                                                 classes=np.arange(20))
+        """
+        self.fit_called_ = False
+        for X, y in chunks:
+            if not self.fit_called_:
+                self._set_output_type(X)
+                self._set_n_features_in(X)
+            self._partial_fit(X, y, _classes=classes)
+            classes = None
+        return self
+
     def fit(self, X, y, sample_weight=None) -> "_BaseDiscreteNB":
         """
         Fit Naive Bayes classifier according to X, y
@@ -927,6 +1385,7 @@ class _BaseDiscreteNB(_BaseNB):
         """
         self._update_feature_log_prob(self.alpha)
         self._update_class_log_prior(class_prior=self.class_prior)
+        self._log_probs_stale = False
 
     def _count(self, X, Y, classes):
         """
@@ -1196,13 +1655,14 @@ class MultinomialNB(_BaseDiscreteNB):
 
         alpha : float amount of smoothing to apply (0. means no smoothing)
         """
+        xp = self._xp()
         smoothed_fc = self.feature_count_ + alpha
         smoothed_cc = smoothed_fc.sum(axis=1).reshape(-1, 1)
-        self.feature_log_prob_ = cp.log(smoothed_fc) - cp.log(
+        self.feature_log_prob_ = xp.log(smoothed_fc) - xp.log(
             smoothed_cc.reshape(-1, 1)
         )
 
-    def _joint_log_likelihood(self, X):
+    def _joint_log_likelihood(self, X, classes=slice(None)):
         """
         Calculate the posterior log probability of the samples X
 
@@ -1210,9 +1670,10 @@ class MultinomialNB(_BaseDiscreteNB):
         ----------
 
         X : array-like of size (n_samples, n_features)
+        classes : slice of the classes to compute, all of them by default
         """
-        ret = X.dot(self.feature_log_prob_.T)
-        ret += self.class_log_prior_
+        ret = X.dot(self.feature_log_prob_[classes].T)
+        ret += self.class_log_prior_[classes]
         return ret
 
 
@@ -1323,7 +1784,9 @@ class BernoulliNB(_BaseDiscreteNB):
     def _check_X(self, X):
         X = super()._check_X(X)
         if self.binarize is not None:
-            if cupyx.scipy.sparse.isspmatrix(X):
+            if is_host_array(X):
+                X = binarize_host(X, threshold=self.binarize)
+            elif cupyx.scipy.sparse.isspmatrix(X):
                 X.data = binarize(X.data, threshold=self.binarize)
             else:
                 X = binarize(X, threshold=self.binarize)
@@ -1332,13 +1795,15 @@ class BernoulliNB(_BaseDiscreteNB):
     def _check_X_y(self, X, y):
         X, y = super()._check_X_y(X, y)
         if self.binarize is not None:
-            if cupyx.scipy.sparse.isspmatrix(X):
+            if is_host_array(X):
+                X = binarize_host(X, threshold=self.binarize)
+            elif cupyx.scipy.sparse.isspmatrix(X):
                 X.data = binarize(X.data, threshold=self.binarize)
             else:
                 X = binarize(X, threshold=self.binarize)
         return X, y
 
-    def _joint_log_likelihood(self, X):
+    def _joint_log_likelihood(self, X, classes=slice(None)):
         """Calculate the posterior log probability of the samples X"""
         n_classes, n_features = self.feature_log_prob_.shape
         n_samples, n_features_X = X.shape
@@ -1349,11 +1814,13 @@ class BernoulliNB(_BaseDiscreteNB):
                 % (n_features, n_features_X)
             )
 
-        neg_prob = cp.log(1 - cp.exp(self.feature_log_prob_))
+        xp = self._xp()
+        feature_log_prob = self.feature_log_prob_[classes]
+        neg_prob = xp.log(1 - xp.exp(feature_log_prob))
 
         # Compute  neg_prob · (1 - X).T  as  ∑neg_prob - X · neg_prob
-        jll = X.dot((self.feature_log_prob_ - neg_prob).T)
-        jll += self.class_log_prior_ + neg_prob.sum(axis=1)
+        jll = X.dot((feature_log_prob - neg_prob).T)
+        jll += self.class_log_prior_[classes] + neg_prob.sum(axis=1)
 
         return jll
 
@@ -1367,9 +1834,10 @@ class BernoulliNB(_BaseDiscreteNB):
 
         alpha : float amount of smoothing to apply (0. means no smoothing)
         """
+        xp = self._xp()
         smoothed_fc = self.feature_count_ + alpha
         smoothed_cc = self.class_count_ + alpha * 2
-        self.feature_log_prob_ = cp.log(smoothed_fc) - cp.log(
+        self.feature_log_prob_ = xp.log(smoothed_fc) - xp.log(
             smoothed_cc.reshape(-1, 1)
         )
 
@@ -1481,7 +1949,7 @@ class ComplementNB(_BaseDiscreteNB):
 
     def _check_X(self, X):
         X = super()._check_X(X)
-        if cupyx.scipy.sparse.isspmatrix(X):
+        if _is_sparse(X):
             X_min = X.data.min()
         else:
             X_min = X.min()
@@ -1491,7 +1959,7 @@ class ComplementNB(_BaseDiscreteNB):
 
     def _check_X_y(self, X, y):
         X, y = super()._check_X_y(X, y)
-        if cupyx.scipy.sparse.isspmatrix(X):
+        if _is_sparse(X):
             X_min = X.data.min()
         else:
             X_min = X.min()
@@ -1511,11 +1979,15 @@ class ComplementNB(_BaseDiscreteNB):
         )
         self.feature_all_ = self.feature_count_.sum(axis=0)
 
-    def _joint_log_likelihood(self, X):
+    def _count_host(self, X, Y):
+        super()._count_host(X, Y)
+        self.feature_all_ = self.feature_count_.sum(axis=0)
+
+    def _joint_log_likelihood(self, X, classes=slice(None)):
         """Calculate the class scores for the samples in X."""
-        jll = X.dot(self.feature_log_prob_.T)
+        jll = X.dot(self.feature_log_prob_[classes].T)
         if len(self.class_count_) == 1:
-            jll += self.class_log_prior_
+            jll += self.class_log_prior_[classes]
         return jll
 
     def _update_feature_log_prob(self, alpha):
@@ -1528,7 +2000,8 @@ class ComplementNB(_BaseDiscreteNB):
         alpha : float amount of smoothing to apply (0. means no smoothing)
         """
         comp_count = self.feature_all_ + alpha - self.feature_count_
-        logged = cp.log(comp_count / comp_count.sum(axis=1, keepdims=True))
+        xp = self._xp()
+        logged = xp.log(comp_count / comp_count.sum(axis=1, keepdims=True))
         if self.norm:
             summed = logged.sum(axis=1, keepdims=True)
             feature_log_prob = logged / summed
@@ -1614,6 +2087,8 @@ class CategoricalNB(_BaseDiscreteNB):
         [3]
     """
 
+    _host_engine = False
+
     def __init__(
         self,
         *,
@@ -1915,25 +2390,35 @@ class CategoricalNB(_BaseDiscreteNB):
                 smoothed_class_count[:, :, cp.newaxis]
             )
 
-    def _joint_log_likelihood(self, X):
+    def _joint_log_likelihood(self, X, classes=slice(None)):
         if not X.shape[1] == self.n_features_:
             raise ValueError(
                 "Expected input with %d features, got %d instead"
                 % (self.n_features_, X.shape[1])
             )
         n_rows = X.shape[0]
+        # only the scores of the requested classes are computed
+        class_ids = range(self.n_classes_)[classes]
+        n_classes = len(class_ids)
         if cupyx.scipy.sparse.isspmatrix(X):
+            # the smoothed counts of class i are the rows
+            # i * n_features to (i + 1) * n_features
+            rows = (
+                cp.asarray(class_ids)[:, cp.newaxis] * self.n_features_
+                + cp.arange(self.n_features_)
+            ).ravel()
+            smoothed_cat_count = self.smoothed_cat_count[rows]
             # For sparse data we assume that most categories will be zeros,
             # so we first compute the jll for categories 0
-            features_zeros = self.smoothed_cat_count[:, 0].todense()
+            features_zeros = smoothed_cat_count[:, 0].todense()
             features_zeros = features_zeros.reshape(
-                self.n_classes_, self.n_features_
+                n_classes, self.n_features_
             ).T
             if self.alpha != 1.0:
                 features_zeros[cp.where(features_zeros == 0)] += cp.log(
                     self.alpha
                 )
-            features_zeros -= self.smoothed_class_count
+            features_zeros -= self.smoothed_class_count[:, classes]
             features_zeros = features_zeros.sum(0)
             jll = cp.repeat(features_zeros[cp.newaxis, :], n_rows, axis=0)
 
@@ -1943,11 +2428,11 @@ class CategoricalNB(_BaseDiscreteNB):
             # Adjust with the non-zeros data by adding jll_data (non-zeros)
             # and subtracting jll_zeros which are the zeros
             # that were first computed
-            for i in range(self.n_classes_):
-                jll_data = self.smoothed_cat_count[
+            for i in range(n_classes):
+                jll_data = smoothed_cat_count[
                     col_indices + i * self.n_features_, X.data
                 ].ravel()
-                jll_zeros = self.smoothed_cat_count[
+                jll_zeros = smoothed_cat_count[
                     col_indices + i * self.n_features_, 0
                 ].todense()[:, 0]
                 if self.alpha != 1.0:
@@ -1958,8 +2443,9 @@ class CategoricalNB(_BaseDiscreteNB):
 
         else:
             col_indices = cp.indices(X.shape)[1].flatten()
-            jll = self.feature_log_prob_[col_indices, :, X.ravel()]
-            jll = jll.reshape((n_rows, self.n_features_, self.n_classes_))
+            feature_log_prob = self.feature_log_prob_[:, classes]
+            jll = feature_log_prob[col_indices, :, X.ravel()]
+            jll = jll.reshape((n_rows, self.n_features_, n_classes))
             jll = jll.sum(1)
-        jll += self.class_log_prior_
+        jll += self.class_log_prior_[classes]
         return jll
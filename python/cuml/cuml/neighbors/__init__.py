@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2019-2023, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -18,6 +18,8 @@ from cuml.internals.import_utils import has_dask
 
 from cuml.neighbors.nearest_neighbors import NearestNeighbors
 from cuml.neighbors.nearest_neighbors import kneighbors_graph
+from cuml.neighbors.nearest_neighbors import load_kneighbors_graph
+from cuml.neighbors.knn_graph import KNNGraph
 from cuml.neighbors.kneighbors_classifier import KNeighborsClassifier
 from cuml.neighbors.kneighbors_regressor import KNeighborsRegressor
 from cuml.neighbors.kernel_density import (
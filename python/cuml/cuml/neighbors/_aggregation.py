@@ -0,0 +1,142 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Weighted aggregation of the labels of the nearest neighbors.
+
+The class votes of :class:`~cuml.neighbors.KNeighborsClassifier` and the
+averages of :class:`~cuml.neighbors.KNeighborsRegressor`, for any neighbor
+weights, on host (NumPy) or device (CuPy) arrays. The classes of all the
+outputs are numbered in a single range, so that the votes of all the
+outputs for a chunk of queries are a single weighted ``bincount`` of the
+``(query, class)`` cells of the neighbors.
+"""
+
+from cuml.internals.safe_imports import cpu_only_import
+
+np = cpu_only_import("numpy")
+
+# values of the queries aggregated at once
+_MAX_CHUNK_ELEMENTS = 1 << 24
+
+
+def check_weights(weights):
+    """Validate the ``weights`` parameter of the estimators."""
+    if callable(weights) or weights in ("uniform", "distance"):
+        return weights
+    raise ValueError(
+        "weights not recognized: should be 'uniform', 'distance', or a "
+        "callable function"
+    )
+
+
+def chunk_rows(n_values):
+    """Number of queries aggregated at once, for ``n_values`` each."""
+    return max(1, _MAX_CHUNK_ELEMENTS // max(1, n_values))
+
+
+def neighbor_weights(distances, weights, xp):
+    """
+    Weights of the neighbors, None for uniform weights.
+
+    As in scikit-learn, the neighbors at distance zero of a query get all
+    of its weight with ``weights='distance'``. Callables are given the
+    distances as an array of the same library, NumPy or CuPy.
+    """
+    if callable(weights):
+        return xp.asarray(weights(distances))
+    if weights == "uniform":
+        return None
+    zero = distances == 0
+    w = 1.0 / xp.where(zero, 1, distances)
+    exact = zero.any(axis=1)
+    w[exact] = zero[exact]
+    return w
+
+
+def encode_labels(y, xp):
+    """
+    Number the classes of all the outputs in a single range.
+
+    Parameters
+    ----------
+    y : array of shape (n_samples,) or (n_samples, n_outputs)
+
+    Returns
+    -------
+    codes : array of shape (n_samples, n_outputs)
+    classes : list of arrays
+        Sorted classes of each output.
+    offsets : numpy.ndarray of shape (n_outputs + 1,)
+        The codes of output ``o`` are in ``[offsets[o], offsets[o + 1])``.
+    """
+    y = y.reshape(len(y), -1)
+    classes = [xp.unique(y[:, o]) for o in range(y.shape[1])]
+    offsets = np.cumsum([0] + [len(c) for c in classes])
+    codes = xp.stack(
+        [
+            xp.searchsorted(c, y[:, o]) + int(offsets[o])
+            for o, c in enumerate(classes)
+        ],
+        axis=1,
+    )
+    return codes, classes, offsets
+
+
+def class_votes(neigh_codes, weights, n_codes, xp):
+    """
+    Summed weights of the classes of the neighbors of each query.
+
+    Parameters
+    ----------
+    neigh_codes : array of shape (n_queries, n_neighbors, n_outputs)
+        Codes of the classes of the neighbors, see :func:`encode_labels`.
+    weights : array of shape (n_queries, n_neighbors) or None
+    n_codes : int
+        Number of classes of all the outputs.
+
+    Returns
+    -------
+    votes : array of shape (n_queries, n_codes)
+    """
+    n_queries = neigh_codes.shape[0]
+    rows = xp.arange(n_queries, dtype=np.int64) * n_codes
+    cells = neigh_codes + rows[:, None, None]
+    if weights is not None:
+        weights = xp.broadcast_to(weights[:, :, None], neigh_codes.shape)
+        weights = weights.ravel()
+    votes = xp.bincount(
+        cells.ravel(), weights=weights, minlength=n_queries * n_codes
+    )
+    return votes.reshape(n_queries, n_codes)
+
+
+def weighted_mean(neigh_y, weights, xp):
+    """
+    Mean of the targets of the neighbors of each query.
+
+    Parameters
+    ----------
+    neigh_y : array of shape (n_queries, n_neighbors, n_outputs)
+    weights : array of shape (n_queries, n_neighbors) or None
+
+    Returns
+    -------
+    mean : array of shape (n_queries, n_outputs)
+    """
+    if weights is None:
+        return neigh_y.mean(axis=1)
+    total = (neigh_y * weights[:, :, None]).sum(axis=1)
+    return total / weights.sum(axis=1)[:, None]
@@ -0,0 +1,619 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Host (CPU) IVF-Flat and IVF-PQ indexes of NearestNeighbors.
+
+The training vectors are partitioned into ``nlist`` inverted lists by a
+k-means coarse quantizer, and a query only scans the ``nprobe`` lists of
+its closest centroids. IVF-Flat lists hold the vectors themselves, IVF-PQ
+lists hold the product quantization codes of the residuals of the vectors
+to their centroid: ``M`` sub-vectors each encoded on ``n_bits`` bits by
+their closest centroid of a per sub-space codebook.
+
+Queries are processed by batches and grouped by the lists they probe, so
+that each list is scanned once per batch: the distances of IVF-Flat lists
+are matrix products, the ones of IVF-PQ lists are sums of entries of the
+per query distance tables of the sub-spaces, computed for all the codes of
+a list as the product of their sparse one-hot encoding with the tables.
+
+Vectors added to a fitted index are assigned to the lists of their closest
+centroids. Removed vectors are tombstoned, their entries get the ``-1`` id
+and are skipped by the searches, until they make up a large enough
+fraction of the lists to be dropped.
+"""
+
+from cuml.internals.safe_imports import cpu_only_import
+
+np = cpu_only_import("numpy")
+sp = cpu_only_import("scipy.sparse")
+
+# training points per centroid, as the k-means of FAISS
+_MAX_POINTS_PER_CENTROID = 256
+_KMEANS_N_ITER = 20
+_SEED = 1234
+# candidate distances computed at once when searching a batch of queries
+_MAX_BATCH_ELEMENTS = 1 << 24
+# rows assigned to their closest centroid at once
+_CHUNK_ROWS = 1024
+# fraction of removed entries above which the lists are compacted
+_COMPACT_FRACTION = 0.2
+
+IVF_METRICS = {
+    "l2",
+    "euclidean",
+    "sqeuclidean",
+    "inner_product",
+    "cosine",
+    "correlation",
+}
+
+
+def ivf_default_params(algo, n_samples, n_features):
+    """``algo_params`` used when they are None or ``'auto'``."""
+    if algo == "ivfflat":
+        return {"nlist": 8, "nprobe": 2}
+
+    allowed_subquantizers = [1, 2, 3, 4, 8, 12, 16, 20, 24, 28, 32, 40, 48]
+    allowed_sub_dim_size = {1, 2, 3, 4, 6, 8, 10, 12, 16, 20, 24, 28, 32}
+    params = {"nlist": 8, "nprobe": 3}
+    for n_subq in allowed_subquantizers:
+        if (
+            n_features % n_subq == 0
+            and (n_features / n_subq) in allowed_sub_dim_size
+        ):
+            params["usePrecomputedTables"] = False
+            params["M"] = n_subq
+            break
+
+    if "M" not in params:
+        for n_subq in allowed_subquantizers:
+            if n_features % n_subq == 0:
+                params["usePrecomputedTables"] = True
+                params["M"] = n_subq
+                break
+
+    # n_bits should be in set {4, 5, 6, 8} since FAISS 1.7
+    params["n_bits"] = 4
+    for n_bits in [4, 5, 6, 8]:
+        min_train_points = (2**n_bits) * 39
+        if n_samples >= min_train_points:
+            params["n_bits"] = n_bits
+            break
+    return params
+
+
+def _sq_distances(X, Y, Y_sq_norms=None):
+    """Squared euclidean distances between the rows of X and Y."""
+    if Y_sq_norms is None:
+        Y_sq_norms = np.einsum("ij,ij->i", Y, Y)
+    d = np.einsum("ij,ij->i", X, X)[:, None] - 2 * (X @ Y.T)
+    d += Y_sq_norms
+    return np.maximum(d, 0, out=d)
+
+
+def _nearest(X, centroids, inner_product=False):
+    """
+    Index of the closest centroid of each row of X, in euclidean distance
+    or in inner product, by chunks of rows.
+    """
+    if inner_product:
+        scaled = -centroids.T
+        sq_norms = 0
+    else:
+        # the squared norms of the rows do not change the argmin
+        scaled = -2 * centroids.T
+        sq_norms = np.einsum("ij,ij->i", centroids, centroids)
+    labels = np.empty(len(X), dtype=np.int64)
+    for start in range(0, len(X), _CHUNK_ROWS):
+        d = X[start : start + _CHUNK_ROWS] @ scaled
+        d += sq_norms
+        labels[start : start + _CHUNK_ROWS] = d.argmin(axis=1)
+    return labels
+
+
+def kmeans(X, n_clusters, rng, n_iter=_KMEANS_N_ITER):
+    """
+    Centroids of ``n_clusters`` Lloyd's k-means iterations over ``X``.
+
+    Centroids are initialized on distinct random rows and trained on at most
+    ``256 * n_clusters`` rows. Clusters that become empty keep their
+    previous centroid.
+    """
+    n_rows = X.shape[0]
+    if n_rows < n_clusters:
+        raise ValueError(
+            "Cannot train {} centroids on {} vectors".format(
+                n_clusters, n_rows
+            )
+        )
+    n_train = min(n_rows, _MAX_POINTS_PER_CENTROID * n_clusters)
+    if n_train < n_rows:
+        X = X[rng.choice(n_rows, n_train, replace=False)]
+    centroids = X[rng.choice(n_train, n_clusters, replace=False)]
+    for _ in range(n_iter):
+        labels = _nearest(X, centroids)
+        counts = np.bincount(labels, minlength=n_clusters)
+        sums = (
+            sp.csr_matrix(
+                (
+                    np.ones(n_train, dtype=X.dtype),
+                    (labels, np.arange(n_train)),
+                ),
+                shape=(n_clusters, n_train),
+            )
+            @ X
+        )
+        filled = counts > 0
+        centroids = centroids.copy()
+        centroids[filled] = sums[filled] / counts[filled, None]
+    return centroids
+
+
+def _merge_topk(best_d, best_i, rows, d, ids, k):
+    """
+    Merge candidates into the running top-k of the given rows.
+
+    ``d`` holds the distances of the rows to the vectors of ids ``ids``,
+    smaller being better. ``rows`` must not contain duplicates.
+    """
+    cand_d = np.hstack([best_d[rows], d])
+    cand_i = np.hstack([best_i[rows], np.broadcast_to(ids, d.shape)])
+    top = np.argpartition(cand_d, k - 1, axis=1)[:, :k]
+    best_d[rows] = np.take_along_axis(cand_d, top, axis=1)
+    best_i[rows] = np.take_along_axis(cand_i, top, axis=1)
+
+
+class IVFNearestNeighbors:
+    """
+    Host nearest neighbors search over an IVF-Flat or IVF-PQ index.
+
+    This is the CPU estimator of :class:`~cuml.neighbors.NearestNeighbors`
+    for the ``'ivfflat'`` and ``'ivfpq'`` algorithms, with the same
+    parameters. ``usePrecomputedTables`` is accepted and ignored: distance
+    tables are always computed per query and probed list.
+
+    Cosine and correlation searches are euclidean searches over the
+    normalized (and centered) vectors. Distances of IVF-PQ searches are
+    computed on the encoded vectors, they are approximate.
+    """
+
+    def __init__(
+        self,
+        n_neighbors=5,
+        algorithm="ivfflat",
+        metric="euclidean",
+        p=2,
+        algo_params=None,
+        metric_params=None,
+        n_jobs=None,
+    ):
+        self.n_neighbors = n_neighbors
+        self.algorithm = algorithm
+        self.metric = metric
+        self.p = p
+        self.algo_params = algo_params
+        self.metric_params = metric_params
+        self.n_jobs = n_jobs
+
+    @property
+    def effective_metric_(self):
+        return self.metric
+
+    @effective_metric_.setter
+    def effective_metric_(self, val):
+        self.metric = val
+
+    @property
+    def effective_metric_params_(self):
+        return self.metric_params if self.metric_params else {}
+
+    @effective_metric_params_.setter
+    def effective_metric_params_(self, val):
+        self.metric_params = val
+
+    def _get_params(self):
+        n_samples, n_features = self.n_samples_fit_, self.n_features_in_
+        if self.algo_params is None or self.algo_params == "auto":
+            params = ivf_default_params(self.algorithm, n_samples, n_features)
+        else:
+            params = dict(self.algo_params)
+        nlist = int(params["nlist"])
+        nprobe = max(1, min(int(params["nprobe"]), nlist))
+        if nlist < 1 or nlist > n_samples:
+            raise ValueError(
+                "nlist must be between 1 and the number of samples, "
+                "got {}".format(nlist)
+            )
+        if self.algorithm == "ivfflat":
+            return nlist, nprobe, None, None
+        M, n_bits = int(params["M"]), int(params["n_bits"])
+        if M < 1 or n_features % M != 0:
+            raise ValueError(
+                "M must divide the number of features ({}), "
+                "got {}".format(n_features, M)
+            )
+        if not 1 <= n_bits <= 8:
+            raise ValueError(
+                "n_bits must be between 1 and 8, got {}".format(n_bits)
+            )
+        if 2**n_bits > n_samples:
+            raise ValueError(
+                "IVF-PQ with n_bits={} requires at least {} samples".format(
+                    n_bits, 2**n_bits
+                )
+            )
+        return nlist, nprobe, M, n_bits
+
+    def _transform(self, X):
+        """Vectors searched in place of X for the metric."""
+        X = np.asarray(X, dtype=np.float32)
+        if self.metric == "correlation":
+            X = X - X.mean(axis=1, keepdims=True)
+        if self.metric in ("cosine", "correlation"):
+            norms = np.linalg.norm(X, axis=1, keepdims=True)
+            X = X / np.where(norms > 0, norms, 1)
+        return X
+
+    def fit(self, X, y=None, convert_dtype=True):
+        """Train the coarse quantizer (and codebooks) and fill the lists."""
+        if sp.issparse(X):
+            raise ValueError(
+                "Approximate Nearest Neighbors methods require dense data"
+            )
+        if self.algorithm not in ("ivfflat", "ivfpq"):
+            raise ValueError("Unsupported algorithm {}".format(self.algorithm))
+        if self.metric not in IVF_METRICS:
+            raise ValueError(
+                "Metric {} is not valid for {}".format(
+                    self.metric, self.algorithm
+                )
+            )
+        X = np.asarray(X)
+        if X.ndim != 2:
+            raise ValueError("data should be two dimensional")
+        self.n_samples_fit_, self.n_features_in_ = X.shape
+        self._fit_method = self.algorithm
+        nlist, nprobe, M, n_bits = self._get_params()
+        self._nprobe = nprobe
+        rng = np.random.RandomState(_SEED)
+
+        X = self._transform(X)
+        self._centroids = kmeans(X, nlist, rng)
+        labels = _nearest(X, self._centroids, self.metric == "inner_product")
+        self._ids = np.argsort(labels, kind="stable")
+        self._offsets = np.searchsorted(
+            labels[self._ids], np.arange(nlist + 1)
+        )
+        X = X[self._ids]
+
+        if self.algorithm == "ivfflat":
+            self._vectors = X
+            self._sq_norms = np.einsum("ij,ij->i", X, X)
+            self._positions = np.argsort(self._ids)
+            return self
+
+        residuals = X - self._centroids[labels[self._ids]]
+        d_sub = self.n_features_in_ // M
+        self._codebooks = np.empty((M, 2**n_bits, d_sub), dtype=np.float32)
+        for m in range(M):
+            sub = np.ascontiguousarray(
+                residuals[:, m * d_sub : (m + 1) * d_sub]
+            )
+            self._codebooks[m] = kmeans(sub, 2**n_bits, rng)
+        self._codebook_sq_norms = np.einsum(
+            "mkd,mkd->mk", self._codebooks, self._codebooks
+        )
+        self._codes = self._encode(residuals)
+        return self
+
+    def _encode(self, residuals):
+        """PQ codes of the residuals of vectors to their centroid."""
+        M, _, d_sub = self._codebooks.shape
+        codes = np.empty((len(residuals), M), dtype=np.uint8)
+        for m in range(M):
+            sub = np.ascontiguousarray(
+                residuals[:, m * d_sub : (m + 1) * d_sub]
+            )
+            codes[:, m] = _nearest(sub, self._codebooks[m])
+        return codes
+
+    def _list_labels(self):
+        """List of each entry of the lists."""
+        nlist = len(self._centroids)
+        return np.repeat(np.arange(nlist), np.diff(self._offsets))
+
+    def partial_fit(self, X, y=None, convert_dtype=True):
+        """
+        Add vectors to the lists of their closest centroids, after the
+        vectors of the index. The centroids and codebooks are not updated.
+        """
+        if not hasattr(self, "_centroids"):
+            return self.fit(X)
+        if sp.issparse(X):
+            raise ValueError(
+                "Approximate Nearest Neighbors methods require dense data"
+            )
+        X = self._transform(X)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                "Dimensions of X need to match dimensions of "
+                "indices (%d)" % self.n_features_in_
+            )
+        nlist = len(self._centroids)
+        n_entries = len(self._ids)
+        labels = _nearest(X, self._centroids, self.metric == "inner_product")
+        # the lists are sorted already, the merge sort only interleaves
+        order = np.argsort(
+            np.concatenate([self._list_labels(), labels]), kind="stable"
+        )
+        new_ids = np.arange(len(X)) + self.n_samples_fit_
+        self._ids = np.concatenate([self._ids, new_ids])[order]
+        self._offsets = self._offsets + np.searchsorted(
+            np.sort(labels), np.arange(nlist + 1)
+        )
+        self.n_samples_fit_ += len(X)
+
+        if self.algorithm == "ivfflat":
+            entries = np.empty_like(order)
+            entries[order] = np.arange(len(order))
+            self._vectors = np.concatenate([self._vectors, X])[order]
+            self._sq_norms = np.concatenate(
+                [self._sq_norms, np.einsum("ij,ij->i", X, X)]
+            )[order]
+            self._positions = entries[
+                np.concatenate(
+                    [self._positions, n_entries + np.arange(len(X))]
+                )
+            ]
+        else:
+            codes = self._encode(X - self._centroids[labels])
+            self._codes = np.concatenate([self._codes, codes])[order]
+        return self
+
+    def remove(self, positions):
+        """
+        Remove the vectors at the given positions: their entries are
+        tombstoned and the positions of the next vectors are shifted.
+        """
+        positions = np.unique(positions)
+        removed = (self._ids < 0) | np.isin(self._ids, positions)
+        # the ids may be memory-mapped read-only, they are not updated in place
+        self._ids = np.where(
+            removed, -1, self._ids - np.searchsorted(positions, self._ids)
+        )
+        self.n_samples_fit_ -= len(positions)
+        if self.algorithm == "ivfflat":
+            self._positions = np.delete(self._positions, positions)
+        if (self._ids < 0).sum() > _COMPACT_FRACTION * len(self._ids):
+            self._compact()
+        return self
+
+    def _compact(self):
+        """Drop the tombstoned entries of the lists."""
+        keep = self._ids >= 0
+        nlist = len(self._centroids)
+        self._offsets = np.searchsorted(
+            self._list_labels()[keep], np.arange(nlist + 1)
+        )
+        self._ids = self._ids[keep]
+        if self.algorithm == "ivfflat":
+            self._vectors = self._vectors[keep]
+            self._sq_norms = self._sq_norms[keep]
+            self._positions = (np.cumsum(keep) - 1)[self._positions]
+        else:
+            self._codes = self._codes[keep]
+
+    def get_index_state(self):
+        """Metadata and arrays of the fitted index, to be saved."""
+        names = ["_centroids", "_ids", "_offsets"]
+        if self.algorithm == "ivfflat":
+            names += ["_vectors", "_sq_norms", "_positions"]
+        else:
+            names += ["_codes", "_codebooks", "_codebook_sq_norms"]
+        metadata = {
+            "n_samples_fit": self.n_samples_fit_,
+            "n_features_in": self.n_features_in_,
+            "nprobe": self._nprobe,
+        }
+        return metadata, {name: getattr(self, name) for name in names}
+
+    def set_index_state(self, metadata, arrays):
+        """Restore an index from the output of ``get_index_state``."""
+        self.n_samples_fit_ = metadata["n_samples_fit"]
+        self.n_features_in_ = metadata["n_features_in"]
+        self._nprobe = metadata["nprobe"]
+        self._fit_method = self.algorithm
+        for name, a in arrays.items():
+            setattr(self, name, a)
+        return self
+
+    def _coarse_scores(self, X):
+        """Scores of the rows of X for each list, smaller being closer."""
+        if self.metric == "inner_product":
+            return -(X @ self._centroids.T)
+        return _sq_distances(X, self._centroids)
+
+    def _list_scores(self, Q, lst):
+        """Scores of the queries Q to the vectors of list ``lst``."""
+        start, stop = self._offsets[lst], self._offsets[lst + 1]
+        if self.algorithm == "ivfflat":
+            vectors = self._vectors[start:stop]
+            if self.metric == "inner_product":
+                return -(Q @ vectors.T)
+            return _sq_distances(Q, vectors, self._sq_norms[start:stop])
+
+        M, ksub, d_sub = self._codebooks.shape
+        if self.metric == "inner_product":
+            # <q, c + r> = <q, c> + sum of the sub-space products
+            base = -(Q @ self._centroids[lst])
+            subs = Q
+        else:
+            subs = Q - self._centroids[lst]
+            base = np.einsum("ij,ij->i", subs, subs)
+        # (M, ksub, n_queries) tables of the sub-space scores
+        subs = subs.reshape(len(Q), M, d_sub).transpose(1, 2, 0)
+        tables = np.matmul(self._codebooks, subs)
+        if self.metric == "inner_product":
+            tables *= -1
+        else:
+            tables *= -2
+            tables += self._codebook_sq_norms[:, :, None]
+
+        # the score of a code is the product of its one-hot encoding, with
+        # M non-zeros, with the tables
+        n_codes = stop - start
+        cells = self._codes[start:stop] + np.arange(0, M * ksub, ksub)
+        one_hot = sp.csr_matrix(
+            (
+                np.ones(n_codes * M, dtype=np.float32),
+                cells.ravel(),
+                np.arange(0, n_codes * M + 1, M),
+            ),
+            shape=(n_codes, M * ksub),
+        )
+        scores = (one_hot @ tables.reshape(M * ksub, -1)).T
+        scores += base[:, None]
+        return scores
+
+    def _search(self, Q, k):
+        n_queries = len(Q)
+        best_d = np.full((n_queries, k), np.inf, dtype=np.float32)
+        best_i = np.full((n_queries, k), -1, dtype=np.int64)
+        nlist = len(self._centroids)
+        nprobe = self._nprobe
+        list_sizes = np.diff(self._offsets)
+        batch = max(1, _MAX_BATCH_ELEMENTS // max(1, list_sizes.max()))
+
+        for start in range(0, n_queries, batch):
+            Q_batch = Q[start : start + batch]
+            coarse = self._coarse_scores(Q_batch)
+            if nprobe < nlist:
+                probes = np.argpartition(coarse, nprobe - 1, axis=1)
+                probes = probes[:, :nprobe]
+            else:
+                probes = np.broadcast_to(np.arange(nlist), coarse.shape)
+            # queries grouped by probed list, each list is scanned once
+            probed = probes.ravel()
+            by_list = np.argsort(probed, kind="stable")
+            bounds = np.searchsorted(probed[by_list], np.arange(nlist + 1))
+            for lst in np.flatnonzero(np.diff(bounds) * list_sizes):
+                rows = by_list[bounds[lst] : bounds[lst + 1]] // nprobe
+                scores = self._list_scores(Q_batch[rows], lst)
+                ids = self._ids[self._offsets[lst] : self._offsets[lst + 1]]
+                removed = ids < 0
+                if removed.any():
+                    scores[:, removed] = np.inf
+                _merge_topk(best_d, best_i, rows + start, scores, ids, k)
+
+        if self.algorithm == "ivfflat" and self.metric != "inner_product":
+            self._refine(Q, best_d, best_i)
+        order = np.argsort(best_d, axis=1, kind="stable")
+        best_d = np.take_along_axis(best_d, order, axis=1)
+        best_i = np.take_along_axis(best_i, order, axis=1)
+        if self.metric == "inner_product":
+            best_d = -best_d
+        elif self.metric in ("euclidean", "l2"):
+            best_d = np.sqrt(best_d)
+        elif self.metric in ("cosine", "correlation"):
+            # squared distance of unit vectors is 2 - 2 cos
+            best_d = best_d / 2
+        return best_d, best_i
+
+    def _refine(self, Q, best_d, best_i):
+        """
+        Recompute the squared distances of the selected neighbors directly,
+        the expanded form loses the precision of the small distances.
+        """
+        found = best_i >= 0
+        positions = self._positions[np.where(found, best_i, 0)]
+        for start in range(0, len(Q), _CHUNK_ROWS):
+            chunk = slice(start, start + _CHUNK_ROWS)
+            diff = self._vectors[positions[chunk]] - Q[chunk, None, :]
+            exact = np.einsum("ijk,ijk->ij", diff, diff)
+            best_d[chunk] = np.where(found[chunk], exact, np.inf)
+
+    def _training_vectors(self):
+        if self.algorithm != "ivfflat":
+            raise ValueError(
+                "IVF-PQ indexes do not keep the training vectors, the "
+                "query vectors must be given"
+            )
+        return self._vectors[self._positions]
+
+    def kneighbors(
+        self, X=None, n_neighbors=None, return_distance=True, **kwargs
+    ):
+        """
+        Approximate k nearest neighbors of the rows of X, of the training
+        vectors without themselves if X is None. Queries that probe fewer
+        than ``n_neighbors`` vectors get ``-1`` indices and infinite
+        distances. ``kwargs`` (``convert_dtype``, ``two_pass_precision``)
+        are ignored.
+        """
+        if not hasattr(self, "_centroids"):
+            raise ValueError(
+                "IVF indexes built on device cannot be searched on host, "
+                "fit the model with the 'cpu' device type"
+            )
+        n_neighbors = self.n_neighbors if n_neighbors is None else n_neighbors
+        if n_neighbors <= 0:
+            raise ValueError("k or n_neighbors must be a positive integers")
+        if n_neighbors > self.n_samples_fit_:
+            raise ValueError(
+                "n_neighbors must be <= number of samples in index"
+            )
+        use_training_data = X is None
+        if use_training_data:
+            Q = self._training_vectors()
+            n_neighbors += 1
+        else:
+            if sp.issparse(X):
+                raise ValueError(
+                    "Approximate Nearest Neighbors methods require dense data"
+                )
+            Q = self._transform(X)
+            if Q.ndim != 2 or Q.shape[1] != self.n_features_in_:
+                raise ValueError(
+                    "Dimensions of X need to match dimensions of "
+                    "indices (%d)" % self.n_features_in_
+                )
+        distances, indices = self._search(Q, n_neighbors)
+        if use_training_data:
+            # drop the first column, the query itself
+            distances, indices = distances[:, 1:], indices[:, 1:]
+        return (distances, indices) if return_distance else indices
+
+    def kneighbors_graph(self, X=None, n_neighbors=None, mode="connectivity"):
+        n_neighbors = self.n_neighbors if n_neighbors is None else n_neighbors
+        if mode == "connectivity":
+            indices = self.kneighbors(X, n_neighbors, return_distance=False)
+            distances = np.ones(indices.shape, dtype=np.float32)
+        elif mode == "distance":
+            distances, indices = self.kneighbors(X, n_neighbors)
+        else:
+            raise ValueError(
+                'Unsupported mode, must be one of "connectivity"'
+                ' or "distance" but got "%s" instead' % mode
+            )
+        # the padding of the queries that probe fewer than n_neighbors
+        # vectors is not an edge
+        found = indices >= 0
+        indptr = np.zeros(indices.shape[0] + 1, dtype=np.int64)
+        np.cumsum(found.sum(axis=1), out=indptr[1:])
+        return sp.csr_matrix(
+            (distances[found], indices[found], indptr),
+            shape=(indices.shape[0], self.n_samples_fit_),
+        )
@@ -0,0 +1,180 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Binary file format of the saved nearest neighbors indexes.
+
+A file starts with the magic string ``b"CUMLIDX\\0"``, the little-endian
+uint32 format version and the uint64 length of a UTF-8 JSON header. The
+header holds the metadata of the index and the dtype, shape and offset of
+each of its arrays. The arrays follow the header, each one starting on a
+64 bytes boundary, in C order, so that they can be memory-mapped.
+"""
+
+import json
+
+from cuml.internals.safe_imports import cpu_only_import
+
+np = cpu_only_import("numpy")
+
+MAGIC = b"CUMLIDX\0"
+FORMAT_VERSION = 1
+_ALIGNMENT = 64
+_PREFIX = np.dtype([("version", "<u4"), ("header_size", "<u8")])
+
+
+def _aligned(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _layout(metadata, specs):
+    """Header and data offset of arrays given by (dtype, shape) pairs."""
+    entries = {}
+    offset = 0
+    for name, (dtype, shape) in specs.items():
+        offset = _aligned(offset)
+        entries[name] = {
+            "dtype": np.dtype(dtype).str,
+            "shape": list(shape),
+            "offset": offset,
+        }
+        offset += np.dtype(dtype).itemsize * int(np.prod(shape))
+    header = json.dumps({"metadata": metadata, "arrays": entries}).encode()
+    data_start = _aligned(len(MAGIC) + _PREFIX.itemsize + len(header))
+    return header, entries, data_start, data_start + _aligned(offset)
+
+
+def _write_header(f, header):
+    prefix = np.array([(FORMAT_VERSION, len(header))], dtype=_PREFIX)
+    f.write(MAGIC)
+    f.write(prefix.tobytes())
+    f.write(header)
+
+
+def save_arrays(path, metadata, arrays):
+    """
+    Write an index file.
+
+    Parameters
+    ----------
+    path : str or path-like
+    metadata : dict
+        JSON serializable metadata of the index.
+    arrays : dict of str to numpy.ndarray
+    """
+    arrays = {name: np.asarray(a, order="C") for name, a in arrays.items()}
+    header, entries, data_start, size = _layout(
+        metadata, {name: (a.dtype, a.shape) for name, a in arrays.items()}
+    )
+    with open(path, "wb") as f:
+        _write_header(f, header)
+        for name, a in arrays.items():
+            f.seek(data_start + entries[name]["offset"])
+            f.write(a.tobytes())
+        f.truncate(size)
+
+
+def create_arrays(path, metadata, specs):
+    """
+    Create a file in the format of :func:`save_arrays` and memory-map its
+    arrays for writing, so that they can be filled incrementally.
+
+    The file is allocated at once, without writing the arrays, which are
+    zero until filled.
+
+    Parameters
+    ----------
+    path : str or path-like
+    metadata : dict
+        JSON serializable metadata of the index.
+    specs : dict of str to (dtype, shape)
+
+    Returns
+    -------
+    arrays : dict of str to numpy.memmap
+        Writable arrays, flushed to the file when deleted.
+    """
+    header, entries, data_start, size = _layout(metadata, specs)
+    with open(path, "wb") as f:
+        _write_header(f, header)
+        f.truncate(size)
+
+    arrays = {}
+    for name, entry in entries.items():
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        if int(np.prod(shape)) > 0 and shape:
+            arrays[name] = np.memmap(
+                path,
+                dtype=dtype,
+                mode="r+",
+                offset=data_start + entry["offset"],
+                shape=shape,
+            )
+        else:
+            # empty and 0-d arrays cannot be memory-mapped
+            arrays[name] = np.zeros(shape, dtype=dtype)
+    return arrays
+
+
+def load_arrays(path, mmap=True):
+    """
+    Read an index file written by :func:`save_arrays`.
+
+    Parameters
+    ----------
+    path : str or path-like
+    mmap : bool, default=True
+        Whether to memory-map the arrays, read-only, instead of reading them
+        in memory. Memory-mapped pages are shared by the processes loading
+        the same file.
+
+    Returns
+    -------
+    metadata : dict
+    arrays : dict of str to numpy.ndarray
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError("{} is not a cuML index file".format(path))
+        prefix = np.frombuffer(f.read(_PREFIX.itemsize), dtype=_PREFIX)[0]
+        if prefix["version"] > FORMAT_VERSION:
+            raise ValueError(
+                "{} has format version {}, this version of cuML reads "
+                "versions up to {}".format(
+                    path, prefix["version"], FORMAT_VERSION
+                )
+            )
+        header = json.loads(f.read(int(prefix["header_size"])).decode())
+        data_start = _aligned(
+            len(MAGIC) + _PREFIX.itemsize + int(prefix["header_size"])
+        )
+
+        arrays = {}
+        for name, entry in header["arrays"].items():
+            dtype = np.dtype(entry["dtype"])
+            shape = tuple(entry["shape"])
+            offset = data_start + entry["offset"]
+            count = int(np.prod(shape))
+            # empty and 0-d arrays cannot be memory-mapped
+            if mmap and count > 0 and shape:
+                arrays[name] = np.memmap(
+                    path, dtype=dtype, mode="r", offset=offset, shape=shape
+                )
+            else:
+                f.seek(offset)
+                arrays[name] = np.fromfile(f, dtype=dtype, count=count)
+                arrays[name] = arrays[name].reshape(shape)
+    return header["metadata"], arrays
@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2019-2021, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -20,6 +20,8 @@
 from libc.stdint cimport uintptr_t
 from libcpp cimport bool
 
+from cuml.neighbors._host_ann import ivf_default_params
+
 
 cdef check_algo_params(algo, params):
     def check_param_list(params, param_list):
@@ -37,10 +39,7 @@ cdef check_algo_params(algo, params):
 cdef build_ivfflat_algo_params(params, automated):
     cdef IVFFlatParam* algo_params = new IVFFlatParam()
     if automated:
-        params = {
-            'nlist': 8,
-            'nprobe': 2
-        }
+        params = ivf_default_params('ivfflat', None, None)
     algo_params.nlist = <int> params['nlist']
     algo_params.nprobe = <int> params['nprobe']
     return <uintptr_t>algo_params
@@ -49,36 +48,8 @@ cdef build_ivfflat_algo_params(params, automated):
 cdef build_ivfpq_algo_params(params, automated, additional_info):
     cdef IVFPQParam* algo_params = new IVFPQParam()
     if automated:
-        allowedSubquantizers = [1, 2, 3, 4, 8, 12, 16, 20, 24, 28, 32, 40, 48]
-        allowedSubDimSize = {1, 2, 3, 4, 6, 8, 10, 12, 16, 20, 24, 28, 32}
-        N = additional_info['n_samples']
-        D = additional_info['n_features']
-
-        params = {
-            'nlist': 8,
-            'nprobe': 3
-        }
-
-        for n_subq in allowedSubquantizers:
-            if D % n_subq == 0 and (D / n_subq) in allowedSubDimSize:
-                params['usePrecomputedTables'] = False
-                params['M'] = n_subq
-                break
-
-        if 'M' not in params:
-            for n_subq in allowedSubquantizers:
-                if D % n_subq == 0:
-                    params['usePrecomputedTables'] = True
-                    params['M'] = n_subq
-                    break
-
-        # n_bits should be in set {4, 5, 6, 8} since FAISS 1.7
-        params['n_bits'] = 4
-        for n_bits in [4, 5, 6, 8]:
-            min_train_points = (2 ** n_bits) * 39
-            if N >= min_train_points:
-                params['n_bits'] = n_bits
-                break
+        params = ivf_default_params('ivfpq', additional_info['n_samples'],
+                                    additional_info['n_features'])
 
     algo_params.nlist = <int> params['nlist']
     algo_params.nprobe = <int> params['nprobe']
@@ -18,8 +18,10 @@ from cuml.common.exceptions import NotFittedError
 from cuml.internals.import_utils import has_scipy
 from cuml.metrics import pairwise_distances
 from cuml.internals.base import Base
-from cuml.internals.input_utils import input_to_cuml_array
 from cuml.internals.input_utils import input_to_cupy_array
+from cuml.internals.input_utils import input_to_host_array
+from cuml.internals.device_type import DeviceType
+from cuml.internals.global_settings import GlobalSettings
 from cuml.internals.safe_imports import gpu_only_import_from
 import math
 from cuml.internals.safe_imports import cpu_only_import
@@ -31,6 +33,7 @@ cuda = gpu_only_import_from("numba", "cuda")
 
 if has_scipy():
     from scipy.special import gammainc
+    from scipy.spatial.distance import cdist
 
 
 VALID_KERNELS = [
@@ -42,6 +45,24 @@ VALID_KERNELS = [
     "cosine",
 ]
 
+# kernels that are zero beyond the bandwidth
+COMPACT_KERNELS = ["tophat", "epanechnikov", "linear", "cosine"]
+
+# training points per leaf of the spatial index, and queries per tile
+_LEAF_SIZE = 256
+_QUERY_TILE = 256
+# distances computed at once when scoring a tile of queries
+_MAX_TILE_ELEMENTS = 1 << 22
+
+# metrics of scipy's cdist, under their name in pairwise_distances
+_HOST_METRICS = {
+    "l1": "cityblock",
+    "manhattan": "cityblock",
+    "taxicab": "cityblock",
+    "l2": "euclidean",
+    "linf": "chebyshev",
+}
+
 
 @cp.fuse()
 def gaussian_log_kernel(x, h):
@@ -149,6 +170,87 @@ def logsumexp_kernel(distances, log_probabilities):
     log_probabilities[i] = math.log(sum) + max_exp
 
 
+def log_kernel(x, h, kernel, xp):
+    """
+    Log of the unnormalized kernel at distances ``x``, on NumPy or CuPy
+    arrays. Unlike the fused device kernels, compact kernels are exactly
+    ``-inf`` beyond the bandwidth.
+    """
+    if kernel == "gaussian":
+        return -(x * x) / (2 * h * h)
+    if kernel == "exponential":
+        return -x / h
+    if kernel == "tophat":
+        z = xp.ones_like(x)
+    elif kernel == "epanechnikov":
+        z = 1.0 - (x * x) / (h * h)
+    elif kernel == "linear":
+        z = 1.0 - x / h
+    elif kernel == "cosine":
+        z = xp.cos(0.5 * np.pi * x / h)
+    else:
+        raise ValueError("Unsupported kernel.")
+    # don't call log(0) otherwise we get NaNs
+    return xp.where(x < h, xp.log(xp.maximum(z, 1e-30)), -xp.inf)
+
+
+def _kd_leaves(X, leaf_size, xp):
+    """
+    Order the rows of ``X`` by the leaves of a k-d tree.
+
+    Nodes are split at the median of their widest feature until they hold
+    at most ``leaf_size`` rows, so that each leaf is a contiguous range of
+    the returned ordering.
+
+    Returns
+    -------
+    order : array of shape (n_rows,)
+        Permutation of the rows, leaf by leaf.
+    starts : list of int
+        Start of each leaf in ``order``, followed by ``n_rows``.
+    lo, hi : arrays of shape (n_leaves, n_features)
+        Bounding box of each leaf, in float64.
+    """
+    n_rows = X.shape[0]
+    order = xp.arange(n_rows)
+    nodes = [(0, n_rows)]
+    starts, lo, hi = [], [], []
+    while nodes:
+        start, stop = nodes.pop()
+        points = X[order[start:stop]]
+        low, high = points.min(axis=0), points.max(axis=0)
+        if stop - start <= leaf_size:
+            starts.append(start)
+            lo.append(low)
+            hi.append(high)
+            continue
+        mid = (stop - start) // 2
+        split = xp.argpartition(points[:, int((high - low).argmax())], mid)
+        order[start:stop] = order[start:stop][split]
+        # the left child is popped first, leaves come out in order
+        nodes.append((start + mid, stop))
+        nodes.append((start, start + mid))
+    return (
+        order,
+        starts + [n_rows],
+        xp.stack(lo).astype(xp.float64),
+        xp.stack(hi).astype(xp.float64),
+    )
+
+
+def _box_distances(q_lo, q_hi, lo, hi, xp):
+    """
+    Smallest and largest euclidean distances between the points of the box
+    ``[q_lo, q_hi]`` and the points of each box ``[lo[i], hi[i]]``.
+    """
+    gap = xp.maximum(xp.maximum(lo - q_hi, q_lo - hi), 0)
+    far = xp.maximum(xp.abs(hi - q_lo), xp.abs(q_hi - lo))
+    # margins absorb the rounding of the distances computed in float32
+    d_min = xp.sqrt((gap * gap).sum(axis=1)) * (1 - 1e-5)
+    d_max = xp.sqrt((far * far).sum(axis=1)) * (1 + 1e-5)
+    return d_min, d_max
+
+
 class KernelDensity(Base):
     """
     Kernel Density Estimation. Computes a non-parametric density estimate
@@ -170,6 +272,12 @@ class KernelDensity(Base):
     metric_params : dict, default=None
         Additional parameters to be passed to the tree for use with the
         metric.
+    atol : float, default=0.0
+        The desired absolute tolerance of the result. A larger tolerance
+        will generally lead to faster execution.
+    rtol : float, default=0.0
+        The desired relative tolerance of the result. A larger tolerance
+        will generally lead to faster execution.
     output_type : {'input', 'array', 'dataframe', 'series', 'df_obj', \
         'numba', 'cupy', 'numpy', 'cudf', 'pandas'}, default=None
         Return results and set estimator attributes to the indicated output
@@ -187,6 +295,25 @@ class KernelDensity(Base):
         Sets logging level. It must be one of `cuml.common.logger.level_*`.
         See :ref:`verbosity-levels` for more info.
 
+    Notes
+    -----
+    Densities are computed by tiles of queries and training points,
+    accumulating a running log-sum-exp, so that the memory used does not
+    depend on the number of queries times the number of training points.
+    Models fitted under
+    :py:func:`cuml.common.device_selection.using_device_type` ``"cpu"`` are
+    fitted and scored with NumPy and SciPy.
+
+    With the euclidean metric, the training points are ordered in the leaves
+    of a k-d tree and the contribution of each leaf to a tile of queries is
+    bounded from the bounding boxes of the leaf and of the tile. Leaves
+    that cannot contribute, those beyond the bandwidth of the compact
+    kernels (tophat, epanechnikov, linear and cosine), are always skipped.
+    Within ``atol`` and ``rtol``, the leaves with the tightest bounds are
+    also skipped and replaced by the middle of their bounds, like
+    scikit-learn's KernelDensity. The tolerances are ignored for the other
+    metrics.
+
     Examples
     --------
 
@@ -208,6 +335,8 @@ class KernelDensity(Base):
         kernel="gaussian",
         metric="euclidean",
         metric_params=None,
+        atol=0.0,
+        rtol=0.0,
         output_type=None,
         handle=None,
         verbose=False,
@@ -219,9 +348,13 @@ class KernelDensity(Base):
         self.kernel = kernel
         self.metric = metric
         self.metric_params = metric_params
+        self.atol = atol
+        self.rtol = rtol
 
         if bandwidth <= 0:
             raise ValueError("bandwidth must be positive")
+        if atol < 0 or rtol < 0:
+            raise ValueError("atol and rtol must be non-negative")
         if kernel not in VALID_KERNELS:
             raise ValueError("invalid kernel: '{0}'".format(kernel))
 
@@ -231,8 +364,26 @@ class KernelDensity(Base):
             "kernel",
             "metric",
             "metric_params",
+            "atol",
+            "rtol",
         ]
 
+    def _xp(self):
+        """Array module of the fitted attributes, NumPy for host models."""
+        return np if self.__dict__.get("_host") else cp
+
+    def _to_array(self, X, convert_dtype, **kwargs):
+        if self.__dict__.get("_host"):
+            to_array = input_to_host_array
+        else:
+            to_array = input_to_cupy_array
+        return to_array(
+            X,
+            convert_to_dtype=(np.float32 if convert_dtype else None),
+            check_dtype=[np.float32, np.float64],
+            **kwargs,
+        ).array
+
     def fit(self, X, y=None, sample_weight=None, convert_dtype=True):
         """Fit the Kernel Density model on the data.
 
@@ -253,23 +404,19 @@ class KernelDensity(Base):
         self : object
             Returns the instance itself.
         """
+        self._host = GlobalSettings().device_type is DeviceType.host
         if sample_weight is not None:
-            self.sample_weight_ = input_to_cupy_array(
-                sample_weight,
-                convert_to_dtype=(np.float32 if convert_dtype else None),
-                check_dtype=[cp.float32, cp.float64],
-            ).array
+            self.sample_weight_ = self._to_array(sample_weight, convert_dtype)
             if self.sample_weight_.min() <= 0:
                 raise ValueError("sample_weight must have positive values")
         else:
             self.sample_weight_ = None
 
-        self.X_ = input_to_cupy_array(
-            X,
-            order="C",
-            convert_to_dtype=(np.float32 if convert_dtype else None),
-            check_dtype=[cp.float32, cp.float64],
-        ).array
+        self.X_ = self._to_array(X, convert_dtype, order="C")
+        if self.X_.ndim == 1:
+            # one dimensional data has a single feature
+            self.X_ = self.X_.reshape(-1, 1)
+        self._leaves = None
 
         return self
 
@@ -293,66 +440,191 @@ class KernelDensity(Base):
         """
         if not hasattr(self, "X_"):
             raise NotFittedError()
-        X_cuml = input_to_cuml_array(
-            X,
-            convert_to_dtype=(np.float32 if convert_dtype else None),
-        )
-        if self.metric_params:
-            if len(self.metric_params) != 1:
-                raise ValueError(
-                    "Cuml only supports metrics with a single arg."
-                )
-            metric_arg = list(self.metric_params.values())[0]
-            distances = pairwise_distances(
-                X_cuml.array,
-                self.X_,
-                metric=self.metric,
-                metric_arg=metric_arg,
-            )
-        else:
-            distances = pairwise_distances(
-                X_cuml.array, self.X_, metric=self.metric
-            )
-
-        distances = cp.asarray(distances)
-
-        h = self.bandwidth
-        if self.kernel in log_probability_kernels_:
-            distances = log_probability_kernels_[self.kernel](distances, h)
-        else:
-            raise ValueError("Unsupported kernel.")
-
-        log_probabilities = cp.zeros(distances.shape[0])
-        if self.sample_weight_ is not None:
-            distances += cp.log(self.sample_weight_)
+        if self.metric_params and len(self.metric_params) != 1:
+            raise ValueError("Cuml only supports metrics with a single arg.")
+        X = self._to_array(X, convert_dtype, order="C")
+        if X.ndim == 1:
+            # if X is one dimensional, we have 1 feature
+            X = X.reshape(-1, 1)
 
-        logsumexp_kernel.forall(log_probabilities.size)(
-            distances, log_probabilities
-        )
+        log_probabilities = self._log_kernel_sums(X)
         # Note that sklearns user guide is wrong
         # It says the (unnormalised) probability output for
         #  the kernel density is sum(K(x,h)).
         # In fact what they implement is (1/n)*sum(K(x,h))
         # Here we divide by n in normal probability space
         # Which becomes -log(n) in log probability space
-        sum_weights = (
-            cp.sum(self.sample_weight_)
-            if self.sample_weight_ is not None
-            else distances.shape[1]
+        log_probabilities -= np.log(self._sum_weights())
+
+        return norm_log_probabilities(
+            log_probabilities, self.kernel, self.bandwidth, X.shape[1]
         )
-        log_probabilities -= np.log(sum_weights)
 
-        # norm
-        if len(X_cuml.array.shape) == 1:
-            # if X is one dimensional, we have 1 feature
-            dimension = 1
-        else:
-            dimension = X_cuml.array.shape[1]
-        log_probabilities = norm_log_probabilities(
-            log_probabilities, self.kernel, h, dimension
+    def _sum_weights(self):
+        if self.sample_weight_ is None:
+            return self.X_.shape[0]
+        return float(self.sample_weight_.sum())
+
+    def _distances(self, X, Y):
+        """Distances between the rows of X and Y, on host or device."""
+        metric_arg = (
+            list(self.metric_params.values())[0]
+            if self.metric_params
+            else None
         )
+        if self.__dict__.get("_host"):
+            has_scipy(raise_if_unavailable=True)
+            metric = _HOST_METRICS.get(self.metric, self.metric)
+            kwargs = {}
+            if metric_arg is not None:
+                kwargs[list(self.metric_params)[0]] = metric_arg
+            return cdist(X, Y, metric=metric, **kwargs)
+        if metric_arg is not None:
+            distances = pairwise_distances(
+                X, Y, metric=self.metric, metric_arg=metric_arg
+            )
+        else:
+            distances = pairwise_distances(X, Y, metric=self.metric)
+        return cp.asarray(distances)
+
+    def _get_leaves(self):
+        """
+        Spatial index of the training points, built at the first query: the
+        training points and their log weights ordered by the leaves of a
+        k-d tree, the leaf of each point, the bounding box and the log of
+        the total weight of each leaf.
+        """
+        if self.__dict__.get("_leaves") is None:
+            xp = self._xp()
+            order, starts, lo, hi = _kd_leaves(self.X_, _LEAF_SIZE, xp)
+            sizes = xp.asarray(np.diff(starts))
+            point_leaf = xp.repeat(xp.arange(len(sizes)), sizes.tolist())
+            if self.sample_weight_ is None:
+                log_weights = None
+                leaf_weight = sizes.astype(xp.float64)
+            else:
+                weights = self.sample_weight_[order].astype(xp.float64)
+                log_weights = xp.log(weights)
+                leaf_weight = xp.bincount(point_leaf, weights=weights)
+            self._leaves = (
+                self.X_[order],
+                log_weights,
+                point_leaf,
+                lo,
+                hi,
+                xp.log(leaf_weight),
+            )
+        return self._leaves
+
+    def _prune(self, q_lo, q_hi, leaves):
+        """
+        Leaves to score exactly for a tile of queries bounded by the box
+        ``[q_lo, q_hi]``, and the log of the estimated contribution of the
+        other leaves.
+        """
+        xp = self._xp()
+        _, _, _, lo, hi, log_leaf_weight = leaves
+        h = self.bandwidth
+        d_min, d_max = _box_distances(q_lo, q_hi, lo, hi, xp)
+        log_upper = log_leaf_weight + log_kernel(d_min, h, self.kernel, xp)
+        log_lower = log_leaf_weight + log_kernel(d_max, h, self.kernel, xp)
+        top = float(log_upper.max())
+        if top == -np.inf:
+            return xp.zeros(len(lo), dtype=bool), -np.inf
+        # bounds are scaled by the largest one to stay in range
+        upper = xp.exp(log_upper - top)
+        lower = xp.exp(log_lower - top)
+
+        # the tolerances of sklearn, in the scale of the bounds
+        tol = self.rtol * float(lower.sum())
+        if self.atol > 0:
+            log_norm = -norm_log_probabilities(
+                0.0, self.kernel, h, self.X_.shape[1]
+            )
+            tol += math.exp(
+                math.log(self.atol)
+                + math.log(self._sum_weights())
+                + log_norm
+                - top
+            )
+        # the error of replacing a leaf by the middle of its bounds is at
+        # most half their gap, skip the leaves with the smallest gaps
+        error = (upper - lower) / 2
+        by_error = xp.argsort(error)
+        n_skipped = int((xp.cumsum(error[by_error]) <= tol).sum())
+        skip = xp.zeros(len(lo), dtype=bool)
+        skip[by_error[:n_skipped]] = True
+        rest = float(((upper + lower) / 2)[skip].sum())
+        log_rest = math.log(rest) + top if rest > 0 else -np.inf
+        return ~skip, log_rest
+
+    def _log_kernel_sums(self, X):
+        """
+        Log of the weighted sum of the kernel values between each query and
+        the training points, computed by tiles with a running log-sum-exp.
+        """
+        xp = self._xp()
+        h = self.bandwidth
+        if self.__dict__.get("_host"):
+
+            def kernel(distances):
+                return log_kernel(distances, h, self.kernel, np)
+
+        else:
 
-        return log_probabilities
+            def kernel(distances):
+                return log_probability_kernels_[self.kernel](distances, h)
+
+        n_queries = X.shape[0]
+        prune = self.metric in ("euclidean", "l2")
+        if prune:
+            leaves = self._get_leaves()
+            train, log_weights, point_leaf = leaves[:3]
+            queries, q_starts, q_lo, q_hi = _kd_leaves(X, _QUERY_TILE, xp)
+        else:
+            train = self.X_
+            log_weights = (
+                None
+                if self.sample_weight_ is None
+                else xp.log(self.sample_weight_.astype(xp.float64))
+            )
+            queries = xp.arange(n_queries)
+            q_starts = list(range(0, n_queries, _QUERY_TILE)) + [n_queries]
+
+        log_sums = xp.empty(n_queries, dtype=xp.float64)
+        for tile in range(len(q_starts) - 1):
+            rows = queries[q_starts[tile] : q_starts[tile + 1]]
+            Q = X[rows]
+            points, log_rest = None, -np.inf
+            if prune:
+                keep, log_rest = self._prune(q_lo[tile], q_hi[tile], leaves)
+                points = xp.nonzero(keep[point_leaf])[0]
+            n_points = train.shape[0] if points is None else len(points)
+
+            # running maximum and sum of the exponentials shifted by it
+            top = xp.full(len(rows), log_rest)
+            total = xp.ones(len(rows)) * (log_rest > -np.inf)
+            chunk = max(1, _MAX_TILE_ELEMENTS // len(rows))
+            for start in range(0, n_points, chunk):
+                if points is None:
+                    idx = slice(start, start + chunk)
+                else:
+                    idx = points[start : start + chunk]
+                log_k = kernel(self._distances(Q, train[idx]))
+                if log_weights is not None:
+                    log_k = log_k + log_weights[idx]
+                new_top = xp.maximum(top, log_k.max(axis=1))
+                # keep the shift finite for the rows without any term yet
+                shift = xp.where(new_top > -np.inf, new_top, 0)
+                total = total * xp.exp(top - shift) + xp.exp(
+                    log_k - shift[:, None]
+                ).sum(axis=1)
+                top = new_top
+            with np.errstate(divide="ignore"):
+                log_sums[rows] = xp.log(total) + xp.where(
+                    top > -np.inf, top, 0
+                )
+        return log_sums
 
     def score(self, X, y=None):
         """Compute the total log-likelihood under the model.
@@ -374,7 +646,7 @@ class KernelDensity(Base):
             probability density, so the value will be low for high-dimensional
             data.
         """
-        return cp.sum(self.score_samples(X))
+        return self.score_samples(X).sum()
 
     def sample(self, n_samples=1, random_state=None):
         """
@@ -386,11 +658,13 @@ class KernelDensity(Base):
         ----------
         n_samples : int, default=1
             Number of samples to generate.
-        random_state : int, cupy RandomState instance or None, default=None
+        random_state : int, cupy or numpy RandomState instance or None, \
+                default=None
+            A numpy RandomState for models fitted on host.
 
         Returns
         -------
-        X : cupy array of shape (n_samples, n_features)
+        X : cupy or numpy array of shape (n_samples, n_features)
             List of samples.
         """
         if not hasattr(self, "X_"):
@@ -403,20 +677,21 @@ class KernelDensity(Base):
                 " metric are supported.".format(supported_kernels)
             )
 
-        if isinstance(random_state, cp.random.RandomState):
+        xp = self._xp()
+        if isinstance(random_state, xp.random.RandomState):
             rng = random_state
         else:
-            rng = cp.random.RandomState(random_state)
+            rng = xp.random.RandomState(random_state)
 
         u = rng.uniform(0, 1, size=n_samples)
         if self.sample_weight_ is None:
             i = (u * self.X_.shape[0]).astype(np.int64)
         else:
-            cumsum_weight = cp.cumsum(self.sample_weight_)
+            cumsum_weight = xp.cumsum(self.sample_weight_)
             sum_weight = cumsum_weight[-1]
-            i = cp.searchsorted(cumsum_weight, u * sum_weight)
+            i = xp.searchsorted(cumsum_weight, u * sum_weight)
         if self.kernel == "gaussian":
-            return cp.atleast_2d(rng.normal(self.X_[i], self.bandwidth))
+            return xp.atleast_2d(rng.normal(self.X_[i], self.bandwidth))
 
         elif self.kernel == "tophat":
             # we first draw points from a d-dimensional normal distribution,
@@ -425,11 +700,13 @@ class KernelDensity(Base):
             has_scipy(raise_if_unavailable=True)
             dim = self.X_.shape[1]
             X = rng.normal(size=(n_samples, dim))
-            s_sq = cp.einsum("ij,ij->i", X, X).get()
+            s_sq = xp.einsum("ij,ij->i", X, X)
+            if xp is cp:
+                s_sq = s_sq.get()
 
             # do this on the CPU because we don't have
             # a gammainc function  readily available
-            correction = cp.array(
+            correction = xp.asarray(
                 gammainc(0.5 * dim, 0.5 * s_sq) ** (1.0 / dim)
                 * self.bandwidth
                 / np.sqrt(s_sq)
@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2019-2023, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -19,6 +19,10 @@
 import typing
 
 from cuml.neighbors.nearest_neighbors import NearestNeighbors
+from cuml.neighbors.knn_graph import fingerprint
+from cuml.neighbors._aggregation import (
+    check_weights, chunk_rows, class_votes, encode_labels, neighbor_weights
+)
 
 import cuml.internals
 from cuml.internals.array import CumlArray
@@ -88,9 +92,12 @@ class KNeighborsClassifier(ClassifierMixin,
         The query algorithm to use. Currently, only 'brute' is supported.
     metric : string (default='euclidean').
         Distance metric to use.
-    weights : string (default='uniform')
-        Sample weights to use. Currently, only the uniform strategy is
-        supported.
+    weights : {'uniform', 'distance'} or callable (default='uniform')
+        Weights of the votes of the neighbors: 'uniform' weights all the
+        neighbors equally, 'distance' by the inverse of their distance. A
+        callable is given the array of distances of the neighbors and
+        returns an array of weights of the same shape. It gets NumPy arrays
+        on host and CuPy arrays on device.
     handle : cuml.Handle
         Specifies the cuml.handle that holds internal CUDA state for
         computations in this model. Most importantly, this specifies the CUDA
@@ -150,28 +157,137 @@ class KNeighborsClassifier(ClassifierMixin,
 
         self.y = None
         self.classes_ = None
-        self.weights = weights
+        self.weights = check_weights(weights)
 
-        if weights != "uniform":
-            raise ValueError("Only uniform weighting strategy is "
-                             "supported currently.")
-
-    @generate_docstring(convert_dtype_cast='np.float32')
+    @generate_docstring(convert_dtype_cast='np.float32',
+                        skip_parameters_heading=True)
     @cuml.internals.api_base_return_any(set_output_dtype=True)
-    def fit(self, X, y, convert_dtype=True) -> "KNeighborsClassifier":
+    def fit(self, X, y, convert_dtype=True,
+            knn_graph=None) -> "KNeighborsClassifier":
         """
         Fit a GPU index for k-nearest neighbors classifier model.
 
+        Parameters
+        ----------
+        knn_graph : cuml.neighbors.KNNGraph, optional
+            Precomputed neighbors of the samples of X, see
+            :meth:`NearestNeighbors.fit`.
+
         """
-        super(KNeighborsClassifier, self).fit(X, convert_dtype)
+        super(KNeighborsClassifier, self).fit(X, convert_dtype=convert_dtype,
+                                              knn_graph=knn_graph)
         self.y, _, _, _ = \
             input_to_cuml_array(y, order='F', check_dtype=np.int32,
                                 convert_to_dtype=(np.int32
                                                   if convert_dtype
                                                   else None))
-        self.classes_ = cp.unique(self.y)
+        self.classes_ = self._xp().unique(self._to_xp(self.y))
+        self._encoded_labels = None
+        self._last_votes = None
         return self
 
+    @generate_docstring(skip_parameters_heading=True,
+                        convert_dtype_cast='np.float32')
+    @cuml.internals.api_base_return_any(set_output_dtype=True)
+    def partial_fit(self, X, y, ids=None,
+                    convert_dtype=True) -> "KNeighborsClassifier":
+        """
+        Add labeled vectors to the index of the classifier model, see
+        :meth:`NearestNeighbors.partial_fit`.
+
+        Parameters
+        ----------
+        ids : array-like of int, shape = (n_samples,), optional
+            Unique identifiers of the new vectors, see
+            :attr:`NearestNeighbors.ids_`.
+
+        """
+        y, _, _, _ = \
+            input_to_cuml_array(y, order='F', check_dtype=np.int32,
+                                convert_to_dtype=(np.int32
+                                                  if convert_dtype
+                                                  else None))
+        xp = self._xp()
+        if self.y is not None:
+            y = xp.concatenate([self._to_xp(self.y), self._to_xp(y)])
+        super(KNeighborsClassifier, self).partial_fit(
+            X, ids=ids, convert_dtype=convert_dtype)
+        self.y = input_to_cuml_array(y, order='F').array
+        self.classes_ = xp.unique(self._to_xp(self.y))
+        self._encoded_labels = None
+        self._last_votes = None
+        return self
+
+    def _remove_positions(self, positions):
+        super(KNeighborsClassifier, self)._remove_positions(positions)
+        xp = self._xp()
+        keep = np.ones(self.y.shape[0], dtype=bool)
+        keep[positions] = False
+        self.y = input_to_cuml_array(self._to_xp(self.y)[xp.asarray(keep)],
+                                     order='F').array
+        self.classes_ = xp.unique(self._to_xp(self.y))
+        self._encoded_labels = None
+        self._last_votes = None
+
+    def _votes(self, X, convert_dtype):
+        """
+        Weighted votes of the neighbors of X for the classes of all the
+        outputs, see :func:`cuml.neighbors._aggregation.class_votes`. The
+        neighbors are searched once for all the outputs, and the votes of
+        the last queries are kept so that :meth:`predict` and
+        :meth:`predict_proba` of the same X share them.
+
+        Returns
+        -------
+        votes : array of shape (n_queries, n_classes of all the outputs)
+        classes : list of arrays
+            Sorted classes of each output.
+        offsets : numpy.ndarray of shape (n_outputs + 1,)
+            The votes for the classes of output ``o`` are the columns
+            ``offsets[o]:offsets[o + 1]``.
+        index : index of the queries
+        """
+        xp = self._xp()
+        device = "host" if xp is np else "device"
+        key = (fingerprint(X), convert_dtype, device, self.n_neighbors,
+               self.weights)
+        last = self.__dict__.get("_last_votes")
+        if last is not None and last[0] == key:
+            return last[1]
+
+        encoded = self.__dict__.get("_encoded_labels")
+        if encoded is None or encoded[0] != device:
+            encoded = (device,) + encode_labels(self._to_xp(self.y), xp)
+            self._encoded_labels = encoded
+        _, codes, classes, offsets = encoded
+
+        if self.weights == "uniform":
+            knn_indices = self.kneighbors(X, return_distance=False,
+                                          convert_dtype=convert_dtype)
+        else:
+            distances, knn_indices = self.kneighbors(
+                X, convert_dtype=convert_dtype)
+            distances = self._to_xp(input_to_cuml_array(distances).array)
+        inds = input_to_cuml_array(knn_indices, order='C').array
+        indices = self._to_xp(inds)
+
+        n_rows, n_neighbors = indices.shape
+        n_codes = int(offsets[-1])
+        votes = xp.empty((n_rows, n_codes), dtype=np.float64)
+        chunk = chunk_rows(max(n_neighbors * codes.shape[1], n_codes))
+        for start in range(0, n_rows, chunk):
+            rows = slice(start, start + chunk)
+            weights = None if self.weights == "uniform" else \
+                neighbor_weights(distances[rows], self.weights, xp)
+            votes[rows] = class_votes(codes[indices[rows]], weights,
+                                      n_codes, xp)
+        self._last_votes = (key, (votes, classes, offsets, inds.index))
+        return self._last_votes[1]
+
+    def _use_votes(self):
+        # the C++ primitives only implement uniform votes, on device
+        return self._xp() is np or self.weights != "uniform"
+
     @generate_docstring(convert_dtype_cast='np.float32',
                         return_values={'name': 'X_new',
                                        'type': 'dense',
@@ -184,6 +300,17 @@ class KNeighborsClassifier(ClassifierMixin,
         predict the labels for X
 
         """
+        if self._use_votes():
+            votes, classes, offsets, index = self._votes(X, convert_dtype)
+            xp = self._xp()
+            labels = xp.stack([
+                classes[o][votes[:, offsets[o]:offsets[o + 1]].argmax(axis=1)]
+                for o in range(len(classes))
+            ], axis=1).astype(np.int32)
+            if labels.shape[1] == 1:
+                labels = labels[:, 0]
+            return CumlArray(data=xp.ascontiguousarray(labels), index=index)
+
         knn_indices = self.kneighbors(X, return_distance=False,
                                       convert_dtype=convert_dtype)
 
@@ -244,6 +371,18 @@ class KNeighborsClassifier(ClassifierMixin,
         predict the label probabilities for X
 
         """
+        if self._use_votes():
+            votes, classes, offsets, index = self._votes(X, convert_dtype)
+            xp = self._xp()
+            probas = []
+            for o in range(len(classes)):
+                proba = votes[:, offsets[o]:offsets[o + 1]]
+                normalizer = proba.sum(axis=1, keepdims=True)
+                normalizer[normalizer == 0] = 1
+                proba = (proba / normalizer).astype(np.float32)
+                probas.append(CumlArray(data=proba, index=index))
+            return probas[0] if len(probas) == 1 else tuple(probas)
+
         knn_indices = self.kneighbors(X, return_distance=False,
                                       convert_dtype=convert_dtype)
 
@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2019-2023, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -17,6 +17,9 @@
 # distutils: language = c++
 
 from cuml.neighbors.nearest_neighbors import NearestNeighbors
+from cuml.neighbors._aggregation import (
+    check_weights, chunk_rows, neighbor_weights, weighted_mean
+)
 
 import cuml.internals
 from cuml.internals.array import CumlArray
@@ -38,6 +41,7 @@ from pylibraft.common.handle cimport handle_t
 
 from cuml.internals.safe_imports import gpu_only_import
 rmm = gpu_only_import('rmm')
+cp = gpu_only_import('cupy')
 
 from libc.stdint cimport uintptr_t, int64_t
 
@@ -96,9 +100,12 @@ class KNeighborsRegressor(RegressorMixin,
           partial information allowing faster distances calculations
     metric : string (default='euclidean').
         Distance metric to use.
-    weights : string (default='uniform')
-        Sample weights to use. Currently, only the uniform strategy is
-        supported.
+    weights : {'uniform', 'distance'} or callable (default='uniform')
+        Weights of the targets of the neighbors in their average: 'uniform'
+        weights all the neighbors equally, 'distance' by the inverse of
+        their distance. A callable is given the array of distances of the
+        neighbors and returns an array of weights of the same shape. It
+        gets NumPy arrays on host and CuPy arrays on device.
     handle : cuml.Handle
         Specifies the cuml.handle that holds internal CUDA state for
         computations in this model. Most importantly, this specifies the CUDA
@@ -158,20 +165,26 @@ class KNeighborsRegressor(RegressorMixin,
             output_type=output_type,
             **kwargs)
         self.y = None
-        self.weights = weights
-        if weights != "uniform":
-            raise ValueError("Only uniform weighting strategy "
-                             "is supported currently.")
+        self.weights = check_weights(weights)
 
-    @generate_docstring(convert_dtype_cast='np.float32')
-    def fit(self, X, y, convert_dtype=True) -> "KNeighborsRegressor":
+    @generate_docstring(convert_dtype_cast='np.float32',
+                        skip_parameters_heading=True)
+    def fit(self, X, y, convert_dtype=True,
+            knn_graph=None) -> "KNeighborsRegressor":
         """
         Fit a GPU index for k-nearest neighbors regression model.
 
+        Parameters
+        ----------
+        knn_graph : cuml.neighbors.KNNGraph, optional
+            Precomputed neighbors of the samples of X, see
+            :meth:`NearestNeighbors.fit`.
+
         """
         self._set_target_dtype(y)
 
-        super(KNeighborsRegressor, self).fit(X, convert_dtype=convert_dtype)
+        super(KNeighborsRegressor, self).fit(X, convert_dtype=convert_dtype,
+                                             knn_graph=knn_graph)
         self.y, _, _, _ = \
             input_to_cuml_array(y, order='F', check_dtype=np.float32,
                                 convert_to_dtype=(np.float32
@@ -179,6 +192,72 @@ class KNeighborsRegressor(RegressorMixin,
                                                   else None))
         return self
 
+    @generate_docstring(skip_parameters_heading=True,
+                        convert_dtype_cast='np.float32')
+    def partial_fit(self, X, y, ids=None,
+                    convert_dtype=True) -> "KNeighborsRegressor":
+        """
+        Add labeled vectors to the index of the regression model, see
+        :meth:`NearestNeighbors.partial_fit`.
+
+        Parameters
+        ----------
+        ids : array-like of int, shape = (n_samples,), optional
+            Unique identifiers of the new vectors, see
+            :attr:`NearestNeighbors.ids_`.
+
+        """
+        self._set_target_dtype(y)
+        y, _, _, _ = \
+            input_to_cuml_array(y, order='F', check_dtype=np.float32,
+                                convert_to_dtype=(np.float32
+                                                  if convert_dtype
+                                                  else None))
+        if self.y is not None:
+            y = self._xp().concatenate([self._to_xp(self.y),
+                                        self._to_xp(y)])
+        super(KNeighborsRegressor, self).partial_fit(
+            X, ids=ids, convert_dtype=convert_dtype)
+        self.y = input_to_cuml_array(y, order='F').array
+        return self
+
+    def _remove_positions(self, positions):
+        super(KNeighborsRegressor, self)._remove_positions(positions)
+        keep = np.ones(self.y.shape[0], dtype=bool)
+        keep[positions] = False
+        y = self._to_xp(self.y)[self._xp().asarray(keep)]
+        self.y = input_to_cuml_array(y, order='F').array
+
+    def _predict_mean(self, X, convert_dtype):
+        """
+        Weighted means of the targets of the neighbors of X, computed for
+        all the outputs at once, chunk of queries by chunk of queries.
+        """
+        xp = self._xp()
+        if self.weights == "uniform":
+            knn_indices = self.kneighbors(X, return_distance=False,
+                                          convert_dtype=convert_dtype)
+        else:
+            distances, knn_indices = self.kneighbors(
+                X, convert_dtype=convert_dtype)
+            distances = self._to_xp(input_to_cuml_array(distances).array)
+        inds = input_to_cuml_array(knn_indices, order='C').array
+        indices = self._to_xp(inds)
+        y = self._to_xp(self.y)
+        y = y.reshape(len(y), -1)
+
+        n_rows, n_neighbors = indices.shape
+        results = xp.empty((n_rows, y.shape[1]), dtype=np.float32)
+        chunk = chunk_rows(n_neighbors * y.shape[1])
+        for start in range(0, n_rows, chunk):
+            rows = slice(start, start + chunk)
+            weights = None if self.weights == "uniform" else \
+                neighbor_weights(distances[rows], self.weights, xp)
+            results[rows] = weighted_mean(y[indices[rows]], weights, xp)
+        if results.shape[1] == 1:
+            results = xp.ascontiguousarray(results[:, 0])
+        return CumlArray(data=results, index=inds.index)
+
     @generate_docstring(convert_dtype_cast='np.float32',
                         return_values={'name': 'X_new',
                                        'type': 'dense',
@@ -193,6 +272,10 @@ class KNeighborsRegressor(RegressorMixin,
         if (convert_dtype):
             cuml.internals.set_api_output_dtype(self._get_target_dtype())
 
+        # the C++ primitives only implement uniform weights, on device
+        if self._xp() is np or self.weights != "uniform":
+            return self._predict_mean(X, convert_dtype)
+
         knn_indices = self.kneighbors(X, return_distance=False,
                                       convert_dtype=convert_dtype)
 
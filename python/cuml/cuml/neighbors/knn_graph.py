@@ -0,0 +1,389 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import hashlib
+from collections import OrderedDict
+
+from cuml.internals.device_type import DeviceType
+from cuml.internals.global_settings import GlobalSettings
+from cuml.internals.input_utils import (
+    determine_array_type_full,
+    input_to_cuml_array,
+    input_to_host_array,
+    input_to_host_array_with_sparse_support,
+)
+from cuml.internals.memory_utils import using_output_type
+from cuml.internals.safe_imports import cpu_only_import
+from cuml.internals.safe_imports import cpu_only_import_from
+from cuml.internals.safe_imports import gpu_only_import
+
+np = cpu_only_import("numpy")
+cp = gpu_only_import("cupy")
+cupyx = gpu_only_import("cupyx")
+scipy_sparse = cpu_only_import("scipy.sparse")
+csgraph = cpu_only_import("scipy.sparse.csgraph")
+SkNearestNeighbors = cpu_only_import_from(
+    "sklearn.neighbors", "NearestNeighbors"
+)
+
+# graphs kept by KNNGraph.build, least recently used first
+_CACHE_SIZE = 4
+_cache = OrderedDict()
+
+_METRIC_ALIASES = {
+    "l2": "euclidean",
+    "l1": "manhattan",
+    "cityblock": "manhattan",
+    "taxicab": "manhattan",
+    "lp": "minkowski",
+    "linf": "chebyshev",
+}
+
+
+def _canonical_metric(metric):
+    return _METRIC_ALIASES.get(metric, metric)
+
+
+def fingerprint(X):
+    """
+    Digest of the shape, dtype and values of a dense or sparse array, on
+    host or device, identifying the data a graph was built on.
+    """
+    _, is_sparse = determine_array_type_full(X)
+    if is_sparse:
+        X = input_to_host_array_with_sparse_support(X).tocsr()
+        parts = [X.data, X.indices, X.indptr]
+    else:
+        X = input_to_host_array(X, order="C").array
+        parts = [X]
+    digest = hashlib.sha256()
+    digest.update(repr(X.shape).encode())
+    for part in parts:
+        part = np.ascontiguousarray(part)
+        digest.update(part.dtype.str.encode())
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def _edge_weights(distances):
+    # SciPy drops the explicit zeros of sparse results, which would remove
+    # the edges between duplicate samples: keep them as the smallest
+    # positive distance
+    return np.maximum(distances, np.finfo(distances.dtype).tiny)
+
+
+def connected_distances(graph, X):
+    """
+    Symmetric SciPy CSR matrix of the distances of a graph, without the
+    samples themselves, completed with the shortest edges between its
+    connected components until it is connected. Zero distances are stored
+    as the smallest positive float so that the edges stay in the matrix.
+
+    The k nearest neighbors graphs of clustered data are often disconnected.
+    As the minimum spanning tree of cuML's HDBSCAN, each round searches the
+    closest sample of another component of every sample of ``X``, on host,
+    and adds the shortest edge out of each component.
+
+    Parameters
+    ----------
+    graph : KNNGraph
+    X : array-like of shape (n_samples, n_features)
+        The samples the graph was built on.
+    """
+    distances = graph.to_host().to_csr(include_self=False)
+    distances.data = _edge_weights(distances.data)
+    distances = distances.maximum(distances.T).tocsr()
+    n_components, labels = csgraph.connected_components(
+        distances, directed=False
+    )
+    if n_components == 1:
+        return distances
+
+    X = input_to_host_array_with_sparse_support(X)
+    metric = _canonical_metric(graph.metric)
+    edges = {}
+    while n_components > 1:
+        for component in range(n_components):
+            inside = np.flatnonzero(labels == component)
+            outside = np.flatnonzero(labels != component)
+            model = SkNearestNeighbors(n_neighbors=1, metric=metric)
+            dist, ind = model.fit(X[outside]).kneighbors(X[inside])
+            closest = np.argmin(dist[:, 0])
+            i, j = inside[closest], outside[ind[closest, 0]]
+            edges[min(i, j), max(i, j)] = dist[closest, 0]
+        rows, cols = np.array(list(edges.keys())).T
+        values = _edge_weights(
+            np.fromiter(edges.values(), dtype=distances.dtype)
+        )
+        added = scipy_sparse.csr_matrix(
+            (
+                np.concatenate([values, values]),
+                (np.concatenate([rows, cols]), np.concatenate([cols, rows])),
+            ),
+            shape=distances.shape,
+        )
+        n_components, labels = csgraph.connected_components(
+            distances.maximum(added), directed=False
+        )
+    return distances.maximum(added).tocsr()
+
+
+class KNNGraph:
+    """
+    Precomputed k nearest neighbors of the samples of a dataset, to compute
+    them once for all the estimators searching them.
+
+    :class:`cuml.UMAP` and :class:`cuml.TSNE` accept a graph as
+    ``knn_graph`` or ``precomputed_knn``, :class:`cuml.HDBSCAN`,
+    :class:`NearestNeighbors`, :class:`KNeighborsClassifier` and
+    :class:`KNeighborsRegressor` as the ``knn_graph`` argument of ``fit``.
+    The estimators use the first neighbors of the graph when they need
+    fewer, and raise a ValueError when the graph has too few neighbors,
+    another number of samples or another metric.
+
+    Row ``i`` holds the neighbors of sample ``i`` by increasing distance,
+    including the sample itself, as returned by
+    ``NearestNeighbors().fit(X).kneighbors(X)``. The sample is usually the
+    first neighbor, but duplicates of it can come before.
+
+    Parameters
+    ----------
+    indices : array-like of shape (n_samples, n_neighbors)
+        Indices of the neighbors, on host or device.
+    distances : array-like of shape (n_samples, n_neighbors)
+        Distances to the neighbors, in the same memory as ``indices``.
+    metric : str, default='euclidean'
+        Metric of the distances.
+    fingerprint : str, optional
+        Fingerprint of the data, see :func:`fingerprint`.
+
+    Attributes
+    ----------
+    indices : numpy.ndarray or cupy.ndarray of int64
+    distances : numpy.ndarray or cupy.ndarray of float32
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        >>> import cupy as cp
+        >>> from cuml import UMAP
+        >>> from cuml.neighbors import KNNGraph, KNeighborsClassifier
+        >>> X = cp.random.random((1000, 16), dtype=cp.float32)
+        >>> y = (X[:, 0] > 0.5).astype(cp.int32)
+        >>> graph = KNNGraph.build(X, n_neighbors=30)
+        >>> embedding = UMAP(n_neighbors=15).fit_transform(X, knn_graph=graph)
+        >>> knn = KNeighborsClassifier(n_neighbors=10).fit(
+        ...     X, y, knn_graph=graph)
+        >>> distances, indices = knn.kneighbors()  # no search
+    """
+
+    def __init__(
+        self, indices, distances, metric="euclidean", fingerprint=None
+    ):
+        indices = input_to_cuml_array(
+            indices, order="C", convert_to_dtype=np.int64
+        ).array
+        distances = input_to_cuml_array(
+            distances, order="C", convert_to_dtype=np.float32
+        ).array
+        if len(indices.shape) != 2 or indices.shape != distances.shape:
+            raise ValueError(
+                "indices and distances must have the same shape "
+                "(n_samples, n_neighbors)"
+            )
+        output_type = (
+            "cupy" if indices.mem_type.is_device_accessible else "numpy"
+        )
+        self.indices = indices.to_output(output_type)
+        self.distances = distances.to_output(output_type)
+        self.metric = metric
+        self.fingerprint = fingerprint
+
+    def __repr__(self):
+        return "KNNGraph(n_samples={}, n_neighbors={}, metric={!r})".format(
+            self.n_samples, self.n_neighbors, self.metric
+        )
+
+    @property
+    def n_samples(self):
+        return self.indices.shape[0]
+
+    @property
+    def n_neighbors(self):
+        """Number of neighbors of each sample, including itself."""
+        return self.indices.shape[1]
+
+    @property
+    def _xp(self):
+        return np if isinstance(self.indices, np.ndarray) else cp
+
+    def truncate(self, n_neighbors):
+        """
+        The graph of the first ``n_neighbors`` neighbors of each sample.
+        """
+        if n_neighbors > self.n_neighbors:
+            raise ValueError(
+                "The graph has {} neighbors per sample, including the "
+                "sample itself, {} are required".format(
+                    self.n_neighbors, n_neighbors
+                )
+            )
+        if n_neighbors == self.n_neighbors:
+            return self
+        return KNNGraph(
+            self.indices[:, :n_neighbors],
+            self.distances[:, :n_neighbors],
+            metric=self.metric,
+            fingerprint=self.fingerprint,
+        )
+
+    def to_host(self):
+        """The graph with NumPy arrays."""
+        if self._xp is np:
+            return self
+        return KNNGraph(
+            cp.asnumpy(self.indices),
+            cp.asnumpy(self.distances),
+            metric=self.metric,
+            fingerprint=self.fingerprint,
+        )
+
+    def validate(self, n_samples=None, metric=None, n_neighbors=None):
+        """
+        Check that the graph can be used by an estimator fitted on
+        ``n_samples`` samples with ``metric``, and truncate it to
+        ``n_neighbors`` neighbors.
+        """
+        if n_samples is not None and n_samples != self.n_samples:
+            raise ValueError(
+                "The graph has {} samples, the data has {}".format(
+                    self.n_samples, n_samples
+                )
+            )
+        if metric is not None and _canonical_metric(
+            metric
+        ) != _canonical_metric(self.metric):
+            raise ValueError(
+                "The graph has {!r} distances, the estimator uses the "
+                "{!r} metric".format(self.metric, metric)
+            )
+        return self if n_neighbors is None else self.truncate(n_neighbors)
+
+    def kneighbors(self, n_neighbors=None):
+        """
+        Neighbors of the samples, excluding themselves, like
+        :meth:`NearestNeighbors.kneighbors` without queries: the sample is
+        dropped from its ``n_neighbors + 1`` first neighbors. When it is not
+        among them, because of duplicates, the first one is dropped, as
+        scikit-learn does.
+
+        Returns
+        -------
+        distances, indices : arrays of shape (n_samples, n_neighbors)
+        """
+        if n_neighbors is None:
+            n_neighbors = self.n_neighbors - 1
+        graph = self.truncate(n_neighbors + 1)
+        xp = self._xp
+        is_self = graph.indices == xp.arange(self.n_samples)[:, None]
+        is_self[:, 0] |= ~is_self.any(axis=1)
+        keep = ~is_self
+        shape = (self.n_samples, n_neighbors)
+        return (
+            graph.distances[keep].reshape(shape),
+            graph.indices[keep].reshape(shape),
+        )
+
+    def to_csr(self, include_self=True):
+        """
+        The graph as a CSR matrix of distances, of SciPy or CuPy like the
+        arrays of the graph, as :meth:`NearestNeighbors.kneighbors_graph`
+        with ``mode='distance'``.
+        """
+        xp = self._xp
+        distances, indices = self.distances, self.indices
+        if not include_self:
+            distances, indices = self.kneighbors()
+        n_neighbors = indices.shape[1]
+        indptr = xp.arange(0, self.n_samples * n_neighbors + 1, n_neighbors)
+        csr_matrix = (
+            scipy_sparse.csr_matrix
+            if xp is np
+            else cupyx.scipy.sparse.csr_matrix
+        )
+        return csr_matrix(
+            (distances.ravel(), indices.ravel(), indptr),
+            shape=(self.n_samples, self.n_samples),
+        )
+
+    @classmethod
+    def build(
+        cls, X, n_neighbors=15, metric="euclidean", cache=True, **kwargs
+    ):
+        """
+        Search the neighbors of the samples of ``X`` with
+        :class:`NearestNeighbors`, on the current device type.
+
+        The graphs are cached by fingerprint of ``X``, metric and
+        ``kwargs``: a graph with at least ``n_neighbors`` neighbors built on
+        the same data is truncated instead of searched again. The last
+        graphs built are kept until :meth:`clear_cache` is called.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+        n_neighbors : int, default=15
+            Number of neighbors of each sample, including itself.
+        metric : str, default='euclidean'
+        cache : bool, default=True
+            Whether to look up and store the graph in the cache.
+        **kwargs
+            Other parameters of :class:`NearestNeighbors`.
+
+        Returns
+        -------
+        graph : KNNGraph
+        """
+        from cuml.neighbors.nearest_neighbors import NearestNeighbors
+
+        data_fingerprint = fingerprint(X)
+        key = (
+            data_fingerprint,
+            _canonical_metric(metric),
+            repr(sorted(kwargs.items())),
+        )
+        graph = _cache.get(key) if cache else None
+        if graph is None or graph.n_neighbors < n_neighbors:
+            model = NearestNeighbors(
+                n_neighbors=n_neighbors, metric=metric, **kwargs
+            ).fit(X)
+            host = GlobalSettings().device_type is DeviceType.host
+            with using_output_type("numpy" if host else "cupy"):
+                distances, indices = model.kneighbors(X)
+            graph = cls(indices, distances, metric, data_fingerprint)
+        if cache:
+            _cache[key] = graph
+            _cache.move_to_end(key)
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+        return graph.truncate(n_neighbors)
+
+    @staticmethod
+    def clear_cache():
+        """Release the graphs cached by :meth:`build`."""
+        _cache.clear()
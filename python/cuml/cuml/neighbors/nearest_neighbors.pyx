@@ -16,10 +16,13 @@
 
 # distutils: language = c++
 
+import inspect
+import numbers
 import typing
 
 from cuml.internals.safe_imports import cpu_only_import
 np = cpu_only_import('numpy')
+scipy_sparse = cpu_only_import('scipy.sparse')
 from cuml.internals.safe_imports import gpu_only_import
 cp = gpu_only_import('cupy')
 cupyx = gpu_only_import('cupyx')
@@ -34,12 +37,20 @@ from cuml.common.doc_utils import generate_docstring
 from cuml.common.doc_utils import insert_into_docstring
 from cuml.internals.mixins import CMajorInputTagMixin
 from cuml.internals.input_utils import input_to_cupy_array
+from cuml.internals.input_utils import input_to_host_array_with_sparse_support
+from cuml.internals.device_type import DeviceType
+from cuml.internals.global_settings import GlobalSettings
 from cuml.common import input_to_cuml_array
 from cuml.common.sparse_utils import is_sparse
 from cuml.common.sparse_utils import is_dense
 from cuml.metrics.distance_type cimport DistanceType
 from cuml.internals.api_decorators import device_interop_preparation
 from cuml.internals.api_decorators import enable_device_interop
+from cuml.internals.memory_utils import using_output_type
+from cuml.neighbors._host_ann import IVFNearestNeighbors
+from cuml.neighbors._index_io import (
+    create_arrays, load_arrays, save_arrays
+)
 
 from cuml.neighbors.ann cimport *
 
@@ -181,6 +192,10 @@ class NearestNeighbors(UniversalBase,
           to intermediary k-means clusterings. This encoding provide
           partial information allowing faster distances calculations
 
+        With :py:func:`cuml.common.device_selection.using_device_type`
+        ``"cpu"``, ``'ivfflat'`` and ``'ivfpq'`` indexes are built and
+        searched on host by cuML, the other algorithms by scikit-learn.
+
     metric : string (default='euclidean').
         Distance metric to use. Supported distances are ['l1, 'cityblock',
         'taxicab', 'manhattan', 'euclidean', 'l2', 'braycurtis', 'canberra',
@@ -210,7 +225,8 @@ class NearestNeighbors(UniversalBase,
             - nprobe: (int) at query time, number of cells used for search
             - M: (int) number of subquantizers
             - n_bits: (int) bits allocated per subquantizer
-            - usePrecomputedTables : (bool) whether to use precomputed tables
+            - usePrecomputedTables : (bool) whether to use precomputed tables,
+              ignored on host
 
     metric_expanded : bool
         Can increase performance in Minkowski-based (Lp) metrics (for p > 1)
@@ -278,6 +294,11 @@ class NearestNeighbors(UniversalBase,
     kwargs allows for passing of arguments that are not explicit in the
     class constructor, such as 'n_jobs', but they have no effect on behavior.
 
+    Vectors can be added to and removed from a fitted index with
+    :meth:`partial_fit` and :meth:`remove`, by identifier. The indices
+    returned by :meth:`kneighbors` remain positions in the indexed vectors,
+    ``ids_[indices]`` are the identifiers of the neighbors.
+
     For an additional example see `the NearestNeighbors notebook
     <https://github.com/rapidsai/cuml/blob/main/notebooks/nearest_neighbors_demo.ipynb>`_.
 
@@ -318,12 +339,21 @@ class NearestNeighbors(UniversalBase,
         self.algo_params = algo_params
         self.knn_index = None
 
-    @generate_docstring(X='dense_sparse')
+    @generate_docstring(X='dense_sparse', skip_parameters_heading=True)
     @enable_device_interop
-    def fit(self, X, convert_dtype=True) -> "NearestNeighbors":
+    def fit(self, X, convert_dtype=True,
+            knn_graph=None) -> "NearestNeighbors":
         """
         Fit GPU index for performing nearest neighbor queries.
 
+        Parameters
+        ----------
+        knn_graph : cuml.neighbors.KNNGraph, optional
+            Precomputed neighbors of the samples of X, with the metric of
+            the model. :meth:`kneighbors` and :meth:`kneighbors_graph`
+            without queries read the neighbors of the training samples from
+            the graph instead of searching them, when it has enough.
+
         """
         if len(X.shape) != 2:
             raise ValueError("data should be two dimensional")
@@ -420,11 +450,312 @@ class NearestNeighbors(UniversalBase,
             self.n_indices = 1
         return self
 
+    def partial_fit(self, X, ids=None, convert_dtype=True):
+        """
+        Add vectors to the index, fitting it if it is not fitted yet.
+
+        IVF indexes built on host, with
+        :py:func:`cuml.common.device_selection.using_device_type` ``"cpu"``,
+        assign the new vectors to the inverted lists of their closest
+        centroids. Their centroids and codebooks are not trained again,
+        fit the model again once the distribution of the vectors drifted.
+        Other models are fitted again on their training vectors followed by
+        the new ones: brute-force models have no index to build, random
+        ball cover indexes are rebuilt. IVF indexes built on device do not
+        keep their training vectors and cannot be updated.
+
+        Parameters
+        ----------
+        X : array-like (device or host) shape = (n_samples, n_features)
+            Dense or sparse matrix, like the training vectors.
+
+        ids : array-like of int, shape = (n_samples,), optional
+            Unique identifiers of the new vectors, see :attr:`ids_`. By
+            default the integers following the largest identifier of the
+            index.
+
+        convert_dtype : bool, optional (default = True)
+            When set to True, the method will automatically convert the
+            inputs to np.float32.
+
+        Returns
+        -------
+        self : NearestNeighbors
+        """
+        self.__dict__.pop("_knn_graph", None)
+        fitted = hasattr(self, "n_samples_fit_")
+        index_ids = self.ids_ if fitted else np.empty(0, dtype=np.int64)
+        n_new = X.shape[0]
+        if ids is None:
+            start = index_ids.max() + 1 if len(index_ids) else 0
+            ids = np.arange(start, start + n_new)
+        else:
+            ids = _to_host_ids(ids)
+            if len(ids) != n_new:
+                raise ValueError("ids should have one identifier per vector, "
+                                 "got %d for %d vectors" % (len(ids), n_new))
+            if len(np.unique(ids)) != n_new or \
+                    np.isin(ids, index_ids).any():
+                raise ValueError("The identifiers of the vectors should be "
+                                 "unique")
+
+        cpu_model = self._host_ivf_model()
+        if not fitted:
+            NearestNeighbors.fit(self, X, convert_dtype=convert_dtype)
+        elif cpu_model is not None:
+            cpu_model.partial_fit(input_to_host_array_with_sparse_support(X))
+            self.cpu_to_gpu()
+        else:
+            fit_X = self._fit_vectors()
+            if is_sparse(X) != is_sparse(fit_X):
+                raise ValueError("The new vectors should be dense or sparse "
+                                 "like the indexed ones")
+            if isinstance(fit_X, np.ndarray) or scipy_sparse.issparse(fit_X):
+                X = input_to_host_array_with_sparse_support(X)
+                if is_sparse(X):
+                    fit_X = scipy_sparse.vstack([fit_X, X], format="csr")
+                else:
+                    fit_X = np.vstack([fit_X, X])
+            elif is_sparse(X):
+                X = SparseCumlArray(X, convert_to_dtype=cp.float32,
+                                    convert_format=False)
+                fit_X = cupyx.scipy.sparse.vstack(
+                    [fit_X, X.to_output("cupy")], format="csr"
+                )
+            else:
+                X = input_to_cupy_array(
+                    X, order='C',
+                    convert_to_dtype=(np.float32 if convert_dtype else None)
+                ).array
+                fit_X = cp.vstack([fit_X, X])
+            NearestNeighbors.fit(self, fit_X, convert_dtype=convert_dtype)
+
+        self._index_ids = np.concatenate([index_ids, ids])
+        return self
+
+    def remove(self, ids):
+        """
+        Remove vectors from the index, by identifier.
+
+        IVF indexes built on host, with
+        :py:func:`cuml.common.device_selection.using_device_type` ``"cpu"``,
+        mark the entries of the removed vectors as deleted, searches skip
+        them, and drop them once they make up a fifth of their inverted
+        lists. Other models are fitted again on their remaining training
+        vectors, see :meth:`partial_fit`. The remaining vectors keep their
+        order: the positions of the vectors following removed ones, which
+        :meth:`kneighbors` returns, are shifted.
+
+        Parameters
+        ----------
+        ids : array-like of int
+            Identifiers of the vectors to remove, see :attr:`ids_`.
+
+        Returns
+        -------
+        self : NearestNeighbors
+        """
+        ids = _to_host_ids(ids)
+        index_ids = self.ids_
+        unknown = np.setdiff1d(ids, index_ids)
+        if len(unknown):
+            raise ValueError("Identifiers %s are not in the index" % unknown)
+        removed = np.isin(index_ids, ids)
+        if removed.all():
+            raise ValueError("All the vectors of the index cannot be "
+                             "removed, fit a new model instead")
+        self.__dict__.pop("_knn_graph", None)
+        self._remove_positions(np.flatnonzero(removed))
+        self._index_ids = index_ids[~removed]
+        return self
+
+    def _remove_positions(self, positions):
+        cpu_model = self._host_ivf_model()
+        if cpu_model is not None:
+            cpu_model.remove(positions)
+            self.cpu_to_gpu()
+            return
+        fit_X = self._fit_vectors()
+        keep = np.delete(np.arange(fit_X.shape[0]), positions)
+        if not (isinstance(fit_X, np.ndarray) or
+                scipy_sparse.issparse(fit_X)):
+            keep = cp.asarray(keep)
+        NearestNeighbors.fit(self, fit_X[keep], convert_dtype=False)
+
+    def _xp(self):
+        """Array module of the current device type."""
+        return np if GlobalSettings().device_type is DeviceType.host else cp
+
+    def _to_xp(self, array):
+        """A CumlArray as an array of the current device type."""
+        return array.to_output("numpy" if self._xp() is np else "cupy")
+
+    def _host_ivf_model(self):
+        """The host IVF model searched by kneighbors, if any."""
+        cpu_model = self.__dict__.get("_cpu_model")
+        if GlobalSettings().device_type is DeviceType.host and \
+                isinstance(cpu_model, IVFNearestNeighbors) and \
+                hasattr(cpu_model, "_centroids"):
+            return cpu_model
+        return None
+
+    def _fit_vectors(self):
+        """Training vectors of the model, on the current device type."""
+        if self._fit_method in ["ivfflat", "ivfpq"]:
+            raise ValueError("IVF indexes built on device cannot be updated, "
+                             "build them with the 'cpu' device type")
+        if GlobalSettings().device_type is DeviceType.host:
+            cpu_model = self.__dict__.get("_cpu_model")
+            if hasattr(cpu_model, "_fit_X"):
+                return cpu_model._fit_X
+            return self._fit_X.to_output("numpy")
+        return self._fit_X.to_output("cupy")
+
+    @property
+    def ids_(self):
+        """
+        Identifiers of the indexed vectors, by position. They are the
+        positions of the training vectors until vectors are added with
+        identifiers or removed.
+        """
+        ids = self.__dict__.get("_index_ids")
+        return np.arange(self.n_samples_fit_) if ids is None else ids
+
+    def _graph_has_neighbors(self, X, n_neighbors):
+        """
+        Whether the neighbors of the training samples can be read from the
+        graph given to fit.
+        """
+        graph = self.__dict__.get("_knn_graph")
+        if n_neighbors is None:
+            n_neighbors = self.n_neighbors
+        return X is None and graph is not None and \
+            graph.n_neighbors > n_neighbors
+
+    def dispatch_func(self, func_name, gpu_func, *args, **kwargs):
+        if func_name == "fit":
+            # identifiers given to partial_fit do not outlive the index
+            self.__dict__.pop("_index_ids", None)
+            self.__dict__.pop("_knn_graph", None)
+            knn_graph = kwargs.pop("knn_graph", None)
+            if knn_graph is not None:
+                X = args[0] if args else kwargs["X"]
+                knn_graph.validate(X.shape[0], self.metric)
+            result = self._dispatch_host_or_device(func_name, gpu_func,
+                                                   args, kwargs)
+            if knn_graph is not None:
+                self._knn_graph = knn_graph
+            return result
+        if func_name == "kneighbors":
+            X = args[0] if args else kwargs.get("X")
+            n_neighbors = args[1] if len(args) > 1 else \
+                kwargs.get("n_neighbors")
+            if self._graph_has_neighbors(X, n_neighbors):
+                # no search, on any device type
+                return gpu_func(self, *args, **kwargs)
+        return self._dispatch_host_or_device(func_name, gpu_func, args, kwargs)
+
+    def _dispatch_host_or_device(self, func_name, gpu_func, args, kwargs):
+        if GlobalSettings().device_type is DeviceType.host:
+            # the host estimators take neither the cuML only parameters nor
+            # None for their defaults
+            kwargs = {name: value for name, value in kwargs.items()
+                      if value is not None and
+                      name not in ("convert_dtype", "two_pass_precision")}
+        return super().dispatch_func(func_name, gpu_func, *args, **kwargs)
+
     def get_param_names(self):
         return super().get_param_names() + \
             ["n_neighbors", "algorithm", "metric",
                 "p", "metric_params", "algo_params", "n_jobs"]
 
+    def import_cpu_model(self):
+        # scikit-learn has no IVF index, they have a host implementation
+        if self.algorithm in ("ivfflat", "ivfpq"):
+            self._cpu_model_class = IVFNearestNeighbors
+            self._cpu_hyperparams = list(
+                inspect.signature(IVFNearestNeighbors.__init__).parameters
+            )
+        else:
+            super().import_cpu_model()
+
+    def save_index(self, path):
+        """
+        Save the fitted index to a file that can be memory-mapped.
+
+        IVF indexes built on host, with
+        :py:func:`cuml.common.device_selection.using_device_type` ``"cpu"``,
+        are saved as is: centroids, inverted lists and PQ codebooks. Other
+        models save their training vectors and rebuild their index, if any,
+        when loaded. The identifiers of the vectors, see :attr:`ids_`, are
+        saved with them. Indexes of sparse data and IVF indexes built on
+        device cannot be saved.
+
+        Parameters
+        ----------
+        path : str or path-like
+            Path of the file, see :meth:`load_index`.
+        """
+        cpu_model = self.__dict__.get("_cpu_model")
+        params = {
+            name: getattr(self, name)
+            for name in ["n_neighbors", "algorithm", "metric", "p",
+                         "algo_params", "metric_params"]
+        }
+        if isinstance(cpu_model, IVFNearestNeighbors) and \
+                hasattr(cpu_model, "_centroids"):
+            index, arrays = cpu_model.get_index_state()
+        elif getattr(self, "_fit_method", None) in ["ivfflat", "ivfpq"]:
+            raise ValueError("IVF indexes built on device cannot be saved, "
+                             "build them with the 'cpu' device type")
+        elif not hasattr(self, "_fit_X"):
+            raise ValueError("This NearestNeighbors instance has not been "
+                             "fitted yet, call 'fit' before saving it")
+        elif isinstance(self._fit_X, SparseCumlArray):
+            raise ValueError("Indexes of sparse data cannot be saved")
+        else:
+            index = None
+            arrays = {"fit_X": self._fit_X.to_output("numpy")}
+        index_ids = self.__dict__.get("_index_ids")
+        if index_ids is not None:
+            arrays = {**arrays, "index_ids": index_ids}
+        save_arrays(path, {"params": params, "index": index}, arrays)
+
+    @classmethod
+    def load_index(cls, path, mmap=True):
+        """
+        Load a model saved by :meth:`save_index`.
+
+        Host IVF indexes are searched in place, they must be queried with
+        the ``"cpu"`` device type. Other models are fitted again on the
+        saved training vectors, on the current device type.
+
+        Parameters
+        ----------
+        path : str or path-like
+        mmap : bool (default=True)
+            Whether to memory-map the saved arrays, read-only, instead of
+            reading them. Processes loading the same file then share its
+            pages.
+
+        Returns
+        -------
+        model : NearestNeighbors
+        """
+        metadata, arrays = load_arrays(path, mmap=mmap)
+        index_ids = arrays.pop("index_ids", None)
+        model = cls(**metadata["params"])
+        if metadata["index"] is None:
+            model.fit(arrays["fit_X"])
+        else:
+            model.import_cpu_model()
+            model.build_cpu_model()
+            model._cpu_model.set_index_state(metadata["index"], arrays)
+            model.cpu_to_gpu()
+        if index_ids is not None:
+            model._index_ids = index_ids
+        return model
+
     def get_attr_names(self):
         return ['_fit_X', 'effective_metric_', 'effective_metric_params_',
                 'n_samples_fit_', 'n_features_in_', 'feature_names_in_',
@@ -587,6 +918,15 @@ class NearestNeighbors(UniversalBase,
         """
         n_neighbors = self.n_neighbors if n_neighbors is None else n_neighbors
 
+        if self._graph_has_neighbors(X, n_neighbors):
+            out_type = _output_type if _output_type is not None \
+                else self._get_output_type(self._fit_X)
+            D_ndarr, I_ndarr = self._knn_graph.kneighbors(n_neighbors)
+            I_ndarr = CumlArray(data=I_ndarr).to_output(out_type)
+            if not return_distance:
+                return I_ndarr
+            return CumlArray(data=D_ndarr).to_output(out_type), I_ndarr
+
         use_training_data = X is None
         if X is None:
             X = self._fit_X
@@ -902,6 +1242,165 @@ class NearestNeighbors(UniversalBase,
 
         return sparse_csr
 
+    def kneighbors_iter(self, X, n_neighbors=None, batch_size=65536,
+                        return_distance=True, convert_dtype=True):
+        """
+        Lazily query the index for the k nearest neighbors, batch by batch.
+
+        Only the results of one batch are held in memory at once, so that
+        more vectors can be queried than the output of :meth:`kneighbors`
+        could hold.
+
+        Parameters
+        ----------
+        X : array-like or iterable of array-like
+            Query vectors, in any format accepted by :meth:`kneighbors`.
+            Arrays are sliced in batches. The chunks of other iterables are
+            consumed lazily and sliced in batches too, but small chunks are
+            not merged.
+
+        n_neighbors : Integer
+            Number of neighbors to search. If not provided, the n_neighbors
+            from the model instance is used
+
+        batch_size : int (default=65536)
+            Maximum number of query vectors per batch.
+
+        return_distance: Boolean
+            If False, distances will not be returned
+
+        convert_dtype : bool, optional (default = True)
+            When set to True, the kneighbors method will automatically
+            convert the inputs to np.float32.
+
+        Yields
+        ------
+        distances, indices : array-like of shape (batch_size, n_neighbors)
+            The results of :meth:`kneighbors` for each batch, in order. Only
+            the indices are yielded if return_distance is False.
+        """
+        if not isinstance(batch_size, numbers.Integral) or batch_size <= 0:
+            raise ValueError("batch_size=%r, should be a positive integer"
+                             % batch_size)
+        if X is None:
+            raise ValueError("kneighbors_iter needs query vectors, pass the "
+                             "training vectors to query them")
+
+        for batch in _iter_query_batches(X, batch_size):
+            yield self.kneighbors(batch, n_neighbors=n_neighbors,
+                                  return_distance=return_distance,
+                                  convert_dtype=convert_dtype)
+
+    def kneighbors_graph_to_file(self, path, X, n_neighbors=None,
+                                 mode='connectivity', batch_size=65536,
+                                 n_samples=None):
+        """
+        Write the k nearest neighbors graph of X to a file, batch by batch,
+        and return it memory-mapped.
+
+        The CSR arrays of the graph (``indptr``, ``indices`` and ``data``)
+        are allocated in the file and filled as the batches of
+        :meth:`kneighbors_iter` are queried, so that the graph of all the
+        training vectors can be built when neither the graph nor the
+        results of a single :meth:`kneighbors` call fit in memory. The
+        graph can be passed as ``knn_graph`` to :class:`cuml.UMAP` and
+        reopened with :func:`cuml.neighbors.load_kneighbors_graph`.
+
+        Parameters
+        ----------
+        path : str or path-like
+            Path of the file.
+
+        X : array-like or iterable of array-like
+            Query vectors, see :meth:`kneighbors_iter`. When the training
+            vectors are queried, each vector is its own first neighbor.
+
+        n_neighbors : Integer
+            Number of neighbors to search. If not provided, the n_neighbors
+            from the model instance is used
+
+        mode : string (default='connectivity')
+            Values in connectivity matrix: 'connectivity' returns the
+            connectivity matrix with ones and zeros, 'distance' returns the
+            edges as the distances between points with the requested metric.
+
+        batch_size : int (default=65536)
+            Maximum number of query vectors per batch.
+
+        n_samples : int, optional
+            Number of query vectors, required when X is an iterable of
+            chunks.
+
+        Returns
+        -------
+        A : scipy.sparse.csr_matrix of shape (n_samples, n_samples_fit)
+            Graph whose arrays are memory-mapped, read-only, from the file.
+            Its indices are int32 when they fit, int64 otherwise. The
+            neighbors that an approximate search does not find are left
+            out of the rows.
+        """
+        if mode not in ('connectivity', 'distance'):
+            raise ValueError('Unsupported mode, must be one of "connectivity"'
+                             ' or "distance" but got "%s" instead' % mode)
+        if n_samples is None:
+            if not hasattr(X, "shape"):
+                raise ValueError("n_samples must be given when X is an "
+                                 "iterable of chunks")
+            n_samples = X.shape[0]
+        if n_neighbors is None:
+            n_neighbors = self.n_neighbors
+
+        n_nonzero = n_samples * n_neighbors
+        # scipy would copy int64 indices that fit in int32
+        index_dtype = np.int32 \
+            if max(n_nonzero, self.n_samples_fit_) <= np.iinfo(np.int32).max \
+            else np.int64
+        shape = (n_samples, self.n_samples_fit_)
+        graph = create_arrays(
+            path,
+            {"graph": {"mode": mode, "shape": list(shape)}},
+            {"data": (np.float32, (n_nonzero,)),
+             "indices": (index_dtype, (n_nonzero,)),
+             "indptr": (index_dtype, (n_samples + 1,))},
+        )
+
+        start = 0
+        n_edges = 0
+        # the batches are spilled to the file as host arrays
+        with cuml.internals.exit_internal_api(), using_output_type("numpy"):
+            for result in self.kneighbors_iter(
+                X, n_neighbors, batch_size,
+                return_distance=mode == 'distance'
+            ):
+                if mode == 'distance':
+                    distances, indices = result
+                else:
+                    distances, indices = None, result
+                stop = start + indices.shape[0]
+                if stop > n_samples:
+                    raise ValueError("X holds more than n_samples=%d query "
+                                     "vectors" % n_samples)
+                # approximate searches pad the rows of the queries that
+                # find fewer than n_neighbors vectors with -1 indices
+                found = indices >= 0
+                row_nnz = np.cumsum(found.sum(axis=1))
+                edges = slice(n_edges, n_edges + int(found.sum()))
+                graph["indices"][edges] = indices[found]
+                graph["data"][edges] = \
+                    1 if distances is None else distances[found]
+                graph["indptr"][start + 1:stop + 1] = n_edges + row_nnz
+                n_edges = edges.stop
+                start = stop
+        if start != n_samples:
+            raise ValueError("X holds %d query vectors, fewer than "
+                             "n_samples=%d" % (start, n_samples))
+
+        for array in graph.values():
+            if isinstance(array, np.memmap):
+                array.flush()
+        del graph
+        return load_kneighbors_graph(path)
+
     @property
     def effective_metric_(self):
         return self.metric
@@ -934,6 +1433,59 @@ class NearestNeighbors(UniversalBase,
                 del rbc_index
 
 
+def _to_host_ids(ids):
+    """Identifiers of vectors as a 1D NumPy array."""
+    if hasattr(ids, "to_numpy"):
+        # pandas or cuDF
+        ids = ids.to_numpy()
+    elif hasattr(ids, "get"):
+        # CuPy
+        ids = ids.get()
+    return np.asarray(ids, dtype=np.int64).ravel()
+
+
+def _iter_query_batches(X, batch_size):
+    """
+    Slice query vectors, or the chunks of an iterable of query vectors, in
+    batches of at most batch_size rows.
+    """
+    chunks = [X] if hasattr(X, "shape") else X
+    for chunk in chunks:
+        rows = chunk.iloc if hasattr(chunk, "iloc") else chunk
+        for start in range(0, chunk.shape[0], batch_size):
+            yield rows[start:start + batch_size]
+
+
+def load_kneighbors_graph(path, mmap=True):
+    """
+    Load a graph written by
+    :meth:`NearestNeighbors.kneighbors_graph_to_file`.
+
+    Parameters
+    ----------
+    path : str or path-like
+    mmap : bool (default=True)
+        Whether to memory-map the arrays of the graph, read-only, instead
+        of reading them.
+
+    Returns
+    -------
+    A : scipy.sparse.csr_matrix of shape (n_samples, n_samples_fit)
+    """
+    metadata, arrays = load_arrays(path, mmap=mmap)
+    if "graph" not in metadata:
+        raise ValueError("{} is not a k nearest neighbors graph "
+                         "file".format(path))
+    indptr = arrays["indptr"]
+    # the arrays are allocated for n_neighbors edges per row, the missing
+    # neighbors of approximate searches leave unused space at their end
+    n_edges = int(indptr[-1]) if len(indptr) else 0
+    return scipy_sparse.csr_matrix(
+        (arrays["data"][:n_edges], arrays["indices"][:n_edges], indptr),
+        shape=tuple(metadata["graph"]["shape"])
+    )
+
+
 @cuml.internals.api_return_sparse_array()
 def kneighbors_graph(X=None, n_neighbors=5, mode='connectivity', verbose=False,
                      handle=None, algorithm="brute", metric="euclidean", p=2,
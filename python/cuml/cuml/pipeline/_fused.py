@@ -0,0 +1,408 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import numbers
+
+import cuml
+from cuml.internals.safe_imports import cpu_only_import, gpu_only_import
+from cuml._thirdparty.sklearn.preprocessing import (
+    Binarizer,
+    FunctionTransformer,
+    MaxAbsScaler,
+    MinMaxScaler,
+    Normalizer,
+    RobustScaler,
+    SimpleImputer,
+    StandardScaler,
+)
+
+import sklearn.impute
+import sklearn.preprocessing
+from sklearn.pipeline import Pipeline
+from sklearn.utils.metaestimators import available_if
+
+np = cpu_only_import("numpy")
+cp = gpu_only_import("cupy")
+
+
+# Size in bytes of the row blocks processed at once on host, chosen so that
+# a block and its temporaries stay in the L2 cache while all the stages run
+_HOST_BLOCK_BYTES = 256 * 1024
+
+
+def _get_attr(estimator, name, xp):
+    """Fitted attribute of a cuML or scikit-learn estimator as an xp array"""
+    output_type = "numpy" if xp is np else "cupy"
+    with cuml.using_output_type(output_type):
+        value = getattr(estimator, name)
+    return xp.asarray(value)
+
+
+def _get_namespace(X):
+    """Array module of a dense 2D floating point array, None otherwise"""
+    if isinstance(X, np.ndarray):
+        xp = np
+    elif type(X).__module__.startswith("cupy") and isinstance(X, cp.ndarray):
+        xp = cp
+    else:
+        return None
+    return xp if X.ndim == 2 and X.dtype.kind == "f" else None
+
+
+def _handle_zeros_in_scale(xp, scale):
+    return xp.where(scale == 0, 1, scale)
+
+
+def _scaler_stage(shift, scale):
+    """In-place ``(X - shift) / scale``, either term being optional"""
+
+    def stage(xp, X):
+        if shift is not None:
+            X -= shift
+        if scale is not None:
+            X /= scale
+
+    return stage
+
+
+def _compile_standard_scaler(est, xp, dtype):
+    return _scaler_stage(
+        _get_attr(est, "mean_", xp) if est.with_mean else None,
+        _get_attr(est, "scale_", xp) if est.with_std else None,
+    )
+
+
+def _compile_robust_scaler(est, xp, dtype):
+    return _scaler_stage(
+        _get_attr(est, "center_", xp) if est.with_centering else None,
+        _get_attr(est, "scale_", xp) if est.with_scaling else None,
+    )
+
+
+def _compile_max_abs_scaler(est, xp, dtype):
+    return _scaler_stage(None, _get_attr(est, "scale_", xp))
+
+
+def _compile_min_max_scaler(est, xp, dtype):
+    scale = _get_attr(est, "scale_", xp)
+    offset = _get_attr(est, "min_", xp)
+    clip = getattr(est, "clip", False)
+    low, high = est.feature_range
+
+    def stage(xp, X):
+        X *= scale
+        X += offset
+        if clip:
+            xp.clip(X, low, high, out=X)
+
+    return stage
+
+
+def _compile_normalizer(est, xp, dtype):
+    norm = est.norm
+    if norm not in ("l1", "l2", "max"):
+        return None
+
+    def stage(xp, X):
+        if norm == "l1":
+            norms = xp.abs(X).sum(axis=1)
+        elif norm == "l2":
+            norms = xp.sqrt(xp.einsum("ij,ij->i", X, X))
+        else:
+            norms = xp.abs(X).max(axis=1)
+        X /= _handle_zeros_in_scale(xp, norms)[:, None]
+
+    return stage
+
+
+def _compile_binarizer(est, xp, dtype):
+    threshold = est.threshold
+
+    def stage(xp, X):
+        xp.copyto(X, X > threshold)
+
+    return stage
+
+
+def _compile_simple_imputer(est, xp, dtype):
+    if est.add_indicator or not isinstance(est.missing_values, numbers.Real):
+        return None
+    with cuml.using_output_type("numpy"):
+        statistics = np.asarray(est.statistics_)
+    # columns without statistics are dropped by the imputer, which changes
+    # the shape of the data and cannot be done in place
+    if statistics.dtype.kind not in "biuf" or (
+        est.strategy != "constant" and np.isnan(statistics).any()
+    ):
+        return None
+    statistics = xp.asarray(statistics, dtype=dtype)
+    missing_values = est.missing_values
+    missing_nan = missing_values != missing_values
+
+    def stage(xp, X):
+        mask = xp.isnan(X) if missing_nan else X == missing_values
+        xp.copyto(X, xp.broadcast_to(statistics, X.shape), where=mask)
+
+    return stage
+
+
+def _compile_function_transformer(est, xp, dtype):
+    func = est.func
+    if func is None:
+        return lambda xp, X: None
+    if est.kw_args or not isinstance(func, np.ufunc):
+        return None
+    if func.nin != 1 or func.nout != 1:
+        return None
+    name = func.__name__
+
+    def stage(xp, X):
+        getattr(xp, name)(X, out=X)
+
+    return stage
+
+
+_COMPILERS = (
+    (
+        (StandardScaler, sklearn.preprocessing.StandardScaler),
+        _compile_standard_scaler,
+    ),
+    (
+        (RobustScaler, sklearn.preprocessing.RobustScaler),
+        _compile_robust_scaler,
+    ),
+    (
+        (MaxAbsScaler, sklearn.preprocessing.MaxAbsScaler),
+        _compile_max_abs_scaler,
+    ),
+    (
+        (MinMaxScaler, sklearn.preprocessing.MinMaxScaler),
+        _compile_min_max_scaler,
+    ),
+    ((Normalizer, sklearn.preprocessing.Normalizer), _compile_normalizer),
+    ((Binarizer, sklearn.preprocessing.Binarizer), _compile_binarizer),
+    ((SimpleImputer, sklearn.impute.SimpleImputer), _compile_simple_imputer),
+    (
+        (FunctionTransformer, sklearn.preprocessing.FunctionTransformer),
+        _compile_function_transformer,
+    ),
+)
+
+
+def _compile_stage(estimator, xp, dtype):
+    """Compile a fitted transformer into an in-place function of a block of
+    rows, or return None if it cannot be fused."""
+    for classes, compiler in _COMPILERS:
+        # subclasses may override transform, only fuse the exact classes
+        if type(estimator) in classes:
+            return compiler(estimator, xp, dtype)
+    return None
+
+
+def _is_fusable(estimator):
+    return any(type(estimator) in classes for classes, _ in _COMPILERS)
+
+
+def _run_fused(stages, X, xp, block_rows):
+    """Apply the stages to X reading it once and writing the output once"""
+    out = xp.empty(X.shape, dtype=X.dtype)
+    n_rows = X.shape[0]
+    if block_rows is None:
+        if xp is np:
+            row_bytes = max(X.shape[1] * X.dtype.itemsize, 1)
+            block_rows = max(_HOST_BLOCK_BYTES // row_bytes, 1)
+        else:
+            block_rows = max(n_rows, 1)
+    for start in range(0, n_rows, block_rows):
+        block = out[start : start + block_rows]
+        block[...] = X[start : start + block_rows]
+        for stage in stages:
+            stage(xp, block)
+    return out
+
+
+def _final_estimator_has(attr):
+    def check(self):
+        getattr(self._final_estimator, attr)
+        return True
+
+    return check
+
+
+def _can_transform(self):
+    return self._final_estimator == "passthrough" or hasattr(
+        self._final_estimator, "transform"
+    )
+
+
+class FusedPipeline(Pipeline):
+    """
+    Pipeline fusing consecutive element-wise preprocessing steps at
+    inference.
+
+    The pipeline is fitted exactly like :class:`Pipeline`. When transforming
+    or predicting on a dense floating point NumPy or CuPy array, runs of
+    consecutive fitted transformers that only apply element-wise or
+    per-row operations are compiled into a single pass: the input is read
+    once and the output written once, instead of materializing a full
+    intermediate matrix at each step. On host, the pass goes over blocks
+    of rows small enough to remain in cache while every fused step is
+    applied to them.
+
+    The following cuML and scikit-learn transformers are fused:
+    ``StandardScaler``, ``RobustScaler``, ``MaxAbsScaler``,
+    ``MinMaxScaler``, ``Normalizer``, ``Binarizer``, ``SimpleImputer``
+    (without ``add_indicator`` and when no feature gets dropped) and
+    ``FunctionTransformer`` wrapping a NumPy ufunc without ``kw_args``.
+    Other steps and other input types go through the regular, unfused,
+    transform.
+
+    Parameters
+    ----------
+    steps : list of tuples
+        List of (name, transform) tuples that are chained, in the order in
+        which they are chained, with the last object an estimator.
+    memory : str or object with the joblib.Memory interface, default=None
+        Used to cache the fitted transformers of the pipeline, see
+        :class:`Pipeline`.
+    verbose : bool, default=False
+        If True, the time elapsed while fitting each step will be printed.
+    block_rows : int, default=None
+        Number of rows processed at once by a fused pass. By default, about
+        256KiB worth of rows on host and all the rows on device.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from sklearn.preprocessing import StandardScaler, Normalizer
+    >>> from sklearn.impute import SimpleImputer
+    >>> from cuml.pipeline import FusedPipeline
+    >>> X = np.array([[1., np.nan], [3., 4.], [5., 8.]])
+    >>> pipe = FusedPipeline([("impute", SimpleImputer()),
+    ...                       ("scale", StandardScaler()),
+    ...                       ("normalize", Normalizer())]).fit(X)
+    >>> print(pipe.transform(X))
+    [[-1.          0.        ]
+     [ 0.         -1.        ]
+     [ 0.70710678  0.70710678]]
+    """
+
+    def __init__(self, steps, *, memory=None, verbose=False, block_rows=None):
+        super().__init__(steps, memory=memory, verbose=verbose)
+        self.block_rows = block_rows
+
+    def _fused_transform(self, X, with_final):
+        """Transform X through the steps, fusing the runs of fusable ones"""
+        xp = _get_namespace(X)
+        Xt = X
+        run = []
+        for _, _, transformer in self._iter(with_final=with_final):
+            if xp is not None and _is_fusable(transformer):
+                stage = _compile_stage(transformer, xp, Xt.dtype)
+                if stage is not None:
+                    run.append(stage)
+                    continue
+            if run:
+                Xt = _run_fused(run, Xt, xp, self.block_rows)
+                run = []
+            Xt = transformer.transform(Xt)
+            xp = _get_namespace(Xt)
+        if run:
+            Xt = _run_fused(run, Xt, xp, self.block_rows)
+        return Xt
+
+    @available_if(_can_transform)
+    def transform(self, X, **params):
+        """Transform the data through every step of the pipeline.
+
+        Parameters
+        ----------
+        X : iterable
+            Data to transform. Must fulfill input requirements of first step
+            of the pipeline.
+
+        Returns
+        -------
+        Xt : ndarray of shape (n_samples, n_transformed_features)
+            Transformed data.
+        """
+        if params:
+            return super().transform(X, **params)
+        return self._fused_transform(X, with_final=True)
+
+    @available_if(_final_estimator_has("predict"))
+    def predict(self, X, **params):
+        """Transform the data, and apply `predict` with the final estimator.
+
+        Parameters
+        ----------
+        X : iterable
+            Data to predict on. Must fulfill input requirements of first step
+            of the pipeline.
+
+        **params : dict of str -> object
+            Parameters to the ``predict`` called at the end of all
+            transformations in the pipeline.
+
+        Returns
+        -------
+        y_pred : ndarray
+            Result of calling `predict` on the final estimator.
+        """
+        Xt = self._fused_transform(X, with_final=False)
+        return self.steps[-1][1].predict(Xt, **params)
+
+    @available_if(_final_estimator_has("predict_proba"))
+    def predict_proba(self, X, **params):
+        """Transform the data, and apply `predict_proba` with the final
+        estimator.
+
+        Parameters
+        ----------
+        X : iterable
+            Data to predict on. Must fulfill input requirements of first step
+            of the pipeline.
+
+        **params : dict of str -> object
+            Parameters to the `predict_proba` called at the end of all
+            transformations in the pipeline.
+
+        Returns
+        -------
+        y_proba : ndarray of shape (n_samples, n_classes)
+            Result of calling `predict_proba` on the final estimator.
+        """
+        Xt = self._fused_transform(X, with_final=False)
+        return self.steps[-1][1].predict_proba(Xt, **params)
+
+    @available_if(_final_estimator_has("decision_function"))
+    def decision_function(self, X, **params):
+        """Transform the data, and apply `decision_function` with the final
+        estimator.
+
+        Parameters
+        ----------
+        X : iterable
+            Data to predict on. Must fulfill input requirements of first step
+            of the pipeline.
+
+        Returns
+        -------
+        y_score : ndarray of shape (n_samples, n_classes)
+            Result of calling `decision_function` on the final estimator.
+        """
+        Xt = self._fused_transform(X, with_final=False)
+        return self.steps[-1][1].decision_function(Xt, **params)
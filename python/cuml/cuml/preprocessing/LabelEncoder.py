@@ -19,6 +19,9 @@ from typing import TYPE_CHECKING
 from cuml import Base
 from cuml._thirdparty.sklearn.utils.validation import check_is_fitted
 from cuml.common.exceptions import NotFittedError
+from cuml.common.hash_index import HashIndex
+from cuml.internals.device_type import DeviceType
+from cuml.internals.global_settings import GlobalSettings
 from cuml.internals.safe_imports import (
     cpu_only_import,
     cpu_only_import_from,
@@ -29,14 +32,51 @@ if TYPE_CHECKING:
     import cudf
     import cupy as cp
     import numpy as np
+    import pandas as pd
     from pandas import Series as pdSeries
 else:
     cudf = gpu_only_import("cudf")
     cp = gpu_only_import("cupy")
     np = cpu_only_import("numpy")
+    pd = cpu_only_import("pandas")
     pdSeries = cpu_only_import_from("pandas", "Series")
 
 
+def _to_host(y):
+    """Convert labels of any supported type to a 1-d NumPy array."""
+    if isinstance(y, np.ndarray):
+        return y.ravel()
+    if isinstance(y, (pd.Series, pd.Index)):
+        return y.to_numpy()
+    if hasattr(y, "values_host"):
+        # cudf Series or Index
+        return y.values_host
+    if hasattr(y, "__cuda_array_interface__"):
+        return cp.asnumpy(y).ravel()
+    if hasattr(y, "to_numpy"):
+        # pyarrow Array or ChunkedArray
+        return y.to_numpy(zero_copy_only=False)
+    return np.asarray(y).ravel()
+
+
+def _pack_strings(values):
+    """Pack an array of strings into utf-8 data and int64 offsets."""
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return {"offsets": offsets, "data": b"".join(encoded)}
+
+
+def _unpack_strings(packed):
+    data, offsets = packed["data"], packed["offsets"]
+    out = np.empty(len(offsets) - 1, dtype=object)
+    out[:] = [
+        data[start:stop].decode("utf-8")
+        for start, stop in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+    ]
+    return out
+
+
 class LabelEncoder(Base):
     """
     An nvcategory based implementation of ordinal label encoding
@@ -127,6 +167,25 @@ class LabelEncoder(Base):
     4    b
     dtype: object
 
+    >>> # New classes can be appended without changing existing codes
+    >>> le = le.partial_fit(Series(['e', 'a']))
+    >>> print(le.transform(Series(['e', 'd'])))
+    0    4
+    1    3
+    dtype: uint8
+
+    Notes
+    -----
+    When the global device type is ``'cpu'`` (see
+    :py:func:`cuml.common.device_selection.using_device_type`), the encoder
+    runs on host: ``classes_`` is a NumPy array, numeric labels are encoded
+    by a binary search over the sorted classes and other labels through a
+    hash index. Encoded and decoded labels are returned as NumPy arrays, or
+    pandas Series for pandas inputs, and unknown labels are encoded as -1
+    when ``handle_unknown='ignore'``. Missing labels (None, NaN) are not
+    classes: as on device, ``fit_transform`` encodes them as missing (-1)
+    while ``transform`` treats them as unknown. Pickling such an encoder
+    stores string classes as a single utf-8 buffer plus offsets.
     """
 
     def __init__(
@@ -146,6 +205,8 @@ class LabelEncoder(Base):
         self.dtype = None
         self._fitted: bool = False
         self.handle_unknown = handle_unknown
+        self._sorter = None
+        self._index = None
 
     def __sklearn_is_fitted__(self) -> bool:
         return self.classes_ is not None
@@ -179,6 +240,10 @@ class LabelEncoder(Base):
         """
         self._validate_keywords()
 
+        if _classes is None and self._host_device():
+            self._set_host_classes(self._unique_host(_to_host(y)))
+            return self
+
         if _classes is None:
             # dedupe and sort
             y = cudf.Series(y).drop_duplicates().sort_values(ignore_index=True)
@@ -189,6 +254,117 @@ class LabelEncoder(Base):
         self.dtype = y.dtype if y.dtype != cp.dtype("O") else str
         return self
 
+    def partial_fit(self, y):
+        """
+        Extend the classes of the encoder with the unseen labels of `y`
+
+        Classes seen in previous calls keep their codes, new classes are
+        appended in sorted order, so data encoded before remains valid.
+        The first call is equivalent to `fit`.
+
+        Parameters
+        ----------
+        y : cudf.Series, pandas.Series, cupy.ndarray or numpy.ndarray
+            Series containing the categories to be encoded. It's elements
+            may or may not be unique
+
+        Returns
+        -------
+        self : LabelEncoder
+            A fitted instance of itself to allow method chaining
+        """
+        if self.classes_ is None:
+            return self.fit(y)
+
+        if self._is_host():
+            y = _to_host(y)
+            new = self._unique_host(y[self._lookup_host(y) < 0])
+            if len(new):
+                self._set_host_classes(
+                    np.concatenate([self.classes_, new]), new=new
+                )
+            return self
+
+        y = cudf.Series(y)
+        classes = cudf.Series(self.classes_)
+        new = (
+            y[~y.isin(classes)]
+            .dropna()
+            .drop_duplicates()
+            .sort_values(ignore_index=True)
+        )
+        if len(new):
+            self.classes_ = cudf.concat([classes, new], ignore_index=True)
+        return self
+
+    def _host_device(self):
+        return GlobalSettings().device_type is DeviceType.host
+
+    def _is_host(self):
+        return isinstance(self.classes_, np.ndarray)
+
+    @staticmethod
+    def _unique_host(y):
+        uniques = pd.unique(y)
+        return np.sort(uniques[~pd.isna(uniques)])
+
+    def _set_host_classes(self, classes, new=None):
+        """Set host classes and update the structures used to look them up.
+
+        Numeric classes are searched with `np.searchsorted`, through a sort
+        permutation once `partial_fit` appended unsorted classes. Other
+        classes go through a hash index, extended in place with `new`.
+        """
+        self.classes_ = classes
+        self.dtype = classes.dtype if classes.dtype != np.dtype("O") else str
+        if classes.dtype.kind in "biufmM":
+            self._index = None
+            # classes stay sorted as long as every appended batch sorts
+            # after the previous classes
+            is_sorted = new is None or (
+                self._sorter is None
+                and classes[len(classes) - len(new) - 1] < new[0]
+            )
+            self._sorter = (
+                None if is_sorted else np.argsort(classes, kind="stable")
+            )
+        elif new is not None and self._index is not None:
+            self._index.add(new)
+        else:
+            self._sorter = None
+            self._index = HashIndex(classes)
+
+    def _lookup_host(self, y):
+        """Codes of host labels `y`, -1 for unknown labels."""
+        classes = self.classes_
+        if not len(classes):
+            return np.full(len(y), -1, dtype=np.int64)
+        if self._index is None and classes.dtype.kind in "biufmM":
+            y = np.asarray(y)
+            if y.dtype.kind not in "biufmM":
+                try:
+                    y = y.astype(classes.dtype)
+                except (TypeError, ValueError):
+                    # labels of another type, e.g. strings against numeric
+                    # classes, are compared as objects
+                    return HashIndex(classes.astype(object)).lookup(y)
+            pos = np.searchsorted(classes, y, sorter=self._sorter)
+            pos = np.minimum(pos, len(classes) - 1)
+            if self._sorter is not None:
+                pos = self._sorter[pos]
+            return np.where(classes[pos] == y, pos, -1)
+        if self._index is None:
+            self._index = HashIndex(classes)
+        return self._index.lookup(y)
+
+    def _host_output(self, values, y):
+        if isinstance(y, pd.Series):
+            return pd.Series(values, index=y.index, name=y.name)
+        return values
+
+    def _code_dtype(self):
+        return np.int32 if len(self.classes_) < 2**31 - 1 else np.int64
+
     def transform(self, y) -> cudf.Series:
         """
         Transform an input into its categorical keys.
@@ -215,6 +391,12 @@ class LabelEncoder(Base):
         """
         check_is_fitted(self)
 
+        if self._is_host():
+            encoded = self._lookup_host(_to_host(y))
+            if self.handle_unknown == "error" and (encoded < 0).any():
+                raise KeyError("Attempted to encode unseen key")
+            return self._host_output(encoded.astype(self._code_dtype()), y)
+
         y = cudf.Series(y, dtype="category")
 
         encoded = y.cat.set_categories(self.classes_).cat.codes
@@ -231,6 +413,13 @@ class LabelEncoder(Base):
         This is functionally equivalent to (but faster than)
         `LabelEncoder().fit(y).transform(y)`
         """
+        if self._host_device():
+            self._validate_keywords()
+            # one hash pass gives both the sorted classes and the codes
+            encoded, classes = pd.factorize(_to_host(y), sort=True)
+            self._sorter = None
+            self._set_host_classes(np.asarray(classes))
+            return self._host_output(encoded.astype(self._code_dtype()), y)
 
         y = cudf.Series(y)
         self.dtype = y.dtype if y.dtype != cp.dtype("O") else str
@@ -257,6 +446,8 @@ class LabelEncoder(Base):
         """
         # check LabelEncoder is fitted
         check_is_fitted(self)
+        if self._is_host():
+            return self._inverse_transform_host(y)
         # check input type is cudf.Series
         y = cudf.Series(y)
 
@@ -284,6 +475,40 @@ class LabelEncoder(Base):
 
         return res
 
+    def _inverse_transform_host(self, y):
+        codes = _to_host(y)
+        invalid = (codes < 0) | (codes >= len(self.classes_))
+        if self.handle_unknown == "error" and invalid.any():
+            raise ValueError(
+                "y contains previously unseen label {}".format(
+                    codes[invalid][0]
+                )
+            )
+        res = self.classes_[np.where(invalid, 0, codes)]
+        if invalid.any():
+            res = res.astype(object)
+            res[invalid] = None
+        return self._host_output(res, y)
+
+    def __getstate__(self):
+        state = super().__getstate__().copy()
+        # the hash index is rebuilt lazily, string classes are stored as a
+        # single utf-8 buffer and offsets rather than as Python objects
+        state["_index"] = None
+        classes = state.get("classes_")
+        if (
+            isinstance(classes, np.ndarray)
+            and classes.dtype.kind in "OU"
+            and pd.api.types.infer_dtype(classes) == "string"
+        ):
+            state["classes_"] = _pack_strings(classes)
+        return state
+
+    def __setstate__(self, state):
+        if isinstance(state.get("classes_"), dict):
+            state = dict(state, classes_=_unpack_strings(state["classes_"]))
+        super().__setstate__(state)
+
     def get_param_names(self):
         return super().get_param_names() + [
             "handle_unknown",
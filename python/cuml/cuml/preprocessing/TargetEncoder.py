@@ -16,6 +16,9 @@
 
 import warnings
 from cuml.common.exceptions import NotFittedError
+from cuml.common.hash_index import HashIndex
+from cuml.internals.device_type import DeviceType
+from cuml.internals.global_settings import GlobalSettings
 from cuml.internals.safe_imports import cpu_only_import
 from cuml.internals.safe_imports import gpu_only_import
 
@@ -36,6 +39,73 @@ def get_stat_func(stat):
     return func
 
 
+def _as_array(xp, a):
+    """Array of NumPy (copied from device if needed) or CuPy."""
+    if xp is np and hasattr(a, "__cuda_array_interface__"):
+        return cp.asnumpy(a)
+    return xp.asarray(a)
+
+
+def _out_of_fold_median(xp, groups, folds, y, n_groups):
+    """
+    Out-of-fold median of every row and full median of every group.
+
+    Rows are sorted by (group, y) once. The out-of-fold median of a
+    (group, fold) cell is found by a binary search, vectorized over all
+    cells, for the position whose rank among the group values that are not
+    in the fold equals the median rank.
+    """
+    n = len(y)
+    order = xp.lexsort(xp.stack([y, groups]))
+    ys = y[order]
+    start = xp.searchsorted(groups[order], xp.arange(n_groups))
+    group_count = xp.bincount(groups, minlength=n_groups)
+
+    lower = start + (group_count - 1) // 2
+    upper = start + group_count // 2
+    encode_all = xp.full(n_groups, xp.nan)
+    seen = group_count > 0
+    encode_all[seen] = (ys[lower[seen]] + ys[upper[seen]]) / 2
+
+    # position of the fold members in the sorted order, keyed by fold
+    sorted_folds = folds[order]
+    fold_keys = xp.sort(sorted_folds * n + xp.arange(n))
+
+    n_folds = int(folds.max()) + 1 if n else 0
+    cells, row_cell = xp.unique(groups * n_folds + folds, return_inverse=True)
+    row_cell = row_cell.ravel()
+    cell_group, cell_fold = cells // n_folds, cells % n_folds
+    cell_start = start[cell_group]
+    cell_stop = cell_start + group_count[cell_group]
+    in_fold_before = xp.searchsorted(fold_keys, cell_fold * n + cell_start)
+    m = group_count[cell_group] - (
+        xp.searchsorted(fold_keys, cell_fold * n + cell_stop) - in_fold_before
+    )
+
+    def order_statistic(k):
+        # smallest p such that k + 1 out-of-fold values are at or before p
+        lo, hi = cell_start.copy(), xp.maximum(cell_stop - 1, cell_start)
+        active = lo < hi
+        while bool(active.any()):
+            mid = (lo + hi) // 2
+            in_fold = (
+                xp.searchsorted(fold_keys, cell_fold * n + mid, side="right")
+                - in_fold_before
+            )
+            ok = (mid - cell_start + 1 - in_fold) >= k + 1
+            # converged cells, and the ones without any out-of-fold value,
+            # must not move past their group
+            hi = xp.where(active & ok, mid, hi)
+            lo = xp.where(active & ~ok, mid + 1, lo)
+            active = lo < hi
+        return lo
+
+    lower = order_statistic(xp.maximum(m - 1, 0) // 2)
+    upper = order_statistic(m // 2)
+    cell_median = xp.where(m > 0, (ys[lower] + ys[upper]) / 2, xp.nan)
+    return cell_median[row_cell], encode_all
+
+
 class TargetEncoder:
     """
     A cudf based implementation of target encoding [1]_, which converts
@@ -46,6 +116,12 @@ class TargetEncoder:
     optimizations are applied to prevent label leakage and parallelize
     the execution.
 
+    Out-of-fold encodings are derived from per-(category, fold) statistics
+    computed in a single pass, whatever the number of folds. Multiple
+    columns are encoded jointly. The encoder runs on host with NumPy
+    under the "cpu" device type, on device with cupy otherwise, whatever
+    the type of the inputs.
+
     Parameters
     ----------
     n_folds : int (default=4)
@@ -139,14 +215,8 @@ class TargetEncoder:
         self.seed = seed
         self.smooth = smooth
         self.split_method = split_method
-        self.y_col = "__TARGET__"
-        self.y_col2 = "__TARGET__SQUARE__"
-        self.x_col = "__FEA__"
-        self.out_col = "__TARGET_ENCODE__"
-        self.out_col2 = "__TARGET_ENCODE__SQUARE__"
-        self.fold_col = "__FOLD__"
-        self.id_col = "__INDEX__"
-        self.train = None
+        self._fitted = False
+        self._train_groups = None
         self.output_type = output_type
         self.stat = stat
 
@@ -191,9 +261,7 @@ class TargetEncoder:
                 f"{len(x)}"
             )
 
-        res, train = self._fit_transform(x, y, fold_ids=fold_ids)
-        self.train_encode = res
-        self.train = train
+        self.train_encode = self._fit_transform(x, y, fold_ids=fold_ids)
         self._fitted = True
         return self
 
@@ -246,95 +314,99 @@ class TargetEncoder:
 
         """
         self._check_is_fitted()
-        test = self._data_with_strings_to_cudf_dataframe(x)
-        if self._is_train_df(test):
+        # new data is mapped with the categories found in `fit`
+        host = isinstance(self._categories[0], HashIndex)
+        columns = self._get_columns(x, host)
+        if len(columns) != len(self._categories):
+            raise ValueError(
+                f"Input has {len(columns)} columns but the encoder was "
+                f"fitted on {len(self._categories)}."
+            )
+        xp = np if host else cp
+        groups = self._lookup_groups(xp, columns, host)
+        if self._is_train_groups(xp, groups):
             return self.train_encode
-        x_cols = [i for i in test.columns.tolist() if i != self.id_col]
-        test = test.merge(self.encode_all, on=x_cols, how="left")
-        return self._impute_and_sort(test)
+        encode_all = xp.asarray(self.encode_all)
+        res = xp.full(len(groups), xp.nan)
+        known = groups >= 0
+        res[known] = encode_all[groups[known]]
+        return self._impute_and_convert(xp, res)
 
     def _fit_transform(self, x, y, fold_ids):
         """
-        Core function of target encoding
+        Core function of target encoding.
+
+        Rows are mapped to integer group ids and folds, the per-(group, fold)
+        sufficient statistics are accumulated in a single pass and the
+        out-of-fold statistics of every row are derived by subtracting its
+        own cell from the group totals, so no per-fold groupby or merge is
+        needed. The same code runs on NumPy (on host) or CuPy.
         """
         self.output_type = self._get_output_type(x)
-        cp.random.seed(self.seed)
-        train = self._data_with_strings_to_cudf_dataframe(x)
-        x_cols = [i for i in train.columns.tolist() if i != self.id_col]
-        train[self.y_col] = self._make_y_column(y)
-
-        self.n_folds = min(self.n_folds, len(train))
-        train[self.fold_col] = self._make_fold_column(len(train), fold_ids)
-
-        self.y_stat_val = get_stat_func(self.stat)(train[self.y_col])
-        if self.stat in ["median"]:
-            return self._fit_transform_for_loop(train, x_cols)
-
-        self.mean = train[self.y_col].mean()
-        if self.stat == "var":
-            y_cols = [self.y_col, self.y_col2]
-            train[self.y_col2] = self._make_y_column(y * y)
-            self.mean2 = train[self.y_col2].mean()
+        host = GlobalSettings().device_type is DeviceType.host
+        columns = self._get_columns(x, host)
+        xp = np if host else cp
+
+        groups = self._fit_groups(xp, columns, host)
+        n_groups = self._n_groups
+        y = _as_array(xp, self._make_y_column(y)).astype(xp.float64)
+
+        self.n_folds = min(self.n_folds, len(y))
+        folds = self._make_fold_column(xp, len(y), fold_ids)
+        _, folds = xp.unique(xp.asarray(folds), return_inverse=True)
+        folds = folds.ravel()
+        n_folds = int(folds.max()) + 1 if len(folds) else 0
+
+        series = pandas.Series if host else cudf.Series
+        self.y_stat_val = get_stat_func(self.stat)(series(y))
+        self.mean = float(y.mean())
+
+        valid = groups >= 0
+        g, f, yv = groups[valid], folds[valid], y[valid]
+        res = xp.full(len(y), xp.nan)
+        if self.stat == "median":
+            res[valid], self.encode_all = _out_of_fold_median(
+                xp, g, f, yv, n_groups
+            )
         else:
-            y_cols = [self.y_col]
-
-        y_count_each_fold, y_count_all = self._groupby_agg(
-            train, x_cols, op="count", y_cols=y_cols
-        )
-
-        y_sum_each_fold, y_sum_all = self._groupby_agg(
-            train, x_cols, op="sum", y_cols=y_cols
-        )
-
+            n_moments = 2 if self.stat == "var" else 1
+            if self.stat == "var":
+                self.mean2 = float((y * y).mean())
+            cell = g * n_folds + f
+            size = n_groups * n_folds
+            stats = [xp.bincount(cell, minlength=size)]
+            for p in range(1, n_moments + 1):
+                w = yv if p == 1 else yv * yv
+                stats.append(xp.bincount(cell, weights=w, minlength=size))
+            stats = [s.reshape(n_groups, n_folds) for s in stats]
+            totals = [s.sum(axis=1) for s in stats]
+            # out-of-fold statistics: group totals minus the row's own fold
+            oof = [t[g] - s[g, f] for s, t in zip(stats, totals)]
+            res[valid] = self._compute_output(*oof)
+            self.encode_all = self._compute_output(*totals)
+
+        self._train_groups = groups
+        return self._impute_and_convert(xp, res)
+
+    def _compute_output(self, count, y_sum, y2_sum=None):
         """
-        Note:
-            encode_each_fold is used to encode train data.
-            encode_all is used to encode test data.
+        Compute the output encoding based on aggregated sum and count
         """
-        cols = [self.fold_col] + x_cols
-        encode_each_fold = self._compute_output(
-            y_sum_each_fold,
-            y_count_each_fold,
-            cols,
-            f"{self.y_col}_x",
-            f"{self.y_col2}_x",
-        )
-        encode_all = self._compute_output(
-            y_sum_all, y_count_all, x_cols, self.y_col, self.y_col2
-        )
-
-        self.encode_all = encode_all
-
-        train = train.merge(encode_each_fold, on=cols, how="left")
-        del encode_each_fold
-        return self._impute_and_sort(train), train
-
-    def _fit_transform_for_loop(self, train, x_cols):
-        def _rename_col(df, col):
-            df.columns = [col]
-            return df.reset_index()
-
-        res = []
-        unq_vals = train[self.fold_col].unique()
-        if not isinstance(unq_vals, (cp.ndarray, np.ndarray)):
-            unq_vals = unq_vals.values_host
-        for f in unq_vals:
-            mask = train[self.fold_col].values == f
-            dg = train.loc[~mask].groupby(x_cols).agg({self.y_col: self.stat})
-            dg = _rename_col(dg, self.out_col)
-            res.append(train.loc[mask].merge(dg, on=x_cols, how="left"))
-        res = cudf.concat(res, axis=0)
-        self.encode_all = train.groupby(x_cols).agg({self.y_col: self.stat})
-        self.encode_all = _rename_col(self.encode_all, self.out_col)
-        return self._impute_and_sort(res), train
+        smooth = self.smooth
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = (y_sum + smooth * self.mean) / (count + smooth)
+            if self.stat == "var":
+                out2 = (y2_sum + smooth * self.mean2) / (count + smooth)
+                out = (out2 - out**2) * count / (count - 1)
+        return out
 
     def _make_y_column(self, y):
         """
         Create a target column given y
         """
-        if isinstance(y, cudf.Series) or isinstance(y, pandas.Series):
+        if isinstance(y, pandas.Series):
             return y.values
-        elif isinstance(y, cp.ndarray) or isinstance(y, np.ndarray):
+        elif isinstance(y, np.ndarray) or isinstance(y, cp.ndarray):
             if len(y.shape) == 1:
                 return y
             elif y.shape[1] == 1:
@@ -343,6 +415,8 @@ class TargetEncoder:
                 raise ValueError(
                     f"Input of shape {y.shape} " "is not a 1-D array."
                 )
+        elif isinstance(y, cudf.Series):
+            return y.values
         else:
             raise TypeError(
                 f"Input of type {type(y)} is not cudf.Series, "
@@ -351,19 +425,23 @@ class TargetEncoder:
                 "or cupy.ndarray"
             )
 
-    def _make_fold_column(self, len_train, fold_ids):
+    def _make_fold_column(self, xp, len_train, fold_ids):
         """
         Create a fold id column for each split
         """
 
         if self.split_method == "random":
+            if xp is np:
+                rs = np.random.RandomState(self.seed)
+                return rs.randint(0, self.n_folds, len_train)
+            cp.random.seed(self.seed)
             return cp.random.randint(0, self.n_folds, len_train)
         elif self.split_method == "continuous":
             return (
-                cp.arange(len_train) / (len_train / self.n_folds)
+                xp.arange(len_train) / (len_train / self.n_folds)
             ) % self.n_folds
         elif self.split_method == "interleaved":
-            return cp.arange(len_train) % self.n_folds
+            return xp.arange(len_train) % self.n_folds
         elif self.split_method == "customize":
             if fold_ids is None:
                 raise ValueError(
@@ -371,7 +449,10 @@ class TargetEncoder:
                     "since split_method is set to"
                     "'customize'."
                 )
-            return fold_ids
+            if hasattr(fold_ids, "values"):
+                # pandas or cudf Series
+                fold_ids = fold_ids.values
+            return _as_array(xp, fold_ids)
         else:
             msg = (
                 "split_method should be either 'random'"
@@ -380,119 +461,134 @@ class TargetEncoder:
             )
             raise ValueError(msg)
 
-    def _compute_output(self, df_sum, df_count, cols, y_col, y_col2=None):
+    def _fit_groups(self, xp, columns, host):
         """
-        Compute the output encoding based on aggregated sum and count
+        Map every row to the id of its (joint) category, -1 for rows with a
+        null key. Per-column categories and the tables combining the column
+        codes are stored to map new data in `transform`.
         """
-        df_sum = df_sum.merge(df_count, on=cols, how="left")
-        smooth = self.smooth
-        df_sum[self.out_col] = (df_sum[f"{y_col}_x"] + smooth * self.mean) / (
-            df_sum[f"{y_col}_y"] + smooth
-        )
-        if self.stat == "var":
-            df_sum[self.out_col2] = (
-                df_sum[f"{y_col2}_x"] + smooth * self.mean2
-            ) / (df_sum[f"{y_col2}_y"] + smooth)
-            df_sum[self.out_col] = (
-                df_sum[self.out_col2] - df_sum[self.out_col] ** 2
-            )
-            df_sum[self.out_col] = (
-                df_sum[self.out_col]
-                * df_sum[f"{y_col2}_y"]
-                / (df_sum[f"{y_col2}_y"] - 1)
+        self._categories = []
+        codes = []
+        for col in columns:
+            if host:
+                col_codes, uniques = pandas.factorize(col)
+                uniques = np.asarray(uniques)
+                self._categories.append(HashIndex(uniques))
+            else:
+                col_codes, uniques = cudf.Series(col).factorize()
+                col_codes = cp.asarray(col_codes)
+                self._categories.append(uniques)
+            codes.append(xp.asarray(col_codes, dtype=xp.int64))
+
+        groups = codes[0]
+        self._n_groups = len(self._categories[0])
+        self._group_tables = []
+        for col_codes, cats in zip(codes[1:], self._categories[1:]):
+            key = xp.where(
+                (groups < 0) | (col_codes < 0),
+                -1,
+                groups * len(cats) + col_codes,
             )
-        return df_sum
-
-    def _groupby_agg(self, train, x_cols, op, y_cols):
+            table, groups = xp.unique(key, return_inverse=True)
+            groups = groups.ravel()
+            if len(table) and table[0] == -1:
+                table, groups = table[1:], groups - 1
+            self._group_tables.append(table)
+            self._n_groups = len(table)
+        return groups
+
+    def _lookup_groups(self, xp, columns, host):
         """
-        Compute aggregated value of each fold and overall dataframe
-        grouped by `x_cols` and agg by `op`
+        Map rows of new data to the group ids found in `fit`, -1 for
+        unseen categories.
         """
-        cols = [self.fold_col] + x_cols
-        df_each_fold = train.groupby(cols, as_index=False).agg(
-            {y_col: op for y_col in y_cols}
-        )
-        df_all = df_each_fold.groupby(x_cols, as_index=False).agg(
-            {y_col: "sum" for y_col in y_cols}
-        )
-
-        df_each_fold = df_each_fold.merge(df_all, on=x_cols, how="left")
-        for y_col in y_cols:
-            df_each_fold[f"{y_col}_x"] = (
-                df_each_fold[f"{y_col}_y"] - df_each_fold[f"{y_col}_x"]
-            )
-        return df_each_fold, df_all
+        codes = []
+        for col, cats in zip(columns, self._categories):
+            if host:
+                codes.append(cats.lookup(col))
+            else:
+                col_codes = (
+                    cudf.Series(col, dtype="category")
+                    .cat.set_categories(cats)
+                    .cat.codes.astype("int64")
+                    .fillna(-1)
+                )
+                codes.append(cp.asarray(col_codes.values))
+
+        groups = codes[0]
+        for col_codes, cats, table in zip(
+            codes[1:], self._categories[1:], self._group_tables
+        ):
+            key = groups * len(cats) + col_codes
+            idx = xp.minimum(xp.searchsorted(table, key), len(table) - 1)
+            found = (groups >= 0) & (col_codes >= 0) & (table[idx] == key)
+            groups = xp.where(found, idx, -1)
+        return groups
 
     def _check_is_fitted(self):
-        if not self._fitted or self.train is None:
+        if not self._fitted or self._train_groups is None:
             msg = (
                 "This LabelEncoder instance is not fitted yet. Call 'fit' "
                 "with appropriate arguments before using this estimator."
             )
             raise NotFittedError(msg)
 
-    def _is_train_df(self, df):
+    def _is_train_groups(self, xp, groups):
         """
-        Return True if the dataframe `df` is the training dataframe, which
-        is used in `fit_transform`
+        Return True if `groups` are the group ids of the training data,
+        which is used in `fit_transform`
         """
-        if len(df) != len(self.train):
+        if len(groups) != len(self._train_groups):
             return False
-        self.train = self.train.sort_values(self.id_col).reset_index(drop=True)
-        for col in df.columns:
-            if col not in self.train.columns:
-                raise ValueError(
-                    f"Input column {col} " "is not in train data."
-                )
-            if not (df[col] == self.train[col]).all():
-                return False
-        return True
+        return bool((groups == xp.asarray(self._train_groups)).all())
 
-    def _impute_and_sort(self, df):
+    def _impute_and_convert(self, xp, res):
         """
-        Impute and sort the result encoding in the same row order as input
+        Impute missing encodings and convert to the requested output type
         """
-        df[self.out_col] = df[self.out_col].nans_to_nulls()
-        df[self.out_col] = df[self.out_col].fillna(self.y_stat_val)
-        df = df.sort_values(self.id_col)
-        res = df[self.out_col].values.copy()
-        if self.output_type == "numpy":
+        res[xp.isnan(res)] = self.y_stat_val
+        if self.output_type == "numpy" and xp is cp:
             return cp.asnumpy(res)
+        if self.output_type == "cupy" and xp is np:
+            return cp.asarray(res)
         return res
 
-    def _data_with_strings_to_cudf_dataframe(self, x):
+    def _get_columns(self, x, host):
         """
-        Convert input data with strings to cudf dataframe.
+        Split input data into a list of columns.
         Supported data types are:
             1D or 2D numpy/cupy arrays
             pandas/cudf Series
             pandas/cudf DataFrame
-        Input data could have one or more string columns.
+        Input data could have one or more string columns. Device data is
+        copied to host if `host`, host data is encoded with cudf otherwise.
         """
-        if isinstance(x, cudf.DataFrame):
-            df = x.copy()
-        elif isinstance(x, cudf.Series):
-            df = x.to_frame().copy()
-        elif isinstance(x, cp.ndarray) or isinstance(x, np.ndarray):
-            df = cudf.DataFrame()
+        if isinstance(x, np.ndarray):
             if len(x.shape) == 1:
-                df[self.x_col] = x
-            else:
-                df = cudf.DataFrame(
-                    x, columns=[f"{self.x_col}_{i}" for i in range(x.shape[1])]
-                )
+                return [x]
+            return [x[:, i] for i in range(x.shape[1])]
         elif isinstance(x, pandas.DataFrame):
-            df = cudf.from_pandas(x)
+            return [x[c].to_numpy() for c in x.columns]
         elif isinstance(x, pandas.Series):
-            df = cudf.from_pandas(x.to_frame())
+            return [x.to_numpy()]
+        elif isinstance(x, cp.ndarray):
+            if host:
+                return self._get_columns(cp.asnumpy(x), host)
+            if len(x.shape) == 1:
+                return [x]
+            return [x[:, i] for i in range(x.shape[1])]
+        elif isinstance(x, (cudf.DataFrame, cudf.Series)):
+            if host:
+                return self._get_columns(x.to_pandas(), host)
+            if isinstance(x, cudf.Series):
+                return [x]
+            return [x[c] for c in x.columns]
         else:
             raise TypeError(
                 f"Input of type {type(x)} is not cudf.Series, cudf.DataFrame "
                 "or pandas.Series or pandas.DataFrame"
                 "or cupy.ndarray or numpy.ndarray"
             )
-        df[self.id_col] = cp.arange(len(x))
-        return df.reset_index(drop=True)
 
     def _get_output_type(self, x):
         """
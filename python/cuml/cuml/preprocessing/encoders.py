@@ -16,10 +16,12 @@ import warnings
 from typing import List, Optional, TypeVar
 
 import cuml.internals.logger as logger
-from cudf import DataFrame, Series
 from cuml import Base
 from cuml.common.doc_utils import generate_docstring
 from cuml.common.exceptions import NotFittedError
+from cuml.common.hash_index import HashIndex
+from cuml.internals.device_type import DeviceType
+from cuml.internals.global_settings import GlobalSettings
 from cuml.internals.safe_imports import (
     cpu_only_import,
     gpu_only_import,
@@ -28,13 +30,81 @@ from cuml.internals.safe_imports import (
 from cuml.preprocessing import LabelEncoder
 
 np = cpu_only_import("numpy")
+pd = cpu_only_import("pandas")
+scipy_sparse = cpu_only_import("scipy.sparse")
 cudf = gpu_only_import("cudf")
 cp = gpu_only_import("cupy")
 cupyx = gpu_only_import("cupyx")
 
+DataFrame = gpu_only_import_from("cudf", "DataFrame")
+Series = gpu_only_import_from("cudf", "Series")
 Index = gpu_only_import_from("cudf", "Index")
 
 
+def _is_arrow_table(X):
+    return type(X).__module__.startswith("pyarrow") and hasattr(
+        X, "column_names"
+    )
+
+
+def _is_host_input(X):
+    """Whether X is a host table (NumPy array, pandas or Arrow table)."""
+    return isinstance(X, (np.ndarray, pd.DataFrame)) or _is_arrow_table(X)
+
+
+def _input_type(X):
+    """Input type recorded for the output of a host encoder."""
+    return "df" if hasattr(X, "columns") else "array"
+
+
+def _to_host_input(X):
+    """Move a cupy array or cudf DataFrame to host, leave host inputs as is."""
+    if _is_host_input(X):
+        return X
+    if hasattr(X, "to_pandas"):
+        return X.to_pandas()
+    return cp.asnumpy(X)
+
+
+def _host_column(col):
+    if isinstance(col, pd.Series):
+        return col.to_numpy()
+    # pyarrow.ChunkedArray
+    return col.to_numpy(zero_copy_only=False)
+
+
+def _host_columns(X):
+    """Return the feature names and the 1-d NumPy columns of a host table."""
+    if isinstance(X, np.ndarray):
+        return list(range(X.shape[1])), [X[:, i] for i in range(X.shape[1])]
+    if isinstance(X, pd.DataFrame):
+        return list(X.columns), [_host_column(X[c]) for c in X.columns]
+    return list(X.column_names), [_host_column(c) for c in X.columns]
+
+
+def _host_categories(column):
+    """Sorted unique non-null values of a host column."""
+    uniques = pd.unique(np.asarray(column))
+    return np.sort(uniques[~pd.isna(uniques)])
+
+
+def _host_category_lists(categories):
+    """Split user provided categories into one sorted array per feature.
+
+    A 2-d array holds the categories of feature ``i`` in its row ``i`` while
+    a table holds them in its column ``i``, as in the device path.
+    """
+    if isinstance(categories, np.ndarray) and categories.ndim == 2:
+        cats = list(categories)
+    elif isinstance(categories, pd.DataFrame) or _is_arrow_table(categories):
+        cats = _host_columns(categories)[1]
+    else:
+        cats = [np.asarray(c) for c in categories]
+    # rows of a 2-d object array lose the dtype of the feature they describe
+    cats = [pd.Series(c).infer_objects().to_numpy() for c in cats]
+    return [_host_categories(c) for c in cats]
+
+
 class CheckFeaturesMixIn:
     def _check_n_features(self, X, reset: bool = False):
         n_features = X.shape[1]
@@ -90,7 +160,12 @@ class BaseEncoder(Base, CheckFeaturesMixIn):
 
     def _check_input(self, X, is_categories=False):
         """If input is cupy, convert it to a DataFrame with 0 copies."""
-        if isinstance(X, cp.ndarray):
+        if GlobalSettings().device_type is DeviceType.host:
+            # Inputs are encoded on host, see `_fit_host`
+            if not is_categories:
+                self._set_input_type(_input_type(X))
+            return X
+        elif isinstance(X, cp.ndarray):
             self._set_input_type("array")
             if is_categories:
                 X = X.transpose()
@@ -112,6 +187,9 @@ class BaseEncoder(Base, CheckFeaturesMixIn):
         return inp
 
     def _fit(self, X, need_drop: bool):
+        if GlobalSettings().device_type is DeviceType.host:
+            return self._fit_host(X, need_drop)
+        self._host = False
         X = self._check_input_fit(X)
         if type(self.categories) is str and self.categories == "auto":
             self._features = X.columns
@@ -157,9 +235,82 @@ class BaseEncoder(Base, CheckFeaturesMixIn):
             self.drop_idx_ = self._compute_drop_idx()
         self._fitted = True
 
+    def _fit_host(self, X, need_drop: bool):
+        """Fit on host, device inputs are copied to host first.
+
+        Each feature gets a :py:class:`~cuml.common.hash_index.HashIndex`
+        from category value to code, built once here so that transforming a
+        column is a single vectorized lookup.
+        """
+        self._host = True
+        self._set_input_type(_input_type(X))
+        X = _to_host_input(X)
+        names, columns = _host_columns(X)
+        self.n_features_in_ = len(names)
+        if not isinstance(X, np.ndarray):
+            self.feature_names_in_ = [str(c) for c in names]
+
+        self._features = names
+        auto = type(self.categories) is str and self.categories == "auto"
+        if auto:
+            categories = [_host_categories(col) for col in columns]
+        else:
+            categories = _host_category_lists(self.categories)
+            if len(categories) != len(names):
+                raise ValueError(
+                    "Shape mismatch: if categories is not 'auto',"
+                    " it has to be of shape (n_features, _)."
+                )
+        self._encoders = {
+            feature: HashIndex(cats)
+            for feature, cats in zip(names, categories)
+        }
+
+        if not auto and self.handle_unknown == "error":
+            for feature, col in zip(names, columns):
+                unknown = self._encoders[feature].lookup(col) < 0
+                if (unknown & ~pd.isna(col)).any():
+                    msg = (
+                        "Found unknown categories in column {0}"
+                        " during fit".format(feature)
+                    )
+                    raise KeyError(msg)
+
+        if need_drop:
+            self.drop_idx_ = self._compute_drop_idx_host()
+        self._fitted = True
+
+    def _encode_host(self, X):
+        """Return the codes of a host table as an (n_samples, n_features)
+        int64 array, -1 being reserved for unknown and null values.
+
+        Nulls are not categories, they are encoded as missing whatever
+        ``handle_unknown``, as in the device path."""
+        names, columns = _host_columns(_to_host_input(X))
+        if len(columns) != len(self._features):
+            raise ValueError(
+                "X has {} features, but this {} is expecting {} features "
+                "as input.".format(
+                    len(columns),
+                    self.__class__.__name__,
+                    len(self._features),
+                )
+            )
+        n_samples = len(columns[0]) if columns else 0
+        codes = np.empty((n_samples, len(columns)), dtype=np.int64)
+        for i, feature in enumerate(self._features):
+            codes[:, i] = self._encoders[feature].lookup(columns[i])
+            if self.handle_unknown == "error":
+                unknown = (codes[:, i] < 0) & ~pd.isna(columns[i])
+                if unknown.any():
+                    raise KeyError("Attempted to encode unseen key")
+        return codes
+
     @property
     def categories_(self):
         """Returns categories used for the one hot encoding in the correct order."""
+        if self._host:
+            return [self._encoders[f].keys for f in self._features]
         return [self._encoders[f].classes_ for f in self._features]
 
 
@@ -176,6 +327,11 @@ class OneHotEncoder(BaseEncoder):
     in each feature. Alternatively, you can also specify the `categories`
     manually.
 
+    NumPy arrays, pandas DataFrames and pyarrow Tables are encoded on host:
+    each feature gets a hash index from category to code at fit time and
+    ``transform`` returns a :py:class:`scipy.sparse.csr_matrix` (or a NumPy
+    array if ``sparse_output=False``).
+
     .. note:: a one-hot encoding of y labels should use a LabelBinarizer
         instead.
 
@@ -279,6 +435,7 @@ class OneHotEncoder(BaseEncoder):
         self.drop_idx_ = None
         self._features = None
         self._encoders = None
+        self._host = False
         self.input_type = None
         # This parameter validation should be performed in `fit` instead
         # of in the constructor. Hence the awkwark `if` clause
@@ -371,6 +528,50 @@ class OneHotEncoder(BaseEncoder):
             )
             raise ValueError(msg.format(type(self.drop)))
 
+    def _compute_drop_idx_host(self):
+        """Host counterpart of `_compute_drop_idx`, returns integer codes."""
+        if self.drop is None:
+            return None
+        elif isinstance(self.drop, str) and self.drop == "first":
+            return {feature: 0 for feature in self._features}
+        elif isinstance(self.drop, (dict, list)):
+            drop = self.drop
+            if isinstance(drop, list):
+                drop = dict(zip(self._features, drop))
+            if len(drop.keys()) != len(self._encoders):
+                msg = (
+                    "`drop` should have as many columns as the number "
+                    "of features ({}), got {}"
+                )
+                raise ValueError(
+                    msg.format(len(self._encoders), len(drop.keys()))
+                )
+            drop_idx = dict()
+            for feature, value in drop.items():
+                value = np.atleast_1d(np.asarray(value))
+                if len(value) != 1:
+                    msg = (
+                        "Trying to drop multiple values for feature {}, "
+                        "this is not supported."
+                    ).format(feature)
+                    raise ValueError(msg)
+                idx = int(self._encoders[feature].lookup(value)[0])
+                if idx < 0:
+                    msg = (
+                        "Some categories for feature {} were supposed "
+                        "to be dropped, but were not found in the encoder "
+                        "categories.".format(feature)
+                    )
+                    raise ValueError(msg)
+                drop_idx[feature] = idx
+            return drop_idx
+        else:
+            msg = (
+                "Wrong input for parameter `drop`. Expected "
+                "'first', None or a dict, got {}"
+            )
+            raise ValueError(msg.format(type(self.drop)))
+
     def _check_input_fit(self, X, is_categories=False):
         """Helper function used in fit. Can be overridden in subclasses."""
         return self._check_input(X, is_categories=is_categories)
@@ -412,6 +613,8 @@ class OneHotEncoder(BaseEncoder):
     def transform(self, X):
         """Transform X using one-hot encoding."""
         self._check_is_fitted()
+        if self._host:
+            return self._transform_host(X)
         X = self._check_input(X)
 
         cols, rows = list(), list()
@@ -491,6 +694,44 @@ class OneHotEncoder(BaseEncoder):
                 "Internal Error: {}".format(input_types_str, repr(e))
             )
 
+    def _transform_host(self, X):
+        """Build the CSR one-hot matrix straight from the category codes.
+
+        Every row has at most one non-zero per feature, so the column indices
+        are the per-feature codes shifted by the feature offsets, read in
+        row-major order, and no dense intermediate is needed.
+        """
+        codes = self._encode_host(X)
+        offset = 0
+        for i, feature in enumerate(self._features):
+            col = codes[:, i]
+            n_categories = len(self._encoders[feature])
+            if self.drop_idx_ is not None:
+                drop_idx = self.drop_idx_[feature]
+                col[col == drop_idx] = -1
+                col[col > drop_idx] -= 1
+                n_categories -= 1
+            col[col >= 0] += offset
+            offset += n_categories
+
+        valid = codes >= 0
+        index_dtype = np.int32 if codes.size < 2**31 else np.int64
+        indices = codes[valid].astype(index_dtype)
+        indptr = np.zeros(len(codes) + 1, dtype=index_dtype)
+        np.cumsum(valid.sum(axis=1), out=indptr[1:])
+        data = np.ones(len(indices), dtype=self.dtype)
+        ohe = scipy_sparse.csr_matrix(
+            (data, indices, indptr), shape=(len(codes), offset)
+        )
+        if self.output_type in ("cupy", "cudf"):
+            # the matrices of the device path
+            ohe = cupyx.scipy.sparse.csr_matrix(ohe)
+
+        if not self.sparse_output:
+            ohe = ohe.toarray()
+
+        return ohe
+
     def inverse_transform(self, X):
         """Convert the data back to the original representation. In case unknown
         categories are encountered (all zeros in the one-hot encoding), ``None`` is used
@@ -510,6 +751,8 @@ class OneHotEncoder(BaseEncoder):
             Inverse transformed array.
         """
         self._check_is_fitted()
+        if self._host:
+            return self._inverse_transform_host(X)
         if cupyx.scipy.sparse.issparse(X):
             # cupyx.scipy.sparse 7.x does not support argmax,
             # when we upgrade cupy to 8.x, we should add a condition in the
@@ -565,6 +808,43 @@ class OneHotEncoder(BaseEncoder):
                 )
         return result
 
+    def _inverse_transform_host(self, X):
+        if scipy_sparse.issparse(X):
+            X = scipy_sparse.csr_matrix(X)
+        else:
+            X = np.asarray(X)
+        result = {}
+        j = 0
+        for feature in self._features:
+            cats = self._encoders[feature].keys
+            kept = np.arange(len(cats))
+            drop_idx = None
+            if self.drop_idx_ is not None:
+                drop_idx = self.drop_idx_[feature]
+                kept = np.delete(kept, drop_idx)
+            if len(kept) == 0:
+                result[feature] = np.repeat(cats[[drop_idx]], X.shape[0])
+                continue
+
+            enc_size = len(kept)
+            x_feature = X[:, j : j + enc_size]
+            idx = np.asarray(x_feature.argmax(axis=1)).ravel()
+            is_hot = np.asarray((x_feature != 0).sum(axis=1)).ravel() > 0
+            inv = cats[kept[idx]]
+            if not is_hot.all():
+                if drop_idx is not None:
+                    inv[~is_hot] = cats[drop_idx]
+                else:
+                    inv = inv.astype(object)
+                    inv[~is_hot] = None
+            result[feature] = inv
+            j += enc_size
+
+        result = pd.DataFrame(result, columns=self._features)
+        if self.input_type == "array":
+            return result.to_numpy()
+        return result
+
     def get_feature_names(self, input_features=None):
         """Return feature names for output features.
 
@@ -593,11 +873,13 @@ class OneHotEncoder(BaseEncoder):
 
         feature_names = []
         for i in range(len(cats)):
-            names = [
-                input_features[i] + "_" + str(t) for t in cats[i].values_host
-            ]
-            if self.drop_idx_ is not None and self.drop_idx_[i] is not None:
-                names.pop(self.drop_idx_[i])
+            if self._host:
+                values, key = cats[i], self._features[i]
+            else:
+                values, key = cats[i].values_host, i
+            names = [input_features[i] + "_" + str(t) for t in values]
+            if self.drop_idx_ is not None and self.drop_idx_[key] is not None:
+                names.pop(self.drop_idx_[key])
             feature_names.extend(names)
 
         return np.array(feature_names, dtype=object)
@@ -646,6 +928,28 @@ def _get_output(
         raise ValueError("Unsupported output type.")
 
 
+def _get_host_output(
+    output_type: Optional[str],
+    input_type: Optional[str],
+    out: "pd.DataFrame",
+    dtype=None,
+):
+    """Host counterpart of `_get_output`, host types are the default."""
+    if output_type in ("input", None):
+        output_type = "numpy" if input_type == "array" else "pandas"
+
+    if output_type == "pandas":
+        return out
+    elif output_type == "numpy":
+        return out.to_numpy(dtype=dtype, na_value=np.nan)
+    elif output_type == "cupy":
+        return cp.asarray(out.to_numpy(dtype=dtype, na_value=np.nan))
+    elif output_type == "cudf":
+        return cudf.DataFrame.from_pandas(out)
+    else:
+        raise ValueError("Unsupported output type.")
+
+
 class OrdinalEncoder(BaseEncoder):
     def __init__(
         self,
@@ -664,6 +968,10 @@ class OrdinalEncoder(BaseEncoder):
         (discrete) features. The features are converted to ordinal integers. This
         results in a single column of integers (0 to n_categories - 1) per feature.
 
+        NumPy arrays, pandas DataFrames and pyarrow Tables are encoded on host
+        through a per-feature hash index built at fit time, unknown categories
+        being encoded as NaN when ``handle_unknown='ignore'``.
+
         Parameters
         ----------
         categories : 'auto' an cupy.ndarray or a cudf.DataFrame, default='auto'
@@ -702,6 +1010,7 @@ class OrdinalEncoder(BaseEncoder):
         self.dtype = dtype
         self.handle_unknown = handle_unknown
 
+        self._host = False
         self.input_type = None
 
     @generate_docstring(y=None)
@@ -720,6 +1029,13 @@ class OrdinalEncoder(BaseEncoder):
     def transform(self, X):
         """Transform X using ordinal encoding."""
         self._check_n_features(X, reset=False)
+        if self._host:
+            codes = self._encode_host(X).astype(np.float64)
+            codes[codes < 0] = np.nan
+            r = pd.DataFrame(codes, columns=self._features)
+            return _get_host_output(
+                self.output_type, self.input_type, r, self.dtype
+            )
 
         result = {}
         for feature in self._features:
@@ -757,6 +1073,8 @@ class OrdinalEncoder(BaseEncoder):
             Inverse transformed array.
         """
         self._check_n_features(X, reset=False)
+        if self._host:
+            return self._inverse_transform_host(X)
 
         result = {}
         for feature in self._features:
@@ -767,6 +1085,30 @@ class OrdinalEncoder(BaseEncoder):
         r = DataFrame(result)
         return _get_output(self.output_type, self.input_type, r, self.dtype)
 
+    def _inverse_transform_host(self, X):
+        X = _to_host_input(X)
+        if not isinstance(X, np.ndarray):
+            X = np.asarray(X, dtype=np.float64)
+        result = {}
+        for i, feature in enumerate(self._features):
+            cats = self._encoders[feature].keys
+            codes = np.asarray(X[:, i], dtype=np.float64)
+            valid = np.isfinite(codes) & (codes >= 0) & (codes < len(cats))
+            if not valid.all() and self.handle_unknown == "error":
+                raise ValueError(
+                    "y contains previously unseen label {}".format(
+                        codes[~valid][0]
+                    )
+                )
+            inv = cats[np.where(valid, codes, 0).astype(np.int64)]
+            if not valid.all():
+                inv = inv.astype(object)
+                inv[~valid] = None
+            result[feature] = inv
+
+        r = pd.DataFrame(result, columns=self._features)
+        return _get_host_output(self.output_type, self.input_type, r)
+
     def get_param_names(self):
         return super().get_param_names() + [
             "categories",
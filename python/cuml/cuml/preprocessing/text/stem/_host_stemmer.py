@@ -0,0 +1,258 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Host (CPU) Porter stemmer, NLTK_EXTENSIONS mode.
+
+Words are stemmed one at a time by walking tables of suffix rules, which is
+cheap because :class:`~cuml.preprocessing.text.stem.PorterStemmer` only
+stems each distinct word once. The rules and their order are the ones of
+the device implementation in ``porter_stemmer.py``.
+"""
+
+_VOWELS = frozenset("aeiou")
+
+_IRREGULAR_FORMS = {
+    "skies": "sky",
+    "sky": "sky",
+    "dying": "die",
+    "lying": "lie",
+    "tying": "tie",
+    "news": "news",
+    "innings": "inning",
+    "inning": "inning",
+    "outings": "outing",
+    "outing": "outing",
+    "cannings": "canning",
+    "canning": "canning",
+    "howe": "howe",
+    "proceed": "proceed",
+    "exceed": "exceed",
+    "succeed": "succeed",
+}
+
+
+def _consonant_flags(word):
+    """Whether each character of ``word`` is a consonant, in one pass."""
+    flags = []
+    for i, char in enumerate(word):
+        if char in _VOWELS:
+            flags.append(False)
+        elif char == "y":
+            # y is a consonant unless it follows a consonant
+            flags.append(i == 0 or not flags[i - 1])
+        else:
+            flags.append(True)
+    return flags
+
+
+def _measure(stem):
+    """Number of vowel-consonant sequences of ``stem``, the paper's m."""
+    flags = _consonant_flags(stem)
+    return sum(1 for prev, cur in zip(flags, flags[1:]) if not prev and cur)
+
+
+def _has_positive_measure(stem):
+    return _measure(stem) > 0
+
+
+def _measure_gt_1(stem):
+    return _measure(stem) > 1
+
+
+def _contains_vowel(stem):
+    return not all(_consonant_flags(stem))
+
+
+def _ends_double_consonant(word):
+    return (
+        len(word) >= 2 and word[-1] == word[-2] and _consonant_flags(word)[-1]
+    )
+
+
+def _ends_cvc(word):
+    """Condition *o of the paper, with the NLTK extension for 2 letters."""
+    if len(word) >= 3:
+        flags = _consonant_flags(word)
+        if (
+            flags[-3]
+            and not flags[-2]
+            and flags[-1]
+            and word[-1] not in ("w", "x", "y")
+        ):
+            return True
+    if len(word) == 2:
+        flags = _consonant_flags(word)
+        return not flags[0] and flags[1]
+    return False
+
+
+def _apply_rule_list(word, rules):
+    """
+    Apply the first rule whose suffix matches ``word``.
+
+    Rules are ``(suffix, replacement, condition)`` triplets, ``condition``
+    being None or a predicate on the stem left once the suffix is removed.
+    The special suffix ``"*d"`` matches a double consonant and removes one
+    of its letters.
+    """
+    for suffix, replacement, condition in rules:
+        if suffix == "*d":
+            if _ends_double_consonant(word):
+                stem = word[:-1]
+                if condition is None or condition(stem):
+                    return stem
+                return word
+            continue
+        if word.endswith(suffix):
+            stem = word[: len(word) - len(suffix)]
+            if condition is None or condition(stem):
+                return stem + replacement
+            return word
+    return word
+
+
+_STEP1A_RULES = (
+    ("sses", "ss", None),
+    ("ies", "i", None),
+    ("ss", "ss", None),
+    ("s", "", None),
+)
+
+_STEP1B_TIDY_RULES = (
+    ("at", "ate", None),
+    ("bl", "ble", None),
+    ("iz", "ize", None),
+    ("*d", None, lambda stem: stem[-1] not in ("l", "s", "z")),
+    ("", "e", lambda stem: _measure(stem) == 1 and _ends_cvc(stem)),
+)
+
+_STEP1C_RULES = (
+    ("y", "i", lambda stem: len(stem) > 1 and _consonant_flags(stem)[-1]),
+)
+
+_STEP2_RULES = (
+    ("ational", "ate", _has_positive_measure),
+    ("tional", "tion", _has_positive_measure),
+    ("enci", "ence", _has_positive_measure),
+    ("anci", "ance", _has_positive_measure),
+    ("izer", "ize", _has_positive_measure),
+    ("bli", "ble", _has_positive_measure),
+    ("alli", "al", _has_positive_measure),
+    ("entli", "ent", _has_positive_measure),
+    ("eli", "e", _has_positive_measure),
+    ("ousli", "ous", _has_positive_measure),
+    ("ization", "ize", _has_positive_measure),
+    ("ation", "ate", _has_positive_measure),
+    ("ator", "ate", _has_positive_measure),
+    ("alism", "al", _has_positive_measure),
+    ("iveness", "ive", _has_positive_measure),
+    ("fulness", "ful", _has_positive_measure),
+    ("ousness", "ous", _has_positive_measure),
+    ("aliti", "al", _has_positive_measure),
+    ("iviti", "ive", _has_positive_measure),
+    ("biliti", "ble", _has_positive_measure),
+    ("fulli", "ful", _has_positive_measure),
+    # the 'l' of 'logi' is kept with the stem, so that short stems like
+    # 'geo' or 'theo' work like 'archaeo' or 'philo'
+    ("logi", "log", lambda stem: _has_positive_measure(stem + "l")),
+)
+
+_STEP3_RULES = (
+    ("icate", "ic", _has_positive_measure),
+    ("ative", "", _has_positive_measure),
+    ("alize", "al", _has_positive_measure),
+    ("iciti", "ic", _has_positive_measure),
+    ("ical", "ic", _has_positive_measure),
+    ("ful", "", _has_positive_measure),
+    ("ness", "", _has_positive_measure),
+)
+
+_STEP4_RULES = (
+    ("al", "", _measure_gt_1),
+    ("ance", "", _measure_gt_1),
+    ("ence", "", _measure_gt_1),
+    ("er", "", _measure_gt_1),
+    ("ic", "", _measure_gt_1),
+    ("able", "", _measure_gt_1),
+    ("ible", "", _measure_gt_1),
+    ("ant", "", _measure_gt_1),
+    ("ement", "", _measure_gt_1),
+    ("ment", "", _measure_gt_1),
+    ("ent", "", _measure_gt_1),
+    ("ion", "", lambda stem: _measure_gt_1(stem) and stem[-1] in "st"),
+    ("ou", "", _measure_gt_1),
+    ("ism", "", _measure_gt_1),
+    ("ate", "", _measure_gt_1),
+    ("iti", "", _measure_gt_1),
+    ("ous", "", _measure_gt_1),
+    ("ive", "", _measure_gt_1),
+    ("ize", "", _measure_gt_1),
+)
+
+# the measure of the word is the one of the word without its last 'l'
+_STEP5B_RULES = (("ll", "l", lambda stem: _measure(stem + "l") > 1),)
+
+
+def _step1a(word):
+    if word.endswith("ies") and len(word) == 4:
+        return word[:-3] + "ie"
+    return _apply_rule_list(word, _STEP1A_RULES)
+
+
+def _step1b(word):
+    if word.endswith("ied"):
+        return word[:-3] + ("ie" if len(word) == 4 else "i")
+    if word.endswith("eed"):
+        stem = word[:-3]
+        return stem + "ee" if _measure(stem) > 0 else word
+    for suffix in ("ed", "ing"):
+        if word.endswith(suffix):
+            stem = word[: -len(suffix)]
+            if _contains_vowel(stem):
+                return _apply_rule_list(stem, _STEP1B_TIDY_RULES)
+    return word
+
+
+def _step2(word):
+    if word.endswith("alli") and _has_positive_measure(word[:-4]):
+        word = word[:-4] + "al"
+    return _apply_rule_list(word, _STEP2_RULES)
+
+
+def _step5a(word):
+    if word.endswith("e"):
+        stem = word[:-1]
+        measure = _measure(stem)
+        if measure > 1 or (measure == 1 and not _ends_cvc(stem)):
+            return stem
+    return word
+
+
+def stem_word(word):
+    """Porter stem of a single word, as ``PorterStemmer.stem``."""
+    if len(word) <= 2:
+        return word.lower()
+    word = word.lower()
+    if word in _IRREGULAR_FORMS:
+        return _IRREGULAR_FORMS[word]
+    word = _step1a(word)
+    word = _step1b(word)
+    word = _apply_rule_list(word, _STEP1C_RULES)
+    word = _step2(word)
+    word = _apply_rule_list(word, _STEP3_RULES)
+    word = _apply_rule_list(word, _STEP4_RULES)
+    word = _step5a(word)
+    return _apply_rule_list(word, _STEP5B_RULES)
@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2020-2023, NVIDIA CORPORATION.
+# Copyright (c) 2020-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -14,6 +14,9 @@
 # limitations under the License.
 #
 
+from collections import OrderedDict
+
+from ._host_stemmer import stem_word
 from .porter_stemmer_utils.measure_utils import (
     has_positive_measure,
     measure_gt_n,
@@ -39,10 +42,13 @@ from .porter_stemmer_utils.suffix_utils import (
     get_str_replacement_series,
     replace_suffix,
 )
-from cuml.internals.safe_imports import gpu_only_import
+from cuml.internals.safe_imports import cpu_only_import, gpu_only_import
 
 cudf = gpu_only_import("cudf")
 cp = gpu_only_import("cupy")
+np = cpu_only_import("numpy")
+pd = cpu_only_import("pandas")
+pa = cpu_only_import("pyarrow")
 
 
 # Implementation based on nltk//stem/porter.html
@@ -68,10 +74,19 @@ class PorterStemmer:
       NLTK contributors or taken from other modified implementations
       found on the web.
 
+    Each distinct word is only stemmed once per call, the stems being
+    gathered back to the positions of the input, and the stems are kept in
+    a least recently used cache shared by the following calls, so that the
+    cost of stemming a corpus depends on the number of new words rather than
+    on the number of tokens. pandas Series and Arrow arrays are stemmed on
+    host, word by word.
+
     Parameters
     ----------
         mode: Modes of stemming (Only supports (NLTK_EXTENSIONS) currently)
               default("NLTK_EXTENSIONS")
+        cache_size: Maximum number of word stems cached across calls,
+              unbounded if None and no cache if 0. default(2 ** 20)
 
     Examples
     --------
@@ -90,12 +105,19 @@ class PorterStemmer:
 
     """
 
-    def __init__(self, mode="NLTK_EXTENSIONS"):
+    def __init__(self, mode="NLTK_EXTENSIONS", cache_size=2**20):
         if mode != "NLTK_EXTENSIONS":
             raise ValueError(
                 "Only PorterStemmer.NLTK_EXTENSIONS is supported currently"
             )
+        if cache_size is not None and cache_size < 0:
+            raise ValueError(
+                "cache_size should be None or a non-negative integer, "
+                "got {}".format(cache_size)
+            )
         self.mode = mode
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
 
     def stem(self, word_str_ser):
         """
@@ -103,13 +125,78 @@ class PorterStemmer:
 
         Parameters
         ----------
-        word_str_ser : cudf.Series
+        word_str_ser : cudf.Series, pandas.Series or pyarrow.Array
             A string series of words to stem
 
         Returns
         -------
-        stemmed_ser : cudf.Series
-            Stemmed words strings series
+        stemmed_ser : cudf.Series, pandas.Series or pyarrow.Array
+            Stemmed words strings series, of the type of the input
+        """
+        if isinstance(word_str_ser, (pa.Array, pa.ChunkedArray)):
+            stems = self._stem_host(word_str_ser.to_pandas())
+            return pa.array(stems, type=word_str_ser.type, from_pandas=True)
+        if isinstance(word_str_ser, pd.Series):
+            return self._stem_host(word_str_ser)
+
+        codes, uniques = word_str_ser.factorize()
+        if not len(uniques):
+            return word_str_ser.copy()
+        if self.cache_size == 0:
+            stems = self._stem_series(cudf.Series(uniques))
+        else:
+            stems = self._stem_unique(
+                uniques.to_arrow().to_pylist(),
+                lambda words: self._stem_series(
+                    cudf.Series(words, dtype="str")
+                )
+                .to_arrow()
+                .to_pylist(),
+            )
+            stems = cudf.Series(stems, dtype="str")
+        # missing words are coded -1 and stay missing
+        valid = codes >= 0
+        stemmed_ser = stems.take(cp.where(valid, codes, 0)).where(
+            cudf.Series(valid), None
+        )
+        stemmed_ser.index = word_str_ser.index
+        return stemmed_ser
+
+    def _stem_host(self, word_ser):
+        codes, uniques = pd.factorize(word_ser)
+        stems = np.empty(len(uniques) + 1, dtype=object)
+        stems[:-1] = self._stem_unique(
+            list(uniques), lambda words: [stem_word(w) for w in words]
+        )
+        # missing words are coded -1 and stay missing
+        stems[-1] = None
+        return pd.Series(stems[codes], index=word_ser.index, dtype=object)
+
+    def _stem_unique(self, words, stem_words):
+        """
+        Stems of distinct words, looked up in the cache first.
+
+        ``stem_words`` stems a list of the words not cached.
+        """
+        if self.cache_size == 0:
+            return stem_words(words)
+        cache = self._cache
+        stems = [cache.get(word) for word in words]
+        missing = [word for word, stem in zip(words, stems) if stem is None]
+        new_stems = iter(stem_words(missing) if missing else ())
+        for i, (word, stem) in enumerate(zip(words, stems)):
+            if stem is None:
+                stems[i] = cache[word] = next(new_stems)
+            else:
+                cache.move_to_end(word)
+        if self.cache_size is not None:
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        return stems
+
+    def _stem_series(self, word_str_ser):
+        """
+        Stem all the words of a cudf string Series with the rule passes.
         """
         # this is only for NLTK_EXTENSIONS
         # remove the length condition for original algorithm
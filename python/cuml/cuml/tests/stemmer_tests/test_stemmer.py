@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2020-2023, NVIDIA CORPORATION.
+# Copyright (c) 2020-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -16,9 +16,11 @@
 
 from nltk import stem as nltk_stem
 from cuml.preprocessing.text import stem as rapids_stem
-from cuml.internals.safe_imports import gpu_only_import
+from cuml.internals.safe_imports import cpu_only_import, gpu_only_import
+import pytest
 
 cudf = gpu_only_import("cudf")
+pd = cpu_only_import("pandas")
 
 
 def get_words():
@@ -54,3 +56,48 @@ def test_same_results():
     assert all(
         [a == b for a, b in zip(nltk_stemmed, cuml_stemmed.to_pandas().values)]
     )
+
+
+@pytest.mark.parametrize("cache_size", [None, 0, 100])
+def test_repeated_words(cache_size):
+    word_ls = get_words()[:500]
+    word_ser = cudf.Series(word_ls * 3 + [None])
+
+    cuml_stemmer = rapids_stem.PorterStemmer(cache_size=cache_size)
+    stemmed = cuml_stemmer.stem(word_ser)
+    # the second call is served by the cache, if any
+    assert stemmed.equals(cuml_stemmer.stem(word_ser))
+
+    nltk_stemmer = nltk_stem.PorterStemmer()
+    nltk_stemmed = [nltk_stemmer.stem(word) for word in word_ls]
+    assert stemmed.to_arrow().to_pylist() == nltk_stemmed * 3 + [None]
+
+
+def test_same_results_host():
+    pa = pytest.importorskip("pyarrow")
+    word_ls = get_words()
+    nltk_stemmer = nltk_stem.PorterStemmer()
+    nltk_stemmed = [nltk_stemmer.stem(word) for word in word_ls]
+
+    cuml_stemmer = rapids_stem.PorterStemmer()
+    stemmed = cuml_stemmer.stem(pd.Series(word_ls, index=word_ls[::-1]))
+    assert stemmed.tolist() == nltk_stemmed
+    assert stemmed.index.tolist() == word_ls[::-1]
+
+    stemmed = cuml_stemmer.stem(pa.array(word_ls + [None]))
+    assert stemmed.to_pylist() == nltk_stemmed + [None]
+
+
+def test_cache_size():
+    cuml_stemmer = rapids_stem.PorterStemmer(cache_size=2)
+    words = pd.Series(["running", "dogs", "running"])
+    assert cuml_stemmer.stem(words).tolist() == ["run", "dog", "run"]
+    assert cuml_stemmer.stem(pd.Series(["flies", "running"])).tolist() == [
+        "fli",
+        "run",
+    ]
+    # least recently used words are evicted first
+    assert list(cuml_stemmer._cache) == ["flies", "running"]
+
+    with pytest.raises(ValueError):
+        rapids_stem.PorterStemmer(cache_size=-1)
@@ -0,0 +1,107 @@
+#
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from sklearn.impute import SimpleImputer as skSimpleImputer
+from sklearn.linear_model import LogisticRegression as skLogisticRegression
+from sklearn.pipeline import Pipeline as skPipeline
+import sklearn.preprocessing as skpre
+from cuml.pipeline import FusedPipeline
+from cuml.preprocessing import (
+    Normalizer,
+    SimpleImputer,
+    StandardScaler,
+)
+import pytest
+from cuml.internals.safe_imports import cpu_only_import, gpu_only_import
+
+np = cpu_only_import("numpy")
+cp = gpu_only_import("cupy")
+
+
+def _host_steps():
+    return [
+        ("impute", skSimpleImputer(strategy="median")),
+        ("standard", skpre.StandardScaler()),
+        ("minmax", skpre.MinMaxScaler(clip=True)),
+        ("log", skpre.FunctionTransformer(np.log1p)),
+        ("robust", skpre.RobustScaler()),
+        ("maxabs", skpre.MaxAbsScaler()),
+        ("normalize", skpre.Normalizer(norm="l1")),
+        ("binarize", skpre.Binarizer(threshold=0.05)),
+    ]
+
+
+def _dataset(dtype, n_rows=5000, n_features=12):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(n_rows, n_features)).astype(dtype)
+    X[rng.random(X.shape) < 0.1] = np.nan
+    y = (rng.random(n_rows) > 0.5).astype(np.int32)
+    return X, y
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("block_rows", [None, 1, 333])
+def test_fused_pipeline_transform_host(dtype, block_rows):
+    X, _ = _dataset(dtype)
+    expected = skPipeline(_host_steps()).fit(X).transform(X)
+    fused = FusedPipeline(_host_steps(), block_rows=block_rows).fit(X)
+    result = fused.transform(X)
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_fused_pipeline_mixed_steps():
+    X, y = _dataset(np.float64)
+    # PolynomialFeatures changes the shape and splits the fused runs,
+    # the imputer drops its all-missing column so it is not fused either
+    X[:, 3] = np.nan
+
+    def steps():
+        return [
+            ("impute", skSimpleImputer()),
+            ("scale", skpre.StandardScaler()),
+            ("poly", skpre.PolynomialFeatures(2)),
+            ("normalize", skpre.Normalizer()),
+            ("clf", skLogisticRegression()),
+        ]
+
+    expected = skPipeline(steps()).fit(X, y)
+    fused = FusedPipeline(steps()).fit(X, y)
+    np.testing.assert_allclose(
+        fused.predict_proba(X), expected.predict_proba(X)
+    )
+    np.testing.assert_allclose(
+        fused.decision_function(X), expected.decision_function(X)
+    )
+    np.testing.assert_array_equal(fused.predict(X), expected.predict(X))
+    assert not hasattr(fused, "transform")
+
+
+def test_fused_pipeline_device():
+    X, _ = _dataset(np.float32)
+    X = cp.asarray(X)
+
+    def steps():
+        return [
+            ("impute", SimpleImputer()),
+            ("scale", StandardScaler()),
+            ("normalize", Normalizer()),
+        ]
+
+    expected = skPipeline(steps()).fit(X).transform(X)
+    result = FusedPipeline(steps()).fit(X).transform(X)
+    assert isinstance(result, cp.ndarray)
+    cp.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
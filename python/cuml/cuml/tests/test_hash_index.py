@@ -0,0 +1,81 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from cuml.common.hash_index import HashIndex
+
+import pytest
+from cuml.internals.safe_imports import cpu_only_import
+
+np = cpu_only_import("numpy")
+
+
+@pytest.mark.parametrize("n_keys", [0, 1, 100, 100000])
+@pytest.mark.parametrize("dtype", [np.int32, np.int64, np.float64, object])
+def test_hash_index_lookup(n_keys, dtype):
+    rng = np.random.default_rng(0)
+    keys = np.unique(rng.integers(0, 10 * n_keys + 1, n_keys))
+    if dtype is object:
+        keys = np.array(["k%d" % k for k in keys], dtype=object)
+    else:
+        keys = keys.astype(dtype)
+    index = HashIndex(keys)
+    assert len(index) == len(keys)
+
+    perm = rng.permutation(len(keys))
+    np.testing.assert_array_equal(index.lookup(keys[perm]), perm)
+
+    unknown = np.array(["missing"] if dtype is object else [-1], dtype=dtype)
+    assert index.lookup(unknown, missing=-7)[0] == -7
+    assert not index.contains(unknown).any()
+
+
+def test_hash_index_mixed_dtypes():
+    index = HashIndex(np.array([1.0, 2.5, 4.0]))
+    np.testing.assert_array_equal(
+        index.lookup(np.array([4, 1, 3])), [2, 0, -1]
+    )
+
+    index = HashIndex(np.array([1, 2, 2**62], dtype=np.int64))
+    np.testing.assert_array_equal(
+        index.lookup(np.array([2.0, 2.5, np.nan, 2.0**62, 1e30, -1.0])),
+        [1, -1, -1, 2, -1, -1],
+    )
+    index = HashIndex(np.array([1, 2], dtype=np.uint8))
+    np.testing.assert_array_equal(
+        index.lookup(np.array([2.0, 258.0, -254.0])), [1, -1, -1]
+    )
+
+    # integers out of the range of the keys must not wrap around
+    index = HashIndex(np.array([1, 2], dtype=np.int32))
+    np.testing.assert_array_equal(
+        index.lookup(
+            np.array([2**32 + 1, 2, -(2**32) + 2], dtype=np.int64)
+        ),
+        [-1, 1, -1],
+    )
+    index = HashIndex(np.array([1, 2], dtype=np.uint32))
+    np.testing.assert_array_equal(
+        index.lookup(np.array([-(2**32) + 1, 1, -1], dtype=np.int64)),
+        [-1, 0, -1],
+    )
+    index = HashIndex(np.array([-1, 1], dtype=np.int64))
+    np.testing.assert_array_equal(
+        index.lookup(np.array([2**64 - 1, 1], dtype=np.uint64)), [-1, 1]
+    )
+
+    index = HashIndex(np.array(["a", 1, 2.5], dtype=object))
+    np.testing.assert_array_equal(
+        index.lookup(np.array([2.5, "a", None, 1], dtype=object)),
+        [2, 0, -1, 1],
+    )
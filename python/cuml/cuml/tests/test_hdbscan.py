@@ -1,4 +1,4 @@
-# Copyright (c) 2021-2023, NVIDIA CORPORATION.
+# Copyright (c) 2021-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,6 +15,7 @@
 
 from cuml.internals.safe_imports import gpu_only_import
 from sklearn.model_selection import train_test_split
+import scipy.sparse.csgraph
 from sklearn import datasets
 from hdbscan.plots import CondensedTree
 import hdbscan
@@ -23,6 +24,9 @@ import pytest
 
 
 from cuml.cluster.hdbscan import HDBSCAN, condense_hierarchy
+from cuml.common.device_selection import using_device_type
+from cuml.neighbors import KNNGraph
+from cuml.neighbors.knn_graph import connected_distances
 from cuml.cluster.hdbscan.prediction import (
     all_points_membership_vectors,
     approximate_predict,
@@ -494,6 +498,45 @@ def test_hdbscan_metric_parameter_input(metric, supported):
             clf.fit(X)
 
 
+def test_hdbscan_knn_graph():
+    X, _ = make_blobs(
+        n_samples=5000,
+        n_features=8,
+        centers=6,
+        cluster_std=2.0,
+        random_state=1,
+    )
+    X = X.astype(np.float32)
+    graph = KNNGraph.build(X, n_neighbors=16)
+
+    with using_device_type("cpu"):
+        labels = HDBSCAN(min_samples=5).fit_predict(X, knn_graph=graph)
+    ref_labels = HDBSCAN(min_samples=5).fit_predict(X)
+    assert adjusted_rand_score(labels, ref_labels) > 0.95
+
+    with using_device_type("cpu"), pytest.raises(ValueError):
+        HDBSCAN(min_samples=20).fit(X, knn_graph=graph)
+    with pytest.warns(UserWarning, match="knn_graph"):
+        HDBSCAN(min_samples=5).fit(X, knn_graph=graph)
+
+
+def test_hdbscan_knn_graph_duplicates():
+    rng = np.random.RandomState(0)
+    X = np.vstack([rng.random_sample((100, 2)), np.full((10, 2), 5.0)])
+    X = X.astype(np.float32)
+    graph = KNNGraph.build(X, n_neighbors=4)
+
+    # the duplicates are only linked by zero distances
+    distances = connected_distances(graph, X)
+    n_components, _ = scipy.sparse.csgraph.connected_components(distances)
+    assert n_components == 1
+
+    with using_device_type("cpu"):
+        labels = HDBSCAN(min_samples=3).fit_predict(X, knn_graph=graph)
+    assert labels[100] != -1
+    assert np.all(labels[100:] == labels[100])
+
+
 def test_hdbscan_empty_cluster_tree():
 
     raw_tree = np.recarray(
@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2022-2023, NVIDIA CORPORATION.
+# Copyright (c) 2022-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -20,6 +20,7 @@ import pytest
 from hypothesis.extra.numpy import arrays
 from hypothesis import given, settings, assume, strategies as st
 from cuml.neighbors import KernelDensity, VALID_KERNELS, logsumexp_kernel
+from cuml.common.device_selection import using_device_type
 from cuml.common.exceptions import NotFittedError
 from sklearn.metrics import pairwise_distances as skl_pairwise_distances
 from sklearn.neighbors._ball_tree import kernel_norm
@@ -149,6 +150,50 @@ def test_kernel_density(arrays, kernel, metric, bandwidth):
             kde.sample(100)
 
 
+@pytest.mark.parametrize("kernel", VALID_KERNELS)
+@pytest.mark.parametrize("metric", ["euclidean", "manhattan", "chebyshev"])
+def test_kernel_density_host(kernel, metric):
+    rng = np.random.RandomState(0)
+    X = rng.randn(600, 3)
+    X_test = rng.randn(300, 3)
+    sample_weight = rng.uniform(0.1, 2.0, 600)
+    with using_device_type("cpu"):
+        kde = KernelDensity(
+            kernel=kernel,
+            metric=metric,
+            bandwidth=0.8,
+        ).fit(X, sample_weight=sample_weight, convert_dtype=False)
+        prob = kde.score_samples(X_test, convert_dtype=False)
+    assert isinstance(prob, np.ndarray)
+    ref_prob = compute_kernel_naive(
+        X_test, X, kernel, metric, 0.8, sample_weight
+    )
+    assert np.allclose(np.exp(prob), ref_prob, rtol=1e-6, atol=1e-12)
+
+
+@pytest.mark.parametrize("device", ["cpu", "gpu"])
+@pytest.mark.parametrize("kernel", ["gaussian", "epanechnikov", "tophat"])
+@pytest.mark.parametrize("atol, rtol", [(0.0, 0.0), (0.0, 1e-3), (1e-3, 0.0)])
+def test_kernel_density_tolerances(device, kernel, atol, rtol):
+    # more training points and queries than a leaf and a tile, so that
+    # leaves of training points are pruned
+    rng = np.random.RandomState(1)
+    X = rng.randn(5000, 2)
+    X_test = rng.randn(1000, 2)
+    with using_device_type(device):
+        kde = KernelDensity(
+            kernel=kernel, bandwidth=0.2, atol=atol, rtol=rtol
+        ).fit(X, convert_dtype=False)
+        prob = np.exp(as_type("numpy", kde.score_samples(X_test)))
+    ref_prob = compute_kernel_naive(X_test, X, kernel, "euclidean", 0.2, None)
+    # the reference distances are less accurate close to the bandwidth
+    bound = atol + (rtol + 1e-6) * ref_prob + 1e-7
+    assert np.all(np.abs(prob - ref_prob) <= bound)
+    if atol == 0:
+        # compact kernels are exactly zero beyond the bandwidth
+        assert np.array_equal(prob == 0, ref_prob == 0)
+
+
 def test_logaddexp():
     X = np.array([[0.0, 0.0], [0.0, 0.0]])
     out = np.zeros(X.shape[0])
@@ -1,4 +1,4 @@
-# Copyright (c) 2019-2023, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -14,6 +14,7 @@
 #
 
 from cuml.testing.utils import array_equal
+from cuml.common.device_selection import using_device_type
 from cuml.internals.safe_imports import cpu_only_import
 from sklearn.datasets import make_blobs
 from sklearn.neighbors import KNeighborsClassifier as skKNN
@@ -353,3 +354,73 @@ def test_predict_proba_multioutput(input_type, output_type):
 
     assert array_equal(p[0].astype(np.float32), expected[0])
     assert array_equal(p[1].astype(np.float32), expected[1])
+
+
+@pytest.mark.parametrize("device", ["gpu", "cpu"])
+def test_partial_fit_remove(device):
+    X, y = make_blobs(n_samples=1000, centers=5, n_features=10, random_state=0)
+    X = X.astype(np.float32)
+    with using_device_type(device):
+        knn_cu = cuKNN(n_neighbors=5).fit(X[:600], y[:600])
+        knn_cu.partial_fit(X[600:], y[600:])
+        knn_cu.remove(np.arange(0, 1000, 3))
+
+        keep = np.arange(1000) % 3 != 0
+        ref = cuKNN(n_neighbors=5).fit(X[keep], y[keep])
+        assert array_equal(knn_cu.predict(X), ref.predict(X))
+        assert array_equal(knn_cu.predict_proba(X), ref.predict_proba(X))
+
+
+@pytest.mark.parametrize("device", ["gpu", "cpu"])
+@pytest.mark.parametrize(
+    "weights", ["uniform", "distance", lambda d: 1 / (1 + d)]
+)
+def test_weights(device, weights):
+    X, y = make_blobs(
+        n_samples=1000, centers=5, n_features=10, cluster_std=5, random_state=0
+    )
+    X = X.astype(np.float32)
+    y = np.stack([y, y % 2], axis=1)
+    # queries on training points have a neighbor at distance zero
+    X_test = np.vstack([X[:50], X[50:100] + 0.5])
+
+    sk = skKNN(n_neighbors=10, weights=weights).fit(X, y)
+    with using_device_type(device):
+        knn_cu = cuKNN(n_neighbors=10, weights=weights).fit(X, y)
+        pred = knn_cu.predict(X_test)
+        proba = knn_cu.predict_proba(X_test)
+
+    assert array_equal(pred, sk.predict(X_test))
+    for p, sk_p in zip(proba, sk.predict_proba(X_test)):
+        np.testing.assert_allclose(p, sk_p, atol=1e-5)
+
+
+def test_weights_invalid():
+    with pytest.raises(ValueError, match="weights not recognized"):
+        cuKNN(weights="foo")
+
+
+def test_predict_predict_proba_share_neighbors():
+    X, y = make_blobs(n_samples=500, centers=3, n_features=4, random_state=0)
+    X = X.astype(np.float32)
+    calls = []
+
+    with using_device_type("cpu"):
+        knn_cu = cuKNN(n_neighbors=5, weights="distance").fit(X, y)
+        kneighbors = knn_cu.kneighbors
+
+        def counting_kneighbors(*args, **kwargs):
+            calls.append(1)
+            return kneighbors(*args, **kwargs)
+
+        knn_cu.kneighbors = counting_kneighbors
+        pred = knn_cu.predict(X[:100])
+        proba = knn_cu.predict_proba(X[:100])
+        assert len(calls) == 1
+        assert array_equal(pred, np.asarray(proba).argmax(axis=1))
+
+        knn_cu.predict(X[100:200])
+        assert len(calls) == 2
+        knn_cu.fit(X, (y + 1) % 3)
+        knn_cu.predict(X[100:200])
+        assert len(calls) == 3
@@ -1,4 +1,4 @@
-# Copyright (c) 2019-2023, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -14,11 +14,13 @@
 #
 
 from cuml.testing.utils import array_equal
+from cuml.common.device_selection import using_device_type
 from cuml.internals.safe_imports import cpu_only_import
 from cuml.internals.safe_imports import cpu_only_import_from
 from sklearn.model_selection import train_test_split
 from sklearn.utils.validation import check_random_state
 from sklearn.datasets import make_blobs
+from sklearn.neighbors import KNeighborsRegressor as skKNN
 from cuml.neighbors import KNeighborsRegressor as cuKNN
 import pytest
 
@@ -157,3 +159,40 @@ def test_predict_multioutput(input_type, output_type):
         assert isinstance(p, cp.ndarray)
 
     assert array_equal(p.astype(np.int32), y)
+
+
+@pytest.mark.parametrize("device", ["gpu", "cpu"])
+def test_partial_fit_remove(device):
+    X, y = make_blobs(n_samples=1000, centers=5, n_features=10, random_state=0)
+    X = X.astype(np.float32)
+    y = y.astype(np.float32)
+    with using_device_type(device):
+        knn_cu = cuKNN(n_neighbors=5).fit(X[:600], y[:600])
+        knn_cu.partial_fit(X[600:], y[600:])
+        knn_cu.remove(np.arange(0, 1000, 3))
+
+        keep = np.arange(1000) % 3 != 0
+        ref = cuKNN(n_neighbors=5).fit(X[keep], y[keep])
+        assert array_equal(knn_cu.predict(X), ref.predict(X))
+
+
+@pytest.mark.parametrize("device", ["gpu", "cpu"])
+@pytest.mark.parametrize(
+    "weights", ["uniform", "distance", lambda d: 1 / (1 + d)]
+)
+@pytest.mark.parametrize("n_outputs", [1, 3])
+def test_weights(device, weights, n_outputs):
+    X, y = make_blobs(
+        n_samples=1000, centers=5, n_features=10, cluster_std=5, random_state=0
+    )
+    X = X.astype(np.float32)
+    y = np.stack([y * (o + 1) for o in range(n_outputs)], axis=1)
+    y = y.astype(np.float32).squeeze()
+    X_test = np.vstack([X[:50], X[50:100] + 0.5])
+
+    sk = skKNN(n_neighbors=10, weights=weights).fit(X, y)
+    with using_device_type(device):
+        knn_cu = cuKNN(n_neighbors=10, weights=weights).fit(X, y)
+        pred = knn_cu.predict(X_test)
+
+    assert_array_almost_equal(pred, sk.predict(X_test), decimal=4)
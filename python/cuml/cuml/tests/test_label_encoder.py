@@ -1,4 +1,4 @@
-# Copyright (c) 2019-2023, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
+
 import pytest
 
 from cuml._thirdparty.sklearn.utils.validation import check_is_fitted
+from cuml.common.device_selection import using_device_type
 from cuml.common.exceptions import NotFittedError
 from cuml.internals.safe_imports import cpu_only_import, gpu_only_import
 from cuml.preprocessing.LabelEncoder import LabelEncoder
@@ -252,3 +255,113 @@ def test_inverse_transform_cupy_numpy(
     # test if correctly raies ValueError
     with pytest.raises(ValueError, match="y contains previously unseen label"):
         le.inverse_transform(bad_ord_label)
+
+
+@pytest.mark.parametrize(
+    "labels",
+    [
+        np.array([3, 1, 7, 1, 3, 9]),
+        np.array([0.5, -2.0, 0.5, 8.25]),
+        np.array(["b", "a", "d", "b", "c"], dtype=object),
+    ],
+)
+def test_labelencoder_host(labels):
+    with using_device_type("cpu"):
+        le = LabelEncoder()
+        encoded = le.fit_transform(labels)
+        assert isinstance(le.classes_, np.ndarray)
+        np.testing.assert_array_equal(le.classes_, np.unique(labels))
+        np.testing.assert_array_equal(
+            encoded, np.searchsorted(le.classes_, labels)
+        )
+        np.testing.assert_array_equal(le.transform(labels), encoded)
+        np.testing.assert_array_equal(le.inverse_transform(encoded), labels)
+
+        # pandas input keeps its index
+        series = pd.Series(labels, index=np.arange(len(labels)) + 10)
+        out = le.transform(series)
+        assert isinstance(out, pd.Series)
+        assert (out.index == series.index).all()
+
+
+def test_labelencoder_host_unseen():
+    with using_device_type("cpu"):
+        le = LabelEncoder().fit(np.array(["a", "b"], dtype=object))
+        with pytest.raises(KeyError):
+            le.transform(np.array(["c"], dtype=object))
+        with pytest.raises(ValueError, match="previously unseen label"):
+            le.inverse_transform(np.array([2]))
+
+        le = LabelEncoder(handle_unknown="ignore").fit(np.array([1, 5]))
+        np.testing.assert_array_equal(
+            le.transform(np.array([5, 2, 1, 9])), [1, -1, 0, -1]
+        )
+        reverted = le.inverse_transform(np.array([0, 2, -1]))
+        assert reverted[0] == 1
+        assert reverted[1] is None and reverted[2] is None
+
+        # labels which cannot be cast to the classes dtype are unknown
+        np.testing.assert_array_equal(le.transform(["foo"]), [-1])
+        np.testing.assert_array_equal(
+            le.transform(np.array(["foo", 5, None], dtype=object)),
+            [-1, 1, -1],
+        )
+        with pytest.raises(KeyError):
+            LabelEncoder().fit(np.array([1, 5])).transform(["foo"])
+
+
+def test_labelencoder_host_missing():
+    labels = np.array([2.0, np.nan, 1.0, 2.0])
+    with using_device_type("cpu"):
+        le = LabelEncoder(handle_unknown="error")
+        encoded = le.fit_transform(labels)
+        np.testing.assert_array_equal(encoded, [1, -1, 0, 1])
+        np.testing.assert_array_equal(le.classes_, [1.0, 2.0])
+        with pytest.raises(KeyError):
+            le.transform(labels)
+
+
+@pytest.mark.parametrize("device", ["cpu", "gpu"])
+@pytest.mark.parametrize(
+    "batches",
+    [
+        [[5, 3, 5], [1, 3, 8], [8, 2], [9, 10]],
+        [["d", "b"], ["a", "d", "e"], ["c"]],
+    ],
+)
+def test_labelencoder_partial_fit(device, batches):
+    with using_device_type(device):
+        le = LabelEncoder()
+        seen = []
+        for batch in batches:
+            le.partial_fit(pd.Series(batch))
+            # earlier classes keep their codes, new ones are appended in
+            # sorted order
+            seen += sorted(set(batch) - set(seen))
+            encoded = le.transform(pd.Series(seen))
+            assert _to_list(encoded) == list(range(len(seen)))
+            assert len(le.classes_) == len(seen)
+
+
+def _to_list(values):
+    if hasattr(values, "to_arrow"):
+        return values.to_arrow().to_pylist()
+    return list(np.asarray(values))
+
+
+@pytest.mark.parametrize(
+    "labels",
+    [
+        np.array(["b", "é", "a", "b", "ccc"], dtype=object),
+        np.array([4, 2, 2, 0]),
+    ],
+)
+def test_labelencoder_host_pickle(labels):
+    with using_device_type("cpu"):
+        le = LabelEncoder().fit(labels)
+        le.partial_fit(np.array(["z"] if labels.dtype == object else [-1]))
+        le2 = pickle.loads(pickle.dumps(le))
+        np.testing.assert_array_equal(le2.classes_, le.classes_)
+        np.testing.assert_array_equal(
+            le2.transform(labels), le.transform(labels)
+        )
@@ -18,9 +18,11 @@ import platform
 from cuml.metrics.cluster import v_measure_score
 from sklearn.metrics.cluster import v_measure_score as sklearn_v_measure_score
 from scipy.special import rel_entr as scipy_kl_divergence
+from scipy.special import logsumexp as scipy_logsumexp
 from sklearn.metrics import pairwise_distances as sklearn_pairwise_distances
 from cuml.metrics import (
     pairwise_distances,
+    pairwise_distances_reduce,
     sparse_pairwise_distances,
     PAIRWISE_DISTANCE_METRICS,
     PAIRWISE_DISTANCE_SPARSE_METRICS,
@@ -29,11 +31,18 @@ from sklearn.metrics import (
     precision_recall_curve as sklearn_precision_recall_curve,
 )
 from sklearn.metrics import roc_auc_score as sklearn_roc_auc_score
+from sklearn.metrics import auc as sklearn_auc
 from cuml.metrics import log_loss
+from cuml.metrics import (
+    ConfusionMatrixAccumulator,
+    LogLossAccumulator,
+    ROCAccumulator,
+)
 from cuml.metrics import precision_recall_curve
 from cuml.metrics import roc_auc_score
 from cuml.common.sparsefuncs import csr_row_normalize_l1
 from cuml.common import has_scipy
+from cuml.common.device_selection import using_device_type
 from sklearn.metrics import mean_squared_log_error as sklearn_msle
 from sklearn.metrics import mean_absolute_error as sklearn_mae
 from cuml.metrics import confusion_matrix
@@ -869,6 +878,77 @@ def test_roc_auc_score_at_limits():
         roc_auc_score(y_true, y_pred)
 
 
+@pytest.mark.parametrize("device", ["host", "device"])
+@pytest.mark.parametrize("weighted", [False, True])
+def test_roc_auc_score_weighted(device, weighted):
+    rng = np.random.default_rng(0)
+    n_samples = 20000
+    y_true = rng.integers(0, 2, n_samples) * 2 - 1
+    y_score = np.round(rng.normal(0.2 * y_true, 1.0), 2)
+    weights = rng.random(n_samples) if weighted else None
+
+    expected = sklearn_roc_auc_score(y_true, y_score, sample_weight=weights)
+    with using_device_type(device):
+        auc = roc_auc_score(y_true, y_score, sample_weight=weights)
+        binned, bound = roc_auc_score(
+            y_true,
+            y_score,
+            sample_weight=weights,
+            n_bins=100,
+            return_error_bound=True,
+        )
+        # scores on a coarser grid than the bins are binned exactly
+        fine = roc_auc_score(
+            y_true, y_score, sample_weight=weights, n_bins=10000
+        )
+    assert_almost_equal(auc, expected)
+    assert 0 < bound < 0.05
+    assert abs(binned - expected) <= bound + 1e-12
+    assert_almost_equal(fine, expected)
+
+
+@pytest.mark.parametrize("device", ["host", "device"])
+@pytest.mark.parametrize("average", ["macro", "weighted", None])
+def test_roc_auc_score_multiclass(device, average):
+    rng = np.random.default_rng(0)
+    n_samples, n_classes = 5000, 4
+    y_true = rng.integers(0, n_classes, n_samples) * 10
+    y_score = rng.random((n_samples, n_classes))
+    y_score[np.arange(n_samples), y_true // 10] += 0.5
+    y_score /= y_score.sum(axis=1, keepdims=True)
+    weights = rng.random(n_samples)
+
+    with using_device_type(device):
+        with pytest.raises(ValueError):
+            roc_auc_score(y_true, y_score)
+        auc = roc_auc_score(
+            y_true, y_score, multi_class="ovr", average=average
+        )
+        weighted = roc_auc_score(
+            y_true,
+            y_score,
+            multi_class="ovr",
+            average=average,
+            sample_weight=weights,
+        )
+    np.testing.assert_allclose(
+        cp.asnumpy(auc) if isinstance(auc, cp.ndarray) else auc,
+        sklearn_roc_auc_score(
+            y_true, y_score, multi_class="ovr", average=average
+        ),
+    )
+    np.testing.assert_allclose(
+        cp.asnumpy(weighted) if isinstance(weighted, cp.ndarray) else weighted,
+        sklearn_roc_auc_score(
+            y_true,
+            y_score,
+            multi_class="ovr",
+            average=average,
+            sample_weight=weights,
+        ),
+    )
+
+
 @pytest.mark.skip(
     reason="shape discrepancy with sklearn 1.2"
     "https://github.com/rapidsai/cuml/issues/5164"
@@ -1096,6 +1176,90 @@ def test_pairwise_distances(metric: str, matrix_size, is_col_major):
         pairwise_distances(X, Y, metric=metric.capitalize())
 
 
+@pytest.mark.parametrize("device", ["host", "device"])
+@pytest.mark.parametrize("metric", PAIRWISE_DISTANCE_METRICS.keys())
+def test_pairwise_distances_reduce(device, metric, monkeypatch):
+    # small tiles, so that rows and columns are reduced over several tiles
+    monkeypatch.setattr(
+        "cuml.metrics._pairwise_reduce._MAX_TILE_ELEMENTS", 1 << 10
+    )
+    monkeypatch.setattr("cuml.metrics._pairwise_reduce._ROW_TILE", 7)
+    rng = np.random.RandomState(0)
+    X = prep_dense_array(rng.random_sample((50, 6)), metric=metric)
+    Y = prep_dense_array(rng.random_sample((300, 6)), metric=metric)
+    D = ref_dense_pairwise_dist(X, Y, metric=metric)
+
+    def reduce_to_host(reduce, **kwargs):
+        with using_device_type(device):
+            out = pairwise_distances_reduce(
+                X, Y, metric, reduce, convert_dtype=False, **kwargs
+            )
+        if isinstance(out, tuple):
+            return tuple(cp.asnumpy(a) for a in out)
+        return cp.asnumpy(out)
+
+    def assert_close(a, b):
+        np.testing.assert_allclose(a, b, rtol=1e-5, atol=1e-5)
+
+    assert_close(reduce_to_host("min"), D.min(axis=1))
+    idx = reduce_to_host("argmin")
+    assert_close(D[np.arange(len(D)), idx], D.min(axis=1))
+    distances, indices = reduce_to_host("topk", k=5)
+    assert_close(distances, np.sort(D, axis=1)[:, :5])
+    assert_close(np.take_along_axis(D, indices, axis=1), distances)
+    assert_close(reduce_to_host("sum"), D.sum(axis=1))
+    assert_close(
+        reduce_to_host("logsumexp", gamma=2.0),
+        scipy_logsumexp(-2.0 * D, axis=1),
+    )
+
+    starts = []
+
+    def reduce_func(D_chunk, start):
+        starts.append(start)
+        return D_chunk.max(axis=1), D_chunk.argmax(axis=1)
+
+    top, idx = reduce_to_host(reduce_func)
+    assert_close(top, D.max(axis=1))
+    assert_close(D[np.arange(len(D)), idx], D.max(axis=1))
+    assert min(starts) == 0 and len(starts) > 1
+
+
+@pytest.mark.parametrize("device", ["gpu", "cpu"])
+@pytest.mark.parametrize("tile_elements", [1 << 4, 1 << 10, 1 << 22])
+def test_pairwise_distances_reduce_topk_ties(
+    device, tile_elements, monkeypatch
+):
+    monkeypatch.setattr(
+        "cuml.metrics._pairwise_reduce._MAX_TILE_ELEMENTS", tile_elements
+    )
+    # all the distances are equal, except the one to the last point
+    Y = np.zeros((3000, 2))
+    Y[-1] = 1.0
+    X = np.ones((2, 2))
+    with using_device_type(device):
+        distances, indices = pairwise_distances_reduce(
+            X, Y, reduce="topk", k=3, convert_dtype=False
+        )
+    np.testing.assert_array_equal(cp.asnumpy(indices), [[2999, 0, 1]] * 2)
+    np.testing.assert_allclose(
+        cp.asnumpy(distances), [[0.0, np.sqrt(2), np.sqrt(2)]] * 2
+    )
+
+
+def test_pairwise_distances_reduce_errors():
+    X = np.array([[0.0, 0.0], [4.0, 4.0]])
+    Y = np.array([[1.0, 0.0], [3.0, 3.0], [5.0, 5.0]])
+    with pytest.raises(ValueError):
+        pairwise_distances_reduce(X, Y, metric="unknown")
+    with pytest.raises(ValueError):
+        pairwise_distances_reduce(X, Y, reduce="max")
+    with pytest.raises(ValueError):
+        pairwise_distances_reduce(X, Y, reduce="topk", k=4)
+    with pytest.raises(ValueError):
+        pairwise_distances_reduce(X, np.ones((3, 3)))
+
+
 @pytest.mark.parametrize("metric", PAIRWISE_DISTANCE_METRICS.keys())
 @pytest.mark.parametrize(
     "matrix_size",
@@ -1666,3 +1830,129 @@ def test_v_measure_score(beta):
     res = v_measure_score(labels_true, labels_pred, beta=beta)
     ref = sklearn_v_measure_score(labels_true, labels_pred, beta=beta)
     assert_almost_equal(res, ref)
+
+
+def _chunks(n_samples, n_chunks, rng):
+    bounds = np.sort(rng.choice(np.arange(1, n_samples), n_chunks - 1))
+    return np.split(np.arange(n_samples), bounds)
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+@pytest.mark.parametrize("labels", [None, [3, 0, 2]])
+def test_confusion_matrix_accumulator(weighted, labels):
+    rng = np.random.default_rng(0)
+    n_samples = 1000
+    y_true = rng.integers(0, 5, n_samples)
+    y_pred = np.where(
+        rng.random(n_samples) < 0.7, y_true, rng.integers(0, 5, n_samples)
+    )
+    weights = rng.random(n_samples) if weighted else None
+
+    # chunks of samples sorted by label see different labels, their
+    # accumulators are merged in a tree
+    order = np.argsort(y_true, kind="stable")
+    accs = []
+    for idx in _chunks(n_samples, 8, rng):
+        idx = order[idx]
+        acc = ConfusionMatrixAccumulator(labels=labels)
+        accs.append(
+            acc.update(
+                y_true[idx],
+                y_pred[idx],
+                None if weights is None else weights[idx],
+            )
+        )
+    while len(accs) > 1:
+        accs = [a.merge(b) for a, b in zip(accs[::2], accs[1::2])]
+    acc = accs[0]
+
+    expected = sk_confusion_matrix(
+        y_true, y_pred, labels=labels, sample_weight=weights
+    )
+    np.testing.assert_allclose(acc.result(), expected)
+    assert acc.result().dtype.kind == ("f" if weighted else "i")
+    np.testing.assert_allclose(
+        acc.result(normalize="true"),
+        sk_confusion_matrix(
+            y_true,
+            y_pred,
+            labels=labels,
+            sample_weight=weights,
+            normalize="true",
+        ),
+    )
+    if labels is None:
+        assert_almost_equal(
+            acc.accuracy(),
+            sk_acc_score(y_true, y_pred, sample_weight=weights),
+        )
+
+    with pytest.raises(ValueError):
+        acc.merge(ConfusionMatrixAccumulator(labels=[0, 1]))
+
+
+@pytest.mark.parametrize("n_classes", [2, 4])
+def test_log_loss_accumulator(n_classes):
+    rng = np.random.default_rng(0)
+    n_samples = 1000
+    y_true = rng.integers(0, n_classes, n_samples)
+    y_pred = rng.random((n_samples, n_classes))
+    y_pred /= y_pred.sum(axis=1, keepdims=True)
+    if n_classes == 2:
+        y_pred = y_pred[:, 1]
+    weights = rng.random(n_samples)
+
+    acc = LogLossAccumulator()
+    weighted = LogLossAccumulator()
+    for idx in _chunks(n_samples, 5, rng):
+        acc.merge(LogLossAccumulator().update(y_true[idx], y_pred[idx]))
+        weighted.update(y_true[idx], y_pred[idx], weights[idx])
+
+    assert_almost_equal(acc.result(), sklearn_log_loss(y_true, y_pred))
+    assert_almost_equal(
+        acc.result(normalize=False),
+        sklearn_log_loss(y_true, y_pred, normalize=False),
+    )
+    assert_almost_equal(
+        weighted.result(),
+        sklearn_log_loss(y_true, y_pred, sample_weight=weights),
+    )
+
+    with pytest.raises(ValueError):
+        acc.update(y_true[:10], rng.random((10, n_classes + 1)))
+
+
+def test_roc_accumulator():
+    rng = np.random.default_rng(0)
+    n_samples = 10000
+    y_true = rng.integers(0, 2, n_samples)
+    y_score = np.clip(rng.normal(0.4 + 0.2 * y_true, 0.2), 0, 1)
+    weights = rng.random(n_samples)
+
+    acc = ROCAccumulator(n_bins=1000)
+    weighted = ROCAccumulator(n_bins=1000)
+    for idx in _chunks(n_samples, 5, rng):
+        acc.merge(
+            ROCAccumulator(n_bins=1000).update(y_true[idx], y_score[idx])
+        )
+        weighted.update(y_true[idx], y_score[idx], weights[idx])
+
+    expected = sklearn_roc_auc_score(y_true, y_score)
+    assert 0 < acc.error_bound() < 1e-3
+    assert abs(acc.result() - expected) <= acc.error_bound()
+    expected = sklearn_roc_auc_score(y_true, y_score, sample_weight=weights)
+    assert abs(weighted.result() - expected) <= weighted.error_bound()
+
+    fpr, tpr, _ = acc.roc_curve()
+    assert_almost_equal(sklearn_auc(fpr, tpr), acc.result())
+
+    # the area is exact for scores on a grid coarser than the bins
+    y_score = np.round(y_score, 2)
+    acc = ROCAccumulator(n_bins=1000).update(y_true, y_score)
+    assert acc.error_bound() == 0
+    assert_almost_equal(acc.result(), sklearn_roc_auc_score(y_true, y_score))
+
+    with pytest.raises(ValueError):
+        acc.merge(ROCAccumulator(n_bins=100))
+    with pytest.raises(ValueError):
+        ROCAccumulator().update(np.zeros(10), y_score[:10]).result()
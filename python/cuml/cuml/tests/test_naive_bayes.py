@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2020-2023, NVIDIA CORPORATION.
+# Copyright (c) 2020-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -23,6 +23,7 @@ from sklearn.naive_bayes import BernoulliNB as skBNB
 from sklearn.naive_bayes import MultinomialNB as skNB
 from numpy.testing import assert_array_almost_equal, assert_raises
 from numpy.testing import assert_allclose, assert_array_equal
+from cuml.common.device_selection import using_device_type
 from cuml.datasets import make_classification
 from cuml.internals.input_utils import sparse_scipy_to_cp
 from cuml.naive_bayes import GaussianNB
@@ -339,6 +340,102 @@ def test_complement_partial_fit(x_dtype, y_dtype, norm):
     assert_allclose(y_hat, y_sk, rtol=rtol)
 
 
+@pytest.mark.parametrize(
+    "cls, sk_cls, params",
+    [
+        (MultinomialNB, skNB, {}),
+        (MultinomialNB, skNB, {"fit_prior": False}),
+        (BernoulliNB, skBNB, {"binarize": 1.0}),
+        (ComplementNB, skComplementNB, {"norm": True}),
+    ],
+)
+@pytest.mark.parametrize("is_sparse", [True, False])
+def test_discrete_host(cls, sk_cls, params, is_sparse, nlp_20news):
+    X, y = nlp_20news
+    X = X.tocsr()[:2000, :5000].astype(np.float32)
+    y = y[:2000].get()
+    if not is_sparse:
+        X = X.toarray()
+
+    with using_device_type("cpu"):
+        model = cls(**params).fit(X, y)
+        proba = model.predict_proba(X)
+        y_hat = model.predict(X)
+    sk_model = sk_cls(**params).fit(X, y)
+
+    assert isinstance(model.feature_count_, np.ndarray)
+    assert_array_equal(model.feature_count_, sk_model.feature_count_)
+    assert_allclose(model.feature_log_prob_, sk_model.feature_log_prob_)
+    assert_allclose(proba, sk_model.predict_proba(X), atol=1e-6, rtol=1e-4)
+    assert_array_equal(y_hat, sk_model.predict(X))
+
+
+@pytest.mark.parametrize("host", [True, False])
+def test_multinomial_fit_iter(host, nlp_20news):
+    X, y = nlp_20news
+    X = X.tocsr().astype(np.float32)
+    y = y.get()
+    chunks = (
+        (X[i : i + 3000], y[i : i + 3000]) for i in range(0, X.shape[0], 3000)
+    )
+
+    with using_device_type("cpu" if host else "gpu"):
+        model = MultinomialNB().fit_iter(chunks, classes=np.unique(y))
+        # log probabilities are only computed once needed
+        assert "feature_log_prob_" not in model.__dict__
+        proba = model.predict_proba(X[:1000])
+    sk_model = skNB().fit(X, y)
+
+    assert_allclose(
+        cp.asnumpy(model.feature_count_), sk_model.feature_count_, rtol=1e-6
+    )
+    assert_allclose(
+        cp.asnumpy(proba),
+        sk_model.predict_proba(X[:1000]),
+        atol=1e-6,
+        rtol=1e-3,
+    )
+
+    with using_device_type("cpu"):
+        with pytest.raises(ValueError):
+            MultinomialNB().fit_iter([(X[:10], y[:10])]).partial_fit(
+                X[:10], y[:10] + 100
+            )
+
+
+@pytest.mark.parametrize("host", [True, False])
+@pytest.mark.parametrize("cls", [MultinomialNB, ComplementNB, GaussianNB])
+def test_predict_topk_and_batches(host, cls, nlp_20news):
+    X, y = nlp_20news
+    X = X.tocsr()[:2000, :5000].astype(np.float32)
+    y = y[:2000].get()
+
+    with using_device_type("cpu" if host else "gpu"):
+        model = cls().fit(X, y)
+        log_proba = cp.asnumpy(model.predict_log_proba(X[:300]))
+        batched = model.predict_log_proba(X[:300], batch_size=64)
+        proba = model.predict_proba(X[:300], batch_size=64)
+        classes, top_log_proba = model.predict_topk(
+            X[:300], k=3, class_batch_size=7
+        )
+
+    assert_allclose(cp.asnumpy(batched), log_proba, rtol=1e-6, atol=1e-6)
+    assert_allclose(cp.asnumpy(proba), np.exp(log_proba), atol=1e-6)
+    assert_allclose(
+        cp.asnumpy(top_log_proba),
+        -np.sort(-log_proba, axis=1)[:, :3],
+        rtol=1e-5,
+        atol=1e-5,
+    )
+    indices = np.searchsorted(np.unique(y), cp.asnumpy(classes))
+    assert_allclose(
+        np.take_along_axis(log_proba, indices, axis=1),
+        cp.asnumpy(top_log_proba),
+        rtol=1e-5,
+        atol=1e-5,
+    )
+
+
 def test_gaussian_basic():
     # Data is just 6 separable points in the plane
     X = cp.array(
@@ -493,6 +590,68 @@ def test_gaussian_parameters(priors, var_smoothing, nlp_20news):
     assert_array_equal(y_hat, y_hat_sk)
 
 
+@pytest.mark.parametrize("is_sparse", [True, False])
+def test_gaussian_host(is_sparse, nlp_20news):
+    X, y = nlp_20news
+    X = X.tocsr()[:1000, :3000].astype(np.float64)
+    y = y[:1000].get()
+    X_dense = X.toarray()
+    if not is_sparse:
+        X = X_dense
+
+    with using_device_type("cpu"):
+        model = GaussianNB().fit(X, y)
+        log_proba = model.predict_log_proba(X)
+        chunked = GaussianNB()
+        for i in range(0, 1000, 300):
+            chunked.partial_fit(
+                X[i : i + 300], y[i : i + 300], classes=np.unique(y)
+            )
+    model_sk = skGNB().fit(X_dense, y)
+
+    assert isinstance(model.theta_, np.ndarray)
+    assert_allclose(model.theta_, model_sk.theta_, rtol=1e-6)
+    assert_allclose(model.sigma_, model_sk.var_, rtol=1e-5)
+    assert_allclose(
+        log_proba, model_sk.predict_log_proba(X_dense), rtol=1e-4, atol=1e-4
+    )
+    assert_allclose(chunked.theta_, model_sk.theta_, rtol=1e-6)
+    assert_allclose(
+        chunked.sigma_ - chunked.epsilon_,
+        model_sk.var_ - model_sk.epsilon_,
+        rtol=1e-5,
+        atol=1e-8,
+    )
+
+
+@pytest.mark.parametrize("host", [True, False])
+def test_gaussian_merge(host, nlp_20news):
+    X, y = nlp_20news
+    X = X.tocsr()[:1000, :3000].astype(np.float64)
+    y = y[:1000].get()
+    classes = np.unique(y)
+
+    with using_device_type("cpu" if host else "gpu"):
+        model = GaussianNB().partial_fit(X[:400], y[:400], classes=classes)
+        other = GaussianNB().partial_fit(X[400:], y[400:], classes=classes)
+        model.merge(other)
+        full = GaussianNB().fit(X, y)
+
+        with pytest.raises(ValueError):
+            model.merge(GaussianNB().fit(X[:, :10], y))
+
+    assert_allclose(
+        cp.asnumpy(model.class_count_), cp.asnumpy(full.class_count_)
+    )
+    assert_allclose(cp.asnumpy(model.theta_), cp.asnumpy(full.theta_))
+    assert_allclose(
+        cp.asnumpy(model.sigma_ - model.epsilon_),
+        cp.asnumpy(full.sigma_ - full.epsilon_),
+        rtol=1e-5,
+        atol=1e-8,
+    )
+
+
 @pytest.mark.parametrize("x_dtype", [cp.int32, cp.float32, cp.float64])
 @pytest.mark.parametrize("y_dtype", [cp.int32, cp.int64])
 @pytest.mark.parametrize("is_sparse", [True, False])
@@ -532,6 +691,34 @@ def test_categorical(x_dtype, y_dtype, is_sparse, nlp_20news):
     assert sk_score - THRES <= cuml_score <= sk_score + THRES
 
 
+@pytest.mark.parametrize("is_sparse", [True, False])
+def test_categorical_predict_topk(is_sparse, nlp_20news):
+    X, y = nlp_20news
+    X = sparse_scipy_to_cp(X, dtype=cp.float32)
+    X = X.tocsr()[:500, :400]
+    y = y[:500]
+    if not is_sparse:
+        X = X.todense()
+
+    model = CategoricalNB().fit(X, y)
+    log_proba = cp.asnumpy(model.predict_log_proba(X))
+    classes, top_log_proba = model.predict_topk(X, k=3, class_batch_size=7)
+
+    assert_allclose(
+        cp.asnumpy(top_log_proba),
+        -np.sort(-log_proba, axis=1)[:, :3],
+        rtol=1e-5,
+        atol=1e-5,
+    )
+    indices = cp.asnumpy(cp.searchsorted(model.classes_, classes))
+    assert_allclose(
+        np.take_along_axis(log_proba, indices, axis=1),
+        cp.asnumpy(top_log_proba),
+        rtol=1e-5,
+        atol=1e-5,
+    )
+
+
 @pytest.mark.parametrize("x_dtype", [cp.int32, cp.float32, cp.float64])
 @pytest.mark.parametrize("y_dtype", [cp.int32, cp.int64])
 @pytest.mark.parametrize("is_sparse", [True, False])
@@ -31,6 +31,8 @@ from cuml.testing.utils import (
     stress_param,
 )
 from cuml.neighbors import NearestNeighbors as cuKNN
+from cuml.neighbors import KNNGraph
+from cuml.common.device_selection import using_device_type
 
 from sklearn.neighbors import NearestNeighbors as skKNN
 from cuml.datasets import make_blobs
@@ -325,6 +327,317 @@ def test_ann_distances_metrics(algo, metric, request):
     assert bool(array_equal(sk_dist, cu_dist))
 
 
+@pytest.mark.parametrize(
+    "metric",
+    ["euclidean", "sqeuclidean", "cosine", "correlation", "inner_product"],
+)
+def test_ivfflat_host(metric):
+    from sklearn.datasets import make_blobs as sk_make_blobs
+
+    X, _ = sk_make_blobs(
+        n_samples=2000, centers=10, n_features=16, random_state=0
+    )
+    X = X.astype(np.float32)
+    # probing every list is an exhaustive search
+    algo_params = {"nlist": 8, "nprobe": 8}
+    with using_device_type("cpu"):
+        knn_cu = cuKNN(
+            algorithm="ivfflat", metric=metric, algo_params=algo_params
+        )
+        knn_cu.fit(X)
+        dist, ind = knn_cu.kneighbors(X[:100], n_neighbors=5)
+
+    if metric == "inner_product":
+        scores = X[:100] @ X.T
+        ref_ind = np.argsort(-scores, axis=1)[:, :5]
+        ref_dist = np.take_along_axis(scores, ref_ind, axis=1)
+    else:
+        ref_dist, ref_ind = (
+            skKNN(metric=metric, algorithm="brute")
+            .fit(X)
+            .kneighbors(X[:100], n_neighbors=5)
+        )
+    assert_array_equal(ind, ref_ind)
+    assert_allclose(dist, ref_dist, rtol=1e-3, atol=1e-3)
+
+
+@pytest.mark.parametrize("algo", ["ivfflat", "ivfpq"])
+def test_ivf_host_pred(algo):
+    from sklearn.datasets import make_blobs as sk_make_blobs
+
+    X, y = sk_make_blobs(
+        n_samples=4000, centers=5, n_features=64, random_state=0
+    )
+    algo_params = {"nlist": 8, "nprobe": 2}
+    if algo == "ivfpq":
+        algo_params.update(M=16, n_bits=4, usePrecomputedTables=False)
+    with using_device_type("cpu"):
+        knn_cu = cuKNN(algorithm=algo, algo_params=algo_params)
+        knn_cu.fit(X)
+        neigh_ind = knn_cu.kneighbors(X, n_neighbors=8, return_distance=False)
+        graph = knn_cu.kneighbors_graph(X[:10], n_neighbors=8)
+
+    labels, probs = predict(neigh_ind, y, 8)
+    assert array_equal(labels, y)
+    assert graph.shape == (10, 4000)
+    assert graph.nnz == 80
+
+
+def test_ivf_host_graph_missing_neighbors():
+    rng = np.random.RandomState(0)
+    X = rng.randn(200, 8).astype(np.float32)
+    # a query probing a single list can find fewer than n_neighbors vectors
+    with using_device_type("cpu"):
+        knn_cu = cuKNN(
+            algorithm="ivfflat", algo_params={"nlist": 16, "nprobe": 1}
+        )
+        knn_cu.fit(X)
+        ind = knn_cu.kneighbors(X, n_neighbors=30, return_distance=False)
+        graph = knn_cu.kneighbors_graph(X, n_neighbors=30, mode="distance")
+
+    found = ind >= 0
+    assert not found.all()
+    assert graph.nnz == found.sum()
+    assert_array_equal(np.diff(graph.indptr), found.sum(axis=1))
+    assert_array_equal(graph.indices, ind[found])
+
+
+@pytest.mark.parametrize("algo", ["ivfflat", "ivfpq"])
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_host_index(tmp_path, algo, mmap):
+    rng = np.random.RandomState(0)
+    X = rng.randn(2000, 16).astype(np.float32)
+    algo_params = {"nlist": 16, "nprobe": 4}
+    if algo == "ivfpq":
+        algo_params.update(M=4, n_bits=6, usePrecomputedTables=False)
+    path = tmp_path / "index.bin"
+    with using_device_type("cpu"):
+        knn_cu = cuKNN(algorithm=algo, algo_params=algo_params).fit(X)
+        dist, ind = knn_cu.kneighbors(X[:50])
+        knn_cu.save_index(path)
+
+        loaded = cuKNN.load_index(path, mmap=mmap)
+        loaded_dist, loaded_ind = loaded.kneighbors(X[:50])
+
+    assert loaded.n_samples_fit_ == 2000
+    assert_array_equal(loaded_ind, ind)
+    assert_array_equal(loaded_dist, dist)
+
+
+def test_save_load_index(tmp_path):
+    X, _ = make_blobs(n_samples=500, n_features=3, random_state=0)
+    knn_cu = cuKNN(n_neighbors=4, algorithm="rbc").fit(X)
+    path = tmp_path / "index.bin"
+    knn_cu.save_index(path)
+
+    loaded = cuKNN.load_index(path)
+    assert loaded.n_neighbors == 4
+    assert loaded.algorithm == "rbc"
+    dist, ind = knn_cu.kneighbors(X)
+    loaded_dist, loaded_ind = loaded.kneighbors(X)
+    assert array_equal(loaded_ind, ind)
+    assert array_equal(loaded_dist, dist)
+
+    with pytest.raises(ValueError, match="not a cuML index file"):
+        X.get().tofile(path)
+        cuKNN.load_index(path)
+    with pytest.raises(ValueError, match="not been fitted"):
+        cuKNN().save_index(path)
+
+
+@pytest.mark.parametrize("algo", ["brute", "ivfflat"])
+def test_save_load_index_ids(tmp_path, algo):
+    rng = np.random.RandomState(0)
+    X = rng.randn(1000, 8).astype(np.float32)
+    params = {"nlist": 8, "nprobe": 8} if algo == "ivfflat" else None
+    path = tmp_path / "index.bin"
+    with using_device_type("cpu"):
+        knn_cu = cuKNN(n_neighbors=4, algorithm=algo, algo_params=params)
+        knn_cu.fit(X[:800])
+        knn_cu.partial_fit(X[800:], ids=np.arange(5000, 5200))
+        knn_cu.remove(np.arange(0, 800, 2))
+        knn_cu.save_index(path)
+
+        loaded = cuKNN.load_index(path)
+        assert_array_equal(loaded.ids_, knn_cu.ids_)
+        # identifiers still designate the same vectors after a round trip
+        knn_cu.remove(np.arange(5000, 5100))
+        loaded.remove(np.arange(5000, 5100))
+        dist, ind = knn_cu.kneighbors(X[:50])
+        loaded_dist, loaded_ind = loaded.kneighbors(X[:50])
+
+    assert_array_equal(loaded.ids_, knn_cu.ids_)
+    assert_array_equal(loaded_ind, ind)
+    assert_allclose(loaded_dist, dist)
+
+
+@pytest.mark.parametrize(
+    "algo, device", [("brute", "gpu"), ("rbc", "gpu"), ("brute", "cpu")]
+)
+def test_partial_fit_remove(algo, device):
+    X, _ = make_blobs(n_samples=2000, n_features=3, random_state=0)
+    with using_device_type(device):
+        knn_cu = cuKNN(n_neighbors=4, algorithm=algo).fit(X[:1500])
+        knn_cu.partial_fit(X[1500:], ids=cp.arange(5000, 5500))
+        assert knn_cu.n_samples_fit_ == 2000
+        assert_array_equal(knn_cu.ids_[1499:1502], [1499, 5000, 5001])
+
+        removed = np.arange(0, 2000, 7)
+        knn_cu.remove(knn_cu.ids_[removed])
+        remaining = X[cp.asarray(np.delete(np.arange(2000), removed))]
+        ref = cuKNN(n_neighbors=4, algorithm=algo).fit(remaining)
+        dist, ind = knn_cu.kneighbors(X[:100])
+        ref_dist, ref_ind = ref.kneighbors(X[:100])
+        assert knn_cu.n_samples_fit_ == remaining.shape[0]
+        assert array_equal(ind, ref_ind)
+        assert array_equal(dist, ref_dist)
+
+        with pytest.raises(ValueError, match="unique"):
+            knn_cu.partial_fit(X[:2], ids=[5000, 6000])
+        with pytest.raises(ValueError, match="not in the index"):
+            knn_cu.remove([0])
+
+        knn_cu.fit(X)
+        assert_array_equal(knn_cu.ids_, np.arange(2000))
+
+
+@pytest.mark.parametrize("algo", ["ivfflat", "ivfpq"])
+def test_partial_fit_remove_host_ivf(algo):
+    rng = np.random.RandomState(0)
+    X = rng.randn(3000, 16).astype(np.float32)
+    algo_params = {"nlist": 16, "nprobe": 16}
+    if algo == "ivfpq":
+        algo_params.update(M=4, n_bits=6, usePrecomputedTables=False)
+    removed = rng.choice(3000, 700, replace=False)
+    with using_device_type("cpu"):
+        knn_cu = cuKNN(n_neighbors=5, algorithm=algo, algo_params=algo_params)
+        knn_cu.fit(X)
+        dist, ind = knn_cu.kneighbors(X[:100])
+        # removing vectors and adding them back is a no-op
+        knn_cu.remove(removed[:50])
+        knn_cu.remove(removed[50:])
+        assert knn_cu.n_samples_fit_ == 2300
+        knn_cu.partial_fit(X[removed], ids=removed)
+        new_dist, new_ind = knn_cu.kneighbors(X[:100])
+
+    assert knn_cu.n_samples_fit_ == 3000
+    assert_array_equal(knn_cu.ids_[new_ind], ind)
+    assert_allclose(new_dist, dist)
+
+
+def test_kneighbors_iter():
+    X, _ = make_blobs(n_samples=500, n_features=3, random_state=0)
+    knn_cu = cuKNN(n_neighbors=4).fit(X)
+    dist, ind = knn_cu.kneighbors(X)
+
+    batches = list(knn_cu.kneighbors_iter(X, batch_size=128))
+    assert [b[1].shape[0] for b in batches] == [128, 128, 128, 116]
+    assert array_equal(cp.vstack([b[1] for b in batches]), ind)
+    assert array_equal(cp.vstack([b[0] for b in batches]), dist)
+
+    chunks = (X[i : i + 300] for i in range(0, 500, 300))
+    batches = list(
+        knn_cu.kneighbors_iter(chunks, batch_size=256, return_distance=False)
+    )
+    assert [b.shape[0] for b in batches] == [256, 44, 200]
+    assert array_equal(cp.vstack(batches), ind)
+
+    with pytest.raises(ValueError, match="batch_size"):
+        next(knn_cu.kneighbors_iter(X, batch_size=0))
+
+
+@pytest.mark.parametrize("mode", ["connectivity", "distance"])
+def test_kneighbors_graph_to_file(tmp_path, mode):
+    X, _ = make_blobs(n_samples=500, n_features=3, random_state=0)
+    knn_cu = cuKNN(n_neighbors=4).fit(X)
+    expected = knn_cu.kneighbors_graph(X, mode=mode).get()
+    path = tmp_path / "graph.bin"
+
+    graph = knn_cu.kneighbors_graph_to_file(path, X, mode=mode, batch_size=128)
+    assert graph.shape == (500, 500)
+    assert not graph.indices.flags.writeable
+    assert_array_equal(graph.indptr, expected.indptr)
+    assert_array_equal(graph.indices, expected.indices)
+    assert_allclose(graph.data, expected.data)
+
+    loaded = cuml.neighbors.load_kneighbors_graph(path, mmap=False)
+    assert (loaded != graph).nnz == 0
+
+    chunks = (X[i : i + 300] for i in range(0, 500, 300))
+    with pytest.raises(ValueError, match="fewer than n_samples"):
+        knn_cu.kneighbors_graph_to_file(path, chunks, n_samples=600)
+
+
+def test_kneighbors_graph_to_file_missing_neighbors(tmp_path):
+    rng = np.random.RandomState(0)
+    X = rng.randn(200, 8).astype(np.float32)
+    path = tmp_path / "graph.bin"
+    # a query probing a single list can find fewer than n_neighbors vectors
+    algo_params = {"nlist": 16, "nprobe": 1}
+    with using_device_type("cpu"):
+        knn_cu = cuKNN(algorithm="ivfflat", algo_params=algo_params).fit(X)
+        ind = knn_cu.kneighbors(X, n_neighbors=30, return_distance=False)
+        graph = knn_cu.kneighbors_graph_to_file(
+            path, X, n_neighbors=30, mode="distance", batch_size=64
+        )
+
+    found = ind >= 0
+    assert not found.all()
+    assert_array_equal(np.diff(graph.indptr), found.sum(axis=1))
+    assert_array_equal(graph.indices, ind[found])
+    loaded = cuml.neighbors.load_kneighbors_graph(path, mmap=False)
+    assert (loaded != graph).nnz == 0
+
+
+@pytest.mark.parametrize("device", ["gpu", "cpu"])
+def test_knn_graph(device):
+    X, _ = make_blobs(n_samples=1000, n_features=8, random_state=0)
+    X = cp.asnumpy(X)
+    KNNGraph.clear_cache()
+
+    with using_device_type(device):
+        graph = KNNGraph.build(X, n_neighbors=16)
+        # a graph of the same data with more neighbors is truncated
+        assert KNNGraph.build(X.copy(), n_neighbors=8).n_neighbors == 8
+        assert array_equal(
+            KNNGraph.build(X, n_neighbors=8).indices, graph.indices[:, :8]
+        )
+
+        model = cuKNN(n_neighbors=5).fit(X, knn_graph=graph)
+        dists, inds = model.kneighbors()
+        ref_dists, ref_inds = cuKNN(n_neighbors=5).fit(X).kneighbors()
+
+    assert array_equal(inds, ref_inds)
+    assert_allclose(dists, ref_dists, rtol=1e-4, atol=1e-4)
+
+    with pytest.raises(ValueError, match="samples"):
+        cuKNN().fit(X[:500], knn_graph=graph)
+    with pytest.raises(ValueError, match="metric"):
+        cuKNN(metric="cosine").fit(X, knn_graph=graph)
+    with pytest.raises(ValueError, match="neighbors"):
+        graph.truncate(17)
+
+
+def test_knn_graph_duplicates():
+    rng = np.random.RandomState(0)
+    X = np.vstack([rng.random_sample((100, 2)), np.full((10, 2), 5.0)])
+    sk = skKNN(n_neighbors=6).fit(X)
+    distances, indices = sk.kneighbors(X)
+    graph = KNNGraph(indices, distances)
+
+    # duplicates can come before the sample itself in its row
+    dists, inds = graph.kneighbors(4)
+    ref_dists, ref_inds = skKNN(n_neighbors=4).fit(X).kneighbors()
+    assert not (inds == np.arange(110)[:, None]).any()
+    assert_array_equal(inds[:100], ref_inds[:100])
+    assert (inds[100:] >= 100).all()
+    assert_allclose(dists, ref_dists, atol=1e-6)
+
+    csr = graph.to_csr(include_self=False)
+    assert csr.nnz == 110 * 5
+    assert (csr.indices != np.repeat(np.arange(110), 5)).all()
+
+
 def test_return_dists():
     n_samples = 50
     n_feats = 50
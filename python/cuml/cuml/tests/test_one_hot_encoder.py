@@ -19,6 +19,7 @@ from cuml.testing.utils import (
     generate_inputs_from_categories,
 )
 from cuml.preprocessing import OneHotEncoder
+from cuml.common.device_selection import using_device_type
 from cuml.internals.safe_imports import gpu_only_import_from
 import pytest
 from cuml.internals.safe_imports import cpu_only_import
@@ -27,8 +28,10 @@ import math
 from cuml.internals.safe_imports import gpu_only_import
 
 cp = gpu_only_import("cupy")
+cupyx = gpu_only_import("cupyx")
 np = cpu_only_import("numpy")
 pd = cpu_only_import("pandas")
+scipy_sparse = cpu_only_import("scipy.sparse")
 DataFrame = gpu_only_import_from("cudf", "DataFrame")
 
 
@@ -396,6 +399,86 @@ def test_onehot_get_feature_names(as_array):
     assert np.array_equal(feature_names, feature_names_ref)
 
 
+@pytest.mark.parametrize("drop", [None, "first", {"g": "F", "i": 3}])
+@pytest.mark.parametrize("input_type", ["numpy", "pandas", "arrow"])
+def test_onehot_host_vs_skonehot(drop, input_type):
+    pa = pytest.importorskip("pyarrow")
+    with using_device_type("cpu"):
+        X = pd.DataFrame({"g": ["M", "F", "F", "X"], "i": [1, 3, 2, 3]})
+        skX = X.to_numpy()
+        if input_type == "numpy":
+            X = skX
+            if isinstance(drop, dict):
+                drop = list(drop.values())
+        elif input_type == "arrow":
+            X = pa.Table.from_pandas(X)
+
+        enc = OneHotEncoder(drop=drop)
+        skdrop = list(drop.values()) if isinstance(drop, dict) else drop
+        skohe = SkOneHotEncoder(drop=skdrop)
+
+        ohe = enc.fit_transform(X)
+        ref = skohe.fit_transform(skX)
+
+        assert isinstance(ohe, scipy_sparse.csr_matrix)
+        np.testing.assert_array_equal(ohe.toarray(), ref.toarray())
+        inv = enc.inverse_transform(ohe)
+        if input_type == "numpy":
+            np.testing.assert_array_equal(inv, skX)
+        else:
+            np.testing.assert_array_equal(inv.to_numpy(), skX)
+
+
+def test_onehot_host_handle_unknown():
+    with using_device_type("cpu"):
+        X = np.array([[0, 10], [1, 20], [2, 30]])
+        Y = np.array([[3, 10], [1, 40]])
+
+        enc = OneHotEncoder(handle_unknown="error").fit(X)
+        with pytest.raises(KeyError):
+            enc.transform(Y)
+
+        enc = OneHotEncoder(handle_unknown="ignore", sparse_output=False)
+        enc.fit(X)
+        ohe = enc.transform(Y)
+        ref = SkOneHotEncoder(handle_unknown="ignore").fit(X).transform(Y)
+        np.testing.assert_array_equal(ohe, ref.toarray())
+        inv = enc.inverse_transform(ohe)
+        assert inv[0, 0] is None and inv[1, 1] is None
+
+
+def test_onehot_host_nulls():
+    with using_device_type("cpu"):
+        X = pd.DataFrame({"g": ["M", "F", None], "i": [1.0, np.nan, 2.0]})
+        # nulls are not unknown categories, their rows have no hot column
+        enc = OneHotEncoder(handle_unknown="error", sparse_output=False)
+        ohe = enc.fit_transform(X)
+        np.testing.assert_array_equal(
+            ohe, [[0, 1, 1, 0], [1, 0, 0, 0], [0, 0, 0, 1]]
+        )
+
+        ohe = OneHotEncoder(output_type="cupy").fit(X).transform(X)
+        assert cupyx.scipy.sparse.isspmatrix_csr(ohe)
+        ohe = OneHotEncoder(output_type="numpy").fit(X).transform(X)
+        assert scipy_sparse.isspmatrix_csr(ohe)
+
+
+@pytest.mark.parametrize("n_categories", [2, 1000, 50000])
+def test_onehot_host_high_cardinality(n_categories):
+    with using_device_type("cpu"):
+        rng = np.random.default_rng(0)
+        X = rng.integers(0, n_categories, size=(10000, 3))
+        enc = OneHotEncoder()
+        ohe = enc.fit_transform(X)
+        ref = SkOneHotEncoder().fit_transform(X)
+        assert ohe.shape == ref.shape
+        assert (ohe != ref).nnz == 0
+        for cats, sk_cats in zip(
+            enc.categories_, SkOneHotEncoder().fit(X).categories_
+        ):
+            np.testing.assert_array_equal(cats, sk_cats)
+
+
 # TODO(24.08): remove this test
 def test_sparse_deprecation():
     X = cp.array([[33, 1], [34, 3], [34, 2]])
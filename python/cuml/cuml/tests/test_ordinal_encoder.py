@@ -17,6 +17,7 @@ import pandas as pd
 import pytest
 from sklearn.preprocessing import OrdinalEncoder as skOrdinalEncoder
 
+from cuml.common.device_selection import using_device_type
 from cuml.internals.safe_imports import gpu_only_import_from
 from cuml.preprocessing import OrdinalEncoder
 
@@ -133,3 +134,53 @@ def test_handle_unknown(as_array: bool) -> None:
         np.isnan(encoded[0, 0])
     else:
         assert pd.isna(encoded.iloc[0, 0])
+
+
+@pytest.mark.parametrize("input_type", ["numpy", "pandas", "arrow"])
+def test_ordinal_encoder_host(input_type) -> None:
+    pa = pytest.importorskip("pyarrow")
+    with using_device_type("cpu"):
+        X = pd.DataFrame({"cat": ["M", "F", "F", "X"], "num": [1, 3, 2, 3]})
+        skX = X.to_numpy()
+        if input_type == "numpy":
+            X = skX
+        elif input_type == "arrow":
+            X = pa.Table.from_pandas(X)
+
+        enc = OrdinalEncoder().fit(X)
+        Xt = enc.transform(X)
+        ref = skOrdinalEncoder().fit_transform(skX)
+        if input_type == "numpy":
+            assert isinstance(Xt, np.ndarray)
+        else:
+            assert isinstance(Xt, pd.DataFrame)
+            Xt = Xt.to_numpy()
+        np.testing.assert_allclose(Xt, ref)
+
+        inv = enc.inverse_transform(ref)
+        if input_type != "numpy":
+            inv = inv.to_numpy()
+        np.testing.assert_array_equal(inv, skX)
+
+
+def test_handle_unknown_host() -> None:
+    with using_device_type("cpu"):
+        X = np.array([[0], [1]])
+        Y = np.array([[3], [1]])
+
+        enc = OrdinalEncoder(handle_unknown="error").fit(X)
+        with pytest.raises(KeyError):
+            enc.transform(Y)
+
+        enc = OrdinalEncoder(handle_unknown="ignore").fit(X)
+        encoded = enc.transform(Y)
+        assert np.isnan(encoded[0, 0])
+        assert encoded[1, 0] == 1
+
+
+def test_nulls_host() -> None:
+    with using_device_type("cpu"):
+        X = np.array([["a"], [None], ["b"]], dtype=object)
+        # nulls are not unknown categories, they are encoded as NaN
+        encoded = OrdinalEncoder(handle_unknown="error").fit_transform(X)
+        np.testing.assert_array_equal(encoded, [[0.0], [np.nan], [1.0]])
@@ -447,6 +447,64 @@ def test_imputer_sparse(sparse_imputer_dataset, strategy):  # noqa: F811
     assert_allclose(t_X, sk_t_X)
 
 
+@pytest.mark.parametrize(
+    "strategy", ["mean", "median", "most_frequent", "constant"]
+)
+@pytest.mark.parametrize("missing_values", [0, np.nan])
+@pytest.mark.parametrize("add_indicator", [False, True])
+def test_imputer_partial_fit(
+    int_dataset, strategy, missing_values, add_indicator  # noqa: F811
+):
+    zero_filled, _, nan_filled = int_dataset
+    X_np, _ = zero_filled if missing_values == 0 else nan_filled
+    X_np = np.asarray(X_np, dtype=np.float64)
+
+    params = dict(
+        missing_values=missing_values,
+        strategy=strategy,
+        fill_value=3,
+        add_indicator=add_indicator,
+    )
+    imputer = cuSimpleImputer(**params)
+    for chunk in np.array_split(X_np, 4):
+        imputer.partial_fit(chunk)
+    assert imputer.n_samples_seen_ == X_np.shape[0]
+
+    # imputers fitted on separate partitions can be combined
+    merged = cuSimpleImputer(**params)
+    for part in np.array_split(X_np, 3):
+        merged.merge(cuSimpleImputer(**params).partial_fit(part))
+
+    sk_t_X = skSimpleImputer(**params).fit_transform(X_np)
+    assert_allclose(imputer.transform(X_np), sk_t_X)
+    assert_allclose(merged.transform(X_np), sk_t_X)
+
+
+def test_imputer_partial_fit_large_int():
+    # int64 modes above 2**53 are not representable as float64
+    X = cp.array([[2**60 + 1, 3], [2**60 + 1, -1], [5, 3]], dtype=cp.int64)
+    imputer = cuSimpleImputer(missing_values=-1, strategy="most_frequent")
+    imputer.partial_fit(X[:2]).partial_fit(X[2:])
+    assert [int(v) for v in imputer.statistics_] == [2**60 + 1, 3]
+
+
+@pytest.mark.parametrize("strategy", ["mean", "median", "most_frequent"])
+def test_imputer_partial_fit_sparse(
+    sparse_imputer_dataset, strategy  # noqa: F811
+):
+    missing_values, X_sp, X = sparse_imputer_dataset
+    X_sp = X_sp.tocsr()
+
+    imputer = cuSimpleImputer(missing_values=missing_values, strategy=strategy)
+    for start in range(0, X_sp.shape[0], 30):
+        imputer.partial_fit(X_sp[start : start + 30].tocsc())
+
+    sk_imputer = skSimpleImputer(
+        missing_values=missing_values, strategy=strategy
+    ).fit(X_sp)
+    assert_allclose(imputer.statistics_, sk_imputer.statistics_)
+
+
 @pytest.mark.parametrize("degree", [2, 3])
 @pytest.mark.parametrize("interaction_only", [True, False])
 @pytest.mark.parametrize("include_bias", [True, False])
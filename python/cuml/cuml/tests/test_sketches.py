@@ -0,0 +1,117 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from cuml.common.sketches import (
+    CountMinSketch,
+    FrequentItemsSketch,
+    QuantileSketch,
+)
+
+import pytest
+from cuml.internals.safe_imports import cpu_only_import
+
+np = cpu_only_import("numpy")
+
+
+@pytest.mark.parametrize("n_rows", [1, 2, 101, 1000])
+def test_quantile_sketch_exact(n_rows):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(n_rows, 3))
+    weights = (rng.random(X.shape) > 0.2).astype(np.float64)
+    weights[0] = 1
+    weights[:, 2] = 0
+
+    sketch = QuantileSketch(3, size=4096)
+    for chunk, w in zip(np.array_split(X, 5), np.array_split(weights, 5)):
+        sketch.update(chunk, w)
+
+    expected = [np.median(X[weights[:, j] > 0, j]) for j in range(2)]
+    median = sketch.median()
+    np.testing.assert_allclose(median[:2], expected)
+    assert np.isnan(median[2])
+
+
+def test_quantile_sketch_approximate_merge():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(20000, 2))
+    sketches = [
+        QuantileSketch(2, size=128).update(part)
+        for part in np.array_split(X, 8)
+    ]
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+    assert merged.values.shape == (128, 2)
+    np.testing.assert_array_equal(merged.total_weight, [20000, 20000])
+
+    for q in [0.1, 0.5, 0.9]:
+        ranks = (X < merged.quantile(q)).mean(axis=0)
+        np.testing.assert_allclose(ranks, q, atol=0.05)
+
+
+def test_quantile_sketch_weighted_point():
+    # a heavy point, such as the implicit zeros of a sparse column, keeps
+    # its exact value through compaction
+    rng = np.random.default_rng(0)
+    values = np.r_[rng.normal(3, 1, 500), 0.0][:, None]
+    weights = np.r_[np.ones(500), 2000.0][:, None]
+    sketch = QuantileSketch(1, size=16).update(values, weights)
+    assert sketch.median()[0] == 0.0
+
+
+def test_frequent_items_sketch():
+    rng = np.random.default_rng(0)
+    data = np.r_[np.full(3000, 7), rng.integers(0, 1000, 5000)]
+    rng.shuffle(data)
+
+    sketches = [
+        FrequentItemsSketch(size=8).update(part)
+        for part in np.array_split(data, 10)
+    ]
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+    assert len(merged.items) <= 8
+    assert merged.most_frequent() == 7
+    count = merged.counts[merged.items == 7][0]
+    assert 3000 - len(data) / 9 <= count <= 3000
+
+    exact = FrequentItemsSketch(size=100).update(np.array([3, 1, 3, 1, 2]))
+    assert exact.most_frequent() == 1
+    assert FrequentItemsSketch().most_frequent(default=-1) == -1
+
+
+def test_count_min_sketch():
+    rng = np.random.default_rng(0)
+    data = rng.zipf(1.5, 20000) % 5000
+    items, counts = np.unique(data, return_counts=True)
+
+    sketches = [
+        CountMinSketch(width=512).update(part)
+        for part in np.array_split(data, 4)
+    ]
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+    assert merged.total_count == len(data)
+
+    estimates = merged.query(items)
+    assert np.all(estimates >= counts)
+    assert np.all(estimates - counts <= np.e * len(data) / 512)
+
+    weighted = CountMinSketch(width=512).update(items, counts)
+    np.testing.assert_array_equal(weighted.table, merged.table)
+
+    with pytest.raises(ValueError):
+        merged.merge(CountMinSketch(width=512, seed=1))
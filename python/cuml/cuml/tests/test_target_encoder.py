@@ -1,4 +1,4 @@
-# Copyright (c) 2019-2023, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -16,6 +16,7 @@ import pytest
 from cuml.testing.utils import array_equal
 from cuml.internals.safe_imports import cpu_only_import
 from cuml.preprocessing.TargetEncoder import TargetEncoder
+from cuml.common.device_selection import using_device_type
 from cuml.internals.safe_imports import gpu_only_import
 
 cudf = gpu_only_import("cudf")
@@ -314,3 +315,57 @@ def test_targetencoder_median():
     train_encoded = encoder.transform(train.category)
 
     assert array_equal(train_encoded, answer)
+
+
+def test_targetencoder_median_single_fold_category():
+    # category 1 only appears in fold 0, so it has no out-of-fold values
+    x = np.array([0, 0, 0, 0, 0, 0, 1, 1])
+    y = np.arange(8.0)
+    fold_ids = np.array([0, 1, 0, 1, 0, 1, 0, 0])
+    encoder = TargetEncoder(n_folds=2, split_method="customize", stat="median")
+    train_encoded = encoder.fit_transform(x, y, fold_ids=fold_ids)
+    answer = np.array([3.0, 2.0, 3.0, 2.0, 3.0, 2.0, 3.5, 3.5])
+    assert array_equal(train_encoded, answer)
+
+
+@pytest.mark.parametrize("stat", ["mean", "var", "median"])
+@pytest.mark.parametrize("split_method", ["interleaved", "random"])
+def test_targetencoder_host_vs_per_fold_groupby(stat, split_method):
+    rng = np.random.default_rng(0)
+    x = pandas.DataFrame(
+        {
+            "c1": rng.integers(0, 30, 5000),
+            "c2": rng.choice(["a", "b", "c"], 5000),
+        }
+    )
+    y = rng.integers(0, 50, 5000).astype(np.float64)
+
+    encoder = TargetEncoder(stat=stat, n_folds=7, split_method=split_method)
+    with using_device_type("cpu"):
+        train_encoded = encoder.fit_transform(x, y)
+        folds = encoder._make_fold_column(np, len(y), None)
+    assert isinstance(train_encoded, np.ndarray)
+
+    df = x.assign(y=y)
+    answer = np.empty(len(y))
+    for fold in np.unique(folds):
+        mask = folds == fold
+        dg = df[~mask].groupby(["c1", "c2"], as_index=False).agg({"y": stat})
+        dg = dg.rename(columns={"y": "encoded"})
+        test = x[mask].merge(dg, on=["c1", "c2"], how="left")
+        answer[mask] = test["encoded"]
+    answer[np.isnan(answer)] = getattr(pandas.Series(y), stat)()
+    assert array_equal(train_encoded, answer)
+
+
+def test_targetencoder_random_folds_input_type():
+    # the folds are drawn on device whatever the type of the inputs
+    rng = np.random.RandomState(0)
+    x = rng.randint(0, 20, 1000)
+    y = rng.randint(0, 50, 1000).astype(np.float64)
+    numpy_encoded = TargetEncoder(split_method="random").fit_transform(x, y)
+    cupy_encoded = TargetEncoder(split_method="random").fit_transform(
+        cp.asarray(x), cp.asarray(y)
+    )
+    assert isinstance(numpy_encoded, np.ndarray)
+    assert array_equal(numpy_encoded, cupy_encoded)
@@ -1,5 +1,5 @@
 #
-# Copyright (c) 2019-2023, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -25,9 +25,12 @@ import pytest
 from cuml.feature_extraction.text import CountVectorizer
 from cuml.feature_extraction.text import TfidfVectorizer
 from cuml.feature_extraction.text import HashingVectorizer
+from cuml.feature_extraction import _host_text
+from cuml.common.device_selection import using_device_type
 from cuml.internals.safe_imports import gpu_only_import
 
 cp = gpu_only_import("cupy")
+cupyx = gpu_only_import("cupyx")
 
 Series = gpu_only_import_from("cudf", "Series")
 assert_array_equal = cpu_only_import_from(
@@ -35,6 +38,8 @@ assert_array_equal = cpu_only_import_from(
 )
 np = cpu_only_import("numpy")
 pd = cpu_only_import("pandas")
+pa = cpu_only_import("pyarrow")
+scipy_sparse = cpu_only_import("scipy.sparse")
 
 
 def test_count_vectorizer():
@@ -605,3 +610,339 @@ def test_vectorizer_with_pandas_series(vectorizer):
     res = cuml_vec().fit_transform(raw_documents)
     ref = sklearn_vec().fit_transform(raw_documents)
     assert_almost_equal_hash_matrices(res.todense().get(), ref.toarray())
+
+
+def test_countvectorizer_partial_fit():
+    docs = pd.Series(DOCS)
+    cv = CountVectorizer(max_df=0.5)
+    for batch in np.array_split(np.arange(len(docs)), 3):
+        cv.partial_fit(Series(docs.iloc[batch]))
+    ref = CountVectorizer(max_df=0.5).fit(Series(docs))
+
+    assert cv.n_samples_seen_ == len(DOCS)
+    assert (
+        cv.vocabulary_.to_arrow().to_pylist()
+        == ref.vocabulary_.to_arrow().to_pylist()
+    )
+
+
+def test_countvectorizer_pretokenized():
+    tokens = [doc.split() for doc in DOCS]
+    cv = CountVectorizer(analyzer="pretokenized", ngram_range=(1, 2))
+    res = cv.fit_transform(Series(tokens))
+    ref_cv = SkCountVect(
+        analyzer="word",
+        preprocessor=lambda doc: doc,
+        tokenizer=lambda doc: doc,
+        token_pattern=None,
+        lowercase=False,
+        ngram_range=(1, 2),
+    )
+    ref = ref_cv.fit_transform(tokens)
+
+    assert cv.vocabulary_.to_arrow().to_pylist() == list(
+        ref_cv.get_feature_names_out()
+    )
+    cp.testing.assert_array_equal(res.todense(), ref.toarray())
+
+
+def test_hashingvectorizer_transform_iter():
+    docs = pd.Series(DOCS)
+    hv = HashingVectorizer()
+    blocks = list(hv.transform_iter(docs, batch_size=5))
+    res = cupyx.scipy.sparse.vstack(blocks)
+    ref = hv.transform(Series(docs))
+    cp.testing.assert_array_equal(res.todense(), ref.todense())
+
+
+# ----------------------------------------------------------------
+# Host tests
+# ----------------------------------------------------------------
+@pytest.mark.parametrize("ngram_range", NGRAM_RANGES, ids=NGRAM_IDS)
+@pytest.mark.parametrize("input_type", ["pandas", "list", "arrow"])
+def test_countvectorizer_host(ngram_range, input_type):
+    pa = pytest.importorskip("pyarrow")
+    docs = {
+        "pandas": pd.Series(DOCS),
+        "list": list(DOCS),
+        "arrow": pa.array(DOCS),
+    }[input_type]
+    with using_device_type("cpu"):
+        cv = CountVectorizer(ngram_range=ngram_range)
+        res = cv.fit_transform(docs)
+    ref_cv = SkCountVect(ngram_range=ngram_range)
+    ref = ref_cv.fit_transform(DOCS)
+
+    assert isinstance(res, scipy_sparse.csr_matrix)
+    assert res.dtype == np.float32
+    assert cv.get_feature_names().tolist() == list(
+        ref_cv.get_feature_names_out()
+    )
+    assert_array_equal(res.toarray(), ref.toarray())
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"stop_words": "english"},
+        {"max_df": 0.5},
+        {"min_df": 2},
+        {"max_features": 4},
+        {"binary": True, "ngram_range": (1, 2)},
+        {"analyzer": "char", "ngram_range": (1, 3)},
+        {"analyzer": "char_wb", "ngram_range": (2, 4)},
+        {"lowercase": False},
+    ],
+)
+def test_countvectorizer_host_params(params):
+    docs = ["Some Text", "a text to count", "the text to count", "Char"]
+    with using_device_type("cpu"):
+        cv = CountVectorizer(**params)
+        res = cv.fit_transform(pd.Series(docs))
+    ref_cv = SkCountVect(**params)
+    ref = ref_cv.fit_transform(docs)
+
+    assert cv.vocabulary_.tolist() == list(ref_cv.get_feature_names_out())
+    assert_array_equal(res.toarray(), ref.toarray())
+
+
+@pytest.mark.parametrize("stop_words", [None, "english"])
+def test_countvectorizer_host_long_ngrams(stop_words):
+    # n-grams whose token ids do not fit in a single 64-bit key
+    words = ["w%d" % i for i in range(20)] + ["the", "and", "of"]
+    rng = np.random.default_rng(0)
+    docs = [" ".join(rng.choice(words, size=40)) for _ in range(10)]
+    params = {"ngram_range": (1, 25), "stop_words": stop_words}
+    with using_device_type("cpu"):
+        cv = CountVectorizer(**params)
+        res = cv.fit_transform(pd.Series(docs))
+    ref_cv = SkCountVect(**params)
+    ref = ref_cv.fit_transform(docs)
+
+    assert cv.vocabulary_.tolist() == list(ref_cv.get_feature_names_out())
+    assert_array_equal(res.toarray(), ref.toarray())
+
+
+def test_countvectorizer_host_transform(monkeypatch):
+    # several blocks exercise the thread pool and the vocabulary merge
+    monkeypatch.setattr(_host_text, "_BLOCK_SIZE", 3)
+    train = list(JUNK_FOOD_DOCS) + ["the unique word", "", "Αγγλικά pizza"]
+    test = list(NOTJUNK_FOOD_DOCS) + ["unseen pizza tokens"]
+
+    with using_device_type("cpu"):
+        cv = CountVectorizer(ngram_range=(1, 2)).fit(pd.Series(train))
+    # the fitted vocabulary selects the host implementation
+    res = cv.transform(pd.Series(test))
+    ref_cv = SkCountVect(ngram_range=(1, 2)).fit(train)
+    ref = ref_cv.transform(test)
+    assert_array_equal(res.toarray(), ref.toarray())
+
+    inversed = cv.inverse_transform(res)
+    for doc, sk_doc in zip(inversed, ref_cv.inverse_transform(ref)):
+        assert sorted(doc.tolist()) == sorted(sk_doc)
+
+
+def _pretokenized_input(tokens, input_type):
+    if input_type == "arrow":
+        return pa.array(tokens, type=pa.list_(pa.string()))
+    if input_type == "offsets":
+        offsets = np.cumsum([0] + [len(doc) for doc in tokens])
+        values = np.array([token for doc in tokens for token in doc])
+        return offsets, values
+    return pd.Series(tokens)
+
+
+@pytest.mark.parametrize("input_type", ["pandas", "arrow", "offsets"])
+@pytest.mark.parametrize("ngram_range", [(1, 1), (1, 3)])
+def test_countvectorizer_host_pretokenized(input_type, ngram_range):
+    tokens = [doc.split() for doc in DOCS] + [[]]
+    params = {"ngram_range": ngram_range, "max_df": 0.8}
+    with using_device_type("cpu"):
+        cv = CountVectorizer(analyzer="pretokenized", **params)
+        res = cv.fit_transform(_pretokenized_input(tokens, input_type))
+        res_transform = cv.transform(_pretokenized_input(tokens, input_type))
+    ref_cv = SkCountVect(
+        analyzer="word",
+        preprocessor=lambda doc: doc,
+        tokenizer=lambda doc: doc,
+        token_pattern=None,
+        lowercase=False,
+        **params,
+    )
+    ref = ref_cv.fit_transform(tokens)
+
+    assert cv.vocabulary_.tolist() == list(ref_cv.get_feature_names_out())
+    assert_array_equal(res.toarray(), ref.toarray())
+    assert_array_equal(res_transform.toarray(), ref.toarray())
+
+
+def test_countvectorizer_host_pretokenized_integers():
+    offsets = np.array([0, 3, 3, 7])
+    values = np.array([5, 2, 5, 7, 7, 2, 11], dtype=np.int32)
+    with using_device_type("cpu"):
+        cv = CountVectorizer(analyzer="pretokenized")
+        res = cv.fit_transform((offsets, values))
+        arrow_docs = pa.ListArray.from_arrays(
+            pa.array(offsets, type=pa.int32()), pa.array(values)
+        )
+        res_arrow = cv.transform(arrow_docs)
+
+        assert cv.vocabulary_.tolist() == [2, 5, 7, 11]
+        expected = [[1, 2, 0, 0], [0, 0, 0, 0], [1, 0, 2, 1]]
+        assert_array_equal(res.toarray(), expected)
+        assert_array_equal(res_arrow.toarray(), expected)
+
+        with pytest.raises(ValueError):
+            CountVectorizer(analyzer="pretokenized", ngram_range=(1, 2)).fit(
+                (offsets, values)
+            )
+
+
+def test_countvectorizer_host_custom_vocabulary():
+    vocab = ["pizza", "beer", "unknown"]
+    with using_device_type("cpu"):
+        res = CountVectorizer(vocabulary=pd.Series(vocab)).fit_transform(
+            pd.Series(DOCS)
+        )
+    ref = SkCountVect(vocabulary=vocab).fit_transform(DOCS)
+    assert_array_equal(res.toarray(), ref.toarray())
+
+
+def test_countvectorizer_host_empty_vocabulary():
+    v = CountVectorizer(max_df=1.0, stop_words="english")
+    with using_device_type("cpu"), pytest.raises(ValueError):
+        v.fit(pd.Series(["to be or not to be", "and me too", "and so do you"]))
+
+
+def test_countvectorizer_host_no_limit():
+    v = CountVectorizer()
+    with using_device_type("cpu"):
+        X = v.fit_transform(pd.Series(DOCS))
+    vocab = v.vocabulary_
+    assert v._limit_features_host(X, vocab, None, None, None) is X
+    assert v.stop_words_ is None
+    assert v.vocabulary_ is vocab
+
+
+@pytest.mark.parametrize("norm", ["l1", "l2", None])
+@pytest.mark.parametrize("use_idf", [True, False])
+@pytest.mark.parametrize("sublinear_tf", [True, False])
+def test_tfidf_vectorizer_host(norm, use_idf, sublinear_tf):
+    params = dict(norm=norm, use_idf=use_idf, sublinear_tf=sublinear_tf)
+    with using_device_type("cpu"):
+        tv = TfidfVectorizer(**params)
+        res = tv.fit_transform(pd.Series(DOCS))
+    ref_tv = SkTfidfVect(**params)
+    ref = ref_tv.fit_transform(DOCS)
+
+    assert isinstance(res, scipy_sparse.csr_matrix)
+    np.testing.assert_array_almost_equal(res.toarray(), ref.toarray())
+    np.testing.assert_array_almost_equal(
+        tv.transform(pd.Series(DOCS[:3])).toarray(),
+        ref_tv.transform(DOCS[:3]).toarray(),
+    )
+    if use_idf:
+        np.testing.assert_array_almost_equal(tv.idf_[0], ref_tv.idf_)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{}, {"min_df": 2}, {"max_df": 0.5}, {"max_features": 4}],
+)
+def test_countvectorizer_host_partial_fit(params):
+    batches = np.array_split(np.array(DOCS, dtype=object), 3)
+    with using_device_type("cpu"):
+        cv = CountVectorizer(**params)
+        for batch in batches:
+            cv.partial_fit(pd.Series(batch))
+        ref_cv = CountVectorizer(**params).fit(pd.Series(DOCS))
+
+    assert cv.n_samples_seen_ == len(DOCS)
+    assert cv.vocabulary_.tolist() == ref_cv.vocabulary_.tolist()
+    assert_array_equal(
+        cv.transform(pd.Series(DOCS)).toarray(),
+        ref_cv.transform(pd.Series(DOCS)).toarray(),
+    )
+
+    # fit starts over
+    with using_device_type("cpu"):
+        cv.fit(pd.Series(DOCS[:2]))
+    assert not hasattr(cv, "n_samples_seen_")
+
+
+def test_countvectorizer_host_partial_fit_bounded():
+    # terms of df above the error bound of the summary are always kept
+    docs = ["common rare%d" % i for i in range(300)]
+    docs += ["common frequent"] * 100
+    with using_device_type("cpu"):
+        cv = CountVectorizer(sketch_size=8, min_df=50)
+        for batch in np.array_split(np.array(docs, dtype=object), 7):
+            cv.partial_fit(pd.Series(batch))
+    assert len(cv._df_sketch.items) <= 8
+    assert cv.vocabulary_.tolist() == ["common", "frequent"]
+
+
+@pytest.mark.parametrize("vocabulary", [None, ["pizza", "beer", "the"]])
+def test_tfidf_vectorizer_host_partial_fit(vocabulary):
+    with using_device_type("cpu"):
+        tv = TfidfVectorizer(vocabulary=vocabulary)
+        for batch in np.array_split(np.array(DOCS, dtype=object), 3):
+            tv.partial_fit(pd.Series(batch))
+    ref_tv = SkTfidfVect(vocabulary=vocabulary).fit(DOCS)
+
+    np.testing.assert_array_almost_equal(tv.idf_[0], ref_tv.idf_)
+    np.testing.assert_array_almost_equal(
+        tv.transform(pd.Series(DOCS)).toarray(),
+        ref_tv.transform(DOCS).toarray(),
+    )
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"norm": "l1", "ngram_range": (1, 2)},
+        {"norm": None, "alternate_sign": False, "n_features": 2**4},
+        {"binary": True, "stop_words": "english"},
+        {"analyzer": "char", "ngram_range": (2, 4), "norm": None},
+        {"analyzer": "char_wb", "ngram_range": (3, 5)},
+    ],
+)
+def test_hashingvectorizer_host(params):
+    with using_device_type("cpu"):
+        res = HashingVectorizer(**params).fit_transform(pd.Series(DOCS))
+    ref = SkHashVect(**params).fit_transform(DOCS)
+
+    assert isinstance(res, scipy_sparse.csr_matrix)
+    np.testing.assert_array_almost_equal(res.toarray(), ref.toarray())
+
+
+def test_murmurhash3_32():
+    from sklearn.utils import murmurhash3_32
+
+    pa = pytest.importorskip("pyarrow")
+    words = ["", "a", "ab", "abc", "abcd", "abcdefghi", "Αγγλικά pizza"]
+    for seed in [0, 42]:
+        # the slice exercises the offset of the arrow array
+        res = _host_text.murmurhash3_32(pa.array(words)[1:], seed=seed)
+        ref = [murmurhash3_32(w.encode(), seed=seed) for w in words[1:]]
+        assert_array_equal(res, ref)
+
+
+@pytest.mark.parametrize("input_type", ["pandas", "generator"])
+def test_hashingvectorizer_host_transform_iter(input_type):
+    docs = list(DOCS) * 3
+    source = {
+        "pandas": pd.Series(docs),
+        "generator": (doc for doc in docs),
+    }[input_type]
+    with using_device_type("cpu"):
+        hv = HashingVectorizer(ngram_range=(1, 2))
+        blocks = list(hv.transform_iter(source, batch_size=4))
+        ref = hv.transform(pd.Series(docs))
+
+    assert [block.shape[0] for block in blocks] == [4] * 9 + [len(docs) - 36]
+    assert_array_equal(
+        scipy_sparse.vstack(blocks).toarray(),
+        ref.toarray(),
+    )
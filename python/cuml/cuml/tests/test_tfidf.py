@@ -1,4 +1,4 @@
-# Copyright (c) 2019-2023, NVIDIA CORPORATION.
+# Copyright (c) 2019-2024, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,11 +15,13 @@
 
 from sklearn.feature_extraction.text import TfidfTransformer as SkTfidfTransfo
 from cuml.feature_extraction.text import TfidfTransformer
+from cuml.common.device_selection import using_device_type
 from cuml.internals.safe_imports import gpu_only_import
 import pytest
 from cuml.internals.safe_imports import cpu_only_import
 
 np = cpu_only_import("numpy")
+scipy_sparse = cpu_only_import("scipy.sparse")
 cp = gpu_only_import("cupy")
 cupyx = gpu_only_import("cupyx")
 
@@ -107,3 +109,52 @@ def test_tfidf_transformer_sparse():
     X_trans_csr = TfidfTransformer().fit_transform(X_csr).todense()
 
     cp.testing.assert_array_almost_equal(X_trans_csc, X_trans_csr)
+
+
+@pytest.mark.parametrize("smooth_idf", [True, False])
+def test_tfidf_transformer_partial_fit(smooth_idf):
+    X = data[0]
+    tfidf = TfidfTransformer(smooth_idf=smooth_idf)
+    for batch in np.array_split(X, 3):
+        tfidf.partial_fit(cp.array(batch))
+    ref = SkTfidfTransfo(smooth_idf=smooth_idf).fit(X)
+
+    cp.testing.assert_array_almost_equal(tfidf.idf_[0], ref.idf_)
+    cp.testing.assert_array_almost_equal(
+        tfidf.transform(cp.array(X)).todense(), ref.transform(X).todense()
+    )
+
+
+@pytest.mark.parametrize("norm", ["l1", "l2", None])
+@pytest.mark.parametrize("sublinear_tf", [True, False])
+def test_tfidf_transformer_host(norm, sublinear_tf):
+    X = scipy_sparse.csr_matrix(data[0], dtype=np.float64)
+    params = dict(norm=norm, sublinear_tf=sublinear_tf)
+    with using_device_type("cpu"):
+        tfidf = TfidfTransformer(**params)
+        for batch in [X[:1], X[1:]]:
+            tfidf.partial_fit(batch)
+    ref = SkTfidfTransfo(**params).fit(X)
+
+    np.testing.assert_array_almost_equal(tfidf.idf_[0], ref.idf_)
+    res = tfidf.transform(X)
+    assert isinstance(res, scipy_sparse.csr_matrix)
+    np.testing.assert_array_almost_equal(
+        res.toarray(), ref.transform(X).toarray()
+    )
+    # the input is left untouched unless copy=False
+    np.testing.assert_array_equal(X.toarray(), data[0])
+    assert tfidf.transform(X, copy=False) is X
+
+
+def test_tfidf_transformer_merge():
+    X = data[0]
+    with using_device_type("cpu"):
+        tfidf = TfidfTransformer().fit(X[:2])
+        tfidf.merge(TfidfTransformer().fit(X[2:]))
+        other = TfidfTransformer().fit(data[1])
+    ref = SkTfidfTransfo().fit(X)
+    np.testing.assert_array_almost_equal(tfidf.idf_[0], ref.idf_)
+
+    with pytest.raises(ValueError):
+        tfidf.merge(other)
@@ -36,6 +36,7 @@ from cuml.testing.utils import (
     stress_param,
 )
 from cuml.manifold.umap import UMAP as cuUMAP
+from cuml.neighbors import KNNGraph
 from cuml.internals.safe_imports import cpu_only_import
 from cuml.internals.safe_imports import gpu_only_import
 
@@ -838,3 +839,21 @@ def test_umap_distance_metrics_fit_transform_trust_on_sparse_input(
 
     if umap_learn_supported:
         assert array_equal(umap_trust, cuml_trust, 0.05, with_sign=True)
+
+
+def test_umap_knn_graph_object():
+    data, _ = make_blobs(
+        n_samples=2000, n_features=10, centers=5, random_state=0
+    )
+    data = data.astype(np.float32)
+    graph = KNNGraph.build(data, n_neighbors=20)
+
+    # the graph is truncated to the neighbors of the model
+    embedding = cuUMAP(n_neighbors=8).fit_transform(data, knn_graph=graph)
+    trust = trustworthiness(data, embedding, n_neighbors=8)
+    assert trust >= 0.92
+
+    with pytest.raises(ValueError, match="metric"):
+        cuUMAP(metric="cosine").fit(data, knn_graph=graph)
+    with pytest.raises(ValueError, match="neighbors"):
+        cuUMAP(n_neighbors=30).fit(data, knn_graph=graph)